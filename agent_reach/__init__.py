@@ -4,6 +4,14 @@
 __version__ = "1.5.0"
 __author__ = "Neo Reid"
 
-from agent_reach.core import AgentReach
-
 __all__ = ["AgentReach"]
+
+
+def __getattr__(name: str):
+    # Imported on first use: `agent-reach version` must not pay for
+    # AgentReach -> Config -> yaml.
+    if name == "AgentReach":
+        from agent_reach.core import AgentReach
+
+        return AgentReach
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
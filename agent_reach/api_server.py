@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""Local HTTP/JSON API behind `agent-reach serve`.
+
+One resident process per host answers every agent, so cookies, channel
+singletons, the probe cache and recent responses are warmed once instead of
+once per spawned CLI. Endpoints:
+
+- ``GET  /v1/health``              liveness + version
+- ``GET  /v1/status``              doctor results (``?channels=a,b``, ``?refresh=1``)
+- ``GET  /v1/tools``               the channel data tools and their JSON schemas
+- ``POST /v1/tools/<name>``        run a tool; JSON object body = arguments
+
+Concurrent identical requests share one computation. Status responses are
+also kept per channel set for ``cache_ttl`` seconds; tool results are not,
+since their freshness is set per channel method by the on-disk
+agent_reach.response_cache POLICIES (a stock quote is never more than 10s
+old), which the server bypasses with ``response_cache=False``
+(``--no-cache``). ``?refresh=1`` or a ``refresh: true`` tool argument skips
+both caches for one request. At most ``workers``
+computations run at once; a request that cannot get a slot within
+``queue_timeout`` seconds gets 503.
+
+The server only listens on loopback or a Unix socket. Over TCP it also
+rejects requests whose Host header is not a loopback name (DNS rebinding)
+and tool POSTs that are not ``application/json`` (cross-site form posts).
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import json
+import os
+import socketserver
+import stat
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from agent_reach import __version__, response_cache
+from agent_reach.data_tools import DATA_TOOLS, get_data_tool, run_tool
+from agent_reach.utils.text import scrub_url_credentials
+
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 8
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_QUEUE_TIMEOUT = 30.0
+
+_MAX_BODY_BYTES = 64 * 1024
+_MAX_CACHE_ENTRIES = 256
+_LOOPBACK_NAMES = {"localhost", "127.0.0.1", "::1"}
+
+
+class ApiError(Exception):
+    """An error with an HTTP status, rendered as ``{"error": message}``."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache where concurrent misses share one computation."""
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int = _MAX_CACHE_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Any, _Flight] = {}
+
+    def get_or_compute(
+        self, key, compute: Callable[[], Any], refresh: bool = False, store: bool = True
+    ):
+        """Return the cached value for ``key`` or compute it once for all callers.
+
+        With ``store=False`` concurrent callers still share one computation,
+        but its result is neither read from nor kept in the cache.
+        """
+        with self._lock:
+            entry = self._entries.get(key) if store else None
+            if entry is not None and not refresh and self._clock() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+            waiting = self._inflight.get(key)
+            if waiting is None:
+                flight = self._inflight[key] = _Flight()
+
+        if waiting is not None:
+            waiting.done.wait()
+            if waiting.error is not None:
+                raise waiting.error
+            return waiting.value
+
+        try:
+            flight.value = compute()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        else:
+            if not store:
+                return flight.value
+            with self._lock:
+                self._entries[key] = (self._clock(), flight.value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+            return flight.value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+
+def is_loopback_host(host: str) -> bool:
+    host = host.strip("[]")
+    if host in _LOOPBACK_NAMES:
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _host_header_name(value: str) -> str:
+    value = value.strip()
+    if value.startswith("["):
+        return value[1:].split("]", 1)[0]
+    return value.rsplit(":", 1)[0] if value.count(":") == 1 else value
+
+
+def _flag(query: Dict[str, list], name: str) -> bool:
+    return query.get(name, [""])[-1].lower() in ("1", "true", "yes")
+
+
+class AgentReachApi:
+    """Request routing and shared state, independent of the socket server."""
+
+    def __init__(
+        self,
+        *,
+        workers: int = DEFAULT_WORKERS,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+        config_factory: Optional[Callable] = None,
+        check: Optional[Callable] = None,
+        use_response_cache: bool = True,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if config_factory is None:
+            from agent_reach.config import Config
+
+            def config_factory():
+                return Config(read_only=True)
+        self._config_factory = config_factory
+        self._check = check
+        self._use_response_cache = use_response_cache
+        self._slots = threading.BoundedSemaphore(workers)
+        self._queue_timeout = queue_timeout
+        self.cache = ResponseCache(cache_ttl)
+
+    def _bounded(self, compute: Callable[[], Any]) -> Callable[[], Any]:
+        def run():
+            if not self._slots.acquire(timeout=self._queue_timeout):
+                raise ApiError(503, "server busy: all workers are in use, retry later")
+            try:
+                return compute()
+            finally:
+                self._slots.release()
+
+        return run
+
+    def _status(self, query: Dict[str, list]) -> dict:
+        from agent_reach.channels import get_channel_spec
+
+        raw = query.get("channels", [""])[-1]
+        names = tuple(sorted({n.strip() for n in raw.split(",") if n.strip()})) or None
+        unknown = [n for n in names or () if get_channel_spec(n) is None]
+        if unknown:
+            raise ApiError(400, f"unknown channel(s): {', '.join(unknown)}")
+
+        def compute():
+            check = self._check
+            if check is None:
+                from agent_reach.doctor import check_all
+
+                check = check_all
+            return check(self._config_factory(), channels=list(names) if names else None)
+
+        results = self.cache.get_or_compute(
+            ("status", names), self._bounded(compute), refresh=_flag(query, "refresh")
+        )
+        return {"channels": results}
+
+    def _tool(self, name: str, query: Dict[str, list], body: bytes) -> dict:
+        tool = get_data_tool(name)
+        if tool is None:
+            raise ApiError(404, f"unknown tool: {name}")
+        try:
+            arguments = json.loads(body or b"{}")
+        except ValueError:
+            raise ApiError(400, "request body must be a JSON object") from None
+        if not isinstance(arguments, dict):
+            raise ApiError(400, "request body must be a JSON object")
+        refresh = _flag(query, "refresh") or arguments.get("refresh") is True
+        if not self._use_response_cache:
+            mode = response_cache.OFF
+        else:
+            mode = response_cache.REFRESH if refresh else response_cache.USE
+
+        def compute():
+            config = self._config_factory() if tool.long_running else None
+            return run_tool(tool, arguments, config=config, cache=mode)
+
+        canonical = {k: v for k, v in arguments.items() if k != "refresh"}
+        key = ("tool", name, mode, json.dumps(canonical, sort_keys=True, ensure_ascii=False))
+        # Only coalesce: response_cache.POLICIES decide how old a result may be.
+        result = self.cache.get_or_compute(key, self._bounded(compute), store=False)
+        return {"result": result}
+
+    def handle(self, method: str, target: str, body: bytes = b"") -> Tuple[int, dict]:
+        """Route one request; returns (HTTP status, JSON payload). Never raises."""
+        parts = urlsplit(target)
+        path = parts.path.rstrip("/") or "/"
+        query = parse_qs(parts.query)
+        try:
+            if path == "/v1/health":
+                self._require(method, "GET")
+                return 200, {"ok": True, "version": __version__}
+            if path == "/v1/status":
+                self._require(method, "GET")
+                return 200, self._status(query)
+            if path == "/v1/tools":
+                self._require(method, "GET")
+                return 200, {
+                    "tools": [
+                        {
+                            "name": tool.name,
+                            "description": tool.description,
+                            "input_schema": tool.input_schema(),
+                        }
+                        for tool in DATA_TOOLS
+                    ]
+                }
+            if path.startswith("/v1/tools/"):
+                self._require(method, "POST")
+                return 200, self._tool(path[len("/v1/tools/"):], query, body)
+            raise ApiError(404, f"not found: {path}")
+        except ApiError as exc:
+            return exc.status, {"error": str(exc)}
+        except ValueError as exc:
+            return 400, {"error": scrub_url_credentials(exc)}
+        except Exception as exc:  # noqa: BLE001 — one failing upstream must not kill the server
+            return 502, {"error": scrub_url_credentials(exc)}
+
+    @staticmethod
+    def _require(method: str, expected: str) -> None:
+        if method != expected:
+            raise ApiError(405, f"method not allowed: use {expected}")
+
+
+def _make_handler(api: AgentReachApi, *, check_host: bool):
+    class Handler(BaseHTTPRequestHandler):
+        server_version = f"agent-reach/{__version__}"
+        protocol_version = "HTTP/1.1"
+
+        def _respond(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _rejected(self) -> Optional[Tuple[int, dict]]:
+            if check_host and not is_loopback_host(_host_header_name(self.headers.get("Host", ""))):
+                return 403, {"error": "Host header must be a loopback address"}
+            return None
+
+        def do_GET(self):
+            rejected = self._rejected()
+            self._respond(*(rejected or api.handle("GET", self.path)))
+
+        def do_POST(self):
+            rejected = self._rejected()
+            if rejected is None:
+                content_type = self.headers.get("Content-Type", "").split(";", 1)[0].strip()
+                if content_type != "application/json":
+                    rejected = 415, {"error": "Content-Type must be application/json"}
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if rejected is None and not 0 <= length <= _MAX_BODY_BYTES:
+                rejected = 413, {"error": f"body must be at most {_MAX_BODY_BYTES} bytes"}
+            if rejected is not None:
+                self.close_connection = True
+                self._respond(*rejected)
+                return
+            body = self.rfile.read(length) if length else b""
+            self._respond(*api.handle("POST", self.path, body))
+
+        def log_message(self, format, *args):  # noqa: A002 — stdlib signature
+            pass
+
+    return Handler
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(
+    api: AgentReachApi,
+    *,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    unix_socket: Optional[str] = None,
+):
+    """Bind the API to a loopback TCP port or an owner-only Unix socket."""
+    if unix_socket:
+        if os.path.lexists(unix_socket):
+            if not stat.S_ISSOCK(os.lstat(unix_socket).st_mode):
+                raise ValueError(f"{unix_socket} exists and is not a socket")
+            os.unlink(unix_socket)  # stale socket from a previous run
+        old_umask = os.umask(0o177)
+        try:
+            return _UnixHTTPServer(unix_socket, _make_handler(api, check_host=False))
+        finally:
+            os.umask(old_umask)
+
+    if not is_loopback_host(host):
+        raise ValueError(f"refusing to listen on non-loopback address {host!r}")
+    server = ThreadingHTTPServer((host, port), _make_handler(api, check_host=True))
+    server.daemon_threads = True
+    return server
@@ -20,10 +20,10 @@ Probing notes (verified live):
 import glob
 import json
 import os
-import urllib.request
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
-from agent_reach.probe import probe_command
+from agent_reach import http_client
+from agent_reach.probe import probe_command, shared_probe
 
 OPENCLI_PACKAGE = "@jackwener/opencli"
 OPENCLI_EXTENSION_ID = "ildkmabpimmkaediidaifkhjpohdnifk"
@@ -53,19 +53,16 @@ _MAX_DAEMON_STATUS_BYTES = 64 * 1024
 
 def _fetch_daemon_status(timeout: int = 2):
     """Read OpenCLI's loopback status endpoint without starting the CLI."""
-    request = urllib.request.Request(
-        _OPENCLI_DAEMON_STATUS_URL,
-        headers={"X-OpenCLI": "1"},
-        method="GET",
-    )
-    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
     try:
-        with opener.open(request, timeout=min(timeout, 2)) as response:
-            raw = response.read(_MAX_DAEMON_STATUS_BYTES + 1)
+        raw = http_client.get(
+            _OPENCLI_DAEMON_STATUS_URL,
+            headers={"X-OpenCLI": "1"},
+            timeout=min(timeout, 2),
+            direct=True,
+            max_bytes=_MAX_DAEMON_STATUS_BYTES,
+        ).content
     except Exception:
         return None
-    if len(raw) > _MAX_DAEMON_STATUS_BYTES:
-        return None
     try:
         payload = json.loads(raw.decode("utf-8"))
     except (UnicodeDecodeError, json.JSONDecodeError):
@@ -126,7 +123,16 @@ class OpenCLIStatus:
 
 
 def opencli_status(timeout: int = 10) -> OpenCLIStatus:
-    """Probe OpenCLI install + daemon/extension state without side effects."""
+    """Probe OpenCLI install + daemon/extension state without side effects.
+
+    Reddit, Twitter, XiaoHongShu, Bilibili, Facebook and Instagram all ask
+    this same question; within one doctor run the probe executes once and
+    each caller gets its own copy of the answer.
+    """
+    return replace(shared_probe(("opencli", timeout), lambda: _probe_opencli(timeout)))
+
+
+def _probe_opencli(timeout: int) -> OpenCLIStatus:
     version_probe = probe_command(
         "opencli",
         ["--version"],
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""Per-host circuit breaker shared by every process on the machine.
+
+Behind the Great Firewall a blocked host (V2EX, Xueqiu) costs every call —
+and every doctor run — the full request timeout. http_client counts
+consecutive connection failures per host; after FAILURE_THRESHOLD of them
+the circuit opens and requests to that host fail at once with CircuitOpen
+for COOL_DOWN_SECONDS. After the cool-down a single half-open probe is let
+through: success closes the circuit, another failure re-opens it. A probe
+that never reports back (process killed) frees its slot after
+PROBE_LEASE_SECONDS.
+
+Like agent_reach.ratelimit, state is kept in
+``~/.agent-reach/cache/breaker.sqlite3`` when ``~/.agent-reach`` exists so
+short-lived CLI runs learn from each other, and per process otherwise. The
+file is only created once a failure has been recorded.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from agent_reach.utils.paths import PrivatePathError, ensure_no_symlink_path, make_private_dir
+
+_DB_FILE_NAME = "breaker.sqlite3"
+
+#: Consecutive connection failures that open a host's circuit.
+FAILURE_THRESHOLD = 3
+
+#: How long an open circuit fails fast before a half-open probe is allowed.
+COOL_DOWN_SECONDS = 120.0
+
+#: How long the half-open probe owns its slot before another may try.
+PROBE_LEASE_SECONDS = 30.0
+
+
+class CircuitOpen(ConnectionError):
+    """Requests to ``host`` are being refused locally for ``retry_in`` seconds."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(
+            f"{host} unreachable in recent attempts; skipping requests for {retry_in:.0f}s "
+            "(circuit open)"
+        )
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class _Entry:
+    failures: int = 0
+    opened_until: float = 0.0
+    probe_until: float = 0.0
+
+
+_CLOSED = _Entry()
+
+
+def state_path() -> Path:
+    from agent_reach.config import Config
+
+    return Config.CONFIG_DIR / "cache" / _DB_FILE_NAME
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuits keyed by host."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        threshold: int = FAILURE_THRESHOLD,
+        cool_down: float = COOL_DOWN_SECONDS,
+        probe_lease: float = PROBE_LEASE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        if threshold < 1:
+            raise ValueError("threshold must be at least 1")
+        self._path = path
+        self.threshold = threshold
+        self.cool_down = cool_down
+        self.probe_lease = probe_lease
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._local: Dict[str, _Entry] = {}
+
+    @property
+    def path(self) -> Path:
+        return self._path or state_path()
+
+    # ── storage ──
+
+    def _update_shared(self, host: str, change: Callable[[_Entry], Optional[_Entry]]) -> bool:
+        """Apply ``change`` to the host's row in the shared file.
+
+        ``change`` returns the new entry, or None to leave it as is. Returns
+        False when the file is unusable and the caller should fall back to
+        the per-process state.
+        """
+        path = self.path
+        if not path.parent.parent.is_dir():
+            return False  # never create ~/.agent-reach from here
+        try:
+            ensure_no_symlink_path(path, "熔断状态文件")
+            if not path.is_file():
+                if change(_CLOSED) is None:
+                    return True  # nothing to record: keep the common case file-free
+                make_private_dir(path.parent)
+                flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+                os.close(os.open(path, flags, 0o600))
+            with closing(sqlite3.connect(path, timeout=5, isolation_level=None)) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS hosts (host TEXT PRIMARY KEY, "
+                    "failures INTEGER NOT NULL, opened_until REAL NOT NULL, "
+                    "probe_until REAL NOT NULL)"
+                )
+                select = "SELECT failures, opened_until, probe_until FROM hosts WHERE host = ?"
+                # Healthy hosts have no row: read without taking the write lock.
+                if conn.execute(select, (host,)).fetchone() is None and change(_CLOSED) is None:
+                    return True
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(select, (host,)).fetchone()
+                    entry = _Entry(*row) if row else _CLOSED
+                    new = change(entry)
+                    if new is not None and new != entry:
+                        if new.failures:
+                            conn.execute(
+                                "INSERT OR REPLACE INTO hosts VALUES (?, ?, ?, ?)",
+                                (host, new.failures, new.opened_until, new.probe_until),
+                            )
+                        else:
+                            conn.execute("DELETE FROM hosts WHERE host = ?", (host,))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except CircuitOpen:
+            raise
+        except (OSError, PrivatePathError, sqlite3.Error):
+            return False
+        return True
+
+    def _update_local(self, host: str, change: Callable[[_Entry], Optional[_Entry]]) -> None:
+        with self._lock:
+            entry = self._local.get(host, _CLOSED)
+            new = change(entry)
+            if new is None:
+                return
+            if new.failures:
+                self._local[host] = new
+            else:
+                self._local.pop(host, None)
+
+    def _update(self, host: str, change: Callable[[_Entry], Optional[_Entry]]) -> None:
+        if not self._update_shared(host, change):
+            self._update_local(host, change)
+
+    def _entries(self, hosts: Iterable[str]) -> Dict[str, _Entry]:
+        """Read-only view of the given hosts' state; never creates anything."""
+        hosts = [host.lower() for host in hosts]
+        path = self.path
+        if not hosts:
+            return {}
+        if path.parent.parent.is_dir():
+            if not path.is_file():
+                return {}
+            try:
+                ensure_no_symlink_path(path, "熔断状态文件")
+                uri = path.resolve().as_uri() + "?mode=ro"
+                with closing(sqlite3.connect(uri, uri=True, timeout=5)) as conn:
+                    placeholders = ",".join("?" * len(hosts))
+                    rows = conn.execute(
+                        "SELECT host, failures, opened_until, probe_until FROM hosts "
+                        f"WHERE host IN ({placeholders})",
+                        hosts,
+                    ).fetchall()
+                return {row[0]: _Entry(*row[1:]) for row in rows}
+            except (OSError, PrivatePathError, sqlite3.Error):
+                pass
+        with self._lock:
+            return {host: self._local[host] for host in hosts if host in self._local}
+
+    # ── circuit ──
+
+    def before(self, host: Optional[str]) -> None:
+        """Raise CircuitOpen if ``host`` must not be called right now.
+
+        Once the cool-down is over, the first caller becomes the half-open
+        probe; others keep failing fast until it reports back.
+        """
+        if not host:
+            return
+        host = host.lower()
+        now = self._clock()
+
+        def change(entry: _Entry) -> Optional[_Entry]:
+            if entry.failures < self.threshold:
+                return None
+            if now < entry.opened_until:
+                raise CircuitOpen(host, entry.opened_until - now)
+            if now < entry.probe_until:
+                raise CircuitOpen(host, entry.probe_until - now)
+            return _Entry(entry.failures, entry.opened_until, now + self.probe_lease)
+
+        self._update(host, change)
+
+    def record_success(self, host: Optional[str]) -> None:
+        """The host answered (any HTTP status): close its circuit."""
+        if host:
+            self._update(host.lower(), lambda entry: _CLOSED if entry.failures else None)
+
+    def record_failure(self, host: Optional[str]) -> None:
+        """Count a connection failure; opens the circuit at the threshold."""
+        if not host:
+            return
+        now = self._clock()
+
+        def change(entry: _Entry) -> _Entry:
+            failures = entry.failures + 1
+            if failures < self.threshold:
+                return _Entry(failures)
+            return _Entry(failures, now + self.cool_down, 0.0)
+
+        self._update(host.lower(), change)
+
+    def snapshot(self, hosts: Iterable[str]) -> List[dict]:
+        """Hosts among ``hosts`` whose circuit is not closed, for doctor.
+
+        ``state`` is "open" (failing fast for ``retry_in`` more seconds) or
+        "half-open" (one probe request is let through; ``retry_in`` is how
+        long an in-flight probe still holds its slot).
+        """
+        now = self._clock()
+        result = []
+        for host, entry in sorted(self._entries(hosts).items()):
+            if entry.failures < self.threshold:
+                continue
+            retry_in = max(0.0, entry.opened_until - now, entry.probe_until - now)
+            result.append({
+                "host": host,
+                "state": "open" if now < entry.opened_until else "half-open",
+                "failures": entry.failures,
+                "retry_in": round(retry_in, 1),
+            })
+        return result
+
+
+_breaker: Optional[CircuitBreaker] = None
+_breaker_lock = threading.Lock()
+
+
+def get_breaker() -> CircuitBreaker:
+    global _breaker
+    with _breaker_lock:
+        if _breaker is None:
+            _breaker = CircuitBreaker()
+        return _breaker
@@ -1,63 +1,185 @@
 # -*- coding: utf-8 -*-
 """
 Channel registry — lists all supported platforms for doctor checks.
+
+The registry holds lightweight ChannelSpec descriptors; a channel module is
+imported (and its singleton created) only when that channel is actually
+checked or used, so `doctor --channels youtube` or URL routing does not pull
+in every platform's dependencies.
 """
 
-from typing import List, Optional
+import importlib
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
 
-# Import all channels
 from .base import Channel
-from .bilibili import BilibiliChannel
-from .exa_search import ExaSearchChannel
-from .facebook import FacebookChannel
-from .github import GitHubChannel
-from .instagram import InstagramChannel
-from .linkedin import LinkedInChannel
-from .reddit import RedditChannel
-from .rss import RSSChannel
-from .twitter import TwitterChannel
-from .v2ex import V2EXChannel
-from .web import WebChannel
-from .xiaohongshu import XiaoHongShuChannel
-from .xiaoyuzhou import XiaoyuzhouChannel
-from .xueqiu import XueqiuChannel
-from .youtube import YouTubeChannel
-
-ALL_CHANNELS: List[Channel] = [
-    GitHubChannel(),
-    TwitterChannel(),
-    YouTubeChannel(),
-    RedditChannel(),
-    FacebookChannel(),
-    InstagramChannel(),
-    BilibiliChannel(),
-    XiaoHongShuChannel(),
-    LinkedInChannel(),
-    XiaoyuzhouChannel(),
-    V2EXChannel(),
-    XueqiuChannel(),
-    RSSChannel(),
-    ExaSearchChannel(),
-    WebChannel(),
-]
+
+
+@dataclass(frozen=True)
+class ChannelSpec:
+    """Import-free description of one registered channel."""
+
+    name: str
+    tier: int
+    module: str                       # submodule of agent_reach.channels
+    class_name: str
+    #: Hosts routed to this channel. Empty = the channel decides by itself
+    #: in can_handle() (RSS, search-only and fallback channels).
+    domains: Tuple[str, ...] = ()
+    #: Local inputs the channel's check depends on, for `watch --daemon`:
+    #: commands looked up on PATH, files under the home directory ("~/...")
+    #: and whether the mcporter config layers matter.
+    binaries: Tuple[str, ...] = ()
+    files: Tuple[str, ...] = ()
+    mcporter: bool = False
+    #: Hosts the channel's own Python code calls over HTTP; they share the
+    #: channel's rate limit (agent_reach.ratelimit).
+    api_hosts: Tuple[str, ...] = ()
+
+    def load(self) -> Channel:
+        """Return the channel singleton, importing its module on first use."""
+        return _load(self)
+
+
+CHANNEL_SPECS: Tuple[ChannelSpec, ...] = (
+    ChannelSpec(
+        "github", 0, "github", "GitHubChannel", ("github.com",),
+        binaries=("gh",), files=("~/.config/gh/hosts.yml",),
+    ),
+    ChannelSpec(
+        "twitter", 1, "twitter", "TwitterChannel", ("x.com", "twitter.com"),
+        binaries=("twitter", "opencli", "bird", "birdx"),
+    ),
+    ChannelSpec(
+        "youtube", 0, "youtube", "YouTubeChannel", ("youtube.com", "youtu.be"),
+        binaries=("yt-dlp", "deno", "node"),
+    ),
+    ChannelSpec(
+        "reddit", 1, "reddit", "RedditChannel", ("reddit.com", "redd.it"),
+        binaries=("opencli", "rdt"), files=("~/.config/rdt-cli/credential.json",),
+    ),
+    ChannelSpec(
+        "facebook", 1, "facebook", "FacebookChannel", ("facebook.com", "fb.com", "fb.watch"),
+        binaries=("opencli",),
+    ),
+    ChannelSpec(
+        "instagram", 1, "instagram", "InstagramChannel", ("instagram.com", "instagr.am"),
+        binaries=("opencli",),
+    ),
+    ChannelSpec(
+        "bilibili", 1, "bilibili", "BilibiliChannel", ("bilibili.com", "b23.tv"),
+        binaries=("bili", "opencli"), api_hosts=("api.bilibili.com",),
+    ),
+    ChannelSpec(
+        "xiaohongshu", 1, "xiaohongshu", "XiaoHongShuChannel",
+        ("xiaohongshu.com", "xhslink.com"),
+        binaries=("opencli", "mcporter", "xhs"),
+        files=("~/.xiaohongshu-cli/cookies.json",),
+        mcporter=True,
+    ),
+    ChannelSpec(
+        "linkedin", 2, "linkedin", "LinkedInChannel", ("linkedin.com",),
+        binaries=("mcporter", "uvx"), mcporter=True,
+    ),
+    ChannelSpec(
+        "xiaoyuzhou", 1, "xiaoyuzhou", "XiaoyuzhouChannel", ("xiaoyuzhoufm.com",),
+        binaries=("ffmpeg",), files=("~/.agent-reach/tools/xiaoyuzhou/transcribe.sh",),
+    ),
+    ChannelSpec(
+        "v2ex", 0, "v2ex", "V2EXChannel", ("v2ex.com",),
+        binaries=("curl",), api_hosts=("www.v2ex.com", "v2ex.com"),
+    ),
+    ChannelSpec(
+        "xueqiu", 1, "xueqiu", "XueqiuChannel", ("xueqiu.com",),
+        api_hosts=("xueqiu.com", "stock.xueqiu.com"),
+    ),
+    ChannelSpec("rss", 0, "rss", "RSSChannel"),
+    ChannelSpec(
+        "exa_search", 0, "exa_search", "ExaSearchChannel",
+        binaries=("mcporter",), mcporter=True,
+    ),
+    ChannelSpec("web", 0, "web", "WebChannel", api_hosts=("r.jina.ai",)),
+)
+
+_SPECS_BY_NAME: Dict[str, ChannelSpec] = {spec.name: spec for spec in CHANNEL_SPECS}
+_instances: Dict[str, Channel] = {}
+_load_lock = threading.Lock()
+
+
+def _load(spec: ChannelSpec) -> Channel:
+    channel = _instances.get(spec.name)
+    if channel is not None:
+        return channel
+    with _load_lock:
+        channel = _instances.get(spec.name)
+        if channel is None:
+            module = importlib.import_module(f"{__name__}.{spec.module}")
+            channel = getattr(module, spec.class_name)()
+            _instances[spec.name] = channel
+    return channel
+
+
+def get_channel_spec(name: str) -> Optional[ChannelSpec]:
+    """Get a channel descriptor by name without importing the channel."""
+    return _SPECS_BY_NAME.get(name)
 
 
 def get_channel(name: str) -> Optional[Channel]:
     """Get a channel by name."""
-    for ch in ALL_CHANNELS:
-        if ch.name == name:
-            return ch
-    return None
+    spec = _SPECS_BY_NAME.get(name)
+    return spec.load() if spec is not None else None
+
+
+def get_channels(names: Iterable[str]) -> List[Channel]:
+    """Get a subset of channels, in registry order.
+
+    Raises ValueError listing every unknown name.
+    """
+    wanted = set(names)
+    unknown = sorted(wanted - _SPECS_BY_NAME.keys())
+    if unknown:
+        raise ValueError(f"unknown channel(s): {', '.join(unknown)}")
+    return [spec.load() for spec in CHANNEL_SPECS if spec.name in wanted]
 
 
 def get_all_channels() -> List[Channel]:
     """Get all registered channels."""
-    return ALL_CHANNELS
+    return [spec.load() for spec in CHANNEL_SPECS]
+
+
+def channel_for_url(url: str) -> Optional[Channel]:
+    """Route a URL to the first channel that handles it.
+
+    Domain-routed channels are matched on their descriptor, so only the
+    winning channel module gets imported.
+    """
+    from agent_reach.utils.url import host_matches
+
+    for spec in CHANNEL_SPECS:
+        if spec.domains:
+            if host_matches(url, *spec.domains):
+                return spec.load()
+        elif spec.load().can_handle(url):
+            return spec.load()
+    return None
+
+
+def __getattr__(name: str):
+    # ALL_CHANNELS predates the lazy registry; building it imports everything.
+    if name == "ALL_CHANNELS":
+        return get_all_channels()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
     "Channel",
+    "ChannelSpec",
+    "CHANNEL_SPECS",
     "ALL_CHANNELS",
+    "channel_for_url",
     "get_channel",
+    "get_channel_spec",
+    "get_channels",
     "get_all_channels",
 ]
@@ -3,7 +3,7 @@
 
 from agent_reach.utils.url import host_matches
 
-from .base import Channel
+from .base import Channel, CheckResult
 
 
 class OpenCLISiteChannel(Channel):
@@ -24,24 +24,23 @@ class OpenCLISiteChannel(Channel):
     def can_handle(self, url: str) -> bool:
         return host_matches(url, *self.domains)
 
-    def check(self, config=None):
+    def diagnose(self, config=None):
         from agent_reach.backends import opencli_status
 
-        self.active_backend = None
         st = opencli_status()
         if not st.installed:
-            return "off", (
+            return CheckResult("off", (
                 f"未安装 {self.description} 后端。安装：\n"
                 "  agent-reach install --system --channels opencli\n"
                 f"然后在 Chrome 里登录 {self.login_hint}"
-            )
+            ))
         if st.broken:
-            return "error", st.hint
+            return CheckResult("error", st.hint)
 
         if st.ready:
-            return "warn", (
+            return CheckResult("warn", (
                 f"OpenCLI 桥接已连接，但 {self.description} 的登录态和实际命令"
                 "未实时验证；Doctor 不执行平台命令，因此当前不标记为可用。"
                 f"需要时请先在 Chrome 里登录 {self.login_hint}"
-            )
-        return "warn", st.hint
+            ))
+        return CheckResult("warn", st.hint)
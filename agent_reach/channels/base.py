@@ -13,17 +13,85 @@ Backend routing semantics:
   - `backends` is an ORDERED candidate list: backends[0] is the preferred
     backend, the rest are fallbacks. "Switching backends" for a platform
     means reordering this list (or a user override) — not rewriting code.
-  - check() must set `self.active_backend` to the backend that is actually
-    serving the channel right now (None when nothing usable is found).
-    shutil.which() alone is NOT proof of health — a stale venv shim passes
-    which() but cannot execute (see agent_reach.probe). Channels should
-    really execute a lightweight command before claiming a backend active.
+  - diagnose() returns a CheckResult whose `active_backend` is the backend
+    that is actually serving the channel right now (None when nothing
+    usable is found). shutil.which() alone is NOT proof of health — a stale
+    venv shim passes which() but cannot execute (see agent_reach.probe).
+    Channels should really execute a lightweight command before claiming a
+    backend active.
   - Users can force a backend with config key `<channel>_backend`
     (or env var `<CHANNEL>_BACKEND`); ordered_backends() applies it.
+
+Re-entrancy: channels are registry singletons, so diagnose() must not write
+instance state. run_check() is the thread-safe entry point used by doctor
+and the MCP server; check() is the legacy tuple API kept as a thin shim.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class BackendProbe:
+    """What probing one backend candidate found.
+
+    status is "ok"/"warn"/"error", "unverified" for a network backend skipped
+    by offline mode, or "missing" for a candidate that is not installed / not
+    reachable and therefore did not compete.
+    """
+
+    backend: str
+    status: str
+    message: str = ""
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    """Immutable outcome of one channel health check."""
+
+    status: str                       # "ok" | "warn" | "off" | "error" | "unverified"
+    message: str
+    active_backend: Optional[str] = None
+    #: Per-candidate findings, in probe order. Only multi-backend channels
+    #: fill this in; single-backend channels leave it empty.
+    candidates: Tuple[BackendProbe, ...] = ()
+    #: Wall time of the check in seconds, filled in by run_check().
+    duration: float = 0.0
+
+    def as_tuple(self) -> Tuple[str, str]:
+        return self.status, self.message
+
+
+def select_backend(candidates: Sequence[BackendProbe]) -> Optional[CheckResult]:
+    """Two-phase backend choice shared by multi-backend channels.
+
+    The first "ok" candidate wins; without one, the first fixable ("warn")
+    candidate is reported so the user gets one actionable prescription, then
+    the first backend left "unverified" by offline mode. A
+    warn candidate earlier in the list must never hide a fully working one
+    later on, so all candidates are collected before choosing. When only
+    broken candidates remain their messages are joined into one error.
+    Returns None when no candidate is installed at all.
+    """
+    findings = [c for c in candidates if c.status != "missing"]
+    for wanted in ("ok", "warn", "unverified"):
+        for chosen in findings:
+            if chosen.status == wanted:
+                return CheckResult(
+                    chosen.status,
+                    chosen.message,
+                    active_backend=chosen.backend if wanted == "ok" else None,
+                    candidates=tuple(candidates),
+                )
+    if findings:
+        return CheckResult(
+            "error",
+            "\n".join(c.message for c in findings),
+            candidates=tuple(candidates),
+        )
+    return None
 
 
 class Channel(ABC):
@@ -34,7 +102,8 @@ class Channel(ABC):
     backends: List[str] = []          # ordered candidates — backends[0] = preferred
     tier: int = 0                     # 0=zero-config, 1=needs free key, 2=needs setup
 
-    #: Backend currently serving this channel; set by check(), None = unavailable.
+    #: Legacy mirror of the last check()'s active backend (None = unavailable).
+    #: Not thread-safe — concurrent callers should read CheckResult instead.
     active_backend: Optional[str] = None
 
     @abstractmethod
@@ -58,13 +127,29 @@ class Channel(ABC):
                     break
         return candidates
 
-    def check(self, config=None) -> Tuple[str, str]:
+    def diagnose(self, config=None) -> CheckResult:
         """
         Check if this channel's upstream tool is available.
-        Returns (status, message) where status is 'ok'/'warn'/'off'/'error'.
 
         Subclasses with external backends must really probe them (see
-        agent_reach.probe.probe_command) and set self.active_backend.
+        agent_reach.probe.probe_command) and report the serving backend in
+        CheckResult.active_backend. Must not mutate the instance.
         """
-        self.active_backend = self.backends[0] if self.backends else "内置"
-        return "ok", f"{'、'.join(self.backends) if self.backends else '内置'}"
+        return CheckResult(
+            "ok",
+            f"{'、'.join(self.backends) if self.backends else '内置'}",
+            active_backend=self.backends[0] if self.backends else "内置",
+        )
+
+    def run_check(self, config=None) -> CheckResult:
+        """Re-entrant, timed health check. Safe to call from many threads."""
+        started = time.perf_counter()
+        result = self.diagnose(config)
+        return replace(result, duration=time.perf_counter() - started)
+
+    def check(self, config=None) -> Tuple[str, str]:
+        """Legacy API: returns (status, message) with status in
+        'ok'/'warn'/'off'/'error', and mirrors active_backend onto self."""
+        result = self.run_check(config)
+        self.active_backend = result.active_backend
+        return result.as_tuple()
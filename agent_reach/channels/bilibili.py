@@ -9,12 +9,12 @@ OpenCLI covers subtitles through the browser session. yt-dlp remains the
 YouTube backend; it just no longer serves bilibili.
 """
 
-import json
-import urllib.request
+from dataclasses import replace
 
-from agent_reach.probe import probe_command
+from agent_reach import http_client, timings
+from agent_reach.probe import OFFLINE_UNVERIFIED, is_offline, probe_command
 
-from .base import Channel
+from .base import BackendProbe, Channel, CheckResult, select_backend
 
 _UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
 _TIMEOUT = 10
@@ -23,13 +23,17 @@ _SEARCH_API = "https://api.bilibili.com/x/web-interface/search/all/v2?keyword=te
 
 def _search_api_ok() -> bool:
     """Return True if Bilibili search API responds with code 0."""
-    req = urllib.request.Request(_SEARCH_API, headers={"User-Agent": _UA})
-    try:
-        with urllib.request.urlopen(req, timeout=_TIMEOUT) as resp:
-            data = json.loads(resp.read())
-            return data.get("code") == 0
-    except Exception:
-        return False
+    with timings.timed(timings.HTTP, timings.http_label(_SEARCH_API)) as timing:
+        try:
+            data = http_client.get(
+                _SEARCH_API, headers={"User-Agent": _UA}, timeout=_TIMEOUT
+            ).json()
+        except Exception as exc:
+            timing.outcome = type(exc).__name__
+            return False
+        ok = data.get("code") == 0
+        timing.outcome = "ok" if ok else f"code={data.get('code')}"
+        return ok
 
 
 class BilibiliChannel(Channel):
@@ -43,41 +47,38 @@ class BilibiliChannel(Channel):
 
         return host_matches(url, "bilibili.com", "b23.tv")
 
-    def check(self, config=None):
+    def diagnose(self, config=None):
         """Probe candidates in order; first fully-usable backend wins."""
-        self.active_backend = None
-        findings = []
+        candidates = []
 
         for backend in self.ordered_backends(config):
             if backend == "bili-cli":
-                result = self._check_bili_cli()
+                found = self._check_bili_cli()
             elif backend == "OpenCLI":
-                result = self._check_opencli()
+                found = self._check_opencli()
             else:
-                result = self._check_search_api()
-            if result is None:
+                found = self._check_search_api()
+            if found is None:
+                candidates.append(BackendProbe(backend, "missing"))
                 continue
-            findings.append((backend, *result))
-
-        # 有后端断链时，即使别的候选兜底成功也要把处方带出来
-        broken_notes = [m for _, s, m in findings if s == "error"]
-
-        for wanted in ("ok", "warn"):
-            for backend, status, message in findings:
-                if status == wanted:
-                    self.active_backend = backend if status == "ok" else None
-                    if broken_notes:
-                        message += "\n[备选后端异常] " + "；".join(broken_notes)
-                    return status, message
-
-        if findings:
-            return "error", "\n".join(m for _, _, m in findings)
-
-        return "off", (
+            candidates.append(BackendProbe(backend, *found))
+
+        result = select_backend(candidates)
+        if result is not None:
+            # 有后端断链时，即使别的候选兜底成功也要把处方带出来
+            broken_notes = [c.message for c in candidates if c.status == "error"]
+            if broken_notes and result.status != "error":
+                result = replace(
+                    result,
+                    message=result.message + "\n[备选后端异常] " + "；".join(broken_notes),
+                )
+            return result
+
+        return CheckResult("off", (
             "没有可用的 B站后端（搜索 API 也不可达，可能是网络问题）。推荐：\n"
             "  pipx install bilibili-cli（搜索/热门/视频详情，无需登录）\n"
             "  或桌面装 OpenCLI（额外解锁字幕）：agent-reach install --system --channels opencli"
-        )
+        ), candidates=tuple(candidates))
 
     def _check_bili_cli(self):
         """bili-cli candidate. None = not installed."""
@@ -111,6 +112,8 @@ class BilibiliChannel(Channel):
 
     def _check_search_api(self):
         """Zero-dependency search API fallback. None = unreachable."""
+        if is_offline():
+            return "unverified", f"{OFFLINE_UNVERIFIED}（B站搜索 API）"
         if not _search_api_ok():
             return None
         return "ok", (
@@ -3,7 +3,7 @@
 
 import shutil
 
-from .base import Channel
+from .base import Channel, CheckResult
 from .mcporter import McporterConfigError, inspect_mcporter_config
 
 
@@ -16,29 +16,28 @@ class ExaSearchChannel(Channel):
     def can_handle(self, url: str) -> bool:
         return False  # Search-only channel
 
-    def check(self, config=None):
-        self.active_backend = None
+    def diagnose(self, config=None):
         if not shutil.which("mcporter"):
-            return "off", (
+            return CheckResult("off", (
                 "需要 mcporter + Exa MCP。安装：\n"
                 "  npm install -g mcporter\n"
                 "  mcporter config add exa https://mcp.exa.ai/mcp --scope home"
-            )
+            ))
         try:
             inspection = inspect_mcporter_config()
         except McporterConfigError as exc:
-            return "error", f"mcporter 配置检查失败：{exc}"
+            return CheckResult("error", f"mcporter 配置检查失败：{exc}")
         if "exa" in inspection.server_names:
-            return "warn", (
+            return CheckResult("warn", (
                 "Exa 已写入 mcporter 配置，但 Doctor 未启动远端服务做"
                 "连通验证，不能仅凭配置宣称可用。"
-            )
+            ))
         if inspection.imports_unchecked:
-            return "warn", (
+            return CheckResult("warn", (
                 "mcporter 本地配置未发现 Exa；配置还启用了 editor imports，"
                 "Doctor 为避免扩大凭据读取范围没有展开，当前未验证。"
-            )
-        return "off", (
+            ))
+        return CheckResult("off", (
             "mcporter 已装但 Exa 未配置。运行：\n"
             "  mcporter config add exa https://mcp.exa.ai/mcp --scope home"
-        )
+        ))
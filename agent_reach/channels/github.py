@@ -14,7 +14,7 @@ from agent_reach.utils.paths import (
     read_small_text_no_follow,
 )
 
-from .base import Channel
+from .base import Channel, CheckResult
 
 _MAX_HOSTS_BYTES = 1024 * 1024
 _GH_READ_ONLY_ENV = {
@@ -103,8 +103,7 @@ class GitHubChannel(Channel):
 
         return host_matches(url, "github.com")
 
-    def check(self, config=None):
-        self.active_backend = None
+    def diagnose(self, config=None):
         probe = probe_command(
             "gh",
             ["--version"],
@@ -113,33 +112,33 @@ class GitHubChannel(Channel):
             env=_GH_READ_ONLY_ENV,
         )
         if probe.status == "missing":
-            return "warn", "gh CLI 未安装。安装：https://cli.github.com"
+            return CheckResult("warn", "gh CLI 未安装。安装：https://cli.github.com")
         if probe.status == "broken":
-            return "error", (
+            return CheckResult("error", (
                 "gh 命令存在但无法执行——安装已损坏。重装即可修复：\n"
                 "  brew reinstall gh\n"
                 "或从 https://cli.github.com 重新安装 gh CLI"
-            )
+            ))
         if not probe.ok:
             detail = probe.hint or probe.status
-            return "error", f"gh CLI 版本检查失败：{detail}"
+            return CheckResult("error", f"gh CLI 版本检查失败：{detail}")
 
         try:
             configured = _explicit_github_credentials(
                 config
             ) or _saved_github_host_configured()
         except GitHubConfigError as exc:
-            return "warn", (
+            return CheckResult("warn", (
                 f"gh CLI 可执行，但认证配置无法安全确认：{exc}。"
                 "Doctor 不执行会写 device-id 的 `gh auth status`，当前未验证。"
-            )
+            ))
 
         if configured:
-            return "warn", (
+            return CheckResult("warn", (
                 "gh CLI 可执行，且检测到显式认证配置；Doctor 不执行会写"
                 " device-id 的 `gh auth status`，因此未实时验证，未标记为可用。"
-            )
-        return "warn", (
+            ))
+        return CheckResult("warn", (
             "gh CLI 可执行，但未检测到显式认证配置。运行 `gh auth login` "
             "完成登录；Doctor 不会自动执行 `gh auth status`。"
-        )
+        ))
@@ -7,6 +7,8 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 
+from agent_reach import timings
+from agent_reach.probe import shared_probe
 from agent_reach.utils.paths import (
     PrivatePathError,
     read_small_text_no_follow,
@@ -41,7 +43,29 @@ def inspect_mcporter_config(
     names. Only exact ``mcpServers`` keys are returned. Editor imports are
     deliberately not opened because Doctor must not expand its
     credential-read boundary.
+
+    Exa, LinkedIn and XiaoHongShu all inspect the same layers, so the result
+    is shared across channels within one doctor run.
     """
+    root = os.path.abspath(os.fspath(root_dir or Path.cwd()))
+    key = (
+        "mcporter-config",
+        root,
+        os.environ.get("MCPORTER_CONFIG", ""),
+        os.fspath(Path.home()),
+    )
+    return shared_probe(key, lambda: _timed_inspect_config_layers(root))
+
+
+def _timed_inspect_config_layers(root_dir: str) -> McporterConfigInspection:
+    with timings.timed(timings.CONFIG, "mcporter config") as timing:
+        inspection = _inspect_config_layers(root_dir)
+        if inspection.source is None:
+            timing.outcome = "absent"
+        return inspection
+
+
+def _inspect_config_layers(root_dir: str) -> McporterConfigInspection:
     selected_layers = _select_config_layers(root_dir)
     if not selected_layers:
         return McporterConfigInspection(frozenset(), None)
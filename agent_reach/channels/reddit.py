@@ -19,7 +19,7 @@ from agent_reach.utils.paths import (
     read_small_text_no_follow,
 )
 
-from .base import Channel
+from .base import BackendProbe, Channel, CheckResult, select_backend
 
 _CREDENTIAL_FILE = "~/.config/rdt-cli/credential.json"
 _CREDENTIAL_TTL_SECONDS = 7 * 86400
@@ -38,30 +38,25 @@ class RedditChannel(Channel):
 
         return host_matches(url, "reddit.com", "redd.it")
 
-    def check(self, config=None):
+    def diagnose(self, config=None):
         """Probe candidates in order; first fully-usable backend wins."""
-        self.active_backend = None
-        findings = []
+        candidates = []
 
         for backend in self.ordered_backends(config):
             if backend == "OpenCLI":
-                result = self._check_opencli()
+                found = self._check_opencli()
             else:
-                result = self._check_rdt()
-            if result is None:
+                found = self._check_rdt()
+            if found is None:
+                candidates.append(BackendProbe(backend, "missing"))
                 continue
-            findings.append((backend, *result))
+            candidates.append(BackendProbe(backend, *found))
 
-        for wanted in ("ok", "warn"):
-            for backend, status, message in findings:
-                if status == wanted:
-                    self.active_backend = backend if status == "ok" else None
-                    return status, message
+        result = select_backend(candidates)
+        if result is not None:
+            return result
 
-        if findings:
-            return "error", "\n".join(m for _, _, m in findings)
-
-        return "off", (
+        return CheckResult("off", (
             "未安装任何 Reddit 后端。注意：Reddit 没有零配置路径"
             "（匿名 .json 已被封，官方 API 需人工审批），必须用登录态。推荐：\n"
             "  桌面：agent-reach install --system --channels opencli\n"
@@ -69,7 +64,7 @@ class RedditChannel(Channel):
             f"  服务器/存量：pipx install '{_RDT_GIT_SOURCE}'\n"
             "       然后 `rdt login` 或手动写入 Cookie（见 doctor 提示）\n"
             "中国大陆访问 Reddit 需要代理"
-        )
+        ), candidates=tuple(candidates))
 
     def _check_opencli(self):
         """OpenCLI candidate. None = not installed."""
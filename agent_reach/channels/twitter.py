@@ -6,7 +6,7 @@ import shutil
 
 from agent_reach.utils.url import host_matches
 
-from .base import Channel
+from .base import BackendProbe, Channel, CheckResult, select_backend
 
 
 def twitter_cli_child_env(config=None) -> dict[str, str]:
@@ -40,45 +40,41 @@ class TwitterChannel(Channel):
     def can_handle(self, url: str) -> bool:
         return host_matches(url, "x.com", "twitter.com")
 
-    def check(self, config=None):
+    def diagnose(self, config=None):
         """Probe candidates in order; first fully-usable backend wins.
 
         与其他多后端渠道同一套两段式：先收集全部候选状态，第一个 ok 获胜；
         没有 ok 才轮到第一个 warn——否则「装了但未登录」的 twitter-cli
         会把排在后面、完整可用的 OpenCLI 挡在门外。
         """
-        self.active_backend = None
-        findings = []
+        candidates = []
 
         for backend in self.ordered_backends(config):
             if backend == "twitter-cli":
-                result = self._check_twitter_cli(config)
+                found = self._check_twitter_cli(config)
             elif backend == "OpenCLI":
-                result = self._check_opencli()
+                found = self._check_opencli()
             elif backend == "bird CLI (legacy)":
-                result = self._check_bird()
+                found = self._check_bird()
             else:
                 continue
 
-            if result is None:
-                continue  # 未安装——不参与候选
-            findings.append((backend, *result))
-
-        for wanted in ("ok", "warn"):
-            for backend, status, message in findings:
-                if status == wanted:
-                    self.active_backend = backend if status == "ok" else None
-                    return status, message
+            if found is None:
+                candidates.append(BackendProbe(backend, "missing"))  # 未安装——不参与候选
+                continue
+            candidates.append(BackendProbe(backend, *found))
 
-        if findings:  # 只剩 broken/timeout 候选
-            return "error", "\n".join(m for _, _, m in findings)
+        # 只剩 broken/timeout 候选时 select_backend 汇总为 error
+        result = select_backend(candidates)
+        if result is not None:
+            return result
 
-        return "warn", (
+        return CheckResult("warn", (
             "Twitter CLI 未安装。安装方式：\n"
             "  pipx install twitter-cli\n"
             "或：\n"
             "  uv tool install twitter-cli"
-        )
+        ), candidates=tuple(candidates))
 
     def _check_twitter_cli(self, config=None):
         """Inspect explicit credentials without starting twitter-cli.
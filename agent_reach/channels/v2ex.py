@@ -1,24 +1,65 @@
 # -*- coding: utf-8 -*-
-"""V2EX — public API channel for topics, nodes, users, and replies."""
+"""V2EX — public API channel for topics, nodes, users, and replies.
 
+Some networks reset Python's TLS handshake with V2EX (an unexpected EOF)
+while the OS curl gets through. Once that fallback has been needed the
+channel sticks to curl for _STICKY_CURL_SECONDS — in this process and, when
+``~/.agent-reach`` exists, in ``cache/v2ex_transport.json`` for other
+processes — instead of paying for a failed handshake on every request. In
+that mode several URLs requested together share one curl invocation.
+"""
+
+import contextvars
 import json
+import math
 import shutil
 import ssl
 import subprocess
-import urllib.request
-from typing import Any
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Sequence
 from urllib.parse import quote, urlencode, urlsplit
 
+from agent_reach import http_client, ratelimit, response_cache, timings, v2ex_index
+from agent_reach.probe import OFFLINE_UNVERIFIED, is_offline
+from agent_reach.utils.paths import (
+    PrivatePathError,
+    atomic_write_private_text,
+    read_small_text_no_follow,
+)
 from agent_reach.utils.process import utf8_subprocess_env
 from agent_reach.utils.text import scrub_url_credentials
 
-from .base import Channel
+from .base import Channel, CheckResult
 
 _UA = "agent-reach/1.0"
 _TIMEOUT = 10
 _MAX_RESPONSE_BYTES = 1024 * 1024
 _API_BASE = "https://www.v2ex.com"
 
+#: V2EX serves topic replies 100 per page.
+_REPLIES_PER_PAGE = 100
+
+#: Default cap on the replies get_topic() returns; every page is one request
+#: against the V2EX rate limit (120 per hour).
+DEFAULT_MAX_REPLIES = 500
+
+#: Requests get_topic() keeps in flight at once.
+_MAX_PARALLEL_PAGES = 4
+
+#: How long curl stays the transport after Python's TLS stack hit the EOF.
+_STICKY_CURL_SECONDS = 6 * 3600
+
+#: URLs fetched by one pipelined curl invocation.
+_MAX_CURL_BATCH = 20
+
+_TRANSPORT_FILE_NAME = "v2ex_transport.json"
+_sticky_until = 0.0
+_transport_lock = threading.Lock()
+
 
 def _v2ex_url(path: str, **params: Any) -> str:
     """Build a V2EX URL without letting caller values alter its query."""
@@ -43,15 +84,21 @@ def _validate_api_url(url: str) -> None:
         raise ValueError("only the V2EX HTTPS API is allowed")
 
 
-def _get_json_with_urllib(url: str) -> Any:
-    """Fetch JSON with Python's standard HTTP stack."""
+def _get_json_pooled(url: str, *, rate_limit: bool = True) -> Any:
+    """Fetch JSON over the shared pooled HTTP client."""
     _validate_api_url(url)
-    req = urllib.request.Request(url, headers={"User-Agent": _UA})
-    with urllib.request.urlopen(req, timeout=_TIMEOUT) as resp:
-        raw = resp.read(_MAX_RESPONSE_BYTES + 1)
-    if len(raw) > _MAX_RESPONSE_BYTES:
-        raise ValueError("V2EX API response exceeds the 1 MiB safety limit")
-    return json.loads(raw.decode("utf-8"))
+    try:
+        resp = http_client.get(
+            url,
+            headers={"User-Agent": _UA},
+            timeout=_TIMEOUT,
+            max_bytes=_MAX_RESPONSE_BYTES,
+            revalidate=True,
+            rate_limit=rate_limit,
+        )
+    except http_client.ResponseTooLarge:
+        raise ValueError("V2EX API response exceeds the 1 MiB safety limit") from None
+    return json.loads(resp.content.decode("utf-8"))
 
 
 def _is_unexpected_tls_eof(error: BaseException) -> bool:
@@ -76,20 +123,18 @@ def _is_unexpected_tls_eof(error: BaseException) -> bool:
             getattr(current, "reason", None),
             current.__cause__,
             current.__context__,
+            *current.args,  # requests/urllib3 wrap the ssl error as an argument
         ):
             if isinstance(nested, BaseException):
                 pending.append(nested)
     return False
 
 
-def _get_json_with_curl(url: str) -> Any:
-    """Fetch bounded JSON with the OS curl TLS stack."""
-    _validate_api_url(url)
+def _curl_command() -> List[str]:
     curl = shutil.which("curl")
     if not curl:
         raise RuntimeError("curl is unavailable for the V2EX TLS fallback")
-
-    command = [
+    return [
         curl,
         "--fail",
         "--silent",
@@ -104,9 +149,13 @@ def _get_json_with_curl(url: str) -> Any:
         str(_MAX_RESPONSE_BYTES),
         "--header",
         f"User-Agent: {_UA}",
-        "--url",
-        url,
     ]
+
+
+def _get_json_with_curl(url: str) -> Any:
+    """Fetch bounded JSON with the OS curl TLS stack."""
+    _validate_api_url(url)
+    command = _curl_command() + ["--url", url]
     try:
         result = subprocess.run(
             command,
@@ -125,16 +174,330 @@ def _get_json_with_curl(url: str) -> Any:
     return json.loads(result.stdout)
 
 
+def _get_json_many_with_curl(urls: Sequence[str]) -> List[Any]:
+    """Fetch several URLs with one curl process, reusing its TLS connection.
+
+    Returns one entry per URL, in order: the decoded JSON, or the exception
+    that URL failed with. Only a curl that cannot run at all raises.
+    """
+    for url in urls:
+        _validate_api_url(url)
+    command = _curl_command() + ["--write-out", "%{http_code}\n"]
+    with tempfile.TemporaryDirectory(prefix="agent-reach-v2ex-") as tmp:
+        outputs = [Path(tmp) / f"{index}.json" for index in range(len(urls))]
+        for url, output in zip(urls, outputs):
+            command += ["--url", url, "--output", str(output)]
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=_TIMEOUT * len(urls) + 2,
+                env=utf8_subprocess_env(),
+            )
+        except (OSError, subprocess.TimeoutExpired) as exc:
+            raise RuntimeError("curl could not complete the V2EX TLS fallback") from exc
+        statuses = result.stdout.split()
+        values: List[Any] = []
+        for index, output in enumerate(outputs):
+            status = statuses[index] if index < len(statuses) else "000"
+            if status != "200" or not output.is_file():
+                values.append(RuntimeError(f"curl could not fetch the V2EX API (HTTP {status})"))
+                continue
+            if output.stat().st_size > _MAX_RESPONSE_BYTES:
+                values.append(ValueError("V2EX API response exceeds the 1 MiB safety limit"))
+                continue
+            try:
+                values.append(json.loads(output.read_text(encoding="utf-8")))
+            except ValueError as exc:
+                values.append(exc)
+    return values
+
+
+def _transport_path() -> Path:
+    from agent_reach.config import Config
+
+    return Config.CONFIG_DIR / "cache" / _TRANSPORT_FILE_NAME
+
+
+def _curl_preferred() -> bool:
+    """Whether a recent TLS EOF made curl this machine's V2EX transport."""
+    global _sticky_until
+    now = time.time()
+    if _sticky_until > now:
+        return True
+    try:
+        raw = read_small_text_no_follow(_transport_path(), max_bytes=4096)
+        state = json.loads(raw) if raw else {}
+    except (OSError, PrivatePathError, UnicodeError, ValueError):
+        return False
+    if not isinstance(state, dict) or state.get("transport") != "curl":
+        return False
+    until = state.get("until")
+    if not isinstance(until, (int, float)):
+        return False
+    if not now < until <= now + _STICKY_CURL_SECONDS:
+        return False
+    _sticky_until = until
+    return True
+
+
+def _remember_transport(curl: bool) -> None:
+    """Record (or clear) the sticky curl transport. Best effort."""
+    global _sticky_until
+    with _transport_lock:
+        _sticky_until = time.time() + _STICKY_CURL_SECONDS if curl else 0.0
+        target = _transport_path()
+        # Never create ~/.agent-reach from a read-only command.
+        if not target.parent.parent.is_dir():
+            return
+        try:
+            if curl:
+                atomic_write_private_text(
+                    target, json.dumps({"transport": "curl", "until": _sticky_until})
+                )
+            elif target.is_file():
+                target.unlink()
+        except (OSError, PrivatePathError):
+            pass
+
+
 def _get_json(url: str) -> Any:
-    """Fetch JSON, retrying only Python's known TLS EOF via native curl."""
+    """Fetch JSON, retrying only Python's known TLS EOF via native curl.
+
+    After such a fallback, curl is used first until the sticky window ends;
+    if curl itself then fails the pooled client is tried again on the same
+    rate-limit token, and its success switches the channel back.
+    """
+    with timings.timed(timings.HTTP, timings.http_label(url)) as timing:
+        sticky = _curl_preferred()
+        if sticky:
+            _validate_api_url(url)
+            ratelimit.acquire(urlsplit(url).hostname)
+            try:
+                data = _get_json_with_curl(url)
+            except RuntimeError:
+                pass  # curl broke or the host is down; let Python's stack decide
+            else:
+                timing.outcome = "ok (curl)"
+                return data
+        try:
+            # In sticky mode curl failed and its token is reused here.
+            data = _get_json_pooled(url, rate_limit=not sticky)
+        except Exception as exc:
+            if isinstance(exc, ssl.SSLCertVerificationError):
+                raise
+            if not _is_unexpected_tls_eof(exc):
+                raise
+            data = _get_json_with_curl(url)
+            _remember_transport(curl=True)
+            timing.outcome = "ok (curl fallback)"
+            return data
+        if sticky:
+            _remember_transport(curl=False)
+        return data
+
+
+def _get_json_many(urls: Sequence[str]) -> List[Any]:
+    """_get_json() for several URLs: one entry per URL, the value or its exception.
+
+    In sticky curl mode the URLs are pipelined through one curl process per
+    _MAX_CURL_BATCH; otherwise they are fetched _MAX_PARALLEL_PAGES at a time.
+    """
+    urls = list(urls)
+    if len(urls) > 1 and _curl_preferred():
+        values: List[Any] = []
+        for start in range(0, len(urls), _MAX_CURL_BATCH):
+            batch = urls[start:start + _MAX_CURL_BATCH]
+            label = f"{timings.http_label(batch[0])} (+{len(batch) - 1})"
+            with timings.timed(timings.HTTP, label) as timing:
+                # A URL refused by validation or the rate limiter fails alone;
+                # only the ones that got a token go to curl.
+                fetched: List[Any] = []
+                ready: List[int] = []
+                for index, url in enumerate(batch):
+                    try:
+                        _validate_api_url(url)
+                        ratelimit.acquire(urlsplit(url).hostname)
+                    except Exception as exc:  # noqa: BLE001 — reported per URL
+                        fetched.append(exc)
+                    else:
+                        fetched.append(None)
+                        ready.append(index)
+                if ready:
+                    try:
+                        results = _get_json_many_with_curl([batch[i] for i in ready])
+                    except RuntimeError as exc:
+                        results = [exc] * len(ready)
+                    for index, value in zip(ready, results):
+                        fetched[index] = value
+                failed = sum(isinstance(value, Exception) for value in fetched)
+                timing.outcome = f"{failed} failed (curl)" if failed else "ok (curl)"
+                values += fetched
+        return values
+
+    def fetch(url: str) -> Any:
+        try:
+            return _get_json(url)
+        except Exception as exc:  # noqa: BLE001 — reported per URL
+            return exc
+
+    if len(urls) <= 1:
+        return [fetch(url) for url in urls]
+    with ThreadPoolExecutor(
+        max_workers=_MAX_PARALLEL_PAGES, thread_name_prefix="agent-reach-v2ex"
+    ) as pool:
+        futures = [_submit(pool, fetch, url) for url in urls]
+        return [future.result() for future in futures]
+
+
+def _get_cached_json(policy: str, url: str) -> Any:
+    """_get_json() through the shared response cache (public API, no credentials)."""
+    return response_cache.cached(policy, url, lambda: _get_json(url))
+
+
+def _get_cached_json_many(policy: str, urls: Sequence[str]) -> List[Any]:
+    """_get_json_many() through the shared response cache; only misses are fetched."""
+    return response_cache.cached_many(policy, urls, _get_json_many)
+
+
+def _submit(pool: ThreadPoolExecutor, fn: Callable, *args: Any) -> Future:
+    """Run ``fn`` in ``pool`` with the caller's context (timings, cache mode)."""
+    return pool.submit(contextvars.copy_context().run, fn, *args)
+
+
+def _reply_page(topic_id: Any, page: int) -> Optional[list]:
+    """One page of a topic's replies, or None when it could not be fetched."""
+    try:
+        data = _get_cached_json(
+            "v2ex.replies",
+            _v2ex_url("/api/replies/show.json", topic_id=topic_id, page=page),
+        )
+    except Exception:
+        return None
+    return data if isinstance(data, list) else []
+
+
+def _reply_pages(topic_id: Any, pages: Sequence[int]) -> List[Optional[list]]:
+    """Several reply pages at once (pipelined in curl mode); None marks a failed page."""
+    urls = [
+        _v2ex_url("/api/replies/show.json", topic_id=topic_id, page=page) for page in pages
+    ]
+    return [
+        None if isinstance(data, Exception) else (data if isinstance(data, list) else [])
+        for data in _get_cached_json_many("v2ex.replies", urls)
+    ]
+
+
+def _merge_reply_pages(pages: List[Optional[list]]) -> list:
+    """Concatenate reply pages in order, up to the first failed page.
+
+    Replies already seen (by id) are skipped, so an API that ignores
+    ``page`` and returns the whole thread each time does not duplicate them.
+    """
+    merged: list = []
+    seen: set = set()
+    for page in pages:
+        if page is None:
+            break
+        for reply in page:
+            reply_id = reply.get("id") if isinstance(reply, dict) else None
+            if reply_id is not None:
+                if reply_id in seen:
+                    continue
+                seen.add(reply_id)
+            merged.append(reply)
+    return merged
+
+
+def _topic_record(item: dict, node_name: str = "") -> dict:
+    """Compact listing record for one topic from the topics API."""
+    node = item.get("node") or {}
+    content = item.get("content", "") or ""
+    return {
+        "id": item.get("id", 0),
+        "title": item.get("title", ""),
+        "url": item.get("url", ""),
+        "replies": item.get("replies", 0),
+        "node_name": node.get("name", node_name),
+        "node_title": node.get("title", ""),
+        "content": content[:200],
+        "created": item.get("created", 0),
+    }
+
+
+def _reply_record(reply: dict) -> dict:
+    return {
+        "author": (reply.get("member") or {}).get("username", ""),
+        "content": reply.get("content", ""),
+        "created": reply.get("created", 0),
+    }
+
+
+def _iter_pages(
+    policy: str,
+    url_for_page: Callable[[int], str],
+    *,
+    page_size: Optional[int] = None,
+    read_ahead: bool = False,
+    max_pages: Optional[int] = None,
+) -> Iterator[list]:
+    """Yield pages 1, 2, ... of a paged list API until it runs out.
+
+    The listing ends at an empty page, a page shorter than ``page_size``, or
+    a page with nothing new since the previous one (an API that ignores
+    ``page`` would otherwise repeat page 1 forever), or after ``max_pages``.
+    Only the previous page is kept, so memory does not grow with depth.
+    """
+
+    def fetch(page: int) -> list:
+        data = _get_cached_json(policy, url_for_page(page))
+        return [item for item in data if isinstance(item, dict)] if isinstance(data, list) else []
+
+    pool = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-reach-v2ex")
+        if read_ahead
+        else None
+    )
     try:
-        return _get_json_with_urllib(url)
-    except Exception as exc:
-        if isinstance(exc, ssl.SSLCertVerificationError):
-            raise
-        if not _is_unexpected_tls_eof(exc):
-            raise
-        return _get_json_with_curl(url)
+        page = 1
+        pending = _submit(pool, fetch, page) if pool else None
+        previous_ids: set = set()
+        while True:
+            items = pending.result() if pending is not None else fetch(page)
+            fresh = [item for item in items if item.get("id") not in previous_ids]
+            if not fresh:
+                return
+            last = (page_size is not None and len(items) < page_size) or page == max_pages
+            pending = _submit(pool, fetch, page + 1) if pool and not last else None
+            yield fresh
+            if last:
+                return
+            previous_ids = {item.get("id") for item in items}
+            page += 1
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _recorded(pages: Iterator[list], record: Callable[[list], None]) -> Iterator[list]:
+    """Pass pages through, handing each to ``record`` (the local index) first."""
+    for page in pages:
+        record(page)
+        yield page
+
+
+def _take(records: Iterator[dict], max_items: Optional[int]) -> Iterator[dict]:
+    if max_items is None:
+        yield from records
+        return
+    if max_items == 0:
+        return
+    for count, record in enumerate(records, 1):
+        yield record
+        if count >= max_items:
+            return
 
 
 class V2EXChannel(Channel):
@@ -156,19 +519,25 @@ class V2EXChannel(Channel):
     # Health check
     # ------------------------------------------------------------------ #
 
-    def check(self, config=None):
+    def diagnose(self, config=None):
+        if is_offline():
+            return CheckResult(
+                "unverified", f"{OFFLINE_UNVERIFIED}（公开 API，无需本地配置）"
+            )
         try:
             _get_json(
                 "https://www.v2ex.com/api/topics/show.json?node_name=python&page=1"
             )
-            self.active_backend = self.backends[0]
-            return "ok", "公开 API 可用（热门主题、节点浏览、主题详情、用户信息）"
         except Exception as e:
-            self.active_backend = None
-            return (
+            return CheckResult(
                 "warn",
                 f"V2EX API 连接失败（可能需要代理）：{scrub_url_credentials(e)}",
             )
+        return CheckResult(
+            "ok",
+            "公开 API 可用（热门主题、节点浏览、主题详情、用户信息）",
+            active_backend=self.backends[0],
+        )
 
     # ------------------------------------------------------------------ #
     # Data-fetching methods
@@ -180,24 +549,9 @@ class V2EXChannel(Channel):
         Returns a list of dicts with keys:
           title, url, replies, node_name, node_title, content
         """
-        data = _get_json("https://www.v2ex.com/api/topics/hot.json")
-        results = []
-        for item in data[:limit]:
-            node = item.get("node") or {}
-            content = item.get("content", "") or ""
-            results.append(
-                {
-                    "id": item.get("id", 0),
-                    "title": item.get("title", ""),
-                    "url": item.get("url", ""),
-                    "replies": item.get("replies", 0),
-                    "node_name": node.get("name", ""),
-                    "node_title": node.get("title", ""),
-                    "content": content[:200],
-                    "created": item.get("created", 0),
-                }
-            )
-        return results
+        data = _get_cached_json("v2ex.hot_topics", "https://www.v2ex.com/api/topics/hot.json")
+        v2ex_index.record_topics(data)
+        return [_topic_record(item) for item in data[:limit]]
 
     def get_node_topics(self, node_name: str, limit: int = 20) -> list:
         """获取指定节点的最新帖子。
@@ -209,72 +563,115 @@ class V2EXChannel(Channel):
         Returns a list of dicts with keys:
           title, url, replies, node_name, node_title, content
         """
-        url = _v2ex_url(
-            "/api/topics/show.json",
-            node_name=node_name,
-            page=1,
+        return list(self.iter_node_topics(node_name, max_items=limit))
+
+    def iter_node_topics(
+        self,
+        node_name: str,
+        max_items: Optional[int] = None,
+        read_ahead: bool = False,
+        max_pages: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """逐页遍历节点帖子（最新在前），边取边产出，适合深度抓取。
+
+        Pages are requested only as the caller consumes them, so memory stays
+        at about one page however deep the crawl goes. With ``read_ahead``
+        the next page is fetched in the background while the current one is
+        being consumed (that page may be wasted if the caller stops early).
+        A failing page raises; the records already yielded stay valid.
+
+        Args:
+            node_name: 节点名称，如 "python"
+            max_items: 最多产出条数（None = 直到最后一页）
+            read_ahead: 是否在后台预取下一页
+            max_pages: 最多请求的页数（None = 不限）
+
+        Yields dicts with the same keys as get_node_topics().
+        """
+        if max_items is not None and max_items < 0:
+            raise ValueError("max_items must be non-negative")
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        pages = _iter_pages(
+            "v2ex.node_topics",
+            lambda page: _v2ex_url("/api/topics/show.json", node_name=node_name, page=page),
+            read_ahead=read_ahead,
+            max_pages=max_pages,
         )
-        data = _get_json(url)
-        results = []
-        for item in data[:limit]:
-            node = item.get("node") or {}
-            content = item.get("content", "") or ""
-            results.append(
-                {
-                    "id": item.get("id", 0),
-                    "title": item.get("title", ""),
-                    "url": item.get("url", ""),
-                    "replies": item.get("replies", 0),
-                    "node_name": node.get("name", node_name),
-                    "node_title": node.get("title", ""),
-                    "content": content[:200],
-                    "created": item.get("created", 0),
-                }
-            )
-        return results
+        pages = _recorded(pages, lambda page: v2ex_index.record_topics(page, node_name))
+        yield from _take(
+            (_topic_record(item, node_name) for page in pages for item in page), max_items
+        )
+
+    def iter_replies(
+        self, topic_id: int, max_items: Optional[int] = None, read_ahead: bool = False
+    ) -> Iterator[dict]:
+        """按楼层顺序逐页遍历帖子回复，边取边产出。
 
-    def get_topic(self, topic_id: int) -> dict:
-        """获取单个帖子详情和回复列表。
+        Same paging behaviour as iter_node_topics(); the last page is
+        recognised by holding fewer than 100 replies, so no empty page is
+        requested after it.
+
+        Yields dicts with keys: author, content, created
+        """
+        if max_items is not None and max_items < 0:
+            raise ValueError("max_items must be non-negative")
+        pages = _iter_pages(
+            "v2ex.replies",
+            lambda page: _v2ex_url("/api/replies/show.json", topic_id=topic_id, page=page),
+            page_size=_REPLIES_PER_PAGE,
+            read_ahead=read_ahead,
+        )
+        pages = _recorded(pages, lambda page: v2ex_index.record_replies(topic_id, page))
+        yield from _take((_reply_record(r) for page in pages for r in page), max_items)
+
+    def get_topic(self, topic_id: int, max_replies: int = DEFAULT_MAX_REPLIES) -> dict:
+        """获取单个帖子详情和回复列表（全部回复页，最多 max_replies 条）。
+
+        The topic and the first reply page are requested together; once the
+        topic's reply count is known the remaining pages are fetched in
+        parallel (at most _MAX_PARALLEL_PAGES at a time), so a long thread
+        takes about two round trips. Replies keep thread order. A reply page
+        that fails ends the list there; the topic itself still comes back.
 
         Args:
-            topic_id: 帖子 ID（从 URL https://www.v2ex.com/t/<id> 中获取）
+            topic_id:    帖子 ID（从 URL https://www.v2ex.com/t/<id> 中获取）
+            max_replies: 最多返回的回复条数（0 = 不取回复）
 
         Returns a dict with keys:
           id, title, url, content, replies_count, node_name, node_title,
           author, created, replies (list of dicts with: author, content, created)
         """
-        topic_data = _get_json(
-            _v2ex_url("/api/topics/show.json", id=topic_id)
-        )
-        # API returns a list even for single-ID queries
-        if isinstance(topic_data, list):
-            topic = topic_data[0] if topic_data else {}
-        else:
-            topic = topic_data
+        if max_replies < 0:
+            raise ValueError("max_replies must be non-negative")
+        page_cap = math.ceil(max_replies / _REPLIES_PER_PAGE)
+        with ThreadPoolExecutor(
+            max_workers=_MAX_PARALLEL_PAGES, thread_name_prefix="agent-reach-v2ex"
+        ) as pool:
+            topic_url = _v2ex_url("/api/topics/show.json", id=topic_id)
+            topic_future = _submit(pool, _get_cached_json, "v2ex.topic", topic_url)
+            page_futures = [_submit(pool, _reply_page, topic_id, 1)] if page_cap else []
+            topic_data = topic_future.result()
+            # API returns a list even for single-ID queries
+            if isinstance(topic_data, list):
+                topic = topic_data[0] if topic_data else {}
+            else:
+                topic = topic_data
+            try:
+                count = int(topic.get("replies") or 0)
+            except (TypeError, ValueError):
+                count = 0
+            pages = min(page_cap, math.ceil(count / _REPLIES_PER_PAGE))
+            later_pages = _reply_pages(topic_id, range(2, pages + 1))
+            replies_raw = _merge_reply_pages([f.result() for f in page_futures] + later_pages)
 
         node = topic.get("node") or {}
         member = topic.get("member") or {}
 
-        # Fetch replies (first page)
-        try:
-            replies_raw = _get_json(
-                _v2ex_url(
-                    "/api/replies/show.json",
-                    topic_id=topic_id,
-                    page=1,
-                )
-            )
-        except Exception:
-            replies_raw = []
-
-        replies = [
-            {
-                "author": (r.get("member") or {}).get("username", ""),
-                "content": r.get("content", ""),
-                "created": r.get("created", 0),
-            }
-            for r in (replies_raw or [])
-        ]
+        if topic:
+            v2ex_index.record_topics([topic])
+            v2ex_index.record_replies(topic.get("id", topic_id), replies_raw[:max_replies])
+        replies = [_reply_record(r) for r in replies_raw[:max_replies]]
 
         return {
             "id": topic.get("id", topic_id),
@@ -302,8 +699,8 @@ class V2EXChannel(Channel):
           id, username, url, website, twitter, psn, github, btc,
           location, bio, avatar, created
         """
-        data = _get_json(
-            _v2ex_url("/api/members/show.json", username=username)
+        data = _get_cached_json(
+            "v2ex.user", _v2ex_url("/api/members/show.json", username=username)
         )
         return {
             "id": data.get("id", 0),
@@ -324,24 +721,30 @@ class V2EXChannel(Channel):
         }
 
     def search(self, query: str, limit: int = 10) -> list:
-        """搜索帖子。
-
-        注意：V2EX 公开 API 暂不支持全文搜索端点（/api/search.json 不可用）。
-        本方法通过 Jina Reader 代理 V2EX 站内搜索页面获取结果（纯文本，无结构化数据）。
+        """搜索帖子与回复（本地全文索引）。
 
-        如需精确搜索，建议直接访问 https://www.v2ex.com/?q=<query> 或
-        使用 Exa channel 的 site:v2ex.com 搜索。
+        V2EX 公开 API 不提供搜索端点，本方法查询本机的 SQLite FTS5 索引
+        （agent_reach.v2ex_index）：用 `agent-reach v2ex-backfill <节点>` 抓取节点，
+        或在 config.yaml 设置 ``v2ex_index: true`` 收录之后浏览过的帖子。
+        结果按相关度排序，不发网络请求。
 
         Returns:
-            list of dicts with keys: title, url, snippet
-            如果搜索不可用，返回包含单条 {"error": str} 的列表。
+            list of dicts with keys: title, url, snippet, kind, topic_id,
+            node_name, author, created, score
+            索引为空时，返回包含单条 {"error": str} 的列表。
         """
+        index = v2ex_index.get_index()
+        results = index.search(query, limit)
+        if results or index.count():
+            return results
         search_url = _v2ex_url("/", q=query)
         return [
             {
                 "error": (
-                    "V2EX 公开 API 不提供搜索端点。"
-                    f"建议改用：{search_url} "
+                    "V2EX 公开 API 不提供搜索端点，本地索引也还是空的。"
+                    "运行 agent-reach v2ex-backfill <节点名> 建立索引，"
+                    "或在 config.yaml 设置 v2ex_index: true 收录浏览过的帖子；"
+                    f"也可以改用：{search_url} "
                     "或通过 Exa channel 使用 site:v2ex.com 搜索。"
                 )
             }
@@ -1,11 +1,10 @@
 # -*- coding: utf-8 -*-
 """Web — any URL via Jina Reader. Always available."""
 
-import urllib.request
-
+from agent_reach import http_client, response_cache
 from agent_reach.utils.url import normalize_public_http_url
 
-from .base import Channel
+from .base import Channel, CheckResult
 
 _UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
 _MAX_RESPONSE_BYTES = 5 * 1024 * 1024
@@ -40,25 +39,34 @@ class WebChannel(Channel):
     def can_handle(self, url: str) -> bool:
         return True  # Fallback — handles any URL
 
-    def check(self, config=None):
+    def diagnose(self, config=None):
         # 恒可用兜底渠道：无本地命令、不做网络探测（doctor 已有多个渠道触网），保持零开销
-        self.active_backend = self.backends[0]
-        return "ok", "通过 Jina Reader 读取任意网页（curl https://r.jina.ai/URL）"
+        return CheckResult(
+            "ok",
+            "通过 Jina Reader 读取任意网页（curl https://r.jina.ai/URL）",
+            active_backend=self.backends[0],
+        )
 
     def read(self, url: str) -> str:
-        """通过 Jina Reader 读取网页，返回 Markdown 全文。"""
+        """通过 Jina Reader 读取网页，返回 Markdown 全文（结果按 response_cache 策略缓存）。"""
         url = normalize_public_http_url(url)
         jina_url = f"https://r.jina.ai/{url}"
-        req = urllib.request.Request(
-            jina_url,
-            headers={"User-Agent": _UA, "Accept": "text/plain"},
-        )
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            body = resp.read(_MAX_RESPONSE_BYTES + 1)
-        if len(body) > _MAX_RESPONSE_BYTES:
+        return response_cache.cached("web.read", jina_url, lambda: self._fetch(jina_url))
+
+    @staticmethod
+    def _fetch(jina_url: str) -> str:
+        try:
+            body = http_client.get(
+                jina_url,
+                headers={"User-Agent": _UA, "Accept": "text/plain"},
+                timeout=30,
+                max_bytes=_MAX_RESPONSE_BYTES,
+                revalidate=True,
+            ).content
+        except http_client.ResponseTooLarge:
             raise ValueError(
                 f"Jina Reader response exceeds {_MAX_RESPONSE_BYTES} byte limit"
-            )
+            ) from None
         if _is_antibot_page(body):
             raise RuntimeError(
                 "Jina Reader 返回了反爬验证页，未获取到目标内容；"
@@ -12,22 +12,24 @@ xhs-cli (upstream unmaintained since
 import json
 import shutil
 import time
-import urllib.error
-import urllib.request
 from pathlib import Path
 
+from agent_reach import http_client
+from agent_reach.probe import OFFLINE_UNVERIFIED, is_offline
 from agent_reach.utils.paths import (
     PrivatePathError,
     read_small_text_no_follow,
 )
 
-from .base import Channel
+from .base import BackendProbe, Channel, CheckResult, select_backend
 from .mcporter import McporterConfigError, inspect_mcporter_config
+from .xhs_format import format_xhs_result  # noqa: F401 — historical import path
 
 _MCP_ENDPOINT = "http://localhost:18060/mcp"
 _MCP_INSTALL_URL = "https://github.com/xpzouying/xiaohongshu-mcp"
 _XHS_COOKIE_TTL_SECONDS = 7 * 86400
 _MAX_XHS_COOKIE_BYTES = 1024 * 1024
+_MAX_MCP_PROBE_BYTES = 64 * 1024
 
 
 def _mcp_service_reachable(timeout: int = 3) -> bool:
@@ -37,126 +39,22 @@ def _mcp_service_reachable(timeout: int = 3) -> bool:
     we only care that the service is up. Proxies are bypassed explicitly:
     localhost must never be routed through HTTP_PROXY.
     """
-    req = urllib.request.Request(_MCP_ENDPOINT, method="GET")
-    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
     try:
-        opener.open(req, timeout=timeout)
+        # 405/404 etc. still mean the service is alive
+        http_client.get(
+            _MCP_ENDPOINT,
+            timeout=timeout,
+            direct=True,
+            raise_for_status=False,
+            max_bytes=_MAX_MCP_PROBE_BYTES,
+        )
+        return True
+    except http_client.ResponseTooLarge:
         return True
-    except urllib.error.HTTPError:
-        return True  # 405/404 etc. — service is alive
     except Exception:
         return False
 
 
-def format_xhs_result(data):
-    """Clean XHS API response, keeping only useful fields.
-
-    Handles both single note objects and lists of notes (search results).
-    Drastically reduces token usage by stripping structural redundancy (#134).
-    """
-    if isinstance(data, list):
-        return [_clean_note(item) for item in data]
-    if isinstance(data, dict):
-        # Handle search_feeds wrapper: {"items": [...]} or {"data": {"items": [...]}}
-        items = None
-        if "items" in data:
-            items = data["items"]
-        elif "data" in data and isinstance(data.get("data"), dict):
-            items = data["data"].get("items") or data["data"].get("notes")
-        if items and isinstance(items, list):
-            return [_clean_note(item) for item in items]
-        # Single note
-        return _clean_note(data)
-    return data
-
-
-def _clean_note(note):
-    """Extract useful fields from a single XHS note/feed item."""
-    if not isinstance(note, dict):
-        return note
-
-    # Some responses nest the note under "note_card" or "note"
-    inner = note.get("note_card") or note.get("note") or note
-
-    result = {}
-
-    # Basic info
-    for key in ("id", "note_id", "xsec_token", "title", "desc", "type", "time"):
-        if key in inner:
-            result[key] = inner[key]
-
-    # Content (may be in desc or content)
-    if "content" in inner and "desc" not in result:
-        result["content"] = inner["content"]
-
-    # Author
-    user = inner.get("user") or inner.get("author")
-    if isinstance(user, dict):
-        result["user"] = {
-            k: user[k] for k in ("nickname", "user_id", "nick_name") if k in user
-        }
-
-    # Engagement metrics
-    interact = inner.get("interact_info") or inner.get("note_interact_info") or {}
-    if isinstance(interact, dict):
-        for key in ("liked_count", "collected_count", "comment_count", "share_count"):
-            if key in interact:
-                result[key] = interact[key]
-    # Also check top-level (some API formats)
-    for key in ("liked_count", "collected_count", "comment_count", "share_count"):
-        if key in inner and key not in result:
-            result[key] = inner[key]
-
-    # Images — just URLs
-    images = inner.get("image_list") or inner.get("images_list") or []
-    if isinstance(images, list):
-        urls = []
-        for img in images:
-            if isinstance(img, dict):
-                url = img.get("url") or img.get("url_default") or img.get("original")
-                if url:
-                    urls.append(url)
-            elif isinstance(img, str):
-                urls.append(img)
-        if urls:
-            result["images"] = urls
-
-    # Tags
-    tags = inner.get("tag_list") or inner.get("tags") or []
-    if isinstance(tags, list):
-        tag_names = []
-        for t in tags:
-            if isinstance(t, dict) and "name" in t:
-                tag_names.append(t["name"])
-            elif isinstance(t, str):
-                tag_names.append(t)
-        if tag_names:
-            result["tags"] = tag_names
-
-    # Comments (if present, e.g. from get_feed_detail with comments)
-    comments = inner.get("comments") or []
-    if isinstance(comments, list) and comments:
-        result["comments"] = [_clean_comment(c) for c in comments]
-
-    return result
-
-
-def _clean_comment(comment):
-    """Extract useful fields from a comment."""
-    if not isinstance(comment, dict):
-        return comment
-    result = {}
-    if "content" in comment:
-        result["content"] = comment["content"]
-    user = comment.get("user_info") or comment.get("user")
-    if isinstance(user, dict):
-        result["user"] = user.get("nickname") or user.get("nick_name", "")
-    for key in ("like_count", "sub_comment_count"):
-        if key in comment:
-            result[key] = comment[key]
-    return result
-
-
 class XiaoHongShuChannel(Channel):
     name = "xiaohongshu"
     description = "小红书笔记"
@@ -168,44 +66,40 @@ class XiaoHongShuChannel(Channel):
 
         return host_matches(url, "xiaohongshu.com", "xhslink.com")
 
-    def check(self, config=None):
+    def diagnose(self, config=None):
         """Probe candidates in order; first fully-usable backend wins.
 
         If none is fully usable, the first fixable candidate (warn) is
         reported, so the user gets one actionable prescription instead
         of three half-relevant ones.
         """
-        self.active_backend = None
-        findings = []  # (backend, status, message)
+        candidates = []
 
         for backend in self.ordered_backends(config):
             if backend == "OpenCLI":
-                result = self._check_opencli()
+                found = self._check_opencli()
             elif backend == "xiaohongshu-mcp":
-                result = self._check_mcp()
+                found = self._check_mcp()
             else:
-                result = self._check_xhs_cli()
-            if result is None:
-                continue  # not installed — not a candidate right now
-            findings.append((backend, *result))
-
-        for wanted in ("ok", "warn"):
-            for backend, status, message in findings:
-                if status == wanted:
-                    self.active_backend = backend if status == "ok" else None
-                    return status, message
-
-        if findings:  # only broken candidates left
-            return "error", "\n".join(m for _, _, m in findings)
-
-        return "off", (
+                found = self._check_xhs_cli()
+            if found is None:
+                # not installed — not a candidate right now
+                candidates.append(BackendProbe(backend, "missing"))
+                continue
+            candidates.append(BackendProbe(backend, *found))
+
+        result = select_backend(candidates)
+        if result is not None:
+            return result
+
+        return CheckResult("off", (
             "未安装任何小红书后端。推荐：\n"
             "  桌面：agent-reach install --system --channels opencli\n"
             "       （复用 Chrome 登录态，刷过小红书即零配置可用）\n"
             f"  服务器：xiaohongshu-mcp：{_MCP_INSTALL_URL}\n"
             "       登录只使用 Cookie-Editor 明确导出：\n"
             "       agent-reach configure xhs-cookies（隐藏输入）"
-        )
+        ), candidates=tuple(candidates))
 
     def _check_opencli(self):
         """OpenCLI candidate. None = not installed."""
@@ -225,6 +119,8 @@ class XiaoHongShuChannel(Channel):
 
     def _check_mcp(self):
         """xiaohongshu-mcp candidate. None = service not running."""
+        if is_offline():
+            return "unverified", f"{OFFLINE_UNVERIFIED}（xiaohongshu-mcp 本地服务）"
         if not _mcp_service_reachable():
             return None
         if not shutil.which("mcporter"):
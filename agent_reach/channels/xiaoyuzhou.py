@@ -6,7 +6,7 @@ import os
 from agent_reach.config import Config
 from agent_reach.probe import probe_command
 
-from .base import Channel
+from .base import Channel, CheckResult
 
 
 class XiaoyuzhouChannel(Channel):
@@ -20,31 +20,29 @@ class XiaoyuzhouChannel(Channel):
 
         return host_matches(url, "xiaoyuzhoufm.com")
 
-    def check(self, config=None):
-        self.active_backend = None
-
+    def diagnose(self, config=None):
         # Check ffmpeg — really execute it: a stale pip-installed ffmpeg shim
         # passes shutil.which() but cannot run
         probe = probe_command("ffmpeg", ["-version"], timeout=10, package="ffmpeg")
         if probe.status == "missing":
-            return "off", (
+            return CheckResult("off", (
                 "需要 ffmpeg（音频转码和切片）。安装：\n"
                 "  Ubuntu/Debian: apt install -y ffmpeg\n"
                 "  macOS: brew install ffmpeg"
-            )
+            ))
         if not probe.ok:
-            return "error", (
+            return CheckResult("error", (
                 "ffmpeg 无法执行，重装：brew install ffmpeg（macOS）/ apt install ffmpeg（Linux）"
-            )
+            ))
 
         # Check script exists
         script = os.path.expanduser("~/.agent-reach/tools/xiaoyuzhou/transcribe.sh")
         if not os.path.isfile(script):
-            return "off", (
+            return CheckResult("off", (
                 "转录脚本未安装。运行：\n"
                 "  agent-reach install --env=auto --system --channels=xiaoyuzhou\n"
                 "  或手动复制 transcribe.sh 到 ~/.agent-reach/tools/xiaoyuzhou/"
-            )
+            ))
 
         # Check GROQ_API_KEY — prefer env var, fall back to Agent Reach config
         has_key = bool(os.environ.get("GROQ_API_KEY"))
@@ -55,11 +53,12 @@ class XiaoyuzhouChannel(Channel):
             except Exception:
                 has_key = False
         if not has_key:
-            return "warn", (
+            return CheckResult("warn", (
                 "需要配置 Groq API Key（免费）。步骤：\n"
                 "  1. 注册 https://console.groq.com\n"
                 "  2. 运行: agent-reach configure groq-key（隐藏输入）"
-            )
+            ))
 
-        self.active_backend = "groq-whisper"
-        return "ok", "完整可用（播客下载 + Whisper 转录）"
+        return CheckResult(
+            "ok", "完整可用（播客下载 + Whisper 转录）", active_backend="groq-whisper"
+        )
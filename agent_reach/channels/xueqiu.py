@@ -5,10 +5,12 @@ import http.cookiejar
 import json
 import re
 import urllib.parse
-import urllib.request
 from typing import Any
 
-from .base import Channel
+from agent_reach import http_client, response_cache, timings
+from agent_reach.probe import OFFLINE_UNVERIFIED, is_offline
+
+from .base import Channel, CheckResult
 
 _UA = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -22,9 +24,6 @@ _XUEQIU_HOME = "https://xueqiu.com"
 # --------------- cookie-aware HTTP helpers --------------- #
 
 _cookie_jar = http.cookiejar.CookieJar()
-_opener = urllib.request.build_opener(
-    urllib.request.HTTPCookieProcessor(_cookie_jar),
-)
 _cookies_initialized = False
 
 
@@ -88,19 +87,43 @@ def _ensure_cookies(config=None) -> None:
     # Fallback: visit homepage to pick up acw_tc anti-DDoS cookie.
     # This is not sufficient for authenticated APIs but avoids hard failures
     # on public endpoints that only need the session cookie.
-    req = urllib.request.Request(_XUEQIU_HOME, headers={"User-Agent": _UA})
-    _opener.open(req, timeout=_TIMEOUT)
+    with timings.timed(timings.HTTP, timings.http_label(_XUEQIU_HOME)):
+        http_client.get(
+            _XUEQIU_HOME,
+            headers={"User-Agent": _UA},
+            cookie_jar=_cookie_jar,
+            timeout=_TIMEOUT,
+        )
     _cookies_initialized = True
 
 
 def _get_json(url: str, config=None) -> Any:
     """Fetch *url* with Xueqiu session cookies and return parsed JSON."""
     _ensure_cookies(config)
-    req = urllib.request.Request(
-        url, headers={"User-Agent": _UA, "Referer": _REFERER}
-    )
-    with _opener.open(req, timeout=_TIMEOUT) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    with timings.timed(timings.HTTP, timings.http_label(url)):
+        resp = http_client.get(
+            url,
+            headers={"User-Agent": _UA, "Referer": _REFERER},
+            cookie_jar=_cookie_jar,
+            timeout=_TIMEOUT,
+        )
+    return json.loads(resp.content.decode("utf-8"))
+
+
+def _cookie_identity(config=None) -> str:
+    """The account the requests run as: the configured cookie, or "" (anonymous)."""
+    try:
+        from ..config import Config
+
+        cfg = config if config is not None else Config(read_only=True)
+        return cfg.get("xueqiu_cookie") or ""
+    except Exception:
+        return ""
+
+
+def _get_cached_json(policy: str, url: str) -> Any:
+    """_get_json() through the shared response cache, never shared across accounts."""
+    return response_cache.cached(policy, url, lambda: _get_json(url), vary=_cookie_identity())
 
 
 def _strip_html(text: str) -> str:
@@ -130,8 +153,9 @@ class XueqiuChannel(Channel):
     # Health check
     # ------------------------------------------------------------------ #
 
-    def check(self, config=None):
-        self.active_backend = None
+    def diagnose(self, config=None):
+        if is_offline():
+            return self._diagnose_offline(config)
         try:
             data = _get_json(
                 "https://stock.xueqiu.com/v5/stock/quote.json"
@@ -140,19 +164,38 @@ class XueqiuChannel(Channel):
             )
             quote = (data.get("data") or {}).get("quote") or {}
             if quote:
-                self.active_backend = self.backends[0]
-                return "ok", "公开 API 可用（行情、搜索、热帖、热股）"
-            return "warn", "API 响应异常（返回数据为空）"
+                return CheckResult(
+                    "ok",
+                    "公开 API 可用（行情、搜索、热帖、热股）",
+                    active_backend=self.backends[0],
+                )
+            return CheckResult("warn", "API 响应异常（返回数据为空）")
         except Exception as e:
             from agent_reach.utils.text import scrub_url_credentials
 
             detail = scrub_url_credentials(e).rstrip(": ")
-            return "warn", (
+            return CheckResult("warn", (
                 f"Xueqiu API 连接失败：{detail}。"
                 "如需登录 Cookie，请运行：agent-reach configure "
                 "--from-browser chrome --platform xueqiu；"
                 "doctor 不会自动读取浏览器 Cookie。"
-            )
+            ))
+
+    def _diagnose_offline(self, config=None):
+        """Report only whether a login cookie is configured."""
+        try:
+            from ..config import Config
+
+            cfg = config if config is not None else Config(read_only=True)
+            has_cookie = bool(cfg.get("xueqiu_cookie"))
+        except Exception:
+            has_cookie = False
+        if has_cookie:
+            return CheckResult("unverified", f"{OFFLINE_UNVERIFIED}（已配置登录 Cookie）")
+        return CheckResult("unverified", (
+            f"{OFFLINE_UNVERIFIED}（未配置登录 Cookie，如需可运行："
+            "agent-reach configure --from-browser chrome --platform xueqiu）"
+        ))
 
     # ------------------------------------------------------------------ #
     # Data-fetching methods
@@ -170,7 +213,8 @@ class XueqiuChannel(Channel):
           pb, eps, timestamp
         """
         encoded_symbol = urllib.parse.quote(symbol, safe="")
-        data = _get_json(
+        data = _get_cached_json(
+            "xueqiu.stock_quote",
             "https://stock.xueqiu.com/v5/stock/quote.json"
             f"?symbol={encoded_symbol}&extend=detail"
         )
@@ -206,7 +250,8 @@ class XueqiuChannel(Channel):
         Returns a list of dicts with keys:
           symbol, name, exchange
         """
-        data = _get_json(
+        data = _get_cached_json(
+            "xueqiu.search_stock",
             f"https://xueqiu.com/stock/search.json"
             f"?code={urllib.parse.quote(query)}&size={limit}"
         )
@@ -240,7 +285,8 @@ class XueqiuChannel(Channel):
         limit = min(limit, 50)
         if limit == 0:
             return []
-        data = _get_json(
+        data = _get_cached_json(
+            "xueqiu.hot_posts",
             "https://xueqiu.com/v4/statuses/public_timeline_by_category.json"
             f"?since_id=-1&max_id=-1&count={limit}&category=-1"
         )
@@ -283,7 +329,8 @@ class XueqiuChannel(Channel):
         Returns a list of dicts with keys:
           symbol, name, current, percent, rank
         """
-        data = _get_json(
+        data = _get_cached_json(
+            "xueqiu.hot_stocks",
             f"https://stock.xueqiu.com/v5/stock/hot_stock/list.json"
             f"?size={limit}&type={stock_type}"
         )
@@ -12,7 +12,7 @@ from agent_reach.utils.paths import (
     render_ytdlp_fix_command,
 )
 
-from .base import Channel
+from .base import Channel, CheckResult
 
 _JS_RUNTIMES_SUPPORTED_FROM = (2025, 11, 12)
 _YTDLP_UPGRADE_COMMAND = 'python -m pip install -U "yt-dlp[default]"'
@@ -47,31 +47,28 @@ class YouTubeChannel(Channel):
 
         return host_matches(url, "youtube.com", "youtu.be")
 
-    def check(self, config=None):
+    def diagnose(self, config=None):
         # 真跑 yt-dlp --version 探活，区分未装 / venv 断链 / 跑不动
         probe = probe_command("yt-dlp", ["--version"], timeout=10, package="yt-dlp")
         if probe.status == "missing":
-            self.active_backend = None
-            return "off", f"yt-dlp 未安装。安装：{_YTDLP_UPGRADE_COMMAND}"
+            return CheckResult("off", f"yt-dlp 未安装。安装：{_YTDLP_UPGRADE_COMMAND}")
         if probe.status == "broken":
-            self.active_backend = None
-            return "error", (
+            return CheckResult("error", (
                 "yt-dlp 已安装但无法执行。重装（含 JS 支持）：\n"
                 f"  {_YTDLP_UPGRADE_COMMAND}\n{probe.hint}"
-            )
+            ))
         if not probe.ok:  # timeout / error：装了但跑不动
-            self.active_backend = None
             detail = probe.hint or probe.output or probe.status
-            return "error", f"yt-dlp 无法正常运行：{detail}"
+            return CheckResult("error", f"yt-dlp 无法正常运行：{detail}")
         # yt-dlp 本体是活的；后面的 JS runtime/转写检查只影响 ok/warn，不影响后端归属
-        self.active_backend = "yt-dlp"
+        active = "yt-dlp"
         # Check JS runtime
         has_js = shutil.which("deno") or shutil.which("node")
         if not has_js:
-            return "warn", (
+            return CheckResult("warn", (
                 "yt-dlp 已安装但缺少 JS runtime（YouTube 必须）。\n"
                 "  安装 Node.js 或 deno，然后运行：agent-reach install --system"
-            )
+            ), active_backend=active)
         # Check yt-dlp config for --js-runtimes
         # Deno works out of the box; Node.js requires explicit config
         has_deno = shutil.which("deno")
@@ -80,19 +77,19 @@ class YouTubeChannel(Channel):
             if not _has_js_runtime_config(ytdlp_config):
                 version = _parse_ytdlp_version(probe.output)
                 if version is None:
-                    return "warn", (
+                    return CheckResult("warn", (
                         "无法确认 yt-dlp 版本是否支持 JS runtime 配置。"
                         "请先升级并重新运行 doctor：\n"
                         f"  {_YTDLP_UPGRADE_COMMAND}"
-                    )
+                    ), active_backend=active)
                 if version < _JS_RUNTIMES_SUPPORTED_FROM:
-                    return "warn", (
+                    return CheckResult("warn", (
                         "yt-dlp 版本过旧，不支持 JS runtime 配置。请先升级并重新运行 doctor：\n"
                         f"  {_YTDLP_UPGRADE_COMMAND}"
-                    )
-                return "warn", (
+                    ), active_backend=active)
+                return CheckResult("warn", (
                     f"yt-dlp 已安装但未配置 JS runtime。运行：\n  {render_ytdlp_fix_command()}"
-                )
+                ), active_backend=active)
         # Surface transcription readiness so `doctor` reports it.
         msg = "可提取视频信息和字幕"
         if config is not None:
@@ -115,7 +112,7 @@ class YouTubeChannel(Channel):
                     )
                 else:
                     msg += f"，可转写音频（{'/'.join(providers)}）"
-        return "ok", msg
+        return CheckResult("ok", msg, active_backend=active)
 
     def transcribe(
         self,
@@ -124,18 +121,21 @@ class YouTubeChannel(Channel):
         provider: str = "auto",
         config=None,
         allow_provider_fallback: bool = False,
+        progress=None,
     ) -> str:
         """Download a YouTube video's audio and return its transcript.
 
         Delegates to :func:`agent_reach.transcribe.transcribe`. Imported lazily
         so the channel module stays cheap to import for users who never
-        transcribe.
+        transcribe. ``progress(done, total, message)`` is forwarded as-is.
         """
         from agent_reach.transcribe import transcribe as _transcribe
 
+        extra = {"progress": progress} if progress is not None else {}
         return _transcribe(
             url,
             provider=provider,
             config=config,
             allow_provider_fallback=allow_provider_fallback,
+            **extra,
         )
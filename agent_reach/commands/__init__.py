@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Subcommand implementations for the agent-reach CLI.
+
+agent_reach.cli only parses arguments; each command module here is imported
+when its subcommand is dispatched, so `agent-reach version` or
+`agent-reach doctor` never loads the installer or configure code.
+"""
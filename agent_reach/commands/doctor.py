@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""`agent-reach doctor` — channel health report."""
+
+import json
+
+
+def _split_channel_names(value: str) -> list:
+    return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+
+def _unknown_channel_names(value: str) -> list:
+    from agent_reach.channels import get_channel_spec
+
+    return [name for name in _split_channel_names(value) if get_channel_spec(name) is None]
+
+
+def _channel_subset(args):
+    """Channel names from --channels, or None for every channel."""
+    return _split_channel_names(getattr(args, "channels", "")) or None
+
+
+def _cmd_doctor(args=None):
+    from agent_reach.config import Config
+    from agent_reach.doctor import DEFAULT_DEADLINE, check_all, format_report
+    config = Config(read_only=True)
+    deadline = getattr(args, "deadline", None) or DEFAULT_DEADLINE
+    use_cache = not getattr(args, "no_cache", False)
+    offline = getattr(args, "offline", False)
+    results = check_all(
+        config,
+        deadline=deadline,
+        use_cache=use_cache,
+        offline=offline,
+        channels=_channel_subset(args),
+        record_history=True,
+    )
+
+    if args is not None and getattr(args, "json", False):
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    report = format_report(results, timings=getattr(args, "timings", False))
+    try:
+        from rich import print as rich_print
+    except ImportError:
+        print(report)
+    else:
+        rich_print(report)
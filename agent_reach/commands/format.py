@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""`agent-reach format` — clean up raw upstream JSON output."""
+
+import json
+import sys
+
+
+def _cmd_format(args):
+    """Clean and format platform API output from stdin."""
+
+    if args.platform == "xhs":
+        from agent_reach.channels.xhs_format import format_xhs_result
+
+        raw = sys.stdin.read().strip()
+        if not raw:
+            print("Error: no input on stdin", file=sys.stderr)
+            sys.exit(1)
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as e:
+            print(f"Error: invalid JSON: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        cleaned = format_xhs_result(data)
+        print(json.dumps(cleaned, ensure_ascii=False, indent=2))
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""`agent-reach history` — uptime, latency and flapping from past doctor runs."""
+
+import json
+import time
+
+from agent_reach.commands.doctor import _channel_subset
+
+
+def _cmd_history(args=None):
+    from agent_reach.history import FLAP_THRESHOLD, FLAP_WINDOW, HistoryStore
+
+    days = getattr(args, "days", None) or 7
+    since = time.time() - days * 24 * 3600
+    stats = HistoryStore().stats(_channel_subset(args), since=since)
+
+    if args is not None and getattr(args, "json", False):
+        payload = {key: s.as_dict() for key, s in stats.items()}
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        return
+
+    if not stats:
+        print(f"最近 {days:g} 天没有体检记录（运行 agent-reach doctor 或 watch 后会自动记录）")
+        return
+
+    print(f"最近 {days:g} 天的体检记录")
+    print("=" * 40)
+    width = max(len(key) for key in stats)
+    for key, s in sorted(stats.items()):
+        line = (
+            f"  {key:<{width}}  可用率 {s.uptime:6.2f}%  "
+            f"p50 {s.p50 or 0.0:.3f}s  p95 {s.p95 or 0.0:.3f}s  "
+            f"{s.checks} 次  最近：{s.last_status}"
+        )
+        if s.flapping:
+            line += "  [不稳定]"
+        print(line)
+    if any(s.flapping for s in stats.values()):
+        print()
+        print(f"[不稳定] = 最近 {FLAP_WINDOW} 次检查中状态切换 ≥ {FLAP_THRESHOLD} 次")
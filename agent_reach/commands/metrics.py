@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""`agent-reach metrics` — OpenMetrics text for Prometheus-style scrapers."""
+
+from agent_reach import __version__
+from agent_reach.commands.doctor import _channel_subset
+from agent_reach.commands.update import _github_get_with_retry, _is_newer_version
+
+
+def _fetch_update_state():
+    from agent_reach.metrics import UpdateState
+
+    resp, err, _attempts = _github_get_with_retry(
+        "https://api.github.com/repos/Panniantong/Agent-Reach/releases/latest",
+        timeout=10,
+        retries=1,
+    )
+    if err or not resp or resp.status_code != 200:
+        return UpdateState(latest=None, available=False)
+    latest = resp.json().get("tag_name", "").lstrip("v")
+    if not latest:
+        return UpdateState(latest=None, available=False)
+    return UpdateState(latest=latest, available=_is_newer_version(latest, __version__))
+
+
+def _make_handler(collector):
+    from http.server import BaseHTTPRequestHandler
+
+    from agent_reach.metrics import CONTENT_TYPE
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        server_version = f"agent-reach/{__version__}"
+
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            try:
+                body = collector.collect().encode("utf-8")
+            except Exception as exc:  # noqa: BLE001 — keep serving later scrapes
+                from agent_reach.utils.text import scrub_url_credentials
+
+                self.send_error(500, explain=scrub_url_credentials(exc))
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # noqa: A002 — stdlib signature
+            pass
+
+    return MetricsHandler
+
+
+def _cmd_metrics(args=None):
+    from agent_reach.metrics import DEFAULT_METRICS_INTERVAL, MetricsCollector
+
+    collector = MetricsCollector(
+        interval=getattr(args, "interval", None) or DEFAULT_METRICS_INTERVAL,
+        channels=_channel_subset(args),
+        use_cache=not getattr(args, "no_cache", False),
+        update_check=None if getattr(args, "no_update_check", False) else _fetch_update_state,
+    )
+    port = getattr(args, "serve", None)
+    if port is None:
+        print(collector.collect(), end="")
+        return
+
+    from http.server import ThreadingHTTPServer
+
+    host = getattr(args, "host", None) or "127.0.0.1"
+    server = ThreadingHTTPServer((host, port), _make_handler(collector))
+    server.daemon_threads = True
+    print(
+        f"Agent Reach metrics: http://{host}:{server.server_address[1]}/metrics"
+        f"（每 {collector.interval:g}s 最多体检一次，Ctrl+C 退出）",
+        flush=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
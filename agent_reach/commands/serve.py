@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""`agent-reach serve` — one local HTTP/JSON API shared by every agent on the host."""
+
+import sys
+
+
+def _cmd_serve(args=None):
+    from agent_reach.api_server import (
+        DEFAULT_CACHE_TTL,
+        DEFAULT_PORT,
+        DEFAULT_WORKERS,
+        AgentReachApi,
+        make_server,
+    )
+
+    cache_ttl = getattr(args, "cache_ttl", None)
+    no_cache = bool(getattr(args, "no_cache", False))
+    if no_cache:
+        cache_ttl = 0.0
+    api = AgentReachApi(
+        workers=getattr(args, "workers", None) or DEFAULT_WORKERS,
+        cache_ttl=DEFAULT_CACHE_TTL if cache_ttl is None else cache_ttl,
+        use_response_cache=not no_cache,
+    )
+    unix_socket = getattr(args, "unix", None)
+    host = getattr(args, "host", None) or "127.0.0.1"
+    port = getattr(args, "port", None)
+    try:
+        server = make_server(
+            api,
+            host=host,
+            port=DEFAULT_PORT if port is None else port,
+            unix_socket=unix_socket,
+        )
+    except (OSError, ValueError) as exc:
+        print(f"无法启动 API 服务：{exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if unix_socket:
+        where = f"unix:{unix_socket}"
+    else:
+        bound_port = server.server_address[1]
+        where = f"http://[{host}]:{bound_port}" if ":" in host else f"http://{host}:{bound_port}"
+    print(
+        f"Agent Reach API: {where}/v1/status（GET /v1/tools 查看可用工具，Ctrl+C 退出）",
+        flush=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if unix_socket:
+            import os
+
+            try:
+                os.unlink(unix_socket)
+            except OSError:
+                pass
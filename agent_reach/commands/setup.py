@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""`agent-reach setup` — interactive configuration wizard."""
+
+from agent_reach.commands.install import _RDT_GIT_SOURCE
+
+
+def _cmd_setup():
+    import getpass
+
+    from agent_reach.config import Config
+
+    config = Config()
+    print()
+    print("Agent Reach Setup")
+    print("=" * 40)
+    print()
+
+    # Step 1: Exa (via mcporter, no API key required)
+    import shutil
+    import subprocess
+
+    print("【推荐】全网搜索 — Exa（通过 mcporter）")
+    print("  免费，无需 API Key")
+
+    if not shutil.which("mcporter"):
+        print("  当前状态: -- mcporter 未安装")
+        print("  安装：npm install -g mcporter")
+        print("  然后：mcporter config add exa https://mcp.exa.ai/mcp --scope home")
+        print()
+    else:
+        try:
+            from agent_reach.channels.mcporter import (
+                McporterConfigError,
+                configured_server_names,
+            )
+
+            r = subprocess.run(
+                ["mcporter", "config", "list", "--json"],
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=10,
+            )
+            if r.returncode != 0:
+                raise McporterConfigError("mcporter 配置查询失败")
+            if "exa" in configured_server_names(r.stdout):
+                print("  当前状态: ✅ 已配置")
+            else:
+                print("  当前状态: -- 未配置")
+                setup_now = input("  现在自动配置 Exa 吗？[Y/n]: ").strip().lower()
+                if setup_now in ("", "y", "yes"):
+                    add_r = subprocess.run(
+                        [
+                            "mcporter",
+                            "config",
+                            "add",
+                            "exa",
+                            "https://mcp.exa.ai/mcp",
+                            "--scope",
+                            "home",
+                        ],
+                        capture_output=True, encoding="utf-8", errors="replace", timeout=10,
+                    )
+                    if add_r.returncode == 0:
+                        print("  ✅ Exa 已配置")
+                    else:
+                        print("  [!] 自动配置失败，请手动执行：")
+                        print("     mcporter config add exa https://mcp.exa.ai/mcp --scope home")
+        except Exception:
+            print("  [!] 无法检查 Exa 配置，请手动执行：")
+            print("     mcporter config add exa https://mcp.exa.ai/mcp --scope home")
+        print()
+
+    # Step 2: GitHub token
+    print("【可选】GitHub Token — 提高 API 限额")
+    print("  无 token: 60 次/小时 | 有 token: 5000 次/小时")
+    print("  获取: https://github.com/settings/tokens (无需任何权限)")
+    current = config.get("github_token")
+    if current:
+        print("  当前状态: ✅ 已配置")
+    else:
+        key = getpass.getpass("  GITHUB_TOKEN (回车跳过): ").strip()
+        if key:
+            config.set("github_token", key)
+            print("  ✅ GitHub API 已提升至 5000 次/小时！")
+        else:
+            print("  跳过。公开 API 也能用")
+    print()
+
+    # Step 3: Reddit — rdt-cli
+    print("【信息】Reddit — 必须登录态（无零配置路径）。桌面推荐 OpenCLI；或 rdt-cli：")
+    print(f"  安装：pipx install '{_RDT_GIT_SOURCE}'")
+    print("  然后运行：rdt login（需先在浏览器登录 reddit.com）")
+    print()
+
+    # Step 4: Groq (Whisper)
+    print("【可选】Groq API — 视频无字幕时的语音转文字")
+    print("  免费额度，注册: https://console.groq.com")
+    current = config.get("groq_api_key")
+    if current:
+        print("  当前状态: ✅ 已配置")
+    else:
+        key = getpass.getpass("  GROQ_API_KEY (回车跳过): ").strip()
+        if key:
+            config.set("groq_api_key", key)
+            print("  ✅ 语音转文字已开启！")
+        else:
+            print("  跳过")
+    print()
+
+    # Summary
+    print("=" * 40)
+    print(f"✅ 配置已保存到 {config.config_path}")
+    print("运行 agent-reach doctor 查看完整状态")
+    print()
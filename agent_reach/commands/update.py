@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""`agent-reach check-update` — release lookup against GitHub."""
+
+import time
+
+from agent_reach import __version__
+
+
+def _classify_update_error(exc):
+    """Classify update-check errors for user-friendly diagnostics."""
+    import requests
+
+    if isinstance(exc, requests.exceptions.Timeout):
+        return "timeout"
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        msg = str(exc).lower()
+        dns_markers = [
+            "name or service not known",
+            "temporary failure in name resolution",
+            "nodename nor servname",
+            "getaddrinfo failed",
+            "name resolution",
+            "dns",
+        ]
+        if any(marker in msg for marker in dns_markers):
+            return "dns"
+        return "connection"
+    if isinstance(exc, requests.exceptions.HTTPError):
+        return "http"
+    return "unknown"
+
+
+def _update_error_text(kind):
+    """Map internal error kinds to user-facing text."""
+    mapping = {
+        "timeout": "网络超时",
+        "dns": "DNS 解析失败",
+        "rate_limit": "GitHub API 速率限制",
+        "connection": "网络连接失败",
+        "server_error": "GitHub 服务暂时不可用",
+        "http": "HTTP 请求失败",
+        "unknown": "未知网络错误",
+    }
+    return mapping.get(kind, "请求失败")
+
+
+def _classify_github_response_error(resp):
+    """Classify non-200 GitHub responses that merit special handling."""
+    if resp is None:
+        return "unknown"
+    if resp.status_code == 429:
+        return "rate_limit"
+    if resp.status_code == 403:
+        remaining = resp.headers.get("X-RateLimit-Remaining", "")
+        if remaining == "0":
+            return "rate_limit"
+        try:
+            message = resp.json().get("message", "").lower()
+            if "rate limit" in message:
+                return "rate_limit"
+        except Exception:
+            pass
+    if 500 <= resp.status_code < 600:
+        return "server_error"
+    return None
+
+
+def _github_get_with_retry(url, timeout=10, retries=3, sleeper=time.sleep):
+    """GET GitHub API with retry/backoff and basic error classification.
+
+    Requests are conditional (ETag / Last-Modified), so unchanged releases
+    come back as 304s answered from the locally stored body.
+    """
+    import requests
+
+    from agent_reach import http_client
+    from agent_reach.breaker import CircuitOpen
+
+    for attempt in range(1, retries + 1):
+        try:
+            # Conditional: a 304 reuses the stored release and costs no rate limit.
+            resp = http_client.get(url, timeout=timeout, raise_for_status=False, revalidate=True)
+        except CircuitOpen:
+            # GitHub failed repeatedly just now; retrying would fail the same way.
+            return None, "connection", attempt
+        except requests.exceptions.RequestException as exc:
+            if attempt >= retries:
+                return None, _classify_update_error(exc), attempt
+            sleeper(2 ** (attempt - 1))
+            continue
+
+        err_kind = _classify_github_response_error(resp)
+        if err_kind in ("rate_limit", "server_error"):
+            if attempt >= retries:
+                return None, err_kind, attempt
+            delay = 2 ** (attempt - 1)
+            retry_after = resp.headers.get("Retry-After")
+            if err_kind == "rate_limit" and retry_after:
+                try:
+                    delay = max(delay, float(retry_after))
+                except Exception:
+                    pass
+            sleeper(delay)
+            continue
+
+        return resp, None, attempt
+
+    return None, "unknown", retries
+
+
+#: Full update = package + upstream tools + skill. The one-liner walks an
+#: agent through all three (docs/update.md); bare pip only updates the package.
+_UPDATE_INSTRUCTIONS = (
+    "更新方式（推荐，复制这句话给你的 AI Agent，会完整更新本体+上游工具+skill）：\n"
+    "  帮我更新 Agent Reach：https://raw.githubusercontent.com/Panniantong/agent-reach/main/docs/update.md\n"
+    "仅更新本体（不含上游工具和 skill）：\n"
+    "  pip install --upgrade https://github.com/Panniantong/agent-reach/archive/main.zip"
+)
+
+
+def _is_newer_version(remote: str, local: str) -> bool:
+    """True if remote is strictly newer than local (semantic compare).
+
+    A plain != would tell users "update available" when their local build is
+    AHEAD of the latest release (e.g. installed from main during a release
+    window) — and walk them into a downgrade.
+    """
+    def parse(v):
+        try:
+            return tuple(int(x) for x in v.strip().split("."))
+        except ValueError:
+            return None
+
+    remote_version, local_version = parse(remote), parse(local)
+    if remote_version is None or local_version is None:
+        return remote != local  # unparseable — fall back to old behavior
+    return remote_version > local_version
+
+
+def _cmd_check_update():
+    """Check for newer versions on GitHub."""
+
+    print(f"当前版本: v{__version__}")
+    release_url = "https://api.github.com/repos/Panniantong/Agent-Reach/releases/latest"
+    commit_url = "https://api.github.com/repos/Panniantong/Agent-Reach/commits/main"
+
+    # Fetch latest release with retry/backoff.
+    resp, err, attempts = _github_get_with_retry(release_url, timeout=10, retries=3)
+    if err:
+        print(f"[!] 无法检查更新（{_update_error_text(err)}，已重试 {attempts} 次）")
+        return "error"
+
+    if resp.status_code == 200:
+        data = resp.json()
+        latest = data.get("tag_name", "").lstrip("v")
+        body = data.get("body", "")
+
+        if latest and _is_newer_version(latest, __version__):
+            print(f"最新版本: v{latest} ← 有更新！")
+            if body:
+                print()
+                print("更新内容：")
+                # Show first 20 lines of release notes
+                for line in body.strip().split("\n")[:20]:
+                    print(f"  {line}")
+            print()
+            print(_UPDATE_INSTRUCTIONS)
+            return "update_available"
+        print("✅ 已是最新版本")
+        return "up_to_date"
+
+    release_err = _classify_github_response_error(resp)
+    if release_err == "rate_limit":
+        print("[!] 无法检查更新（GitHub API 速率限制，请稍后重试）")
+        return "error"
+
+    # No releases yet, fall back to latest main commit.
+    resp2, err2, attempts2 = _github_get_with_retry(commit_url, timeout=10, retries=2)
+    if err2:
+        print(f"[!] 无法检查更新（{_update_error_text(err2)}，已重试 {attempts + attempts2} 次）")
+        return "error"
+    if resp2.status_code == 200:
+        commit = resp2.json()
+        sha = commit.get("sha", "")[:7]
+        msg = commit.get("commit", {}).get("message", "").split("\n")[0]
+        date = commit.get("commit", {}).get("committer", {}).get("date", "")[:10]
+        print(f"最新提交: {sha} ({date}) {msg}")
+        print()
+        print(_UPDATE_INSTRUCTIONS)
+        return "unknown"
+
+    commit_err = _classify_github_response_error(resp2)
+    if commit_err == "rate_limit":
+        print("[!] 无法检查更新（GitHub API 速率限制，请稍后重试）")
+        return "error"
+
+    print(f"[!] 无法检查更新（GitHub 返回 {resp2.status_code}）")
+    return "error"
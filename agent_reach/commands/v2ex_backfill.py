@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""`agent-reach v2ex-backfill` — crawl V2EX nodes into the local search index."""
+
+import sys
+
+from agent_reach.commands.v2ex_watch import _split_nodes
+
+#: Topics crawled per node unless --max-topics says otherwise.
+DEFAULT_MAX_TOPICS = 200
+
+
+def _cmd_v2ex_backfill(args=None):
+    from agent_reach import ratelimit
+    from agent_reach.channels.v2ex import V2EXChannel
+    from agent_reach.config import Config
+    from agent_reach.utils.paths import PrivatePathError, make_private_dir
+    from agent_reach.utils.text import scrub_url_credentials
+    from agent_reach.v2ex_index import get_index, recording
+
+    nodes = _split_nodes(getattr(args, "nodes", None))
+    max_topics = getattr(args, "max_topics", None) or DEFAULT_MAX_TOPICS
+    with_replies = bool(getattr(args, "replies", False))
+    try:
+        make_private_dir(Config.CONFIG_DIR)  # an explicit write command may create it
+    except (OSError, PrivatePathError) as exc:
+        print(f"无法创建 {Config.CONFIG_DIR}：{exc}", file=sys.stderr)
+        sys.exit(1)
+
+    channel = V2EXChannel()
+    failed = False
+    # A bulk crawl outlasts the burst: wait for tokens instead of aborting.
+    with recording(), ratelimit.patient():
+        for node in nodes:
+            topics = replies = 0
+            try:
+                busy = []
+                for topic in channel.iter_node_topics(node, max_items=max_topics, read_ahead=True):
+                    topics += 1
+                    if topic.get("replies"):
+                        busy.append(topic["id"])
+                if with_replies:
+                    for topic_id in busy:
+                        replies += sum(1 for _ in channel.iter_replies(topic_id))
+            except Exception as exc:  # noqa: BLE001 — keep what was indexed, go on
+                failed = True
+                print(
+                    f"[!] {node}：抓取中断（已收录 {topics} 个主题、{replies} 条回复）："
+                    f"{scrub_url_credentials(exc)}",
+                    file=sys.stderr,
+                    flush=True,
+                )
+                continue
+            suffix = f"、{replies} 条回复" if with_replies else ""
+            print(f"{node}：已收录 {topics} 个主题{suffix}", flush=True)
+
+    index = get_index()
+    print(f"本地索引共 {index.count()} 条（{index.path}）")
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""`agent-reach v2ex-watch` — new and changed topics of V2EX nodes as NDJSON."""
+
+import sys
+import time
+
+
+def _split_nodes(values) -> list:
+    return [node.strip() for value in values or () for node in value.split(",") if node.strip()]
+
+
+def _cmd_v2ex_watch(args=None):
+    from agent_reach import ratelimit
+    from agent_reach.v2ex_watch import NodeWatcher
+
+    watcher = NodeWatcher(
+        _split_nodes(getattr(args, "nodes", None)),
+        include_existing=bool(getattr(args, "include_existing", False)),
+    )
+    if not watcher.path.parent.is_dir():
+        print(
+            "[!] ~/.agent-reach 不存在，进度只保存在本进程内存中；"
+            "每次启动都会重新建立基线",
+            file=sys.stderr,
+            flush=True,
+        )
+    # A long-running poller is paced by the rate limiter instead of failing.
+    with ratelimit.patient():
+        _run(watcher, once=bool(getattr(args, "once", False)))
+
+
+def _run(watcher, *, once=False, sleep=time.sleep, max_polls=None):
+    """Print each poll's events as NDJSON on stdout and failures on stderr.
+
+    Sleeps until the next node is due. ``once`` polls the due nodes a single
+    time (for cron); ``max_polls`` bounds the loop for tests.
+    """
+    from agent_reach.v2ex_watch import to_ndjson
+
+    polls = 0
+    try:
+        while True:
+            for event in watcher.poll():
+                print(to_ndjson(event), flush=True)
+            for node, error in sorted(watcher.errors.items()):
+                print(f"[!] V2EX 节点 {node} 拉取失败：{error}", file=sys.stderr, flush=True)
+            polls += 1
+            if once or (max_polls is not None and polls >= max_polls):
+                return
+            sleep(max(1.0, watcher.seconds_until_due()))
+    except KeyboardInterrupt:
+        return
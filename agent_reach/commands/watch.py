@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""`agent-reach watch` — quick health + update check for scheduled tasks.
+
+``--daemon`` keeps the process resident instead: channels are re-checked
+only when their local inputs change (see agent_reach.watcher), and only
+status transitions are printed.
+"""
+
+import time
+
+from agent_reach import __version__
+from agent_reach.commands.doctor import _channel_subset
+from agent_reach.commands.update import _github_get_with_retry, _is_newer_version
+
+#: Default seconds between two input polls in --daemon mode.
+DEFAULT_DAEMON_INTERVAL = 60
+
+#: The daemon asks GitHub for a new release at most this often.
+_UPDATE_CHECK_INTERVAL = 24 * 3600
+
+_STATUS_LABELS = {
+    "ok": "正常",
+    "warn": "警告",
+    "off": "未启用",
+    "error": "错误",
+    "unverified": "未验证",
+    "timeout": "超时",
+}
+
+
+def _latest_release():
+    """Return (version, release notes) when a newer release exists, else None."""
+    resp, err, _attempts = _github_get_with_retry(
+        "https://api.github.com/repos/Panniantong/Agent-Reach/releases/latest",
+        timeout=10,
+        retries=2,
+    )
+    if not err and resp and resp.status_code == 200:
+        data = resp.json()
+        latest = data.get("tag_name", "").lstrip("v")
+        if latest and _is_newer_version(latest, __version__):
+            return latest, data.get("body", "")
+    return None
+
+
+def _cmd_watch(args=None):
+    """Quick health check + update check, designed for scheduled tasks.
+
+    Only outputs problems. If everything is fine, outputs a single line.
+    """
+    if getattr(args, "daemon", False):
+        _run_daemon(args)
+        return
+
+    from agent_reach.config import Config
+    from agent_reach.doctor import check_all
+    from agent_reach.history import FLAP_WINDOW, HistoryStore, is_flapping
+
+    config = Config(read_only=True)
+    issues = []
+    recovered = []
+    unstable = []
+
+    # Statuses from earlier runs, read before this run gets recorded
+    previous = HistoryStore().recent_by_channel(FLAP_WINDOW)
+
+    # Check channels
+    use_cache = not getattr(args, "no_cache", False)
+    results = check_all(
+        config, use_cache=use_cache, channels=_channel_subset(args), record_history=True
+    )
+    ok = sum(1 for r in results.values() if r["status"] == "ok")
+    total = len(results)
+
+    for key, r in results.items():
+        before = previous.get(key, [])
+        if is_flapping([r["status"], *before][:FLAP_WINDOW]):
+            # Intermittently failing backend: one alert per flip is noise.
+            if r["status"] != "ok":
+                unstable.append(r["name"])
+            continue
+        if r["status"] == "ok":
+            if before and before[0] != "ok":
+                recovered.append(r["name"])
+            continue
+        # Were working, now broken
+        note = "（上次检查时正常）" if before and before[0] == "ok" else ""
+        if r["status"] in ("off", "error"):
+            issues.append(f"[X] {r['name']}：{r['message']}{note}")
+        elif r["status"] in ("warn", "timeout"):
+            issues.append(f"[!] {r['name']}：{r['message']}{note}")
+
+    # Check for updates
+    release = _latest_release()
+    update_available = release is not None
+    new_version, release_body = release or ("", "")
+
+    # Output
+    notes = []
+    if recovered:
+        notes.append(f"已恢复：{'、'.join(recovered)}")
+    if unstable:
+        notes.append(f"状态不稳定，暂不告警：{'、'.join(unstable)}")
+
+    if not issues and not update_available:
+        suffix = "".join(f"；{note}" for note in notes)
+        print(f"Agent Reach: 全部正常 ({ok}/{total} 渠道可用，v{__version__} 已是最新){suffix}")
+        return
+
+    print("Agent Reach 监控报告")
+    print("=" * 40)
+    print(f"版本: v{__version__}  |  渠道: {ok}/{total}")
+
+    if issues:
+        print()
+        for issue in issues:
+            print(f"  {issue}")
+    if notes:
+        print()
+        for note in notes:
+            print(f"  {note}")
+
+    if update_available:
+        print()
+        print(f"新版本可用: v{new_version}")
+        if release_body:
+            for line in release_body.strip().split("\n")[:10]:
+                print(f"    {line}")
+        print("  更新（一句话发给 Agent 即可完整更新）：")
+        print("    帮我更新 Agent Reach：https://raw.githubusercontent.com/Panniantong/agent-reach/main/docs/update.md")
+
+
+def _format_transition(transition) -> str:
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    after = _STATUS_LABELS.get(transition.after, transition.after)
+    if transition.before is None:
+        return f"[{stamp}] {transition.name}：{after}：{transition.message}"
+    before = _STATUS_LABELS.get(transition.before, transition.before)
+    return f"[{stamp}] {transition.name}：{before} → {after}：{transition.message}"
+
+
+def _format_unstable(transition) -> str:
+    from agent_reach.history import FLAP_THRESHOLD, FLAP_WINDOW
+
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    return (
+        f"[{stamp}] {transition.name}：状态不稳定（最近 {FLAP_WINDOW} 次检查中切换 "
+        f"≥ {FLAP_THRESHOLD} 次），恢复稳定前不再逐次播报"
+    )
+
+
+def _run_daemon(args, *, sleep=time.sleep, max_polls=None):
+    """Stay resident; re-check channels whose inputs changed, print transitions.
+
+    The first poll prints every channel that is not ok plus one summary
+    line. After that nothing is printed until a status changes or a newer
+    release shows up. A channel that is flapping (judged from the recorded
+    history plus this daemon's own transitions, which are not written to it:
+    they cover only changed channels) is announced once and then kept quiet
+    until it settles. ``max_polls`` bounds the loop for tests.
+    """
+    from agent_reach.config import ConfigError
+    from agent_reach.history import FLAP_WINDOW, HistoryStore, is_flapping
+    from agent_reach.watcher import ChannelWatcher
+
+    interval = getattr(args, "interval", None) or DEFAULT_DAEMON_INTERVAL
+    watcher = ChannelWatcher(
+        _channel_subset(args),
+        use_cache=not getattr(args, "no_cache", False),
+    )
+    recent = HistoryStore().recent_by_channel(FLAP_WINDOW)
+    quiet = set()
+    announced_version = None
+    next_update_check = 0.0
+    polls = 0
+    try:
+        while True:
+            try:
+                transitions = watcher.poll()
+            except ConfigError as exc:
+                print(f"[!] 配置文件读取失败，沿用上次结果：{exc}", flush=True)
+                transitions = []
+            for transition in transitions:
+                before = recent.get(transition.channel, [])
+                recent[transition.channel] = [transition.after, *before][:FLAP_WINDOW]
+
+            if polls == 0:
+                for transition in transitions:
+                    if transition.after != "ok":
+                        print(_format_transition(transition))
+                ok = sum(1 for r in watcher.results.values() if r["status"] == "ok")
+                print(
+                    f"Agent Reach watch: {ok}/{len(watcher.results)} 渠道可用，"
+                    f"每 {interval:g}s 检查一次输入变化（Ctrl+C 退出）",
+                    flush=True,
+                )
+            else:
+                for transition in transitions:
+                    if is_flapping(recent[transition.channel]):
+                        if transition.channel not in quiet:
+                            quiet.add(transition.channel)
+                            print(_format_unstable(transition), flush=True)
+                        continue
+                    quiet.discard(transition.channel)
+                    print(_format_transition(transition), flush=True)
+
+            now = time.monotonic()
+            if now >= next_update_check:
+                next_update_check = now + _UPDATE_CHECK_INTERVAL
+                release = _latest_release()
+                if release is not None and release[0] != announced_version:
+                    announced_version = release[0]
+                    print(f"新版本可用: v{announced_version}（当前 v{__version__}）", flush=True)
+
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                return
+            sleep(interval)
+    except KeyboardInterrupt:
+        return
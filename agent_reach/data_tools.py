@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""Channel data methods exposed as tools by the MCP server and `agent-reach serve`.
+
+Each DataTool names a channel method implemented in Python (V2EX, Xueqiu,
+web reading, YouTube transcription) together with the JSON schema of its
+arguments. Front ends validate arguments with tool_kwargs() and run the
+blocking call with run_tool() in a worker thread of their own.
+
+Tools backed by agent_reach.response_cache also accept ``refresh: true`` to
+skip cached results.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+from agent_reach import response_cache
+
+
+@dataclass(frozen=True)
+class DataTool:
+    """A callable tool (MCP / HTTP API) backed by one channel method."""
+
+    name: str
+    channel: str
+    method: str
+    description: str
+    params: Dict[str, dict] = field(default_factory=dict)
+    required: Tuple[str, ...] = ()
+    #: Method accepts config= and progress= (long-running, reports stages).
+    long_running: bool = False
+
+    def all_params(self) -> Dict[str, dict]:
+        """Declared parameters plus ``refresh`` for tools served from the response cache."""
+        if self.long_running:
+            return dict(self.params)
+        return dict(self.params, refresh=_REFRESH_PARAM)
+
+    def input_schema(self) -> dict:
+        return {
+            "type": "object",
+            "properties": self.all_params(),
+            "required": list(self.required),
+            "additionalProperties": False,
+        }
+
+
+_REFRESH_PARAM = {
+    "type": "boolean",
+    "description": "Skip cached results and fetch live",
+    "default": False,
+}
+
+
+def _int_param(description: str, default: int) -> dict:
+    return {"type": "integer", "minimum": 1, "description": description, "default": default}
+
+
+def _str_param(description: str) -> dict:
+    return {"type": "string", "minLength": 1, "description": description}
+
+
+DATA_TOOLS: Tuple[DataTool, ...] = (
+    DataTool(
+        "v2ex_hot_topics", "v2ex", "get_hot_topics", "V2EX hot topics.",
+        {"limit": _int_param("Max topics", 20)},
+    ),
+    DataTool(
+        "v2ex_node_topics", "v2ex", "get_node_topics", "Latest topics of a V2EX node.",
+        {
+            "node_name": _str_param("Node name, e.g. python"),
+            "limit": _int_param("Max topics; later pages are fetched as needed", 20),
+        },
+        ("node_name",),
+    ),
+    DataTool(
+        "v2ex_topic", "v2ex", "get_topic", "One V2EX topic with all its replies.",
+        {
+            "topic_id": {"type": "integer", "minimum": 1, "description": "Topic id"},
+            "max_replies": _int_param("Max replies; all pages are fetched up to this", 500),
+        },
+        ("topic_id",),
+    ),
+    DataTool(
+        "v2ex_user", "v2ex", "get_user", "V2EX user profile.",
+        {"username": _str_param("V2EX username")},
+        ("username",),
+    ),
+    DataTool(
+        "xueqiu_stock_quote", "xueqiu", "get_stock_quote", "Real-time Xueqiu stock quote.",
+        {"symbol": _str_param("Symbol, e.g. SH600519, AAPL, 00700")},
+        ("symbol",),
+    ),
+    DataTool(
+        "xueqiu_search_stock", "xueqiu", "search_stock", "Search stocks on Xueqiu.",
+        {"query": _str_param("Name or code"), "limit": _int_param("Max results", 10)},
+        ("query",),
+    ),
+    DataTool(
+        "xueqiu_hot_posts", "xueqiu", "get_hot_posts", "Xueqiu hot posts.",
+        {"limit": _int_param("Max posts", 20)},
+    ),
+    DataTool(
+        "xueqiu_hot_stocks", "xueqiu", "get_hot_stocks", "Xueqiu hot stock ranking.",
+        {
+            "limit": _int_param("Max stocks", 10),
+            "stock_type": _int_param("Ranking type (10 = A-share, 12 = HK, 13 = US)", 10),
+        },
+    ),
+    DataTool(
+        "web_read", "web", "read", "Read any web page as Markdown via Jina Reader.",
+        {"url": _str_param("Public http(s) URL")},
+        ("url",),
+    ),
+    DataTool(
+        "youtube_transcribe", "youtube", "transcribe",
+        "Download a video's audio and transcribe it (needs a Groq or OpenAI key). "
+        "Sends progress notifications per stage.",
+        {
+            "url": _str_param("Video URL"),
+            "provider": {"type": "string", "enum": ["auto", "groq", "openai"], "default": "auto"},
+        },
+        ("url",),
+        long_running=True,
+    ),
+)
+
+_BY_NAME = {tool.name: tool for tool in DATA_TOOLS}
+
+_JSON_TYPES = {"boolean": bool, "integer": int, "string": str}
+
+
+def tool_kwargs(tool: DataTool, arguments: Optional[dict]) -> dict:
+    """Validate tool arguments against the tool's schema; ValueError on mismatch."""
+    arguments = dict(arguments or {})
+    params = tool.all_params()
+    unknown = sorted(arguments.keys() - params.keys())
+    if unknown:
+        raise ValueError(f"unknown argument(s) for {tool.name}: {', '.join(unknown)}")
+    missing = [name for name in tool.required if name not in arguments]
+    if missing:
+        raise ValueError(f"missing argument(s) for {tool.name}: {', '.join(missing)}")
+    for name, value in arguments.items():
+        spec = params[name]
+        expected = _JSON_TYPES[spec["type"]]
+        if (isinstance(value, bool) and expected is not bool) or not isinstance(value, expected):
+            raise ValueError(f"{name} must be of type {spec['type']}")
+        if expected is int and value < spec.get("minimum", value):
+            raise ValueError(f"{name} must be >= {spec['minimum']}")
+        if isinstance(value, str) and not value.strip():
+            raise ValueError(f"{name} must not be empty")
+        if "enum" in spec and value not in spec["enum"]:
+            raise ValueError(f"{name} must be one of {', '.join(spec['enum'])}")
+    return arguments
+
+
+def get_data_tool(name: str) -> Optional[DataTool]:
+    return _BY_NAME.get(name)
+
+
+def run_tool(
+    tool: DataTool,
+    arguments: Optional[dict],
+    *,
+    config=None,
+    progress: Optional[Callable] = None,
+    cache: str = response_cache.USE,
+):
+    """Validate ``arguments`` and run the tool's channel method (blocking).
+
+    ``cache`` is the response_cache mode; a ``refresh: true`` argument turns
+    USE into REFRESH.
+    """
+    from agent_reach.channels import get_channel
+
+    kwargs = tool_kwargs(tool, arguments)
+    if kwargs.pop("refresh", False) and cache == response_cache.USE:
+        cache = response_cache.REFRESH
+    if tool.long_running:
+        kwargs["config"] = config
+        if progress is not None:
+            kwargs["progress"] = progress
+    with response_cache.cache_mode(cache):
+        return getattr(get_channel(tool.channel), tool.method)(**kwargs)
@@ -4,44 +4,223 @@
 Each channel knows how to check itself. Doctor just collects the results.
 """
 
-from typing import Dict
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, wait
+from typing import Callable, Dict, Optional, Sequence
 
-from rich.markup import escape
-
-from agent_reach.channels import get_all_channels
+from agent_reach.channels import get_all_channels, get_channel_spec, get_channels
+from agent_reach.channels.base import Channel, CheckResult
 from agent_reach.config import Config
+from agent_reach.probe import offline_mode, shared_probe_scope
+from agent_reach.probe_cache import probe_cache
+from agent_reach.timings import Recorder, recording
 from agent_reach.utils.text import scrub_url_credentials
 
+#: Overall wall-clock budget for one doctor run, in seconds. Individual
+#: probes already carry their own timeouts (10s subprocess / HTTP); this only
+#: bounds how long the *report* waits for the slowest of them.
+DEFAULT_DEADLINE = 30.0
+
+#: Upper bound on channel checks running at once. Most checks block on a
+#: subprocess or socket, so threads overlap well without hammering the host.
+DEFAULT_MAX_WORKERS = 8
+
+#: How many operations ``doctor --timings`` lists.
+TIMINGS_TOP_N = 10
+
+
+def _legacy_check_only(ch) -> bool:
+    if getattr(ch, "run_check", None) is None:
+        return True
+    cls = type(ch)
+    return (
+        isinstance(ch, Channel)
+        and cls.check is not Channel.check
+        and cls.diagnose is Channel.diagnose
+    )
+
+
+def _check_one(ch, config) -> CheckResult:
+    """Run one channel check; never raises.
+
+    Channels expose the re-entrant run_check(), which never touches the
+    registry singleton. Third-party channels that only implement the legacy
+    tuple API (no run_check, or a Channel subclass overriding check() but
+    not diagnose()) fall back to check() + active_backend.
+    """
+    try:
+        if not _legacy_check_only(ch):
+            return ch.run_check(config)
+        started = time.perf_counter()
+        status, message = ch.check(config)
+        return CheckResult(
+            status,
+            message,
+            active_backend=getattr(ch, "active_backend", None),
+            duration=time.perf_counter() - started,
+        )
+    except Exception as e:  # noqa: BLE001 — doctor must survive any channel
+        # Channels are registry singletons: a stale active_backend from a
+        # previous check must not leak into an errored result.
+        return CheckResult("error", f"体检异常：{e}")
+
+
+def _check_worker(
+    future: Future, gate: threading.Semaphore, ch, config, recorder: Recorder
+) -> None:
+    with gate:
+        # A check still queued when the deadline passed has been cancelled.
+        if not future.set_running_or_notify_cancel():
+            return
+        with recording(recorder):
+            future.set_result(_check_one(ch, config))
+
+
+def _open_circuits(ch) -> list:
+    """The channel's API hosts whose circuit breaker is open or half-open."""
+    spec = get_channel_spec(ch.name)
+    if spec is None or not spec.api_hosts:
+        return []
+    from agent_reach import breaker
+
+    try:
+        return breaker.get_breaker().snapshot(spec.api_hosts)
+    except Exception:  # noqa: BLE001 — breaker state is informational only
+        return []
+
+
+def _result_dict(ch, result: CheckResult, recorder: Recorder) -> dict:
+    # Doctor is the final output boundary for both expected channel
+    # messages and unexpected exceptions. Upstream probe output can echo a
+    # configured URL, so scrub every path before JSON/text rendering.
+    data = {
+        "status": result.status,
+        "name": ch.description,
+        "message": scrub_url_credentials(result.message),
+        "tier": ch.tier,
+        "backends": ch.backends,
+        "active_backend": result.active_backend,
+        "elapsed": round(result.duration, 4),
+        "operations": [
+            dict(op.as_dict(), label=scrub_url_credentials(op.label))
+            for op in recorder.snapshot()
+        ],
+    }
+    # Only present while a host is failing fast, so healthy output is unchanged.
+    circuits = _open_circuits(ch)
+    if circuits:
+        data["circuits"] = circuits
+    return data
+
+
+def _notify_when_done(
+    future: Future, ch, recorder: Recorder, on_result, closed: threading.Event
+) -> None:
+    def done(f: Future) -> None:
+        # A check finishing after the deadline was already reported as timeout.
+        if f.cancelled() or closed.is_set():
+            return
+        try:
+            on_result(ch.name, _result_dict(ch, f.result(), recorder))
+        except Exception:  # noqa: BLE001 — a listener must not break the check
+            pass
+
+    future.add_done_callback(done)
+
+
+def check_all(
+    config: Config,
+    *,
+    deadline: Optional[float] = DEFAULT_DEADLINE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    use_cache: bool = True,
+    offline: bool = False,
+    channels: Optional[Sequence[str]] = None,
+    record_history: bool = False,
+    on_result: Optional[Callable[[str, dict], None]] = None,
+) -> Dict[str, dict]:
+    """Check all channels concurrently and return status dict.
 
-def check_all(config: Config) -> Dict[str, dict]:
-    """Check all channels and return status dict.
+    ``channels`` restricts the run to those channel names (registry order is
+    kept; unknown names raise ValueError). Only the selected channel modules
+    are imported.
+
+    Checks fan out over at most ``max_workers`` threads. Channels that have
+    not finished when ``deadline`` seconds have passed are reported as
+    status="timeout" instead of holding up the report; ``None`` waits for
+    every check. Result order always follows the channel registry.
+
+    Backends shared by several channels (OpenCLI, mcporter config) are probed
+    once per run and the answer is handed to every channel that uses them.
+    ``use_cache=False`` bypasses the persistent probe cache (``--no-cache``).
+    ``offline=True`` (``--offline``) keeps every check local: backends that
+    can only be verified over the network report status="unverified".
+
+    Every result carries ``elapsed`` (wall seconds of the check) and
+    ``operations``: the subprocess/HTTP/config probes it ran, each with
+    duration and outcome. A timed-out channel still lists the operations
+    that finished before the deadline. Channels whose API hosts are failing
+    fast (agent_reach.breaker) also carry ``circuits``.
+
+    ``on_result(name, result)`` is called from the worker thread as soon as
+    each channel finishes, before the whole run completes (channels that
+    time out only appear in the returned dict).
+
+    With ``record_history`` (doctor and watch runs a user or cron starts;
+    never periodic pollers such as metrics, serve or MCP, whose cadence
+    would skew uptime and latency) a non-offline run is appended to the
+    local history (agent_reach.history), which only exists once
+    ``~/.agent-reach`` does.
 
     A single misbehaving channel must never take the whole report down,
     so per-channel exceptions degrade to status="error".
     """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    selected = list(get_all_channels() if channels is None else get_channels(channels))
+    gate = threading.BoundedSemaphore(max_workers)
+    futures = []
+    recorders = [Recorder() for _ in selected]
+    closed = threading.Event()
+    started = time.perf_counter()
+    with shared_probe_scope(), probe_cache(use_cache), offline_mode(offline):
+        for ch, recorder in zip(selected, recorders):
+            future: Future = Future()
+            if on_result is not None:
+                _notify_when_done(future, ch, recorder, on_result, closed)
+            # Each worker runs in its own copy of this context so it sees the
+            # shared probe scope. Daemon threads: a check stuck past the
+            # deadline must not keep the CLI process alive after the report.
+            context = contextvars.copy_context()
+            threading.Thread(
+                target=context.run,
+                args=(_check_worker, future, gate, ch, config, recorder),
+                name=f"agent-reach-doctor-{ch.name}",
+                daemon=True,
+            ).start()
+            futures.append(future)
+        wait(futures, timeout=deadline)
+        closed.set()
+    waited = time.perf_counter() - started
+
     results = {}
-    for ch in get_all_channels():
-        try:
-            status, message = ch.check(config)
-            active = getattr(ch, "active_backend", None)
-        except Exception as e:  # noqa: BLE001 — doctor must survive any channel
-            # Channels are registry singletons: a stale active_backend from a
-            # previous check must not leak into an errored result.
-            status = "error"
-            message = f"体检异常：{e}"
-            active = None
-        # Doctor is the final output boundary for both expected channel
-        # messages and unexpected exceptions. Upstream probe output can echo a
-        # configured URL, so scrub every path before JSON/text rendering.
-        message = scrub_url_credentials(message)
-        results[ch.name] = {
-            "status": status,
-            "name": ch.description,
-            "message": message,
-            "tier": ch.tier,
-            "backends": ch.backends,
-            "active_backend": active,
-        }
+    for ch, future, recorder in zip(selected, futures, recorders):
+        if future.done() and not future.cancelled():
+            result = future.result()
+        else:
+            future.cancel()
+            result = CheckResult(
+                "timeout",
+                f"体检超时：{deadline:g} 秒内未完成检查，本次结果未知",
+                duration=waited,
+            )
+        results[ch.name] = _result_dict(ch, result, recorder)
+    if record_history and not offline:
+        from agent_reach import history
+
+        history.record(results)
     return results
 
 
@@ -54,12 +233,47 @@ def _name_msg(r: dict, escape) -> str:
     return text
 
 
-def format_report(results: Dict[str, dict]) -> str:
-    """Format results as a readable text report (with Rich markup)."""
+def _format_timings(results: Dict[str, dict], limit: int = TIMINGS_TOP_N) -> list:
+    """Lines listing the slowest probes across all channels (--timings)."""
+    from rich.markup import escape
+
+    ops = [
+        (op, key)
+        for key, r in results.items()
+        for op in r.get("operations", [])
+    ]
+    ops.sort(key=lambda item: item[0]["duration"], reverse=True)
+    lines = ["", f"[bold]耗时最长的操作（共 {len(ops)} 项）：[/bold]"]
+    if not ops:
+        lines.append("  [dim]本次体检没有记录到子进程、HTTP 或配置读取操作[/dim]")
+    for op, key in ops[:limit]:
+        lines.append(
+            f"  {op['duration']:7.3f}s  {escape(key)}  {op['kind']}  "
+            f"{escape(op['label'])}  [dim]{escape(op['outcome'])}[/dim]"
+        )
+    slowest = max(results.items(), key=lambda kv: kv[1].get("elapsed", 0.0), default=None)
+    if slowest is not None:
+        key, r = slowest
+        lines.append(f"  [dim]最慢渠道：{escape(key)}（{r.get('elapsed', 0.0):.3f}s）[/dim]")
+    return lines
+
+
+def format_report(results: Dict[str, dict], timings: bool = False) -> str:
+    """Format results as a readable text report (with Rich markup).
+
+    ``timings=True`` appends the slowest recorded operations (--timings).
+    """
+    from rich.markup import escape
+
     lines = []
     lines.append("[bold cyan]Agent Reach 状态[/bold cyan]")
     lines.append("[cyan]" + "=" * 40 + "[/cyan]")
-    lines.append("图例：[green]✅[/green] 可用  [yellow][!][/yellow] 已装但需配置/登录  [red][X][/red] 未安装")
+    lines.append(
+        "图例：[green]✅[/green] 可用  [yellow][!][/yellow] 已装但需配置/登录或检查超时"
+        "  [red][X][/red] 未安装"
+    )
+    if any(r["status"] == "unverified" for r in results.values()):
+        lines.append("      [cyan][?][/cyan] 离线模式，未联网验证")
 
     ok_count = sum(1 for r in results.values() if r["status"] == "ok")
     total = len(results)
@@ -72,10 +286,12 @@ def format_report(results: Dict[str, dict]) -> str:
             name_msg = _name_msg(r, escape)
             if r["status"] == "ok":
                 lines.append(f"  [green]✅[/green] {name_msg}")
-            elif r["status"] == "warn":
+            elif r["status"] in ("warn", "timeout"):
                 lines.append(f"  [yellow][!][/yellow]  {name_msg}")
             elif r["status"] in ("off", "error"):
                 lines.append(f"  [red][X][/red]  {name_msg}")
+            elif r["status"] == "unverified":
+                lines.append(f"  [cyan][?][/cyan]  {name_msg}")
 
     # Tier 1 — needs free key / login
     tier1 = {k: r for k, r in results.items() if r["tier"] == 1}
@@ -98,12 +314,27 @@ def format_report(results: Dict[str, dict]) -> str:
         for key, r in tier2_active.items():
             lines.append(f"  [green]✅[/green] {_name_msg(r, escape)}")
 
+    # Optional channels offline mode could not verify are neither usable
+    # nor "to unlock": list them on their own.
+    unverified = [
+        r for r in list(tier1_inactive.values()) + list(tier2_inactive.values())
+        if r["status"] == "unverified"
+    ]
+    if unverified:
+        lines.append("")
+        lines.append("[bold]可选渠道（离线未验证）：[/bold]")
+        for r in unverified:
+            lines.append(f"  [cyan][?][/cyan]  {_name_msg(r, escape)}")
+
     lines.append("")
     status_color = "green" if ok_count == total else ("yellow" if ok_count > 0 else "red")
     lines.append(f"状态：[{status_color}]{ok_count}/{total}[/{status_color}] 个渠道可用")
 
     # Summarize inactive optional channels in one line instead of listing each
-    all_inactive = list(tier1_inactive.values()) + list(tier2_inactive.values())
+    all_inactive = [
+        r for r in list(tier1_inactive.values()) + list(tier2_inactive.values())
+        if r["status"] != "unverified"
+    ]
     if all_inactive:
         names = [r["name"] for r in all_inactive]
         lines.append(
@@ -128,4 +359,27 @@ def format_report(results: Dict[str, dict]) -> str:
         except OSError:
             pass
 
+    circuits = [
+        (key, c) for key, r in results.items() for c in r.get("circuits", [])
+    ]
+    if circuits:
+        lines.append("")
+        lines.append(
+            "[bold yellow]连接熔断中（近期连续连接失败，暂停请求以免每次等待超时）："
+            "[/bold yellow]"
+        )
+        for key, c in circuits:
+            if c["state"] == "open":
+                when = f"约 {c['retry_in']:.0f} 秒后重试"
+            else:
+                when = "下一次请求将试探恢复"
+            lines.append(
+                f"  {escape(key)}  {escape(c['host'])}  "
+                f"[dim]连续失败 {c['failures']} 次，{when}[/dim]"
+            )
+        lines.append("  如果你刚配好代理，删除 ~/.agent-reach/cache/breaker.sqlite3 即可立即重试")
+
+    if timings:
+        lines.extend(_format_timings(results))
+
     return "\n".join(lines)
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""Local doctor history: one row per channel per check.
+
+Every non-offline ``doctor`` and one-shot ``watch`` run (check_all() with
+``record_history=True``) appends ``(checked_at, channel, status, backend,
+latency)`` rows to ``~/.agent-reach/history.sqlite3``. On top of
+that the module answers the questions a single run cannot: uptime, p50/p95
+check latency, the previous status of a channel, and whether a channel is
+*flapping* (switching status so often that alerting on each switch is noise).
+
+Like the probe cache, the database is only written when ``~/.agent-reach``
+already exists, so a read-only command on a fresh machine creates nothing,
+and readers open it read-only. Rows never hold check messages or any other
+text a backend produced — only status words, backend names and timings.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from agent_reach.utils.paths import PrivatePathError, ensure_no_symlink_path
+
+_DB_FILE_NAME = "history.sqlite3"
+
+#: Rows older than this are pruned on every write.
+HISTORY_RETENTION_SECONDS = 30 * 24 * 3600
+
+#: Flap detection looks at a channel's last FLAP_WINDOW checks and calls it
+#: flapping when its status changed at least FLAP_THRESHOLD times in them.
+FLAP_WINDOW = 10
+FLAP_THRESHOLD = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checks (
+    checked_at REAL NOT NULL,
+    channel TEXT NOT NULL,
+    status TEXT NOT NULL,
+    backend TEXT,
+    latency REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS checks_by_channel ON checks (channel, checked_at);
+"""
+
+
+def history_path() -> Path:
+    from agent_reach.config import Config
+
+    return Config.CONFIG_DIR / _DB_FILE_NAME
+
+
+@dataclass(frozen=True)
+class ChannelStats:
+    """Aggregates for one channel over the queried period."""
+
+    channel: str
+    checks: int
+    uptime: Optional[float]           # percent of checks that came back ok
+    p50: Optional[float]              # seconds
+    p95: Optional[float]
+    last_status: Optional[str]
+    flapping: bool
+
+    def as_dict(self) -> dict:
+        return {
+            "checks": self.checks,
+            "uptime": None if self.uptime is None else round(self.uptime, 2),
+            "p50": None if self.p50 is None else round(self.p50, 4),
+            "p95": None if self.p95 is None else round(self.p95, 4),
+            "last_status": self.last_status,
+            "flapping": self.flapping,
+        }
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _count_changes(statuses: Iterable[str]) -> int:
+    changes = 0
+    previous = None
+    for status in statuses:
+        if previous is not None and status != previous:
+            changes += 1
+        previous = status
+    return changes
+
+
+def is_flapping(statuses: Iterable[str], threshold: int = FLAP_THRESHOLD) -> bool:
+    """True when a run of statuses changed value ``threshold`` or more times."""
+    return _count_changes(statuses) >= threshold
+
+
+class HistoryStore:
+    """SQLite-backed doctor history. Connections are opened per call."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else history_path()
+
+    # ── writes ──
+
+    def _create_private(self) -> None:
+        ensure_no_symlink_path(self.path, "历史记录文件")
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+        os.close(os.open(self.path, flags, 0o600))
+
+    def record(self, results: Mapping[str, dict], *, now: Optional[float] = None) -> bool:
+        """Append one check_all() run. Returns False when nothing was written.
+
+        Best effort: a locked, corrupt or unwritable database never fails
+        the doctor run that produced the results.
+        """
+        if not results or not self.path.parent.is_dir():
+            return False
+        now = time.time() if now is None else now
+        rows = [
+            (now, key, r["status"], r.get("active_backend"), float(r.get("elapsed", 0.0)))
+            for key, r in results.items()
+        ]
+        try:
+            self._create_private()
+            with closing(sqlite3.connect(self.path, timeout=5)) as conn:
+                with conn:
+                    conn.executescript(_SCHEMA)
+                    conn.executemany("INSERT INTO checks VALUES (?, ?, ?, ?, ?)", rows)
+                    conn.execute(
+                        "DELETE FROM checks WHERE checked_at < ?",
+                        (now - HISTORY_RETENTION_SECONDS,),
+                    )
+        except (OSError, PrivatePathError, sqlite3.Error):
+            return False
+        return True
+
+    # ── reads ──
+
+    def _query(self, sql: str, params=()) -> list:
+        """Run a read-only query; a missing or unreadable database is empty."""
+        if not self.path.is_file():
+            return []
+        try:
+            ensure_no_symlink_path(self.path, "历史记录文件")
+            uri = self.path.resolve().as_uri() + "?mode=ro"
+            with closing(sqlite3.connect(uri, uri=True, timeout=5)) as conn:
+                return conn.execute(sql, params).fetchall()
+        except (PrivatePathError, sqlite3.Error):
+            return []
+
+    def recent_statuses(self, channel: str, limit: int = FLAP_WINDOW) -> List[str]:
+        """The channel's last ``limit`` statuses, newest first."""
+        rows = self._query(
+            "SELECT status FROM checks WHERE channel = ? "
+            "ORDER BY checked_at DESC, rowid DESC LIMIT ?",
+            (channel, limit),
+        )
+        return [status for (status,) in rows]
+
+    def is_flapping(
+        self,
+        channel: str,
+        *,
+        window: int = FLAP_WINDOW,
+        threshold: int = FLAP_THRESHOLD,
+    ) -> bool:
+        """True when the last ``window`` checks changed status ``threshold``+ times."""
+        return is_flapping(self.recent_statuses(channel, window), threshold)
+
+    def recent_by_channel(self, limit: int = FLAP_WINDOW) -> Dict[str, List[str]]:
+        """Every channel's last ``limit`` statuses, newest first, in one query."""
+        rows = self._query(
+            "SELECT channel, status FROM ("
+            "  SELECT channel, status, ROW_NUMBER() OVER ("
+            "    PARTITION BY channel ORDER BY checked_at DESC, rowid DESC"
+            "  ) AS n FROM checks"
+            ") WHERE n <= ? ORDER BY channel, n",
+            (limit,),
+        )
+        recent: Dict[str, List[str]] = {}
+        for channel, status in rows:
+            recent.setdefault(channel, []).append(status)
+        return recent
+
+    def stats(
+        self,
+        channels: Optional[Iterable[str]] = None,
+        *,
+        since: Optional[float] = None,
+    ) -> Dict[str, ChannelStats]:
+        """Uptime, p50/p95 latency and flap state per channel.
+
+        ``since`` is a Unix timestamp; None covers the whole retained history.
+        Channels with no rows in the period are omitted.
+        """
+        rows = self._query(
+            "SELECT channel, status, latency FROM checks WHERE checked_at >= ? "
+            "ORDER BY checked_at, rowid",
+            (since if since is not None else 0.0,),
+        )
+        wanted = set(channels) if channels is not None else None
+        grouped: Dict[str, List[tuple]] = {}
+        for channel, status, latency in rows:
+            if wanted is None or channel in wanted:
+                grouped.setdefault(channel, []).append((status, latency))
+
+        stats = {}
+        for channel, entries in grouped.items():
+            statuses = [status for status, _ in entries]
+            latencies = sorted(latency for status, latency in entries if status != "timeout")
+            stats[channel] = ChannelStats(
+                channel=channel,
+                checks=len(entries),
+                uptime=100.0 * statuses.count("ok") / len(statuses),
+                p50=_percentile(latencies, 50),
+                p95=_percentile(latencies, 95),
+                last_status=statuses[-1],
+                flapping=is_flapping(statuses[-FLAP_WINDOW:]),
+            )
+        return stats
+
+
+def record(results: Mapping[str, dict]) -> bool:
+    """Append a check_all() run to the default history database."""
+    return HistoryStore().record(results)
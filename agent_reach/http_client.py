@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+"""Shared HTTP client for channels, backends and commands.
+
+Every outbound request goes through one of two process-wide
+``requests.Session`` objects: one that honours HTTP(S)_PROXY / NO_PROXY and
+one that ignores them (``direct=True``, for loopback services such as the
+OpenCLI daemon and xiaohongshu-mcp, which must never be proxied). Each
+session keeps a keep-alive connection pool per host, so repeated calls —
+doctor cycles, MCP / `agent-reach serve` tool calls — reuse open TCP+TLS
+connections instead of handshaking every time.
+
+Before each attempt the host's circuit (agent_reach.breaker) and token
+bucket (agent_reach.ratelimit) are consulted: a host that keeps refusing or
+timing out connections fails fast instead of costing every caller the full
+timeout, and callers never exceed a platform's configured request rate.
+Loopback services (``direct=True``) skip the circuit: they are either up or
+refuse instantly, and must be usable again as soon as they restart.
+
+Bodies are read up to ``max_bytes`` (ResponseTooLarge beyond that) and
+returned as an immutable Response. Sessions never persist cookies on their
+own; callers that need a cookie session (Xueqiu) pass their ``cookie_jar``.
+
+GETs made with ``revalidate=True`` remember the body of every response that
+carries an ETag or Last-Modified validator (in agent_reach.response_cache's
+store) and send If-None-Match / If-Modified-Since next time; a 304 is
+answered from the stored body. That saves bandwidth and, for GitHub, the
+rate limit: conditional requests answered with 304 are not counted.
+
+``requests`` is imported on first use so that importing a channel module
+stays cheap on the CLI fast path (doctor --offline, format).
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json as _json
+import threading
+import time
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, cast
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+
+#: Hosts with a pooled connection set, and idle connections kept per host.
+POOL_HOSTS = 16
+POOL_MAXSIZE = 16
+
+#: Statuses worth retrying when the caller asked for retries.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class ResponseTooLarge(ValueError):
+    """The response body exceeded the caller's ``max_bytes``."""
+
+
+@dataclass(frozen=True)
+class Response:
+    """A fully read response; mirrors the parts of requests.Response we use."""
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    url: str
+    encoding: Optional[str] = None
+    #: The server answered 304 and ``content`` is the locally stored body.
+    revalidated: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return _json.loads(self.content)
+
+
+_sessions: Dict[bool, "requests.Session"] = {}
+_sessions_lock = threading.Lock()
+
+
+def _new_session(direct: bool) -> "requests.Session":
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.trust_env = not direct
+    # Cookies live in caller-owned jars only; nothing leaks between channels.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def session(direct: bool = False) -> "requests.Session":
+    """The shared pooled session (``direct=True``: bypass proxy settings)."""
+    with _sessions_lock:
+        current = _sessions.get(direct)
+        if current is None:
+            current = _sessions[direct] = _new_session(direct)
+        return current
+
+
+def close_sessions() -> None:
+    """Close every pooled connection; the next request opens fresh ones."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for current in sessions:
+        current.close()
+
+
+def _read_capped(resp: "requests.Response", max_bytes: int) -> bytes:
+    body = bytearray()
+    for chunk in resp.iter_content(_CHUNK_SIZE):
+        body += chunk
+        if len(body) > max_bytes:
+            host = urlsplit(resp.url).hostname or "server"
+            raise ResponseTooLarge(f"response from {host} exceeds the {max_bytes} byte limit")
+    return bytes(body)
+
+
+def _retry_delay(resp: Optional["requests.Response"], attempt: int, backoff: float) -> float:
+    delay = backoff * 2 ** (attempt - 1)
+    retry_after = resp.headers.get("Retry-After") if resp is not None else None
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass
+    return delay
+
+
+#: response_cache key namespace for stored validators and bodies.
+_VALIDATORS = "http.validators"
+
+
+def _validator_key(url: str, params: Any, headers: Optional[Mapping[str, str]]) -> str:
+    """Key for a revalidated GET; credential headers scope it to their account."""
+    from requests.models import PreparedRequest
+
+    from agent_reach import response_cache
+
+    prepared = PreparedRequest()
+    prepared.prepare_url(url, params)
+    credentials = sorted(
+        (name.lower(), value)
+        for name, value in (headers or {}).items()
+        if name.lower() in ("authorization", "cookie")
+    )
+    vary = hashlib.sha256(_json.dumps(credentials).encode("utf-8")).hexdigest()
+    # prepare_url() always sets .url (or raises); the stubs still say Optional.
+    return response_cache.cache_key(_VALIDATORS, prepared.url or url, vary)
+
+
+def _stored_validators(key: str) -> Optional[dict]:
+    from agent_reach import response_cache
+
+    if response_cache.current_mode() == response_cache.OFF:
+        return None
+    hit = response_cache.get_store().get(key)
+    if hit is None or not isinstance(hit[1], dict):
+        return None
+    return hit[1]
+
+
+def _conditional_headers(
+    headers: Optional[Mapping[str, str]], stored: dict
+) -> Dict[str, str]:
+    merged = dict(headers or {})
+    present = {name.lower() for name in merged}
+    if stored.get("etag") and "if-none-match" not in present:
+        merged["If-None-Match"] = stored["etag"]
+    if stored.get("last_modified") and "if-modified-since" not in present:
+        merged["If-Modified-Since"] = stored["last_modified"]
+    return merged
+
+
+def _store_validators(key: str, result: Response) -> None:
+    from agent_reach import response_cache
+
+    etag = result.headers.get("ETag")
+    last_modified = result.headers.get("Last-Modified")
+    if result.status_code != 200 or not (etag or last_modified):
+        return
+    if response_cache.current_mode() == response_cache.OFF:
+        return
+    response_cache.get_store().put(key, {
+        "etag": etag,
+        "last_modified": last_modified,
+        # Never persist cookies a server handed out.
+        "headers": {k: v for k, v in result.headers.items() if k.lower() != "set-cookie"},
+        "encoding": result.encoding,
+        "body": base64.b64encode(result.content).decode("ascii"),
+    })
+
+
+def _from_stored(stored: dict, resp: "requests.Response") -> Response:
+    from requests.structures import CaseInsensitiveDict
+
+    # A 304 carries updated metadata (rate-limit counters, Date) for the stored body.
+    headers = CaseInsensitiveDict(stored.get("headers") or {})
+    headers.update(resp.headers)
+    return Response(
+        status_code=200,
+        headers=headers,
+        content=base64.b64decode(stored["body"]),
+        url=resp.url,
+        encoding=stored.get("encoding"),
+        revalidated=True,
+    )
+
+
+def request(
+    method: str,
+    url: str,
+    *,
+    headers: Optional[Mapping[str, str]] = None,
+    params: Any = None,
+    data: Any = None,
+    files: Any = None,
+    json: Any = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    retries: int = 0,
+    backoff: float = 0.5,
+    direct: bool = False,
+    cookie_jar: Optional[CookieJar] = None,
+    raise_for_status: bool = True,
+    revalidate: bool = False,
+    rate_limit: bool = True,
+    sleeper: Callable[[float], None] = time.sleep,
+) -> Response:
+    """Send one request over the pooled session and read the body.
+
+    ``retries`` extra attempts are made on connection errors, timeouts and
+    RETRY_STATUSES, with exponential ``backoff`` (Retry-After wins when
+    larger); only use it for idempotent requests. Raises the usual
+    ``requests`` exceptions, ``requests.HTTPError`` for 4xx/5xx when
+    ``raise_for_status`` is set, ResponseTooLarge, ratelimit.RateLimited
+    when the host's request budget is exhausted for longer than it is worth
+    waiting, and breaker.CircuitOpen when the host failed repeatedly and is
+    cooling down.
+
+    ``revalidate=True`` makes a GET conditional on the stored validators of
+    the same URL (see the module docstring); it is ignored for other methods
+    and with a ``cookie_jar``, whose per-account state callers scope
+    themselves. Authorization and Cookie headers are part of the stored key.
+
+    ``rate_limit=False`` is for a caller that already took this request's
+    token: the first attempt skips the limiter, retries still take one.
+    """
+    import requests
+    from requests.cookies import extract_cookies_to_jar
+
+    from agent_reach import breaker, ratelimit
+
+    host = urlsplit(url).hostname
+    circuit = None if direct else breaker.get_breaker()
+    validator_key = stored = None
+    if revalidate and method.upper() == "GET" and cookie_jar is None:
+        validator_key = _validator_key(url, params, headers)
+        stored = _stored_validators(validator_key)
+        if stored is not None:
+            headers = _conditional_headers(headers, stored)
+    attempt = 0
+    while True:
+        attempt += 1
+        if circuit is not None:
+            circuit.before(host)
+        if rate_limit or attempt > 1:
+            ratelimit.acquire(host)
+        try:
+            resp = session(direct).request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                data=data,
+                files=files,
+                json=json,
+                # requests merges any CookieJar as-is; its stubs only name its own.
+                cookies=cast("requests.cookies.RequestsCookieJar", cookie_jar),
+                timeout=timeout,
+                stream=True,
+            )
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            # A TLS failure after connecting is not the host being down (and
+            # V2EX answers those through its curl fallback).
+            if circuit is not None and not isinstance(exc, requests.exceptions.SSLError):
+                circuit.record_failure(host)
+            if attempt > retries:
+                raise
+            sleeper(_retry_delay(None, attempt, backoff))
+            continue
+
+        if circuit is not None:
+            circuit.record_success(host)
+        if resp.status_code in RETRY_STATUSES and attempt <= retries:
+            delay = _retry_delay(resp, attempt, backoff)
+            resp.close()
+            sleeper(delay)
+            continue
+
+        try:
+            content = _read_capped(resp, max_bytes)
+            if cookie_jar is not None:
+                for hop in (*resp.history, resp):
+                    extract_cookies_to_jar(cookie_jar, hop.request, hop.raw)
+        finally:
+            resp.close()
+        break
+
+    if stored is not None and resp.status_code == 304:
+        return _from_stored(stored, resp)
+    result = Response(
+        status_code=resp.status_code,
+        headers=resp.headers,
+        content=content,
+        url=resp.url,
+        encoding=resp.encoding,
+    )
+    if raise_for_status and not result.ok:
+        raise requests.HTTPError(f"HTTP {resp.status_code} for {resp.url}", response=resp)
+    if validator_key is not None:
+        _store_validators(validator_key, result)
+    return result
+
+
+def get(url: str, **kwargs) -> Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> Response:
+    return request("POST", url, **kwargs)
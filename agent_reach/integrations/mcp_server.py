@@ -1,19 +1,27 @@
 # -*- coding: utf-8 -*-
 """
-Agent Reach MCP Server — expose doctor/status as MCP tool.
+Agent Reach MCP Server — expose doctor/status and channel data as MCP tools.
 
 Run: python -m agent_reach.integrations.mcp_server
 
-Agent Reach is an installer + doctor tool. For actual reading/searching,
-agents should call upstream tools directly (twitter-cli, yt-dlp, mcporter, etc.).
+Besides get_status, the channel methods implemented in Python (V2EX, Xueqiu,
+web reading, YouTube transcription) are registered as tools. Every tool runs
+in a worker thread, so one server process serves many parallel calls without
+blocking its event loop. Channels backed by external CLIs (twitter-cli,
+yt-dlp, mcporter, ...) are still meant to be called directly.
 """
 
 import asyncio
+import functools
 import json
+import os
 import sys
+import time
+from typing import Any, Callable, Optional
 
 from agent_reach.config import Config
 from agent_reach.core import AgentReach
+from agent_reach.data_tools import DATA_TOOLS, DataTool, get_data_tool, run_tool
 from agent_reach.utils.text import scrub_url_credentials
 
 try:
@@ -25,8 +33,101 @@ try:
 except ImportError:
     HAS_MCP = False
 
+#: Seconds a get_status report is reused; override with AGENT_REACH_MCP_STATUS_TTL.
+DEFAULT_STATUS_TTL = 60.0
 
-def create_server():
+#: Upper bound on data tool calls running in worker threads at once.
+MAX_CONCURRENT_TOOL_CALLS = 8
+
+_MISSING = object()
+
+
+def _progress_reporter(server, loop: asyncio.AbstractEventLoop):
+    """progress(done, total, message) for the current request, callable from threads.
+
+    None when the client did not ask for progress (no progressToken) or the
+    server has no request context.
+    """
+    try:
+        ctx = server.request_context
+    except (LookupError, AttributeError):
+        return None
+    token = getattr(getattr(ctx, "meta", None), "progressToken", None)
+    if token is None:
+        return None
+    session = ctx.session
+
+    async def send(done, total, message):
+        try:
+            await session.send_progress_notification(token, done, total, message=message)
+        except Exception:  # noqa: BLE001 — progress is best effort
+            pass
+
+    def progress(done, total, message):
+        asyncio.run_coroutine_threadsafe(send(done, total, message), loop)
+
+    return progress
+
+
+class SingleFlight:
+    """Run a blocking call in a worker thread, shared by concurrent callers.
+
+    While a call is in flight every awaiting caller gets that same result
+    instead of starting its own run. A successful result is then reused for
+    ``ttl`` seconds; failures are never cached. The event loop is never
+    blocked by the call itself.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[], Any],
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._func = func
+        self.ttl = ttl
+        self._clock = clock
+        self._value: Any = _MISSING
+        self._stored_at = 0.0
+        self._inflight: Optional[asyncio.Future] = None
+
+    def prime(self, value: Any) -> None:
+        """Store a value computed elsewhere (e.g. by the streaming status tool)."""
+        self._value = value
+        self._stored_at = self._clock()
+
+    def _fresh(self) -> bool:
+        return self._value is not _MISSING and self._clock() - self._stored_at < self.ttl
+
+    def _finish(self, task: asyncio.Future) -> None:
+        self._inflight = None
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._value = task.result()
+        self._stored_at = self._clock()
+
+    async def get(self, refresh: bool = False) -> Any:
+        if not refresh and self._fresh():
+            return self._value
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(asyncio.to_thread(self._func))
+            self._inflight.add_done_callback(self._finish)
+        # shield: one caller giving up must not cancel the run for the others
+        return await asyncio.shield(self._inflight)
+
+
+def _status_ttl_from_env() -> float:
+    raw = os.environ.get("AGENT_REACH_MCP_STATUS_TTL", "").strip()
+    if not raw:
+        return DEFAULT_STATUS_TTL
+    try:
+        ttl = float(raw)
+    except ValueError:
+        return DEFAULT_STATUS_TTL
+    return max(ttl, 0.0)
+
+
+def create_server(status_ttl: Optional[float] = None):
     if not HAS_MCP:
         print(
             "MCP not installed. Install: python -m pip install "
@@ -39,20 +140,105 @@ def create_server():
     server = Server("agent-reach")
     config = Config(read_only=True)
     eyes = AgentReach(config)
+    status = SingleFlight(
+        eyes.doctor_report,
+        _status_ttl_from_env() if status_ttl is None else status_ttl,
+    )
+
+    tool_slots = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+
+    async def run_data_tool(tool: DataTool, arguments: Optional[dict]):
+        progress = None
+        if tool.long_running:
+            progress = _progress_reporter(server, asyncio.get_running_loop())
+        call = functools.partial(run_tool, tool, arguments, config=config, progress=progress)
+        async with tool_slots:
+            return await asyncio.to_thread(call)
+
+    async def stream_status(arguments: Optional[dict]):
+        """Doctor run that reports each channel via progress as soon as it finishes."""
+        import threading
+
+        from agent_reach.channels import CHANNEL_SPECS
+        from agent_reach.doctor import check_all, format_report
+
+        names = (arguments or {}).get("channels")
+        if names is not None and (
+            not isinstance(names, list) or not all(isinstance(n, str) for n in names)
+        ):
+            raise ValueError("channels must be a list of channel names")
+        progress = _progress_reporter(server, asyncio.get_running_loop())
+        total = len(set(names)) if names is not None else len(CHANNEL_SPECS)
+        finished = []
+        lock = threading.Lock()
+
+        def on_result(key: str, result: dict) -> None:
+            with lock:
+                finished.append(key)
+                done = len(finished)
+            if progress is not None:
+                partial = {
+                    "channel": key,
+                    "status": result["status"],
+                    "message": result["message"],
+                    "active_backend": result["active_backend"],
+                }
+                progress(done, total, json.dumps(partial, ensure_ascii=False))
+
+        results = await asyncio.to_thread(
+            check_all, config, channels=names, on_result=on_result
+        )
+        report = format_report(results)
+        if names is None:
+            # Same text get_status would produce: reuse it there.
+            status.prime(report)
+        return report
 
     @server.list_tools()
     async def list_tools():
         return [
             Tool(name="get_status",
                  description="Get Agent Reach status: which channels are installed and active.",
-                 inputSchema={"type": "object", "properties": {}}),
+                 inputSchema={
+                     "type": "object",
+                     "properties": {
+                         "refresh": {
+                             "type": "boolean",
+                             "description": "Re-run the checks instead of reusing a recent report",
+                         },
+                     },
+                 }),
+            Tool(name="get_status_stream",
+                 description=(
+                     "Like get_status, but sends each channel's result as a progress "
+                     "notification (JSON: channel, status, message, active_backend) as "
+                     "soon as its check finishes, then returns the full report."
+                 ),
+                 inputSchema={
+                     "type": "object",
+                     "properties": {
+                         "channels": {
+                             "type": "array",
+                             "items": {"type": "string"},
+                             "description": "Only check these channels (default: all)",
+                         },
+                     },
+                 }),
+            *(
+                Tool(name=tool.name, description=tool.description, inputSchema=tool.input_schema())
+                for tool in DATA_TOOLS
+            ),
         ]
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict):
         try:
             if name == "get_status":
-                result = eyes.doctor_report()
+                result = await status.get(refresh=bool((arguments or {}).get("refresh")))
+            elif name == "get_status_stream":
+                result = await stream_status(arguments)
+            elif (tool := get_data_tool(name)) is not None:
+                result = await run_data_tool(tool, arguments)
             else:
                 result = f"Unknown tool: {name}"
 
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""OpenMetrics exposition of doctor results for `agent-reach metrics`.
+
+One doctor cycle (check_all) becomes:
+
+- ``agent_reach_channel_up`` / ``agent_reach_channel_status``: per-channel
+  gauges (status is one-hot over every doctor status),
+- ``agent_reach_channel_backend_info``: which backend is currently serving,
+- ``agent_reach_channel_check_duration_seconds`` and
+  ``agent_reach_probe_duration_seconds``: histograms of the per-channel
+  check time and of every subprocess/HTTP/config probe it ran,
+- ``agent_reach_update_*``: the last release lookup, when enabled.
+
+MetricsCollector caches the last cycle for ``interval`` seconds and refreshes
+under a lock, so any number of scrapes inside one interval — concurrent or
+not — cost exactly one real probe cycle.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from agent_reach import __version__
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+#: Every status check_all() can report, including doctor's own "timeout".
+CHANNEL_STATUSES = ("ok", "warn", "off", "error", "unverified", "timeout")
+
+#: Histogram buckets (seconds) for check and probe durations.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+#: Default seconds a doctor cycle is reused across scrapes.
+DEFAULT_METRICS_INTERVAL = 60.0
+
+#: The release lookup is far slower-moving than channel health.
+UPDATE_CHECK_INTERVAL = 6 * 3600
+
+
+@dataclass(frozen=True)
+class UpdateState:
+    """Outcome of one release lookup; ``latest`` is None when it failed."""
+
+    latest: Optional[str]
+    available: bool
+
+
+@dataclass
+class _Histogram:
+    counts: List[int] = field(default_factory=lambda: [0] * len(DURATION_BUCKETS))
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+        self.total += value
+        self.count += 1
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class MetricsCollector:
+    """Turn check_all() cycles into OpenMetrics text, at most one cycle per interval.
+
+    ``check`` is called as ``check(config, use_cache=..., channels=...)`` and
+    defaults to doctor.check_all. ``update_check`` returns an UpdateState or
+    is None to leave the update metrics out.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = DEFAULT_METRICS_INTERVAL,
+        channels: Optional[Sequence[str]] = None,
+        use_cache: bool = True,
+        check: Optional[Callable] = None,
+        update_check: Optional[Callable[[], UpdateState]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if check is None:
+            from agent_reach.doctor import check_all
+
+            check = check_all
+        self.interval = interval
+        self._channels = channels
+        self._use_cache = use_cache
+        self._check = check
+        self._update_check = update_check
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._refreshed_at: Optional[float] = None
+        self._update_checked_at: Optional[float] = None
+        self._update: Optional[UpdateState] = None
+        self._results: Dict[str, dict] = {}
+        self._checked_at_unix = 0.0
+        self._cycles = 0
+        self._check_durations: Dict[str, _Histogram] = {}
+        self._probe_durations: Dict[Tuple[str, str], _Histogram] = {}
+
+    def _stale(self, refreshed_at: Optional[float], interval: float, now: float) -> bool:
+        return refreshed_at is None or now - refreshed_at >= interval
+
+    def _refresh(self) -> None:
+        from agent_reach.config import Config
+
+        results = self._check(
+            Config(read_only=True),
+            use_cache=self._use_cache,
+            channels=self._channels,
+        )
+        self._results = results
+        self._checked_at_unix = time.time()
+        self._cycles += 1
+        for key, r in results.items():
+            self._check_durations.setdefault(key, _Histogram()).observe(r.get("elapsed", 0.0))
+            for op in r.get("operations", []):
+                hist = self._probe_durations.setdefault((key, op["kind"]), _Histogram())
+                hist.observe(op["duration"])
+
+    def collect(self) -> str:
+        """Return the exposition, running a doctor cycle only if the last one is stale."""
+        with self._lock:
+            now = self._clock()
+            if self._stale(self._refreshed_at, self.interval, now):
+                self._refresh()
+                self._refreshed_at = now
+            if self._update_check is not None and self._stale(
+                self._update_checked_at, UPDATE_CHECK_INTERVAL, now
+            ):
+                self._update = self._update_check()
+                self._update_checked_at = now
+            return self._render()
+
+    def _render(self) -> str:
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"# HELP {name} {help_text}")
+
+        family("agent_reach_build", "info", "Installed Agent Reach version.")
+        lines.append(f"agent_reach_build_info{_labels(version=__version__)} 1")
+
+        family("agent_reach_channel_up", "gauge", "1 if the channel's last check was ok.")
+        for key, r in self._results.items():
+            up = 1 if r["status"] == "ok" else 0
+            lines.append(f"agent_reach_channel_up{_labels(channel=key)} {up}")
+
+        family("agent_reach_channel_status", "gauge", "Last doctor status, one-hot.")
+        for key, r in self._results.items():
+            for status in CHANNEL_STATUSES:
+                value = 1 if r["status"] == status else 0
+                lines.append(
+                    f"agent_reach_channel_status{_labels(channel=key, status=status)} {value}"
+                )
+
+        family("agent_reach_channel_backend", "info", "Backend serving the channel.")
+        for key, r in self._results.items():
+            backend = r.get("active_backend")
+            if backend:
+                labels = _labels(channel=key, backend=backend)
+                lines.append(f"agent_reach_channel_backend_info{labels} 1")
+
+        self._render_histograms(
+            lines,
+            family,
+            "agent_reach_channel_check_duration_seconds",
+            "Wall time of one channel check.",
+            {(key,): hist for key, hist in self._check_durations.items()},
+            ("channel",),
+        )
+        self._render_histograms(
+            lines,
+            family,
+            "agent_reach_probe_duration_seconds",
+            "Duration of subprocess, HTTP and config probes run by checks.",
+            self._probe_durations,
+            ("channel", "kind"),
+        )
+
+        family("agent_reach_check_cycles", "counter", "Doctor cycles run by this exporter.")
+        lines.append(f"agent_reach_check_cycles_total {self._cycles}")
+        family(
+            "agent_reach_last_check_timestamp_seconds", "gauge",
+            "Unix time the last doctor cycle finished.",
+        )
+        lines.append(f"agent_reach_last_check_timestamp_seconds {self._checked_at_unix!r}")
+
+        if self._update is not None:
+            family(
+                "agent_reach_update_check_success", "gauge",
+                "1 if the last release lookup succeeded.",
+            )
+            success = 1 if self._update.latest is not None else 0
+            lines.append(f"agent_reach_update_check_success {success}")
+            family(
+                "agent_reach_update_available", "gauge",
+                "1 if a newer release than the installed version exists.",
+            )
+            lines.append(f"agent_reach_update_available {1 if self._update.available else 0}")
+            if self._update.latest is not None:
+                family("agent_reach_latest_release", "info", "Latest published release.")
+                labels = _labels(version=self._update.latest)
+                lines.append(f"agent_reach_latest_release_info{labels} 1")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histograms(lines, family, name, help_text, histograms, label_names) -> None:
+        family(name, "histogram", help_text)
+        for label_values, hist in sorted(histograms.items()):
+            base = dict(zip(label_names, label_values))
+            for bound, count in zip(DURATION_BUCKETS, hist.counts):
+                lines.append(f"{name}_bucket{_labels(**base, le=repr(bound))} {count}")
+            lines.append(f"{name}_bucket{_labels(**base, le='+Inf')} {hist.count}")
+            lines.append(f"{name}_count{_labels(**base)} {hist.count}")
+            lines.append(f"{name}_sum{_labels(**base)} {hist.total!r}")
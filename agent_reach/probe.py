@@ -11,18 +11,122 @@ Distinguishes the three failure modes that look identical to shutil.which():
 
 Channels use probe_command() inside check() so doctor reports real health,
 not just file existence.
+
+Backends that serve several channels (OpenCLI, mcporter config) go through
+shared_probe(): inside a shared_probe_scope() — one doctor run — each such
+probe executes once and its result is handed to every channel that asks.
+
+Inside offline_mode() (``doctor --offline``) channels must not touch the
+network: backends that can only be verified remotely report status
+"unverified" instead. Local facts — binaries, credential files, mcporter
+config, loopback daemons — are still checked.
 """
 
 import shutil
 import subprocess
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Mapping, Optional, Sequence
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from agent_reach.utils.process import utf8_subprocess_env
 
 #: Exit codes shells use for "found but not executable" / "not found".
 _BROKEN_EXIT_CODES = (126, 127)
 
+T = TypeVar("T")
+
+
+class SharedProbes:
+    """Single-flight memo for probes of backends shared by several channels.
+
+    The first caller for a key computes the answer; concurrent and later
+    callers wait for it and receive the same result (or the same exception).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: Dict[Hashable, Future] = {}
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = self._futures[key] = Future()
+        assert future is not None
+        if owner:
+            try:
+                future.set_result(compute())
+            except BaseException as exc:
+                future.set_exception(exc)
+        return future.result()
+
+
+_shared_probes: ContextVar[Optional[SharedProbes]] = ContextVar(
+    "agent_reach_shared_probes", default=None
+)
+
+
+@contextmanager
+def shared_probe_scope() -> Iterator[SharedProbes]:
+    """Share backend probes for the duration of the block (one doctor run).
+
+    Nested scopes reuse the outer memo. Worker threads see the scope only when
+    they run inside a copy of the caller's context (contextvars.copy_context).
+    """
+    current = _shared_probes.get()
+    if current is not None:
+        yield current
+        return
+    memo = SharedProbes()
+    token = _shared_probes.set(memo)
+    try:
+        yield memo
+    finally:
+        _shared_probes.reset(token)
+
+
+_offline: ContextVar[bool] = ContextVar("agent_reach_offline", default=False)
+
+#: Message prefix for backends skipped by offline_mode().
+OFFLINE_UNVERIFIED = "离线模式：未联网验证"
+
+
+@contextmanager
+def offline_mode(enabled: bool = True) -> Iterator[None]:
+    """Skip network probes for the duration of the block (--offline)."""
+    token = _offline.set(enabled)
+    try:
+        yield
+    finally:
+        _offline.reset(token)
+
+
+def is_offline() -> bool:
+    """True when channels must report only local facts."""
+    return _offline.get()
+
+
+def shared_probe(key: Hashable, compute: Callable[[], T]) -> T:
+    """Return compute(), memoized per key inside an active shared_probe_scope."""
+    memo = _shared_probes.get()
+    if memo is None:
+        return compute()
+    return memo.get(key, compute)
+
 
 @dataclass
 class ProbeResult:
@@ -63,22 +167,52 @@ def probe_command(
              (defaults to cmd).
     env: values added only to the probed child process.
     remove_env: inherited variables removed only from the child process.
+
+    Healthy results are served from the persistent probe cache while the
+    binary's identity is unchanged (see agent_reach.probe_cache). Each call
+    is reported to agent_reach.timings with the probe status as outcome
+    ("cached" for cache hits).
     """
+    from agent_reach import timings
+
+    with timings.timed(timings.SUBPROCESS, " ".join([cmd, *args])) as timing:
+        result, cached = _probe(cmd, args, timeout, retries, package, env, remove_env)
+        timing.outcome = "cached" if cached else result.status
+    return result
+
+
+def _probe(
+    cmd: str,
+    args: Sequence[str],
+    timeout: int,
+    retries: int,
+    package: Optional[str],
+    env: Optional[Mapping[str, str]],
+    remove_env: Sequence[str],
+) -> Tuple[ProbeResult, bool]:
+    """probe_command() body; also returns whether the answer came from cache."""
+    from agent_reach import probe_cache
+
     path = shutil.which(cmd)
     if not path:
-        return ProbeResult("missing")
+        return ProbeResult("missing"), False
+
+    cached = probe_cache.lookup(path, args, env, remove_env)
+    if cached is not None:
+        return ProbeResult("ok", output=cached), True
 
     last: Optional[ProbeResult] = None
     for _ in range(retries + 1):
         last = _run_once(path, args, timeout, package or cmd, env, remove_env)
         if last.ok:
-            return last
+            probe_cache.store(path, args, last.output, env, remove_env)
+            return last, False
         # missing/broken won't heal between retries — only transient
         # failures (timeout/error) are worth a second attempt
         if last.status in ("missing", "broken"):
-            return last
+            return last, False
     assert last is not None  # retries + 1 always executes at least once
-    return last
+    return last, False
 
 
 def _run_once(
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""On-disk cache for successful probe_command() results.
+
+`yt-dlp --version` and friends only change answer when the binary changes,
+so a healthy result is remembered under ``~/.agent-reach/cache/probes.json``
+and keyed by the binary's *identity*: its resolved path plus the inode, size
+and mtime of both the file and its shebang interpreter. Replacing the binary,
+upgrading the venv, or deleting the interpreter (the stale-venv "broken"
+case) changes or voids the identity, so the cached answer is never reused.
+
+Only "ok" results are cached: failures must always be re-diagnosed live.
+The cache holds version strings, never credentials. It is written only when
+``~/.agent-reach`` already exists, so a read-only command on a fresh machine
+still creates nothing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator, Mapping, Optional, Sequence
+
+from agent_reach.utils.paths import (
+    PrivatePathError,
+    atomic_write_private_text,
+    read_small_text_no_follow,
+)
+
+#: How long a cached probe stays valid even if the binary looks unchanged.
+PROBE_CACHE_TTL_SECONDS = 24 * 3600
+
+_CACHE_FILE_NAME = "probes.json"
+_MAX_CACHE_BYTES = 1024 * 1024
+_MAX_SHEBANG_BYTES = 256
+_MAX_ENTRIES = 256
+
+_cache_enabled: ContextVar[bool] = ContextVar("agent_reach_probe_cache", default=True)
+_write_lock = threading.Lock()
+
+
+@contextmanager
+def probe_cache(enabled: bool) -> Iterator[None]:
+    """Enable or disable the persistent probe cache for the block (--no-cache)."""
+    token = _cache_enabled.set(enabled)
+    try:
+        yield
+    finally:
+        _cache_enabled.reset(token)
+
+
+def cache_path() -> Path:
+    from agent_reach.config import Config
+
+    return Config.CONFIG_DIR / "cache" / _CACHE_FILE_NAME
+
+
+def _stat_identity(path: str) -> Optional[list]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [os.path.realpath(path), st.st_ino, st.st_size, st.st_mtime_ns]
+
+
+def _shebang_interpreter(path: str) -> Optional[str]:
+    """Return the interpreter a script's shebang points at ("" if none)."""
+    try:
+        with open(path, "rb") as handle:
+            head = handle.read(_MAX_SHEBANG_BYTES)
+    except OSError:
+        return None
+    if not head.startswith(b"#!"):
+        return ""
+    line = head[2:].split(b"\n", 1)[0].decode("utf-8", errors="replace").strip()
+    parts = line.split()
+    if not parts:
+        return ""
+    interpreter = parts[0]
+    if os.path.basename(interpreter) == "env":
+        # `#!/usr/bin/env python3` — the real interpreter is the next token
+        target = next((p for p in parts[1:] if not p.startswith("-")), "")
+        return (shutil.which(target) or target) if target else interpreter
+    return interpreter
+
+
+def binary_identity(path: str) -> Optional[list]:
+    """Identity of an executable and its shebang interpreter, or None.
+
+    None means the identity cannot be established (file vanished, dangling
+    interpreter, ...) and the probe must run live.
+    """
+    binary = _stat_identity(path)
+    if binary is None:
+        return None
+    interpreter = _shebang_interpreter(path)
+    if interpreter is None:
+        return None
+    if not interpreter:
+        return [binary]
+    interpreter_identity = _stat_identity(interpreter)
+    if interpreter_identity is None:
+        return None
+    return [binary, interpreter_identity]
+
+
+def _entry_key(
+    path: str,
+    args: Sequence[str],
+    env: Optional[Mapping[str, str]],
+    remove_env: Sequence[str],
+) -> str:
+    # Child env values are hashed, never written to disk.
+    material = json.dumps(
+        [os.path.realpath(path), list(args), sorted((env or {}).items()), sorted(remove_env)],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _load() -> dict:
+    try:
+        raw = read_small_text_no_follow(cache_path(), max_bytes=_MAX_CACHE_BYTES)
+    except (OSError, PrivatePathError, UnicodeError):
+        return {}
+    if raw is None:
+        return {}
+    try:
+        payload = json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def lookup(
+    path: str,
+    args: Sequence[str],
+    env: Optional[Mapping[str, str]] = None,
+    remove_env: Sequence[str] = (),
+) -> Optional[str]:
+    """Return the cached output of a healthy probe, or None on a miss."""
+    if not _cache_enabled.get():
+        return None
+    identity = binary_identity(path)
+    if identity is None:
+        return None
+    entry = _load().get(_entry_key(path, args, env, remove_env))
+    if not isinstance(entry, dict) or entry.get("identity") != identity:
+        return None
+    checked_at = entry.get("checked_at")
+    if not isinstance(checked_at, (int, float)):
+        return None
+    if not 0 <= time.time() - checked_at <= PROBE_CACHE_TTL_SECONDS:
+        return None
+    output = entry.get("output")
+    return output if isinstance(output, str) else None
+
+
+def store(
+    path: str,
+    args: Sequence[str],
+    output: str,
+    env: Optional[Mapping[str, str]] = None,
+    remove_env: Sequence[str] = (),
+) -> None:
+    """Remember a healthy probe. Best effort: failures are silently ignored."""
+    if not _cache_enabled.get():
+        return
+    identity = binary_identity(path)
+    if identity is None:
+        return
+    target = cache_path()
+    # Never create ~/.agent-reach from a read-only command.
+    if not target.parent.parent.is_dir():
+        return
+    with _write_lock:
+        entries = _load()
+        entries[_entry_key(path, args, env, remove_env)] = {
+            "identity": identity,
+            "output": output,
+            "checked_at": time.time(),
+        }
+        if len(entries) > _MAX_ENTRIES:
+            ordered = sorted(
+                entries.items(),
+                key=lambda item: item[1].get("checked_at", 0)
+                if isinstance(item[1], dict)
+                else 0,
+            )
+            entries = dict(ordered[-_MAX_ENTRIES:])
+        try:
+            atomic_write_private_text(
+                target, json.dumps(entries, ensure_ascii=False, indent=0)
+            )
+        except (OSError, PrivatePathError):
+            pass
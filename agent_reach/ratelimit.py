@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""Per-host token buckets shared by every thread and process on the machine.
+
+Each host a channel calls itself (``ChannelSpec.api_hosts``) gets a bucket of
+``burst`` tokens refilled at the channel's rate. http_client takes a token
+before every request and sleeps until one is free, so concurrent agents run
+right up to a platform's limit instead of tripping its 403/412 bans.
+
+When ``~/.agent-reach`` exists the buckets live in
+``~/.agent-reach/cache/ratelimit.sqlite3`` and SQLite's write lock
+serializes the refill-and-take step across processes; otherwise (fresh
+machine, read-only command) they are kept per process and nothing is
+created. An interactive request fails fast with RateLimited when its token
+is more than MAX_WAIT_SECONDS away; bulk commands (v2ex-backfill, v2ex-watch)
+run inside patient(), which waits at least one refill interval. Rates
+default to DEFAULT_RATES and can be overridden per channel in config.yaml::
+
+    rate_limits:
+      v2ex: 60/hour
+      xueqiu: {rate: 2/s, burst: 10}
+      web: off
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from agent_reach.utils.paths import PrivatePathError, ensure_no_symlink_path, make_private_dir
+
+_DB_FILE_NAME = "ratelimit.sqlite3"
+
+#: A request never waits longer than this for a token; it fails with
+#: RateLimited instead (waiting longer than a request timeout is never useful).
+MAX_WAIT_SECONDS = 10.0
+
+#: Wait allowed inside patient(): several refills of the slowest default rate
+#: (V2EX: one token per 30s), so queued bulk requests are paced, not dropped.
+PATIENT_WAIT_SECONDS = 300.0
+
+_patient_wait: ContextVar[Optional[float]] = ContextVar(
+    "agent_reach_ratelimit_patience", default=None
+)
+
+_UNITS = {
+    "s": 1, "sec": 1, "second": 1,
+    "m": 60, "min": 60, "minute": 60,
+    "h": 3600, "hour": 3600,
+}
+_RATE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(?:/\s*([a-z]+))?\s*$")
+
+
+class RateLimited(RuntimeError):
+    """The host's bucket would need more than ``max_wait`` seconds to refill."""
+
+
+@dataclass(frozen=True)
+class Rate:
+    """``per_second`` tokens are added per second, up to ``burst``."""
+
+    per_second: float
+    burst: float
+
+    @classmethod
+    def parse(cls, value: Any, default_burst: float = 1.0) -> Optional["Rate"]:
+        """Parse ``"120/hour"``, ``"2/s"``, ``5`` or ``{rate: ..., burst: ...}``.
+
+        Returns None for ``off`` / ``0`` (no limit); ValueError when malformed.
+        """
+        burst = default_burst
+        if isinstance(value, dict):
+            if "burst" in value:
+                burst = float(value["burst"])
+            value = value.get("rate")
+        if value is False or (isinstance(value, str) and value.strip().lower() == "off"):
+            return None
+        if isinstance(value, bool) or value is None:
+            raise ValueError(f"invalid rate: {value!r}")
+        if isinstance(value, (int, float)):
+            per_second = float(value)
+        else:
+            match = _RATE_RE.match(str(value).lower())
+            if not match or (match.group(2) or "s") not in _UNITS:
+                raise ValueError(f"invalid rate: {value!r} (use e.g. 2/s, 30/min, 120/hour)")
+            per_second = float(match.group(1)) / _UNITS[match.group(2) or "s"]
+        if per_second <= 0:
+            return None
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst:g}")
+        return cls(per_second, burst)
+
+
+#: Conservative defaults per channel, below each platform's known limits
+#: (V2EX: 120 API calls per hour per IP; Jina Reader: 20/min without a key).
+DEFAULT_RATES: Dict[str, Rate] = {
+    "v2ex": Rate(120 / 3600, 20),
+    "xueqiu": Rate(1.0, 5),
+    "bilibili": Rate(1.0, 3),
+    "web": Rate(20 / 60, 5),
+}
+
+
+@contextmanager
+def patient(max_wait: float = PATIENT_WAIT_SECONDS) -> Iterator[None]:
+    """Let requests in the block wait up to ``max_wait`` seconds for a token.
+
+    Never less than one refill interval of the host's rate. For long-running
+    commands that would rather be paced than fail.
+    """
+    token = _patient_wait.set(max_wait)
+    try:
+        yield
+    finally:
+        _patient_wait.reset(token)
+
+
+def state_path() -> Path:
+    from agent_reach.config import Config
+
+    return Config.CONFIG_DIR / "cache" / _DB_FILE_NAME
+
+
+def _take(
+    tokens: float, updated_at: float, rate: Rate, now: float
+) -> Tuple[float, float]:
+    """Refill, then take one token. Returns (tokens left, seconds to wait)."""
+    tokens = min(rate.burst, tokens + max(0.0, now - updated_at) * rate.per_second)
+    wait = 0.0 if tokens >= 1 else (1 - tokens) / rate.per_second
+    # Going negative reserves the token: later callers queue behind us.
+    return tokens - 1, wait
+
+
+class RateLimiter:
+    """Token buckets keyed by host, shared through a SQLite file when possible."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        rates: Optional[Dict[str, Rate]] = None,
+        max_wait: float = MAX_WAIT_SECONDS,
+        clock: Callable[[], float] = time.time,
+        sleeper: Callable[[float], None] = time.sleep,
+    ):
+        self._path = path
+        self._fixed_rates = rates
+        self.max_wait = max_wait
+        self._clock = clock
+        self._sleeper = sleeper
+        self._lock = threading.Lock()
+        self._local: Dict[str, Tuple[float, float]] = {}
+        self._rates_signature: Any = object()
+        self._host_rates: Dict[str, Rate] = {}
+
+    @property
+    def path(self) -> Path:
+        return self._path or state_path()
+
+    # ── configuration ──
+
+    def _config_rates(self) -> Dict[str, Rate]:
+        """Per-host rates: defaults, overridden by config.yaml ``rate_limits``."""
+        from agent_reach.channels import CHANNEL_SPECS
+        from agent_reach.config import Config, ConfigError
+
+        rates: Dict[str, Optional[Rate]] = dict(DEFAULT_RATES)
+        try:
+            overrides = Config(read_only=True).get("rate_limits") or {}
+        except ConfigError:
+            overrides = {}
+        if isinstance(overrides, dict):
+            for channel, value in overrides.items():
+                default = DEFAULT_RATES.get(channel)
+                try:
+                    rates[channel] = Rate.parse(value, default.burst if default else 1.0)
+                except (TypeError, ValueError):
+                    continue  # a typo in one entry keeps that channel's default
+        by_host: Dict[str, Rate] = {}
+        for spec in CHANNEL_SPECS:
+            rate = rates.get(spec.name)
+            if rate is not None:
+                for host in spec.api_hosts:
+                    by_host[host] = rate
+        return by_host
+
+    def rate_for(self, host: str) -> Optional[Rate]:
+        if self._fixed_rates is not None:
+            return self._fixed_rates.get(host)
+        from agent_reach.config import Config
+
+        try:
+            st = os.stat(Config.CONFIG_FILE)
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+        with self._lock:
+            if signature != self._rates_signature:
+                self._host_rates = self._config_rates()
+                self._rates_signature = signature
+            return self._host_rates.get(host)
+
+    # ── buckets ──
+
+    def _reserve_shared(
+        self, host: str, rate: Rate, now: float, max_wait: float
+    ) -> Optional[float]:
+        """Take a token in the shared file; None when the file is unusable."""
+        path = self.path
+        if not path.parent.parent.is_dir():
+            return None  # never create ~/.agent-reach from here
+        try:
+            make_private_dir(path.parent)
+            ensure_no_symlink_path(path, "限流状态文件")
+            flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+            os.close(os.open(path, flags, 0o600))
+            with closing(sqlite3.connect(path, timeout=5, isolation_level=None)) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS buckets ("
+                    "host TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+                )
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(
+                        "SELECT tokens, updated_at FROM buckets WHERE host = ?", (host,)
+                    ).fetchone()
+                    tokens, updated_at = row if row else (rate.burst, now)
+                    left, wait = _take(tokens, updated_at, rate, now)
+                    if wait <= max_wait:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)", (host, left, now)
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except (OSError, PrivatePathError, sqlite3.Error):
+            return None
+        return wait
+
+    def _reserve_local(self, host: str, rate: Rate, now: float, max_wait: float) -> float:
+        with self._lock:
+            tokens, updated_at = self._local.get(host, (rate.burst, now))
+            left, wait = _take(tokens, updated_at, rate, now)
+            if wait <= max_wait:
+                self._local[host] = (left, now)
+            return wait
+
+    def acquire(self, host: Optional[str]) -> float:
+        """Block until ``host`` may be called; returns the seconds waited.
+
+        Hosts without a configured rate return immediately. Raises
+        RateLimited when the wait would exceed ``max_wait`` (inside patient():
+        its limit, and at least one refill interval).
+        """
+        rate = self.rate_for((host or "").lower())
+        if rate is None:
+            return 0.0
+        host = (host or "").lower()
+        max_wait = self.max_wait
+        patience = _patient_wait.get()
+        if patience is not None:
+            max_wait = max(max_wait, patience, 1 / rate.per_second)
+        now = self._clock()
+        wait = self._reserve_shared(host, rate, now, max_wait)
+        if wait is None:
+            wait = self._reserve_local(host, rate, now, max_wait)
+        if wait > max_wait:
+            raise RateLimited(
+                f"local rate limit for {host} reached; next request allowed in {wait:.0f}s"
+            )
+        if wait > 0:
+            self._sleeper(wait)
+        return wait
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> RateLimiter:
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
+
+
+def acquire(host: Optional[str]) -> float:
+    """Take a token for ``host`` from the process-wide limiter."""
+    return get_limiter().acquire(host)
@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+"""Shared on-disk cache for channel data responses.
+
+Agents ask for the same hot lists, profiles and articles over and over.
+Channel methods wrap their network fetch in cached(): the decoded result is
+stored under ``~/.agent-reach/cache/responses.sqlite3`` and reused by every
+process on the machine until its POLICIES entry says it is too old.
+
+- A result younger than the policy's ``ttl`` is returned without a request.
+- Within the following ``stale`` seconds it is still returned at once, while
+  a background thread fetches a fresh copy (stale-while-revalidate).
+- Older results are refetched in the foreground. Failed fetches are never
+  cached.
+
+Keys are a hash of the policy, the normalized request URL (lower-case host,
+no default port or fragment, sorted query) and the caller's ``vary`` string,
+which must identify the account whenever the request carries credentials —
+so a result fetched with one account's cookies is never served to another.
+Neither URLs nor credentials are stored in clear.
+
+The file is bounded to MAX_CACHE_BYTES, evicting least recently used
+entries. Hits are read over a read-only connection and bump an entry's
+last-use time at most once per _TOUCH_INTERVAL, so concurrent readers do
+not queue for the write lock. Like the probe cache it is only written when ``~/.agent-reach``
+already exists; otherwise results are kept in a small per-process LRU.
+cached_many() does the same for a batch of URLs and fetches all misses with
+one call, so a transport that can pipeline requests gets them together.
+cache_mode() switches caching to REFRESH (skip reads, store the new result)
+or OFF for a block of code.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from agent_reach.utils.paths import PrivatePathError, ensure_no_symlink_path, make_private_dir
+
+_DB_FILE_NAME = "responses.sqlite3"
+
+#: Total size of cached results on disk before LRU eviction.
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+#: Results larger than this are never cached.
+MAX_ENTRY_BYTES = 4 * 1024 * 1024
+
+_MEMORY_MAX_BYTES = 8 * 1024 * 1024
+
+USE = "use"
+REFRESH = "refresh"
+OFF = "off"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Serve for ``ttl`` seconds, then ``stale`` more while refreshing in the background."""
+
+    ttl: float
+    stale: float = 0.0
+
+
+#: Per channel method. Quotes move every few seconds and are never served
+#: stale; profiles and articles change rarely.
+POLICIES: Dict[str, CachePolicy] = {
+    "v2ex.hot_topics": CachePolicy(300, 900),
+    "v2ex.node_topics": CachePolicy(300, 900),
+    "v2ex.topic": CachePolicy(600, 3600),
+    "v2ex.replies": CachePolicy(300, 3600),
+    "v2ex.user": CachePolicy(6 * 3600, 24 * 3600),
+    "xueqiu.stock_quote": CachePolicy(10),
+    "xueqiu.search_stock": CachePolicy(24 * 3600, 7 * 24 * 3600),
+    "xueqiu.hot_posts": CachePolicy(300, 900),
+    "xueqiu.hot_stocks": CachePolicy(120, 300),
+    "web.read": CachePolicy(3600, 24 * 3600),
+}
+
+_mode: ContextVar[str] = ContextVar("agent_reach_response_cache", default=USE)
+
+
+@contextmanager
+def cache_mode(mode: str) -> Iterator[None]:
+    """Use USE, REFRESH (--refresh) or OFF (--no-cache) for the block."""
+    if mode not in (USE, REFRESH, OFF):
+        raise ValueError(f"unknown cache mode: {mode!r}")
+    token = _mode.set(mode)
+    try:
+        yield
+    finally:
+        _mode.reset(token)
+
+
+def current_mode() -> str:
+    return _mode.get()
+
+
+#: An entry's last-use time is rewritten on a hit at most this often (seconds).
+_TOUCH_INTERVAL = 60.0
+
+
+def cache_path() -> Path:
+    from agent_reach.config import Config
+
+    return Config.CONFIG_DIR / "cache" / _DB_FILE_NAME
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of ``url`` for cache keys; equivalent URLs compare equal."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    port = parts.port
+    if port is not None and (scheme, port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{port}"
+    if parts.username is not None or parts.password is not None:
+        userinfo = parts.netloc.rpartition("@")[0]
+        host = f"{userinfo}@{host}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def cache_key(policy: str, url: str, vary: str = "") -> str:
+    material = json.dumps([policy, normalize_url(url), vary], ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseStore:
+    """JSON values keyed by cache_key(), LRU-bounded, shared through SQLite when possible."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        max_bytes: int = MAX_CACHE_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._path = path
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._memory_bytes = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path or cache_path()
+
+    def _shared(self) -> bool:
+        return self.path.parent.parent.is_dir()  # never create ~/.agent-reach
+
+    def _connect(self) -> sqlite3.Connection:
+        path = self.path
+        make_private_dir(path.parent)
+        ensure_no_symlink_path(path, "响应缓存文件")
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+        os.close(os.open(path, flags, 0o600))
+        conn = sqlite3.connect(path, timeout=5, isolation_level=None)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+            "size INTEGER NOT NULL, value TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (accessed_at)")
+        return conn
+
+    def _touch(self, key: str, now: float) -> None:
+        """Best-effort last-use bump; skipped while another process writes."""
+        try:
+            with closing(sqlite3.connect(self.path, timeout=0, isolation_level=None)) as conn:
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        except sqlite3.Error:
+            pass
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        """``(age in seconds, value)`` for ``key``, or None; marks the entry as used."""
+        now = self._clock()
+        raw = None
+        if self._shared():
+            path = self.path
+            try:
+                if not path.is_file():
+                    return None
+                ensure_no_symlink_path(path, "响应缓存文件")
+                uri = path.resolve().as_uri() + "?mode=ro"
+                with closing(sqlite3.connect(uri, uri=True, timeout=5)) as conn:
+                    row = conn.execute(
+                        "SELECT stored_at, accessed_at, value FROM responses WHERE key = ?",
+                        (key,),
+                    ).fetchone()
+            except (OSError, PrivatePathError, sqlite3.Error):
+                return None
+            if row is None:
+                return None
+            stored_at, accessed_at, value = row
+            if now - accessed_at >= _TOUCH_INTERVAL:
+                self._touch(key, now)
+            raw = (stored_at, value)
+        else:
+            with self._lock:
+                raw = self._memory.get(key)
+                if raw is not None:
+                    self._memory.move_to_end(key)
+        if raw is None:
+            return None
+        try:
+            return now - raw[0], json.loads(raw[1])
+        except ValueError:
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` (JSON-serializable) and evict the least recently used."""
+        text = json.dumps(value, ensure_ascii=False)
+        size = len(text.encode("utf-8"))
+        if size > min(MAX_ENTRY_BYTES, self.max_bytes):
+            return
+        now = self._clock()
+        if self._shared():
+            try:
+                with closing(self._connect()) as conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                            (key, now, now, size, text),
+                        )
+                        self._evict(conn)
+                        conn.execute("COMMIT")
+                    except BaseException:
+                        conn.execute("ROLLBACK")
+                        raise
+                return
+            except (OSError, PrivatePathError, sqlite3.Error):
+                pass  # fall back to this process's memory
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= len(old[1].encode("utf-8"))
+            self._memory[key] = (now, text)
+            self._memory_bytes += size
+            limit = min(self.max_bytes, _MEMORY_MAX_BYTES)
+            while self._memory_bytes > limit:
+                _, (_, evicted) = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted.encode("utf-8"))
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        doomed = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+
+_store: Optional[ResponseStore] = None
+_store_lock = threading.Lock()
+_refreshing: Set[str] = set()
+_refreshing_lock = threading.Lock()
+
+
+def get_store() -> ResponseStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ResponseStore()
+        return _store
+
+
+def _refresh_in_background(store: ResponseStore, key: str, fetch: Callable[[], Any]) -> None:
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def run() -> None:
+        try:
+            store.put(key, fetch())
+        except Exception:  # noqa: BLE001 — the stale copy was already served
+            pass
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    # Keep the caller's cache mode and timings recorder, like every other worker.
+    threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(run,),
+        name="agent-reach-cache-refresh",
+        daemon=True,
+    ).start()
+
+
+def cached(policy: str, url: str, fetch: Callable[[], Any], *, vary: str = "") -> Any:
+    """Return ``fetch()``'s result for ``url``, served from the cache when fresh.
+
+    ``fetch`` must return a JSON-serializable value and raise on failure.
+    ``policy`` names a POLICIES entry; ``vary`` identifies the account when
+    the request carries credentials (cookies, tokens).
+    """
+    rule = POLICIES[policy]
+    mode = _mode.get()
+    if mode == OFF or rule.ttl <= 0:
+        return fetch()
+    store = get_store()
+    key = cache_key(policy, url, vary)
+    if mode == USE:
+        hit = store.get(key)
+        if hit is not None:
+            age, value = hit
+            if age < rule.ttl:
+                return value
+            if age < rule.ttl + rule.stale:
+                _refresh_in_background(store, key, fetch)
+                return value
+    value = fetch()
+    store.put(key, value)
+    return value
+
+
+def cached_many(
+    policy: str,
+    urls: Sequence[str],
+    fetch_many: Callable[[List[str]], List[Any]],
+    *,
+    vary: str = "",
+) -> List[Any]:
+    """cached() for several URLs; the misses are fetched with one ``fetch_many`` call.
+
+    ``fetch_many(urls)`` returns one entry per URL, in order, where a URL
+    that failed is represented by its exception. The result has the same
+    shape; exceptions are returned, not raised, and never cached.
+    """
+    rule = POLICIES[policy]
+    mode = _mode.get()
+    if mode == OFF or rule.ttl <= 0:
+        return list(fetch_many(list(urls)))
+    store = get_store()
+    results: List[Any] = [None] * len(urls)
+    missing: List[int] = []
+    for index, url in enumerate(urls):
+        hit = store.get(cache_key(policy, url, vary)) if mode == USE else None
+        if hit is None or hit[0] >= rule.ttl + rule.stale:
+            missing.append(index)
+            continue
+        age, results[index] = hit
+        if age >= rule.ttl:
+            _refresh_in_background(
+                store, cache_key(policy, url, vary), functools.partial(_fetch_one, fetch_many, url)
+            )
+    if missing:
+        fetched = fetch_many([urls[index] for index in missing])
+        for index, value in zip(missing, fetched):
+            if not isinstance(value, BaseException):
+                store.put(cache_key(policy, urls[index], vary), value)
+            results[index] = value
+    return results
+
+
+def _fetch_one(fetch_many: Callable[[List[str]], List[Any]], url: str) -> Any:
+    (value,) = fetch_many([url])
+    if isinstance(value, BaseException):
+        raise value
+    return value
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Latency instrumentation for health checks.
+
+Doctor wraps every channel check in ``recording()``; the probes a check runs
+(subprocess probes, HTTP probes, config-file reads) report themselves through
+``timed()``. Outside a recording block ``timed()`` costs one ContextVar
+lookup, so the hooks can stay in place for normal commands.
+
+A backend shared across channels (see probe.shared_probe) is timed once, by
+the channel that actually ran it.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+from urllib.parse import urlsplit
+
+#: Operation kinds reported in ``doctor --json``.
+SUBPROCESS = "subprocess"
+HTTP = "http"
+CONFIG = "config"
+
+
+@dataclass(frozen=True)
+class Operation:
+    kind: str  # "subprocess" | "http" | "config"
+    label: str
+    duration: float  # seconds
+    outcome: str  # "ok", a probe status, or the exception class name
+
+    def as_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "label": self.label,
+            "duration": round(self.duration, 4),
+            "outcome": self.outcome,
+        }
+
+
+def http_label(url: str) -> str:
+    """Label an HTTP probe by host and path only: no query, no userinfo."""
+    try:
+        parts = urlsplit(url)
+        host = parts.hostname or ""
+    except ValueError:
+        return "<invalid url>"
+    return f"{parts.scheme.upper()} {host}{parts.path}"
+
+
+class Recorder:
+    """Thread-safe list of operations recorded for one channel check."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._operations: List[Operation] = []
+
+    def add(self, operation: Operation) -> None:
+        with self._lock:
+            self._operations.append(operation)
+
+    def snapshot(self) -> List[Operation]:
+        with self._lock:
+            return list(self._operations)
+
+
+class _Timing:
+    """Handle yielded by timed(); set ``outcome`` to override the default."""
+
+    __slots__ = ("outcome",)
+
+    def __init__(self) -> None:
+        self.outcome: Optional[str] = None
+
+
+_recorder: ContextVar[Optional[Recorder]] = ContextVar(
+    "agent_reach_timings", default=None
+)
+
+
+@contextmanager
+def recording(recorder: Optional[Recorder] = None) -> Iterator[Recorder]:
+    """Collect every timed() operation in the block into ``recorder``."""
+    recorder = recorder if recorder is not None else Recorder()
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+@contextmanager
+def timed(kind: str, label: str) -> Iterator[_Timing]:
+    """Time the block as one operation of ``kind``.
+
+    The outcome defaults to "ok", or to the exception class name when the
+    block raises (the exception is re-raised unchanged).
+    """
+    recorder = _recorder.get()
+    timing = _Timing()
+    if recorder is None:
+        yield timing
+        return
+    started = time.perf_counter()
+    try:
+        yield timing
+    except BaseException as exc:
+        timing.outcome = timing.outcome or type(exc).__name__
+        raise
+    finally:
+        recorder.add(
+            Operation(kind, label, time.perf_counter() - started, timing.outcome or "ok")
+        )
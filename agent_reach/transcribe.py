@@ -27,11 +27,11 @@ import socket
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 from urllib.parse import urlparse
 
-import requests
-
+from agent_reach import http_client
+from agent_reach.breaker import CircuitOpen
 from agent_reach.config import Config
 
 # Whisper API limit is 25MB; leave headroom for multipart overhead.
@@ -75,6 +75,10 @@ _BLOCKED_HOSTS = {
 }
 
 
+#: progress(done, total, message); total is None until the chunk count is known.
+ProgressCallback = Callable[[float, Optional[float], str], None]
+
+
 def _require(binary: str) -> None:
     if not shutil.which(binary):
         raise MissingDependency(f"{binary} not found in PATH")
@@ -376,17 +380,20 @@ def transcribe_chunk(
             f"(configure with `agent-reach configure {provider}-key ...`)"
         )
 
+    import requests
+
     info = PROVIDERS[provider]
     with chunk.open("rb") as fh:
         try:
-            resp = requests.post(
+            resp = http_client.post(
                 info["endpoint"],
                 headers={"Authorization": f"Bearer {key}"},
                 files={"file": (chunk.name, fh, "audio/m4a")},
                 data={"model": info["model"], "response_format": "text"},
                 timeout=timeout,
+                raise_for_status=False,
             )
-        except requests.RequestException as e:
+        except (requests.RequestException, CircuitOpen) as e:
             raise TranscribeError(f"{provider}: network error: {e}") from e
 
     if not resp.ok:
@@ -409,6 +416,7 @@ def transcribe(
     out_dir: Optional[Path] = None,
     config: Optional[Config] = None,
     allow_provider_fallback: bool = False,
+    progress: Optional[ProgressCallback] = None,
 ) -> str:
     """Transcribe a URL or local file path. Returns the joined transcript text.
 
@@ -417,6 +425,8 @@ def transcribe(
     `allow_provider_fallback=True` to permit sending failed chunks to the next
     configured provider; using the flag with an explicit provider is rejected.
     `out_dir` defaults to a fresh temp directory; intermediate files stay there.
+    `progress(done, total, message)` is called as each stage (download,
+    compression, every chunk) finishes; `total` becomes known after chunking.
     """
     if allow_provider_fallback and provider != "auto":
         raise TranscribeError(
@@ -435,14 +445,25 @@ def transcribe(
     if provider == "auto" and not allow_provider_fallback:
         order = configured[:1]
 
+    report = progress or _no_progress
     if out_dir:
-        return _transcribe_in_dir(source, order, cfg, Path(out_dir))
+        return _transcribe_in_dir(source, order, cfg, Path(out_dir), report)
 
     with tempfile.TemporaryDirectory(prefix="transcribe-") as tmp:
-        return _transcribe_in_dir(source, order, cfg, Path(tmp))
+        return _transcribe_in_dir(source, order, cfg, Path(tmp), report)
 
 
-def _transcribe_in_dir(source: str, order: List[str], cfg: Config, work_dir: Path) -> str:
+def _no_progress(done: float, total: Optional[float], message: str) -> None:
+    pass
+
+
+def _transcribe_in_dir(
+    source: str,
+    order: List[str],
+    cfg: Config,
+    work_dir: Path,
+    progress: ProgressCallback = _no_progress,
+) -> str:
     work_dir.mkdir(parents=True, exist_ok=True)
 
     src_path = Path(source)
@@ -450,6 +471,7 @@ def _transcribe_in_dir(source: str, order: List[str], cfg: Config, work_dir: Pat
         audio = src_path
     else:
         audio = download_audio(source, work_dir)
+        progress(1, None, "audio downloaded")
 
     _require_size_at_most(audio, MAX_SOURCE_BYTES, "source")
     _require_duration_within_budget(audio)
@@ -477,10 +499,14 @@ def _transcribe_in_dir(source: str, order: List[str], cfg: Config, work_dir: Pat
             f"safety limit is {limit_mib:g} MiB"
         )
 
+    # Steps: download + compress + one per chunk.
+    total = 2 + len(chunks)
+    progress(2, total, f"audio compressed into {len(chunks)} chunk(s)")
     pieces: List[str] = []
-    for chunk in chunks:
+    for index, chunk in enumerate(chunks, start=1):
         text = _transcribe_with_fallback(chunk, order, cfg)
         pieces.append(text.strip())
+        progress(2 + index, total, f"transcribed chunk {index}/{len(chunks)}")
     return "\n".join(p for p in pieces if p)
 
 
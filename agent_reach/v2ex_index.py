@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+"""Local full-text index of V2EX topics and replies behind V2EXChannel.search().
+
+The public V2EX API has no search endpoint, so search() answers from
+``~/.agent-reach/v2ex_index.sqlite3``, an SQLite FTS5 index of what this
+machine has fetched:
+
+- with ``v2ex_index: true`` in config.yaml (or ``V2EX_INDEX=1``), every topic
+  and reply the channel fetches is added as a side effect;
+- ``agent-reach v2ex-backfill NODE...`` crawls chosen nodes into it.
+
+FTS5's unicode61 tokenizer would treat a whole run of Chinese text as one
+token, so text is tokenized here before it reaches SQLite. Latin words and
+numbers stay words; each CJK run becomes overlapping bigrams plus its last
+character ("标准库" → "标准 准库 库"). A query is split the same way and all
+of its tokens must match; a single CJK character matches as a prefix.
+Results are ranked with bm25 (titles weigh more than bodies) and carry a
+snippet cut from the original text around the first match.
+
+Like the history database the index is only written when ``~/.agent-reach``
+already exists, and readers open it read-only. Indexing is best effort: a
+failure never breaks the fetch that triggered it.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from agent_reach.utils.paths import PrivatePathError, ensure_no_symlink_path
+
+_DB_FILE_NAME = "v2ex_index.sqlite3"
+_API_BASE = "https://www.v2ex.com"
+
+#: Longest body kept per topic or reply.
+MAX_CONTENT_CHARS = 20_000
+
+_SNIPPET_BEFORE = 40
+_SNIPPET_AFTER = 80
+
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af"
+_CJK_RE = re.compile(f"[{_CJK}]")
+_TOKEN_RE = re.compile(f"[{_CJK}]+|[^\\W_{_CJK}]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    topic_id INTEGER NOT NULL,
+    node TEXT NOT NULL,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    content TEXT NOT NULL,
+    url TEXT NOT NULL,
+    created INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(title, body, tokenize = 'unicode61');
+"""
+
+
+def index_path() -> Path:
+    from agent_reach.config import Config
+
+    return Config.CONFIG_DIR / _DB_FILE_NAME
+
+
+def tokenize(text: str) -> List[str]:
+    """Index tokens of ``text``: lower-cased words, CJK bigrams and run ends."""
+    tokens: List[str] = []
+    for run in _TOKEN_RE.findall((text or "").lower()):
+        if _CJK_RE.match(run):
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+            tokens.append(run[-1])
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def match_expression(query: str) -> str:
+    """FTS5 MATCH expression requiring every token of ``query``; "" if none."""
+    terms = []
+    for run in _TOKEN_RE.findall((query or "").lower()):
+        if _CJK_RE.match(run) and len(run) == 1:
+            terms.append(f'"{run}"*')
+        elif _CJK_RE.match(run):
+            terms.extend(f'"{run[i:i + 2]}"' for i in range(len(run) - 1))
+        else:
+            terms.append(f'"{run}"')
+    return " ".join(dict.fromkeys(terms))
+
+
+def snippet(text: str, query: str) -> str:
+    """A short excerpt of ``text`` around the first query word, marked with **."""
+    flat = " ".join((text or "").split())
+    lowered = flat.lower()
+    best = None
+    for word in _TOKEN_RE.findall((query or "").lower()):
+        for candidate in (word, word[:2]):
+            pos = lowered.find(candidate)
+            if pos >= 0:
+                if best is None or pos < best[0]:
+                    best = (pos, len(candidate))
+                break
+    if best is None:
+        head = flat[:_SNIPPET_BEFORE + _SNIPPET_AFTER]
+        return head + ("…" if len(flat) > len(head) else "")
+    pos, length = best
+    start = max(0, pos - _SNIPPET_BEFORE)
+    end = min(len(flat), pos + length + _SNIPPET_AFTER)
+    return (
+        ("…" if start else "")
+        + flat[start:pos]
+        + f"**{flat[pos:pos + length]}**"
+        + flat[pos + length:end]
+        + ("…" if end < len(flat) else "")
+    )
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _topic_doc(item: dict, node: str = "") -> Optional[tuple]:
+    topic_id = _int(item.get("id"))
+    if not topic_id:
+        return None
+    return (
+        f"topic:{topic_id}",
+        "topic",
+        topic_id,
+        (item.get("node") or {}).get("name") or node,
+        item.get("title") or "",
+        (item.get("member") or {}).get("username") or "",
+        (item.get("content") or "")[:MAX_CONTENT_CHARS],
+        item.get("url") or f"{_API_BASE}/t/{topic_id}",
+        _int(item.get("created")),
+    )
+
+
+def _reply_doc(topic_id: int, reply: dict) -> Optional[tuple]:
+    author = (reply.get("member") or {}).get("username") or ""
+    created = _int(reply.get("created"))
+    reply_id = _int(reply.get("id"))
+    key = f"reply:{reply_id}" if reply_id else f"reply:{topic_id}:{created}:{author}"
+    return (
+        key,
+        "reply",
+        topic_id,
+        "",
+        "",
+        author,
+        (reply.get("content") or "")[:MAX_CONTENT_CHARS],
+        f"{_API_BASE}/t/{topic_id}" + (f"#r_{reply_id}" if reply_id else ""),
+        created,
+    )
+
+
+class V2EXIndex:
+    """SQLite FTS5 index of V2EX topics and replies."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path or index_path()
+
+    def _connect(self) -> sqlite3.Connection:
+        path = self.path
+        ensure_no_symlink_path(path, "V2EX 索引文件")
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+        os.close(os.open(path, flags, 0o600))
+        conn = sqlite3.connect(path, timeout=5, isolation_level=None)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _write(self, docs: List[tuple]) -> int:
+        # Never create ~/.agent-reach from a read-only command.
+        if not docs or not self.path.parent.is_dir():
+            return 0
+        now = time.time()
+        try:
+            with self._lock, closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    for doc in docs:
+                        self._upsert(conn, doc, now)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except (OSError, PrivatePathError, sqlite3.Error):
+            return 0
+        return len(docs)
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, doc: tuple, now: float) -> None:
+        key, kind, topic_id, node, title, author, content, url, created = doc
+        row = conn.execute("SELECT id, node FROM docs WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            cursor = conn.execute(
+                "INSERT INTO docs (key, kind, topic_id, node, title, author, content, url, "
+                "created, indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, kind, topic_id, node, title, author, content, url, created, now),
+            )
+            rowid = cursor.lastrowid
+        else:
+            rowid = row[0]
+            conn.execute(
+                "UPDATE docs SET node = ?, title = ?, author = ?, content = ?, url = ?, "
+                "created = ?, indexed_at = ? WHERE id = ?",
+                (node or row[1], title, author, content, url, created, now, rowid),
+            )
+            conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (rowid,))
+        conn.execute(
+            "INSERT INTO docs_fts (rowid, title, body) VALUES (?, ?, ?)",
+            (rowid, " ".join(tokenize(title)), " ".join(tokenize(content))),
+        )
+
+    def add_topics(self, items: Iterable[dict], node: str = "") -> int:
+        """Index raw topic objects from the topics API; returns how many."""
+        docs = [_topic_doc(item, node) for item in items if isinstance(item, dict)]
+        return self._write([doc for doc in docs if doc is not None])
+
+    def add_replies(self, topic_id: int, replies: Iterable[dict]) -> int:
+        """Index raw reply objects of one topic; returns how many."""
+        topic_id = _int(topic_id)
+        if not topic_id:
+            return 0
+        docs = [_reply_doc(topic_id, reply) for reply in replies if isinstance(reply, dict)]
+        return self._write([doc for doc in docs if doc is not None])
+
+    def _read(self, sql: str, params=()) -> list:
+        path = self.path
+        try:
+            if not path.is_file():
+                return []
+            ensure_no_symlink_path(path, "V2EX 索引文件")
+            uri = f"file:{quote(os.fspath(path))}?mode=ro"
+            with closing(sqlite3.connect(uri, uri=True, timeout=5)) as conn:
+                return conn.execute(sql, params).fetchall()
+        except (OSError, PrivatePathError, sqlite3.Error):
+            return []
+
+    def count(self) -> int:
+        rows = self._read("SELECT COUNT(*) FROM docs")
+        return rows[0][0] if rows else 0
+
+    def search(self, query: str, limit: int = 10, node: Optional[str] = None) -> List[dict]:
+        """Best matches for ``query``, best first.
+
+        Each result has: title, url, snippet, kind ("topic" or "reply"),
+        topic_id, node_name, author, created, score. A reply carries its
+        topic's title when the topic is indexed too.
+        """
+        expression = match_expression(query)
+        if not expression or limit < 1:
+            return []
+        sql = (
+            "SELECT d.kind, d.topic_id, COALESCE(NULLIF(d.node, ''), t.node, ''), "
+            "COALESCE(NULLIF(d.title, ''), t.title, ''), d.author, d.content, d.url, "
+            "d.created, bm25(docs_fts, 5.0, 1.0) AS rank "
+            "FROM docs_fts JOIN docs d ON d.id = docs_fts.rowid "
+            "LEFT JOIN docs t ON t.key = 'topic:' || d.topic_id AND d.kind = 'reply' "
+            "WHERE docs_fts MATCH ?"
+        )
+        params: list = [expression]
+        if node:
+            sql += " AND COALESCE(NULLIF(d.node, ''), t.node, '') = ?"
+            params.append(node)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        return [
+            {
+                "title": title,
+                "url": url,
+                "snippet": snippet(content or title, query),
+                "kind": kind,
+                "topic_id": topic_id,
+                "node_name": node_name,
+                "author": author,
+                "created": created,
+                "score": round(-rank, 3),
+            }
+            for kind, topic_id, node_name, title, author, content, url, created, rank in self._read(
+                sql, params
+            )
+        ]
+
+
+_index: Optional[V2EXIndex] = None
+_index_lock = threading.Lock()
+_recording: ContextVar[bool] = ContextVar("agent_reach_v2ex_index", default=False)
+#: (config signature, enabled) of the last indexing_enabled() lookup.
+_enabled: Optional[Tuple[tuple, bool]] = None
+_enabled_lock = threading.Lock()
+
+
+def get_index() -> V2EXIndex:
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = V2EXIndex()
+        return _index
+
+
+def indexing_enabled(config=None) -> bool:
+    """Whether fetched topics are indexed (``v2ex_index`` in config.yaml).
+
+    Called for every fetched page, so without ``config`` the answer is reused
+    until config.yaml (or V2EX_INDEX) changes.
+    """
+    if config is not None:
+        return _config_enables(config)
+    global _enabled
+    from agent_reach.config import Config
+
+    path = Config.CONFIG_FILE
+    try:
+        st = os.stat(path)
+        stamp: tuple = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = ()
+    signature = (str(path), stamp, os.environ.get("V2EX_INDEX"))
+    with _enabled_lock:
+        if _enabled is None or _enabled[0] != signature:
+            _enabled = (signature, _config_enables(None))
+        return _enabled[1]
+
+
+def _config_enables(config) -> bool:
+    try:
+        from agent_reach.config import Config
+
+        cfg = config if config is not None else Config(read_only=True)
+        value = cfg.get("v2ex_index")
+    except Exception:
+        return False
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+@contextmanager
+def recording() -> Iterator[None]:
+    """Index everything fetched in the block, whatever config.yaml says (backfill)."""
+    token = _recording.set(True)
+    try:
+        yield
+    finally:
+        _recording.reset(token)
+
+
+def record_topics(items: Iterable[dict], node: str = "") -> None:
+    """Index fetched topics when indexing is enabled."""
+    if _recording.get() or indexing_enabled():
+        get_index().add_topics(items, node)
+
+
+def record_replies(topic_id: int, replies: Iterable[dict]) -> None:
+    """Index a topic's fetched replies when indexing is enabled."""
+    if _recording.get() or indexing_enabled():
+        get_index().add_replies(topic_id, replies)
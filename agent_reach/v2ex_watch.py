@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""Incremental V2EX node watcher behind `agent-reach v2ex-watch`.
+
+Each poll fetches only the first page of a node and reports what moved
+since the last poll of that node:
+
+- ``new``: a topic above the node's high-water mark (the highest topic id
+  seen so far; V2EX ids only grow);
+- ``changed``: a topic already reported whose reply count went up.
+
+The first poll of a node only records the high-water mark (pass
+``include_existing`` to report the topics already there). Per node the
+watcher keeps the mark, the reply counts of the topics on the last page and
+a poll interval that follows how often the node posts: the median gap
+between its newest topics, clamped to MIN_INTERVAL..MAX_INTERVAL. A node
+posting every few minutes is polled every few minutes; a quiet one hourly.
+
+Due nodes are polled concurrently; every request still takes a token from
+the shared V2EX rate limiter. Polls bypass the response cache (while still
+refreshing it, and revalidating with ETag). State lives in
+``~/.agent-reach/v2ex_watch.json``; like the other caches it is only written
+when ``~/.agent-reach`` already exists, otherwise it is kept in memory.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from agent_reach import response_cache
+from agent_reach.utils.paths import (
+    PrivatePathError,
+    atomic_write_private_text,
+    read_small_text_no_follow,
+)
+from agent_reach.utils.text import scrub_url_credentials
+
+_STATE_FILE_NAME = "v2ex_watch.json"
+_MAX_STATE_BYTES = 4 * 1024 * 1024
+
+#: Bounds of a node's adaptive poll interval, in seconds.
+MIN_INTERVAL = 60.0
+MAX_INTERVAL = 3600.0
+
+#: Interval for a node whose posting rate is not known yet.
+DEFAULT_INTERVAL = 300.0
+
+#: Newest topics whose creation gaps set a node's interval.
+_RATE_SAMPLE = 10
+
+#: Nodes polled at once.
+_MAX_PARALLEL_NODES = 4
+
+
+def state_path() -> Path:
+    from agent_reach.config import Config
+
+    return Config.CONFIG_DIR / _STATE_FILE_NAME
+
+
+@dataclass
+class NodeState:
+    """What the watcher remembers about one node between polls."""
+
+    last_id: int = 0
+    replies: Dict[int, int] = field(default_factory=dict)
+    interval: float = DEFAULT_INTERVAL
+    next_poll: float = 0.0
+    polled: bool = False
+
+    def as_dict(self) -> dict:
+        return {
+            "last_id": self.last_id,
+            "replies": {str(k): v for k, v in self.replies.items()},
+            "interval": self.interval,
+            "next_poll": self.next_poll,
+            "polled": self.polled,
+        }
+
+    @classmethod
+    def from_dict(cls, data: object) -> "NodeState":
+        if not isinstance(data, dict):
+            return cls()
+        try:
+            return cls(
+                last_id=int(data.get("last_id", 0)),
+                replies={int(k): int(v) for k, v in (data.get("replies") or {}).items()},
+                interval=float(data.get("interval", DEFAULT_INTERVAL)),
+                next_poll=float(data.get("next_poll", 0.0)),
+                polled=bool(data.get("polled", False)),
+            )
+        except (AttributeError, TypeError, ValueError):
+            return cls()
+
+
+def adaptive_interval(created: Sequence[int]) -> float:
+    """Poll interval from the creation times of a node's newest topics."""
+    newest = sorted((c for c in created if c), reverse=True)[:_RATE_SAMPLE]
+    gaps = [a - b for a, b in zip(newest, newest[1:]) if a > b]
+    if not gaps:
+        return MAX_INTERVAL if newest else DEFAULT_INTERVAL
+    return min(MAX_INTERVAL, max(MIN_INTERVAL, statistics.median(gaps)))
+
+
+def _topic_id(record: dict) -> int:
+    try:
+        return int(record.get("id") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class NodeWatcher:
+    """Poll V2EX nodes and report new or changed topics since the last poll."""
+
+    def __init__(
+        self,
+        nodes: Sequence[str],
+        *,
+        channel=None,
+        path: Optional[Path] = None,
+        include_existing: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        if channel is None:
+            from agent_reach.channels.v2ex import V2EXChannel
+
+            channel = V2EXChannel()
+        self.nodes = list(dict.fromkeys(nodes))
+        self.channel = channel
+        self._path = path
+        self.include_existing = include_existing
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.errors: Dict[str, str] = {}
+        saved = self._load()
+        self.states: Dict[str, NodeState] = {
+            node: NodeState.from_dict(saved.get(node)) for node in self.nodes
+        }
+
+    @property
+    def path(self) -> Path:
+        return self._path or state_path()
+
+    def _load(self) -> dict:
+        try:
+            raw = read_small_text_no_follow(self.path, max_bytes=_MAX_STATE_BYTES)
+        except (OSError, PrivatePathError, UnicodeError):
+            return {}
+        try:
+            payload = json.loads(raw) if raw else {}
+        except json.JSONDecodeError:
+            return {}
+        nodes = payload.get("nodes") if isinstance(payload, dict) else None
+        return nodes if isinstance(nodes, dict) else {}
+
+    def save(self) -> bool:
+        """Persist every node's state (merged with nodes other runs watch)."""
+        target = self.path
+        # Never create ~/.agent-reach from a read-only command.
+        if not target.parent.is_dir():
+            return False
+        with self._lock:
+            nodes = self._load()
+            nodes.update({node: state.as_dict() for node, state in self.states.items()})
+            try:
+                atomic_write_private_text(target, json.dumps({"nodes": nodes}, ensure_ascii=False))
+            except (OSError, PrivatePathError):
+                return False
+        return True
+
+    def seconds_until_due(self) -> float:
+        now = self._clock()
+        return max(0.0, min(state.next_poll for state in self.states.values()) - now)
+
+    def poll(self, *, force: bool = False) -> List[dict]:
+        """Poll every due node (all with ``force``) and return its events.
+
+        Events are topic records (see V2EXChannel.get_node_topics) plus
+        ``event`` ("new" or "changed") and ``node``, oldest first per node.
+        A node that fails keeps its state and is retried after its interval;
+        ``errors`` maps the nodes that failed in this poll to their message.
+        """
+        now = self._clock()
+        due = [n for n in self.nodes if force or self.states[n].next_poll <= now]
+        self.errors = {}
+        if not due:
+            return []
+        with response_cache.cache_mode(response_cache.REFRESH), ThreadPoolExecutor(
+            max_workers=min(_MAX_PARALLEL_NODES, len(due)),
+            thread_name_prefix="agent-reach-v2ex-watch",
+        ) as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, self._poll_node, node)
+                for node in due
+            ]
+            events = [event for future in futures for event in future.result()]
+        self.save()
+        return events
+
+    def _poll_node(self, node: str) -> List[dict]:
+        state = self.states[node]
+        try:
+            topics = list(self.channel.iter_node_topics(node, max_pages=1))
+        except Exception as exc:  # noqa: BLE001 — one node must not stop the rest
+            self.errors[node] = scrub_url_credentials(exc)
+            state.next_poll = self._clock() + state.interval
+            return []
+
+        events = []
+        report = state.polled or self.include_existing
+        for topic in sorted(topics, key=_topic_id):
+            topic_id = _topic_id(topic)
+            replies = _int(topic.get("replies"))
+            if topic_id > state.last_id:
+                kind = "new"
+            elif topic_id in state.replies and replies > state.replies[topic_id]:
+                kind = "changed"
+            else:
+                continue
+            if report:
+                events.append({"event": kind, "node": node, **topic})
+
+        state.last_id = max([state.last_id, *map(_topic_id, topics)])
+        state.replies = {_topic_id(t): _int(t.get("replies")) for t in topics if _topic_id(t)}
+        state.interval = adaptive_interval([_int(t.get("created")) for t in topics])
+        state.next_poll = self._clock() + state.interval
+        state.polled = True
+        return events
+
+
+def to_ndjson(event: dict) -> str:
+    return json.dumps(event, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Incremental health checks for `agent-reach watch --daemon`.
+
+A channel's local health only changes when one of its inputs changes: a
+command appearing on (or vanishing from) PATH, a binary being upgraded,
+``config.yaml`` being edited, a credential file being written, or the
+mcporter config layers moving. Each ChannelSpec lists those inputs; the
+watcher fingerprints them with ``stat()`` (path, inode, size, mtime — never
+file contents) and re-runs doctor only for channels whose fingerprint moved.
+
+Polling stat() is used instead of inotify: it is stdlib-only, works the
+same on macOS/Windows, and a few dozen stat calls per interval cost
+effectively nothing.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from agent_reach.channels import CHANNEL_SPECS, ChannelSpec
+from agent_reach.utils.paths import home_dir
+
+Fingerprint = Tuple
+
+
+@dataclass(frozen=True)
+class Transition:
+    """One channel whose doctor status changed between two polls."""
+
+    channel: str
+    name: str
+    before: Optional[str]             # None on the baseline poll
+    after: str
+    message: str
+
+
+def _stat_identity(path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _expand_home(path: str) -> Path:
+    if path.startswith("~/"):
+        return home_dir() / path[2:]
+    return Path(path)
+
+
+def _binary_identity(name: str) -> Tuple:
+    path = shutil.which(name)
+    return (name, path, _stat_identity(path) if path else None)
+
+
+def _mcporter_identity() -> Tuple:
+    from agent_reach.channels.mcporter import _select_config_layers
+
+    return tuple(
+        (os.fspath(path), kind, _stat_identity(path))
+        for path, kind in _select_config_layers(None)
+    )
+
+
+def channel_fingerprint(spec: ChannelSpec, config_path: Path) -> Fingerprint:
+    """Cheap identity of every local input the channel's check reads."""
+    return (
+        _stat_identity(config_path),
+        os.environ.get("PATH", ""),
+        tuple(_binary_identity(name) for name in spec.binaries),
+        tuple((path, _stat_identity(_expand_home(path))) for path in spec.files),
+        _mcporter_identity() if spec.mcporter else (),
+    )
+
+
+class ChannelWatcher:
+    """Re-check channels whose inputs changed since the previous poll.
+
+    ``check`` defaults to doctor.check_all; it is called with the config and
+    the ``use_cache``/``channels`` keywords only.
+    """
+
+    def __init__(
+        self,
+        channels: Optional[Sequence[str]] = None,
+        *,
+        config_path: Optional[Path] = None,
+        check: Optional[Callable] = None,
+        use_cache: bool = True,
+    ):
+        from agent_reach.config import Config
+
+        if channels is None:
+            self.specs = list(CHANNEL_SPECS)
+        else:
+            wanted = set(channels)
+            self.specs = [spec for spec in CHANNEL_SPECS if spec.name in wanted]
+            unknown = sorted(wanted - {spec.name for spec in self.specs})
+            if unknown:
+                raise ValueError(f"unknown channel(s): {', '.join(unknown)}")
+        if check is None:
+            from agent_reach.doctor import check_all
+
+            check = check_all
+        self.config_path = Path(config_path) if config_path else Config.CONFIG_FILE
+        self._check = check
+        self._use_cache = use_cache
+        self._config: Optional[Config] = None
+        self._config_identity: Optional[Tuple[int, int, int]] = None
+        self._fingerprints: Dict[str, Fingerprint] = {}
+        self.results: Dict[str, dict] = {}
+
+    def _current_config(self):
+        """Reload config.yaml only when it changed; ConfigError propagates."""
+        from agent_reach.config import Config
+
+        identity = _stat_identity(self.config_path)
+        if self._config is None or identity != self._config_identity:
+            self._config = Config(self.config_path, read_only=True)
+            self._config_identity = identity
+        return self._config
+
+    def changed_channels(self) -> List[str]:
+        """Names whose input fingerprint differs from the last poll (all, at first)."""
+        changed = []
+        for spec in self.specs:
+            fingerprint = channel_fingerprint(spec, self.config_path)
+            if self._fingerprints.get(spec.name) != fingerprint:
+                self._fingerprints[spec.name] = fingerprint
+                changed.append(spec.name)
+        return changed
+
+    def poll(self) -> List[Transition]:
+        """Re-check changed channels and return their status transitions.
+
+        The first poll checks every channel and reports each one with
+        ``before=None``. Later polls return only channels whose status moved.
+        """
+        config = self._current_config()
+        changed = self.changed_channels()
+        if not changed:
+            return []
+        results = self._check(
+            config,
+            use_cache=self._use_cache,
+            channels=changed,
+        )
+        transitions = []
+        for key in changed:
+            result = results.get(key)
+            if result is None or result["status"] == "timeout":
+                # Not a verdict on the inputs: retry on the next poll.
+                self._fingerprints.pop(key, None)
+            if result is None:
+                continue
+            previous = self.results.get(key)
+            before = previous["status"] if previous is not None else None
+            self.results[key] = result
+            if before != result["status"]:
+                transitions.append(
+                    Transition(key, result["name"], before, result["status"], result["message"])
+                )
+        return transitions
+
+
+__all__ = ["ChannelWatcher", "Transition", "channel_fingerprint"]
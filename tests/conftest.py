@@ -97,3 +97,27 @@ def isolated_xueqiu_cookie_jar(monkeypatch):
     monkeypatch.setattr(xueqiu, "_cookies_initialized", False)
     yield
     xueqiu._cookie_jar.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_circuit_breaker(monkeypatch):
+    """Give each test a fresh circuit breaker so failures never carry over."""
+    from agent_reach import breaker
+
+    monkeypatch.setattr(breaker, "_breaker", None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_response_cache(monkeypatch):
+    """Never serve one test's channel data to another."""
+    from agent_reach import response_cache
+
+    monkeypatch.setattr(response_cache, "_store", None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_v2ex_transport(monkeypatch):
+    """Start every test on V2EX's default transport, not a remembered curl."""
+    from agent_reach.channels import v2ex
+
+    monkeypatch.setattr(v2ex, "_sticky_until", 0.0)
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Tests for the per-host circuit breaker."""
+
+import os
+import stat
+import sys
+
+import pytest
+
+from agent_reach import breaker, doctor
+from agent_reach.breaker import CircuitBreaker, CircuitOpen
+from agent_reach.channels.base import CheckResult
+from agent_reach.timings import Recorder
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(clock, tmp_path=None, **kwargs):
+    return CircuitBreaker(
+        (tmp_path / "cache" / "breaker.sqlite3") if tmp_path else None,
+        threshold=3,
+        cool_down=60,
+        probe_lease=10,
+        clock=clock,
+        **kwargs,
+    )
+
+
+def _trip(circuit, host="api.example", times=3):
+    for _ in range(times):
+        circuit.before(host)
+        circuit.record_failure(host)
+
+
+def test_opens_after_consecutive_failures_and_fails_fast(isolated_home):
+    clock = _Clock()
+    circuit = _breaker(clock)
+
+    _trip(circuit, times=2)
+    circuit.before("api.example")  # still closed below the threshold
+    circuit.record_failure("api.example")
+
+    with pytest.raises(CircuitOpen, match="api.example") as excinfo:
+        circuit.before("api.example")
+    assert excinfo.value.retry_in == 60
+    circuit.before("elsewhere.example")
+    assert not (isolated_home / ".agent-reach").exists()
+
+
+def test_success_resets_the_failure_count():
+    circuit = _breaker(_Clock())
+
+    _trip(circuit, times=2)
+    circuit.record_success("api.example")
+    _trip(circuit, times=2)
+
+    circuit.before("api.example")
+
+
+def test_half_open_lets_one_probe_through_after_cool_down():
+    clock = _Clock()
+    circuit = _breaker(clock)
+    _trip(circuit)
+
+    clock.now += 60
+    circuit.before("api.example")  # the probe
+    with pytest.raises(CircuitOpen):
+        circuit.before("api.example")  # everyone else waits for it
+
+    circuit.record_success("api.example")
+    circuit.before("api.example")
+    circuit.before("api.example")
+
+
+def test_failed_probe_reopens_for_another_cool_down():
+    clock = _Clock()
+    circuit = _breaker(clock)
+    _trip(circuit)
+
+    clock.now += 60
+    circuit.before("api.example")
+    circuit.record_failure("api.example")
+
+    with pytest.raises(CircuitOpen) as excinfo:
+        circuit.before("api.example")
+    assert excinfo.value.retry_in == 60
+
+
+def test_abandoned_probe_frees_its_slot_after_the_lease():
+    clock = _Clock()
+    circuit = _breaker(clock)
+    _trip(circuit)
+    clock.now += 60
+    circuit.before("api.example")  # probe never reports back
+
+    clock.now += 10
+
+    circuit.before("api.example")
+
+
+def test_state_is_shared_through_a_private_file(isolated_home):
+    (isolated_home / ".agent-reach").mkdir()
+    clock = _Clock()
+    path = isolated_home / ".agent-reach" / "cache" / "breaker.sqlite3"
+    first = CircuitBreaker(path, threshold=3, cool_down=60, clock=clock)
+    second = CircuitBreaker(path, threshold=3, cool_down=60, clock=clock)
+
+    first.before("api.example")
+    assert not path.exists()  # healthy hosts never create the file
+
+    _trip(first)
+
+    with pytest.raises(CircuitOpen):
+        second.before("api.example")
+    if sys.platform != "win32":
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_snapshot_reports_open_and_half_open_hosts(isolated_home):
+    (isolated_home / ".agent-reach").mkdir()
+    clock = _Clock()
+    circuit = _breaker(clock, isolated_home / ".agent-reach")
+    _trip(circuit, "a.example")
+    _trip(circuit, "b.example")
+    _trip(circuit, "c.example", times=1)
+
+    clock.now += 60
+    circuit.before("b.example")
+
+    assert circuit.snapshot(["a.example", "b.example", "c.example", "d.example"]) == [
+        {"host": "a.example", "state": "half-open", "failures": 3, "retry_in": 0.0},
+        {"host": "b.example", "state": "half-open", "failures": 3, "retry_in": 10.0},
+    ]
+    clock.now -= 30
+    assert circuit.snapshot(["a.example"])[0]["state"] == "open"
+
+
+def test_doctor_shows_open_circuits_for_the_channels_api_hosts(monkeypatch):
+    from agent_reach.channels import get_channel
+
+    clock = _Clock()
+    circuit = _breaker(clock)
+    monkeypatch.setattr(breaker, "_breaker", circuit)
+    _trip(circuit, "www.v2ex.com")
+
+    ch = get_channel("v2ex")
+    result = doctor._result_dict(ch, CheckResult("warn", "V2EX API 连接失败"), Recorder())
+    assert result["circuits"] == [
+        {"host": "www.v2ex.com", "state": "open", "failures": 3, "retry_in": 60.0}
+    ]
+    healthy = doctor._result_dict(get_channel("web"), CheckResult("ok", "ok"), Recorder())
+    assert "circuits" not in healthy
+
+    report = doctor.format_report({"v2ex": result})
+    assert "连接熔断中" in report
+    assert "www.v2ex.com" in report
+    assert "约 60 秒后重试" in report
@@ -50,16 +50,16 @@ def test_channel_active_backend_set_by_check(monkeypatch, tmp_path):
     monkeypatch.setattr("shutil.which", lambda _cmd: None)
 
     # Keep the network-based channels (V2EX/Xueqiu/Bilibili API) deterministic.
-    import urllib.request
-    from urllib.error import URLError
+    import requests
+
+    from agent_reach import http_client
 
     def _no_net(*_a, **_k):
-        raise URLError("offline")
+        raise requests.ConnectionError("offline")
 
-    monkeypatch.setattr(urllib.request, "urlopen", _no_net)
+    monkeypatch.setattr(http_client, "request", _no_net)
     import agent_reach.channels.xueqiu as xueqiu_mod
     monkeypatch.setattr(xueqiu_mod, "_cookies_initialized", True)
-    monkeypatch.setattr(xueqiu_mod._opener, "open", _no_net)
 
     config = Config(config_path=tmp_path / "config.yaml")
     for ch in get_all_channels():
@@ -69,6 +69,95 @@ def test_channel_active_backend_set_by_check(monkeypatch, tmp_path):
         )
 
 
+def test_diagnose_returns_immutable_result_without_touching_singleton(monkeypatch, tmp_path):
+    """diagnose()/run_check() are re-entrant: no instance state is written."""
+    import dataclasses
+
+    import requests
+
+    from agent_reach import http_client
+    from agent_reach.channels.base import CheckResult
+
+    monkeypatch.setattr("shutil.which", lambda _cmd: None)
+
+    def _no_net(*_a, **_k):
+        raise requests.ConnectionError("offline")
+
+    monkeypatch.setattr(http_client, "request", _no_net)
+    import agent_reach.channels.xueqiu as xueqiu_mod
+    monkeypatch.setattr(xueqiu_mod, "_cookies_initialized", True)
+
+    config = Config(config_path=tmp_path / "config.yaml")
+    for ch in get_all_channels():
+        fresh = type(ch)()
+        fresh.active_backend = "sentinel"
+        result = fresh.run_check(config)
+        assert isinstance(result, CheckResult)
+        assert result.status in {"ok", "warn", "off", "error"}
+        assert result.duration >= 0
+        assert fresh.active_backend == "sentinel", f"{ch.name}: run_check mutated the channel"
+        assert all(c.backend in ch.backends for c in result.candidates)
+        try:
+            result.status = "ok"  # type: ignore[misc]
+        except dataclasses.FrozenInstanceError:
+            pass
+        else:  # pragma: no cover - defensive
+            raise AssertionError("CheckResult must be immutable")
+
+
+def test_check_shim_mirrors_run_check(monkeypatch):
+    from agent_reach.channels.base import CheckResult
+    from agent_reach.channels.web import WebChannel
+
+    ch = WebChannel()
+    monkeypatch.setattr(
+        ch, "diagnose", lambda config=None: CheckResult("warn", "msg", active_backend="b")
+    )
+    assert ch.check() == ("warn", "msg")
+    assert ch.active_backend == "b"
+
+
+def test_run_check_is_safe_across_threads_with_different_configs(monkeypatch):
+    """One registry singleton serving overlapping requests with other overrides."""
+    import threading
+
+    from agent_reach.channels.twitter import TwitterChannel
+
+    monkeypatch.setattr(
+        "shutil.which",
+        lambda cmd: f"/bin/{cmd}" if cmd in {"twitter", "bird"} else None,
+    )
+    monkeypatch.setattr("agent_reach.backends.opencli_status", lambda: None)
+    ch = TwitterChannel()
+    barrier = threading.Barrier(2)
+    original = ch._check_bird
+
+    def slow_bird():
+        barrier.wait(timeout=5)
+        return original()
+
+    monkeypatch.setattr(ch, "_check_bird", slow_bird)
+    monkeypatch.setattr(ch, "_check_opencli", lambda: None)
+    results = {}
+
+    def run(key, override):
+        results[key] = ch.run_check({"twitter_backend": override})
+
+    threads = [
+        threading.Thread(target=run, args=("bird", "bird")),
+        threading.Thread(target=run, args=("cli", "twitter-cli")),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [c.backend for c in results["bird"].candidates][0] == "bird CLI (legacy)"
+    assert [c.backend for c in results["cli"].candidates][0] == "twitter-cli"
+    assert "bird" in results["bird"].message
+    assert "twitter-cli" in results["cli"].message
+
+
 def test_ordered_backends_contract(tmp_path):
     """ordered_backends(config) is a reordering (same multiset) of backends."""
     config = Config(config_path=tmp_path / "config.yaml")
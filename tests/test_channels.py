@@ -4,6 +4,7 @@
 import json
 import shutil
 import subprocess
+import sys
 from urllib.error import URLError
 
 import pytest
@@ -18,6 +19,21 @@ from agent_reach.channels.xiaohongshu import XiaoHongShuChannel
 from agent_reach.channels.xueqiu import XueqiuChannel
 
 
+def _serve_http(monkeypatch, fake_open):
+    """Route agent_reach.http_client through a urlopen-style fake(req, timeout)."""
+    import urllib.request
+
+    from agent_reach import http_client
+
+    def fake_request(method, url, *, headers=None, timeout=None, **_kwargs):
+        req = urllib.request.Request(url, headers=dict(headers or {}), method=method)
+        resp = fake_open(req, timeout=timeout)
+        body = resp.read() if hasattr(resp, "read") else b""
+        return http_client.Response(200, {}, body, url)
+
+    monkeypatch.setattr(http_client, "request", fake_request)
+
+
 class TestChannelRegistry:
     def test_get_channel_by_name(self):
         ch = get_channel("github")
@@ -38,6 +54,56 @@ class TestChannelRegistry:
         assert "v2ex" in names
 
 
+    def test_specs_match_channel_classes(self):
+        from agent_reach.channels import CHANNEL_SPECS
+
+        for spec in CHANNEL_SPECS:
+            ch = spec.load()
+            assert ch is get_channel(spec.name)
+            assert (ch.name, ch.tier) == (spec.name, spec.tier)
+            for domain in spec.domains:
+                assert ch.can_handle(f"https://{domain}/x"), (spec.name, domain)
+
+    def test_get_channels_keeps_registry_order_and_rejects_unknown(self):
+        from agent_reach.channels import get_channels
+
+        assert [ch.name for ch in get_channels(["web", "github"])] == ["github", "web"]
+        with pytest.raises(ValueError, match="nope"):
+            get_channels(["github", "nope"])
+
+    def test_channel_for_url_routes_by_descriptor(self):
+        from agent_reach.channels import channel_for_url
+
+        assert channel_for_url("https://youtu.be/abc").name == "youtube"
+        assert channel_for_url("https://x.com.evil.test/a").name == "web"
+        assert channel_for_url("https://example.com/feed").name == "rss"
+
+    def test_all_channels_alias_still_available(self):
+        from agent_reach import channels
+
+        assert [ch.name for ch in channels.ALL_CHANNELS] == [
+            ch.name for ch in get_all_channels()
+        ]
+
+    def test_looking_up_one_channel_imports_only_that_module(self):
+        code = (
+            "import sys\n"
+            "from agent_reach.channels import channel_for_url, get_channel\n"
+            "get_channel('github')\n"
+            "channel_for_url('https://www.youtube.com/watch?v=x')\n"
+            "loaded = sorted(m for m in sys.modules if m.startswith('agent_reach.channels.'))\n"
+            "print(','.join(loaded))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        assert out.split(",") == [
+            "agent_reach.channels.base",
+            "agent_reach.channels.github",
+            "agent_reach.channels.youtube",
+        ]
+
+
 class TestOpenCLISiteChannels:
     def test_facebook_can_handle_common_urls(self):
         ch = FacebookChannel()
@@ -116,8 +182,6 @@ class TestV2EXChannel:
         assert not ch.can_handle("https://reddit.com/r/Python")
 
     def test_check_ok_when_api_reachable(self, monkeypatch):
-        import urllib.request
-
         class FakeResponse:
             status = 200
 
@@ -130,9 +194,8 @@ class TestV2EXChannel:
             def read(self, _size=-1):
                 return b"[]"
 
-        monkeypatch.setattr(
-            urllib.request,
-            "urlopen",
+        _serve_http(
+            monkeypatch,
             lambda req, timeout=None: FakeResponse(),
         )
         status, msg = V2EXChannel().check()
@@ -140,12 +203,10 @@ class TestV2EXChannel:
         assert "公开 API 可用" in msg
 
     def test_check_warn_when_api_unreachable(self, monkeypatch):
-        import urllib.request
-
         def raise_error(req, timeout=None):
             raise URLError("connection refused")
 
-        monkeypatch.setattr(urllib.request, "urlopen", raise_error)
+        _serve_http(monkeypatch, raise_error)
         status, msg = V2EXChannel().check()
         assert status == "warn"
         assert "失败" in msg
@@ -179,9 +240,8 @@ class TestV2EXChannel:
         monkeypatch.setattr(
             xueqiu_mod, "_load_cookies_from_config", fake_load
         )
-        monkeypatch.setattr(
-            xueqiu_mod._opener,
-            "open",
+        _serve_http(
+            monkeypatch,
             lambda req, timeout=None: FakeResponse(),
         )
 
@@ -195,8 +255,6 @@ class TestV2EXChannel:
     # ------------------------------------------------------------------ #
 
     def test_get_hot_topics_returns_list(self, monkeypatch):
-        import urllib.request
-
         fake_data = [
             {
                 "id": 111,
@@ -230,7 +288,7 @@ class TestV2EXChannel:
             def read(self, _size=-1):
                 return json.dumps(fake_data).encode()
 
-        monkeypatch.setattr(urllib.request, "urlopen", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         topics = V2EXChannel().get_hot_topics(limit=5)
         assert len(topics) == 2
         assert topics[0]["id"] == 111
@@ -241,8 +299,6 @@ class TestV2EXChannel:
         assert topics[0]["created"] == 1700000000
 
     def test_get_hot_topics_respects_limit(self, monkeypatch):
-        import urllib.request
-
         fake_data = [
             {"id": i, "title": f"Topic {i}", "url": f"https://v2ex.com/t/{i}", "replies": i,
              "content": "", "created": 1700000000 + i, "node": {"name": "tech", "title": "Tech"}}
@@ -254,13 +310,11 @@ class TestV2EXChannel:
             def __exit__(self, *_): pass
             def read(self, _size=-1): return json.dumps(fake_data).encode()
 
-        monkeypatch.setattr(urllib.request, "urlopen", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         topics = V2EXChannel().get_hot_topics(limit=3)
         assert len(topics) == 3
 
     def test_get_hot_topics_truncates_content(self, monkeypatch):
-        import urllib.request
-
         long_content = "A" * 300
         fake_data = [
             {"id": 1, "title": "Long post", "url": "https://v2ex.com/t/1", "replies": 0,
@@ -272,7 +326,7 @@ class TestV2EXChannel:
             def __exit__(self, *_): pass
             def read(self, _size=-1): return json.dumps(fake_data).encode()
 
-        monkeypatch.setattr(urllib.request, "urlopen", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         topics = V2EXChannel().get_hot_topics(limit=1)
         assert len(topics[0]["content"]) == 200
 
@@ -281,8 +335,6 @@ class TestV2EXChannel:
     # ------------------------------------------------------------------ #
 
     def test_get_node_topics(self, monkeypatch):
-        import urllib.request
-
         fake_data = [
             {
                 "id": 333,
@@ -300,7 +352,7 @@ class TestV2EXChannel:
             def __exit__(self, *_): pass
             def read(self, _size=-1): return json.dumps(fake_data).encode()
 
-        monkeypatch.setattr(urllib.request, "urlopen", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         topics = V2EXChannel().get_node_topics("python")
         assert len(topics) == 1
         assert topics[0]["id"] == 333
@@ -313,8 +365,6 @@ class TestV2EXChannel:
     # ------------------------------------------------------------------ #
 
     def test_get_topic_returns_detail_and_replies(self, monkeypatch):
-        import urllib.request
-
         topic_data = [
             {
                 "id": 999,
@@ -354,7 +404,7 @@ class TestV2EXChannel:
                 return FakeResponse(replies_data)
             return FakeResponse(topic_data)
 
-        monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+        _serve_http(monkeypatch, fake_urlopen)
         result = V2EXChannel().get_topic(999)
 
         assert result["id"] == 999
@@ -366,8 +416,6 @@ class TestV2EXChannel:
         assert result["replies"][1]["content"] == "第二条回复"
 
     def test_get_topic_handles_empty_replies(self, monkeypatch):
-        import urllib.request
-
         topic_data = [
             {
                 "id": 1,
@@ -392,7 +440,7 @@ class TestV2EXChannel:
                 return FakeResponse([])
             return FakeResponse(topic_data)
 
-        monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+        _serve_http(monkeypatch, fake_urlopen)
         result = V2EXChannel().get_topic(1)
         assert result["replies"] == []
 
@@ -401,8 +449,6 @@ class TestV2EXChannel:
     # ------------------------------------------------------------------ #
 
     def test_get_user_returns_profile(self, monkeypatch):
-        import urllib.request
-
         fake_user = {
             "id": 42,
             "username": "alice",
@@ -423,7 +469,7 @@ class TestV2EXChannel:
             def __exit__(self, *_): pass
             def read(self, _size=-1): return json.dumps(fake_user).encode()
 
-        monkeypatch.setattr(urllib.request, "urlopen", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         user = V2EXChannel().get_user("alice")
 
         assert user["id"] == 42
@@ -478,7 +524,7 @@ class TestXueqiuChannel:
             def read(self):
                 return json.dumps(fake_response_data).encode()
 
-        monkeypatch.setattr(xueqiu_mod._opener, "open", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         status, msg = XueqiuChannel().check()
         assert status == "ok"
         assert "公开 API 可用" in msg
@@ -491,7 +537,7 @@ class TestXueqiuChannel:
         def raise_error(req, timeout=None):
             raise URLError("connection refused")
 
-        monkeypatch.setattr(xueqiu_mod._opener, "open", raise_error)
+        _serve_http(monkeypatch, raise_error)
         status, msg = XueqiuChannel().check()
         assert status == "warn"
         assert "失败" in msg
@@ -540,7 +586,7 @@ class TestXueqiuChannel:
             def read(self):
                 return json.dumps(fake_data).encode()
 
-        monkeypatch.setattr(xueqiu_mod._opener, "open", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         quote = XueqiuChannel().get_stock_quote("SH600519")
         assert quote["symbol"] == "SH600519"
         assert quote["name"] == "贵州茅台"
@@ -574,7 +620,7 @@ class TestXueqiuChannel:
             def read(self):
                 return json.dumps(fake_data).encode()
 
-        monkeypatch.setattr(xueqiu_mod._opener, "open", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         results = XueqiuChannel().search_stock("茅台", limit=5)
         assert len(results) == 2
         assert results[0]["symbol"] == "SH600519"
@@ -619,7 +665,7 @@ class TestXueqiuChannel:
             def read(self):
                 return json.dumps(fake_data).encode()
 
-        monkeypatch.setattr(xueqiu_mod._opener, "open", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         posts = XueqiuChannel().get_hot_posts(limit=10)
         assert len(posts) == 2
         assert posts[0]["id"] == 111
@@ -661,7 +707,7 @@ class TestXueqiuChannel:
             def read(self):
                 return json.dumps(fake_data).encode()
 
-        monkeypatch.setattr(xueqiu_mod._opener, "open", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         posts = XueqiuChannel().get_hot_posts(limit=3)
         assert len(posts) == 3
 
@@ -694,7 +740,7 @@ class TestXueqiuChannel:
             def read(self):
                 return json.dumps(fake_data).encode()
 
-        monkeypatch.setattr(xueqiu_mod._opener, "open", lambda req, timeout=None: FakeResponse())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResponse())
         stocks = XueqiuChannel().get_hot_stocks(limit=10, stock_type=10)
         assert len(stocks) == 3
         assert stocks[0]["symbol"] == "SH600519"
@@ -737,7 +783,7 @@ class TestXueqiuChannel:
             def __exit__(self, *_): pass
             def read(self): return b'{"data":{"items":[]}}'
 
-        monkeypatch.setattr(xq_mod._opener, "open", lambda req, timeout=None: FakeResp())
+        _serve_http(monkeypatch, lambda req, timeout=None: FakeResp())
 
         xq_mod._ensure_cookies()
         assert xq_mod._cookies_initialized is True
@@ -758,9 +804,8 @@ class TestXueqiuChannel:
         class FakeResponse:
             pass
 
-        monkeypatch.setattr(
-            xueqiu_mod._opener,
-            "open",
+        _serve_http(
+            monkeypatch,
             lambda req, timeout=None: requested.append(req.full_url) or FakeResponse(),
         )
         xueqiu_mod._ensure_cookies()
@@ -785,7 +830,7 @@ class TestXueqiuChannel:
             captured["referer"] = req.get_header("Referer")
             return FakeResp()
 
-        monkeypatch.setattr(xueqiu_mod._opener, "open", fake_open)
+        _serve_http(monkeypatch, fake_open)
         xueqiu_mod._get_json("https://stock.xueqiu.com/v5/stock/batch/quote.json?symbol=SH000001")
 
         assert captured["referer"] == "https://xueqiu.com/"
@@ -892,6 +937,21 @@ class TestXiaoHongShuChannel:
             xhs_mod, "_mcp_service_reachable", lambda timeout=3: mcp_reachable
         )
 
+    def test_offline_mode_does_not_probe_the_mcp_service(self, monkeypatch):
+        import agent_reach.channels.xiaohongshu as xhs_mod
+        from agent_reach.probe import offline_mode
+
+        monkeypatch.setattr(
+            xhs_mod, "_mcp_service_reachable",
+            lambda timeout=3: pytest.fail("offline doctor probed xiaohongshu-mcp"),
+        )
+
+        with offline_mode():
+            status, message = XiaoHongShuChannel()._check_mcp()
+
+        assert status == "unverified"
+        assert "xiaohongshu-mcp" in message
+
     def test_opencli_bridge_ready_is_unverified(self, monkeypatch):
         monkeypatch.setattr(
             "agent_reach.backends.opencli_status",
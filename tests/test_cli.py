@@ -11,6 +11,8 @@ import requests
 
 import agent_reach.cli as cli
 from agent_reach.cli import main
+from agent_reach.commands import install as install_cmd
+from agent_reach.commands import skill as skill_cmd
 from agent_reach.config import Config
 
 
@@ -68,11 +70,11 @@ class TestCLI:
         config_dir = tmp_path / ".agent-reach"
         monkeypatch.setattr(Config, "CONFIG_DIR", config_dir)
         monkeypatch.setattr(Config, "CONFIG_FILE", config_dir / "config.yaml")
-        monkeypatch.setattr("agent_reach.doctor.check_all", lambda config: {})
-        monkeypatch.setattr("agent_reach.doctor.format_report", lambda results: "report")
+        monkeypatch.setattr("agent_reach.doctor.check_all", lambda config, **_kwargs: {})
+        monkeypatch.setattr("agent_reach.doctor.format_report", lambda results, **_kwargs: "report")
         install_calls = []
         monkeypatch.setattr(
-            cli,
+            skill_cmd,
             "_install_skill",
             lambda *args, **kwargs: install_calls.append((args, kwargs)),
         )
@@ -214,16 +216,16 @@ class TestCLI:
     def test_install_reddit_deps_routes_by_environment(self, monkeypatch):
         """桌面 → OpenCLI;服务器 → rdt-cli(钉 git 源)。"""
         calls = []
-        monkeypatch.setattr(cli, "_install_opencli_deps", lambda: calls.append("opencli"))
-        monkeypatch.setattr(cli, "_install_rdt_cli", lambda: calls.append("rdt"))
+        monkeypatch.setattr(install_cmd, "_install_opencli_deps", lambda: calls.append("opencli"))
+        monkeypatch.setattr(install_cmd, "_install_rdt_cli", lambda: calls.append("rdt"))
         monkeypatch.setattr(shutil, "which", lambda _: None)
 
-        monkeypatch.setattr(cli, "_detect_environment", lambda: "local")
+        monkeypatch.setattr(install_cmd, "_detect_environment", lambda: "local")
         cli._install_reddit_deps()
         assert calls == ["opencli"]
 
         calls.clear()
-        monkeypatch.setattr(cli, "_detect_environment", lambda: "server")
+        monkeypatch.setattr(install_cmd, "_detect_environment", lambda: "server")
         cli._install_reddit_deps()
         assert calls == ["rdt"]
 
@@ -259,11 +261,11 @@ class TestCLI:
     def test_install_facebook_instagram_routes_to_opencli_once(self, monkeypatch, capsys):
         calls = []
 
-        monkeypatch.setattr(cli, "_detect_environment", lambda: "local")
-        monkeypatch.setattr(cli, "_install_system_deps", lambda: None)
-        monkeypatch.setattr(cli, "_install_mcporter", lambda: None)
-        monkeypatch.setattr(cli, "_install_opencli_deps", lambda: calls.append("opencli"))
-        monkeypatch.setattr(cli, "_install_skill", lambda: None)
+        monkeypatch.setattr(install_cmd, "_detect_environment", lambda: "local")
+        monkeypatch.setattr(install_cmd, "_install_system_deps", lambda: None)
+        monkeypatch.setattr(install_cmd, "_install_mcporter", lambda: None)
+        monkeypatch.setattr(install_cmd, "_install_opencli_deps", lambda: calls.append("opencli"))
+        monkeypatch.setattr(install_cmd, "_install_skill", lambda: None)
         monkeypatch.setattr(
             "agent_reach.doctor.check_all",
             lambda config: {
@@ -277,7 +279,7 @@ class TestCLI:
                 }
             },
         )
-        monkeypatch.setattr("agent_reach.doctor.format_report", lambda results: "report")
+        monkeypatch.setattr("agent_reach.doctor.format_report", lambda results, **_kwargs: "report")
 
         cli._cmd_install(
             Namespace(
@@ -294,7 +296,7 @@ class TestCLI:
         assert "Installation complete" in capsys.readouterr().out
 
     def test_install_server_dry_run_skips_opencli_only_channels(self, monkeypatch, capsys):
-        monkeypatch.setattr(cli, "_install_system_deps_dryrun", lambda: None)
+        monkeypatch.setattr(install_cmd, "_install_system_deps_dryrun", lambda: None)
 
         cli._cmd_install(
             Namespace(
@@ -320,7 +322,7 @@ class TestCheckUpdateRetry:
         def fake_sleep(seconds):
             sleeps.append(seconds)
 
-        with patch("requests.get", side_effect=requests.exceptions.Timeout("timed out")):
+        with patch("agent_reach.http_client.get", side_effect=requests.exceptions.Timeout("timed out")):
             resp, err, attempts = cli._github_get_with_retry(
                 "https://api.github.com/test",
                 timeout=1,
@@ -335,7 +337,7 @@ class TestCheckUpdateRetry:
 
     def test_retry_dns_classification(self):
         error = requests.exceptions.ConnectionError("getaddrinfo failed for api.github.com")
-        with patch("requests.get", side_effect=error):
+        with patch("agent_reach.http_client.get", side_effect=error):
             resp, err, attempts = cli._github_get_with_retry(
                 "https://api.github.com/test",
                 retries=1,
@@ -362,7 +364,7 @@ class TestCheckUpdateRetry:
             R(200, payload={"tag_name": "v1.5.0"}),
         ]
 
-        with patch("requests.get", side_effect=sequence):
+        with patch("agent_reach.http_client.get", side_effect=sequence):
             resp, err, attempts = cli._github_get_with_retry(
                 "https://api.github.com/test",
                 retries=3,
@@ -387,7 +389,7 @@ class TestCheckUpdateRetry:
         assert cli._classify_github_response_error(R()) == "rate_limit"
 
     def test_check_update_reports_classified_error(self, capsys):
-        with patch("agent_reach.cli._github_get_with_retry", return_value=(None, "timeout", 3)):
+        with patch("agent_reach.commands.update._github_get_with_retry", return_value=(None, "timeout", 3)):
             result = cli._cmd_check_update()
 
         captured = capsys.readouterr()
@@ -423,10 +425,10 @@ class TestWatchVersionCompare:
             def json():
                 return {"tag_name": "v1.4.2", "body": ""}
 
-        monkeypatch.setattr(cli, "_github_get_with_retry", lambda *a, **k: (R(), None, 1))
+        monkeypatch.setattr("agent_reach.commands.watch._github_get_with_retry", lambda *a, **k: (R(), None, 1))
         monkeypatch.setattr(
             "agent_reach.doctor.check_all",
-            lambda config: {"web": {"status": "ok", "name": "任意网页", "message": "ok",
+            lambda config, **_kwargs: {"web": {"status": "ok", "name": "任意网页", "message": "ok",
                             "tier": 0, "backends": ["Jina Reader"], "active_backend": "Jina Reader"}},
         )
         cli._cmd_watch()
@@ -50,6 +50,9 @@ class TestDoctor:
 
         results = doctor.check_all(tmp_config)
 
+        for r in results.values():
+            assert r.pop("elapsed") >= 0
+            assert r.pop("operations") == []
         assert results == {
             "web": {
                 "status": "ok",
@@ -134,6 +137,154 @@ def test_stale_active_backend_does_not_leak_into_errored_result(monkeypatch):
     assert results["boom"]["active_backend"] is None
 
 
+def test_channel_subclass_overriding_only_check_keeps_its_status(monkeypatch):
+    from agent_reach.channels.base import Channel
+
+    class _LegacyChannel(Channel):
+        name = "legacy"
+        description = "旧式渠道"
+        backends = ["foo"]
+
+        def can_handle(self, url):
+            return False
+
+        def check(self, config=None):
+            self.active_backend = None
+            return "off", "foo"
+
+    monkeypatch.setattr(doctor, "get_all_channels", lambda: [_LegacyChannel()])
+    result = doctor.check_all(config=None)["legacy"]
+
+    assert (result["status"], result["message"]) == ("off", "foo")
+    assert result["active_backend"] is None
+
+
+class _SlowChannel(_StubChannel):
+    def __init__(self, name, delay, tracker=None):
+        super().__init__(name, name, 0, "ok", f"{name} ok", [name], active_backend=name)
+        self._delay = delay
+        self._tracker = tracker
+
+    def check(self, config=None):
+        import time
+
+        if self._tracker is not None:
+            self._tracker.enter()
+        try:
+            time.sleep(self._delay)
+        finally:
+            if self._tracker is not None:
+                self._tracker.leave()
+        return self._status, self._message
+
+
+def test_check_all_keeps_registry_order_when_checks_finish_out_of_order(monkeypatch):
+    channels = [
+        _SlowChannel("slow", 0.2),
+        _SlowChannel("medium", 0.1),
+        _SlowChannel("fast", 0.0),
+    ]
+    monkeypatch.setattr(doctor, "get_all_channels", lambda: channels)
+
+    results = doctor.check_all(config=None)
+
+    assert list(results) == ["slow", "medium", "fast"]
+    assert all(r["status"] == "ok" for r in results.values())
+    assert results["slow"]["active_backend"] == "slow"
+
+
+def test_check_all_reports_timeout_for_checks_past_the_deadline(monkeypatch):
+    import time
+
+    channels = [_SlowChannel("fast", 0.0), _SlowChannel("stuck", 5.0)]
+    monkeypatch.setattr(doctor, "get_all_channels", lambda: channels)
+
+    started = time.monotonic()
+    results = doctor.check_all(config=None, deadline=0.3)
+
+    assert time.monotonic() - started < 2.0
+    assert results["fast"]["status"] == "ok"
+    assert results["stuck"]["status"] == "timeout"
+    assert results["stuck"]["active_backend"] is None
+    assert "0.3" in results["stuck"]["message"]
+
+
+def test_check_all_streams_each_result_as_it_finishes(monkeypatch):
+    import threading
+
+    channels = [_SlowChannel("slow", 0.3), _SlowChannel("fast", 0.0), _SlowChannel("stuck", 5.0)]
+    monkeypatch.setattr(doctor, "get_all_channels", lambda: channels)
+    streamed = []
+    fast_seen = threading.Event()
+
+    def on_result(name, result):
+        streamed.append((name, result["status"]))
+        if name == "fast":
+            fast_seen.set()
+
+    results = doctor.check_all(config=None, deadline=1.0, on_result=on_result)
+
+    assert fast_seen.is_set()
+    assert streamed == [("fast", "ok"), ("slow", "ok")]
+    assert results["stuck"]["status"] == "timeout"
+
+
+def test_check_all_survives_a_failing_result_listener(monkeypatch):
+    monkeypatch.setattr(doctor, "get_all_channels", lambda: [_SlowChannel("fast", 0.0)])
+
+    def on_result(_name, _result):
+        raise RuntimeError("listener bug")
+
+    results = doctor.check_all(config=None, on_result=on_result)
+
+    assert results["fast"]["status"] == "ok"
+
+
+def test_check_all_bounds_concurrent_checks(monkeypatch):
+    import threading
+
+    class _Tracker:
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.running = 0
+            self.peak = 0
+
+        def enter(self):
+            with self.lock:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+
+        def leave(self):
+            with self.lock:
+                self.running -= 1
+
+    tracker = _Tracker()
+    channels = [_SlowChannel(f"ch{i}", 0.05, tracker) for i in range(6)]
+    monkeypatch.setattr(doctor, "get_all_channels", lambda: channels)
+
+    results = doctor.check_all(config=None, max_workers=2)
+
+    assert len(results) == 6
+    assert all(r["status"] == "ok" for r in results.values())
+    assert 1 <= tracker.peak <= 2
+
+
+def test_format_report_renders_timeout_as_attention():
+    report = doctor.format_report(
+        {
+            "youtube": {
+                "status": "timeout",
+                "name": "YouTube",
+                "message": "体检超时",
+                "tier": 0,
+                "backends": ["yt-dlp"],
+                "active_backend": None,
+            }
+        }
+    )
+    assert "[yellow][!][/yellow]  [bold]YouTube[/bold]" in report
+
+
 def test_channel_exception_credentials_are_scrubbed(monkeypatch):
     """Doctor is the final trust boundary for unexpected channel errors."""
 
@@ -323,3 +474,252 @@ def test_real_doctor_path_is_zero_write_and_never_runs_risky_status_commands(
     ):
         assert payload[channel_name]["status"] == "warn"
         assert payload[channel_name]["active_backend"] is None
+
+
+def test_check_all_probes_shared_opencli_backend_once(monkeypatch):
+    """Six channels ride OpenCLI; one doctor run must probe it only once."""
+    import agent_reach.backends.opencli as opencli
+    from agent_reach.channels.bilibili import BilibiliChannel
+    from agent_reach.channels.facebook import FacebookChannel
+    from agent_reach.channels.instagram import InstagramChannel
+    from agent_reach.channels.reddit import RedditChannel
+    from agent_reach.channels.twitter import TwitterChannel
+    from agent_reach.channels.xiaohongshu import XiaoHongShuChannel
+    from agent_reach.probe import ProbeResult
+
+    version_calls = []
+    status_calls = []
+
+    def fake_probe(cmd, args=("--version",), **kwargs):
+        version_calls.append(cmd)
+        return ProbeResult("ok", output="1.8.6")
+
+    def fake_status(timeout=2):
+        status_calls.append(timeout)
+        return {"ok": True, "extensionConnected": True}
+
+    monkeypatch.setattr(opencli, "probe_command", fake_probe)
+    monkeypatch.setattr(opencli, "_fetch_daemon_status", fake_status)
+    monkeypatch.setattr(shutil, "which", lambda _name: None)
+    import agent_reach.channels.bilibili as bilibili
+    import agent_reach.channels.xiaohongshu as xiaohongshu
+
+    monkeypatch.setattr(bilibili, "probe_command", lambda *a, **k: ProbeResult("missing"))
+    monkeypatch.setattr(bilibili, "_search_api_ok", lambda: False)
+    monkeypatch.setattr(xiaohongshu, "_mcp_service_reachable", lambda timeout=3: False)
+    channels = [
+        RedditChannel(),
+        TwitterChannel(),
+        XiaoHongShuChannel(),
+        BilibiliChannel(),
+        FacebookChannel(),
+        InstagramChannel(),
+    ]
+    monkeypatch.setattr(doctor, "get_all_channels", lambda: channels)
+
+    results = doctor.check_all(config=None)
+
+    assert len(results) == 6
+    assert version_calls == ["opencli"]
+    assert len(status_calls) == 1
+    for name in ("reddit", "twitter", "facebook"):
+        assert "OpenCLI 桥接已连接" in results[name]["message"]
+
+
+class _ProbingChannel(_StubChannel):
+    """Runs real instrumented helpers so timings land in the doctor result."""
+
+    def __init__(self, name, hang=None):
+        super().__init__(name, name, 0, "ok", f"{name} ok", [name])
+        self._hang = hang
+
+    def check(self, config=None):
+        from agent_reach import timings
+        from agent_reach.probe import probe_command
+
+        probe_command("definitely-not-installed-agent-reach")
+        with timings.timed(timings.HTTP, timings.http_label("https://u:p@api.example/x?q=1")):
+            pass
+        if self._hang is not None:
+            self._hang.wait(5)
+        return self._status, self._message
+
+
+def test_check_all_reports_elapsed_and_operations(monkeypatch):
+    monkeypatch.setattr(doctor, "get_all_channels", lambda: [_ProbingChannel("probe")])
+
+    result = doctor.check_all(config=None)["probe"]
+
+    assert result["elapsed"] >= 0
+    assert [(op["kind"], op["label"], op["outcome"]) for op in result["operations"]] == [
+        ("subprocess", "definitely-not-installed-agent-reach --version", "missing"),
+        ("http", "HTTPS api.example/x", "ok"),
+    ]
+    assert all(op["duration"] >= 0 for op in result["operations"])
+    json.dumps(result)
+
+
+def test_timed_out_channel_keeps_operations_finished_before_deadline(monkeypatch):
+    import threading
+
+    hang = threading.Event()
+    monkeypatch.setattr(
+        doctor, "get_all_channels", lambda: [_ProbingChannel("stuck", hang=hang)]
+    )
+    try:
+        result = doctor.check_all(config=None, deadline=0.3)["stuck"]
+    finally:
+        hang.set()
+
+    assert result["status"] == "timeout"
+    assert result["elapsed"] >= 0.3
+    assert [op["kind"] for op in result["operations"]] == ["subprocess", "http"]
+
+
+def test_timed_records_exception_outcome_and_is_inert_outside_recording():
+    from agent_reach import timings
+
+    with timings.timed(timings.HTTP, "outside"):
+        pass
+
+    with timings.recording() as recorder:
+        with pytest.raises(TimeoutError):
+            with timings.timed(timings.HTTP, "GET slow"):
+                raise TimeoutError
+    [op] = recorder.snapshot()
+    assert op.outcome == "TimeoutError"
+
+
+def test_format_report_lists_slowest_operations_only_with_timings():
+    def _op(label, duration):
+        return {"kind": "subprocess", "label": label, "duration": duration, "outcome": "ok"}
+
+    results = {
+        "youtube": {
+            "status": "ok", "name": "YouTube", "message": "ok", "tier": 0,
+            "backends": ["yt-dlp"], "active_backend": "yt-dlp", "elapsed": 2.5,
+            "operations": [_op("yt-dlp --version", 2.4)],
+        },
+        "rss": {
+            "status": "ok", "name": "RSS", "message": "ok", "tier": 0,
+            "backends": ["feedparser"], "active_backend": "feedparser", "elapsed": 0.1,
+            "operations": [_op("[fast] --version", 0.05)],
+        },
+    }
+
+    assert "耗时最长" not in doctor.format_report(results)
+    report = doctor.format_report(results, timings=True)
+    section = report.split("耗时最长的操作（共 2 项）：")[1]
+    assert section.index("yt-dlp --version") < section.index("\\[fast] --version")
+    assert "最慢渠道：youtube（2.500s）" in section
+
+
+def test_cmd_doctor_timings_flag_reaches_report(monkeypatch, capsys):
+    from agent_reach import cli
+
+    seen = {}
+    monkeypatch.setattr(doctor, "check_all", lambda config, **_kwargs: {})
+
+    def fake_report(results, timings=False):
+        seen["timings"] = timings
+        return "report"
+
+    monkeypatch.setattr(doctor, "format_report", fake_report)
+    cli._cmd_doctor(Namespace(json=False, deadline=None, no_cache=False, timings=True))
+
+    assert seen == {"timings": True}
+    assert "report" in capsys.readouterr().out
+
+
+def test_offline_doctor_skips_network_and_stays_fast(monkeypatch):
+    """--offline is meant for shell prompts and agent pre-flight hooks."""
+    import time
+
+    import agent_reach.channels.bilibili as bilibili
+    import agent_reach.channels.v2ex as v2ex
+    import agent_reach.channels.xueqiu as xueqiu
+    from agent_reach import http_client
+
+    def _no_network(*_args, **_kwargs):
+        raise AssertionError("offline doctor touched the network")
+
+    monkeypatch.setattr(shutil, "which", lambda _name: None)
+    monkeypatch.setattr(v2ex, "_get_json", _no_network)
+    monkeypatch.setattr(xueqiu, "_get_json", _no_network)
+    monkeypatch.setattr(bilibili, "_search_api_ok", _no_network)
+    monkeypatch.setattr(http_client, "request", _no_network)
+
+    started = time.perf_counter()
+    results = doctor.check_all(Config(read_only=True), offline=True)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 2.0
+    assert results["v2ex"]["status"] == "unverified"
+    assert results["xueqiu"]["status"] == "unverified"
+    assert results["bilibili"]["status"] == "unverified"
+    assert results["bilibili"]["active_backend"] is None
+    assert not any(op["kind"] == "http" for r in results.values() for op in r["operations"])
+
+
+def test_select_backend_prefers_fixable_warn_over_unverified():
+    from agent_reach.channels.base import BackendProbe, select_backend
+
+    result = select_backend([
+        BackendProbe("api", "unverified", "离线模式：未联网验证"),
+        BackendProbe("cli", "warn", "需要登录"),
+    ])
+    assert (result.status, result.message) == ("warn", "需要登录")
+
+
+def test_format_report_lists_unverified_channels_separately():
+    def _r(name, tier, status):
+        return {
+            "status": status, "name": name, "message": "m", "tier": tier,
+            "backends": [name], "active_backend": None,
+        }
+
+    report = doctor.format_report({
+        "v2ex": _r("V2EX", 0, "unverified"),
+        "xueqiu": _r("雪球", 1, "unverified"),
+        "linkedin": _r("LinkedIn", 1, "off"),
+    })
+
+    assert "[cyan][?][/cyan]  [bold]V2EX[/bold]" in report
+    assert "可选渠道（离线未验证）" in report
+    assert "[cyan][?][/cyan]  [bold]雪球[/bold]" in report
+    assert "还有 1 个可选渠道可以解锁（LinkedIn）" in report
+
+
+def test_doctor_channels_flag_checks_only_the_subset(monkeypatch, capsys):
+    from agent_reach import cli
+
+    seen = {}
+
+    def fake_check_all(config, **kwargs):
+        seen.update(kwargs)
+        return {}
+
+    monkeypatch.setattr(doctor, "check_all", fake_check_all)
+    monkeypatch.setattr("sys.argv", ["agent-reach", "doctor", "--json", "--channels", "youtube, github"])
+    cli.main()
+
+    assert seen["channels"] == ["youtube", "github"]
+
+
+def test_doctor_channels_flag_rejects_unknown_names(monkeypatch, capsys):
+    from agent_reach import cli
+
+    monkeypatch.setattr("sys.argv", ["agent-reach", "doctor", "--channels", "youtube,nope"])
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+
+    assert exc.value.code == 2
+    assert "unknown channel(s): nope" in capsys.readouterr().err
+
+
+def test_check_all_subset_runs_only_selected_channels(monkeypatch):
+    monkeypatch.setattr(shutil, "which", lambda _name: None)
+
+    results = doctor.check_all(config=None, channels=["web", "github"])
+
+    assert list(results) == ["github", "web"]
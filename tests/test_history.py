@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""Tests for the local doctor history and the watch features built on it."""
+
+import json
+import os
+import stat
+import sys
+from argparse import Namespace
+
+import pytest
+
+from agent_reach import history
+from agent_reach.commands import history as history_cmd
+from agent_reach.commands import watch as watch_cmd
+from agent_reach.config import Config
+from agent_reach.history import HistoryStore
+
+
+def _result(status, elapsed=0.1, backend=None, name=None):
+    return {
+        "status": status,
+        "name": name or "渠道",
+        "message": f"{status} message",
+        "tier": 0,
+        "backends": [],
+        "active_backend": backend,
+        "elapsed": elapsed,
+        "operations": [],
+    }
+
+
+@pytest.fixture
+def config_dir():
+    Config.CONFIG_DIR.mkdir(mode=0o700)
+    return Config.CONFIG_DIR
+
+
+def test_record_is_skipped_until_agent_reach_dir_exists(isolated_home):
+    assert HistoryStore().record({"web": _result("ok")}) is False
+    assert not (isolated_home / ".agent-reach").exists()
+    assert HistoryStore().stats() == {}
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_database_is_created_private(config_dir):
+    assert HistoryStore().record({"web": _result("ok")}) is True
+
+    mode = stat.S_IMODE(os.stat(history.history_path()).st_mode)
+    assert mode == 0o600
+
+
+def test_stats_report_uptime_latency_percentiles_and_last_status(config_dir):
+    store = HistoryStore()
+    for i, status in enumerate(["ok"] * 8 + ["error", "ok"]):
+        store.record({"youtube": _result(status, elapsed=(i + 1) / 10)}, now=1000.0 + i)
+
+    stats = store.stats()["youtube"]
+
+    assert stats.checks == 10
+    assert stats.uptime == pytest.approx(90.0)
+    assert stats.p50 == pytest.approx(0.5)
+    assert stats.p95 == pytest.approx(1.0)
+    assert stats.last_status == "ok"
+    assert stats.flapping is False
+
+
+def test_stats_honor_since_and_channel_filter(config_dir):
+    store = HistoryStore()
+    store.record({"web": _result("error"), "v2ex": _result("ok")}, now=1000.0)
+    store.record({"web": _result("ok"), "v2ex": _result("ok")}, now=2000.0)
+
+    stats = store.stats(["web"], since=1500.0)
+
+    assert list(stats) == ["web"]
+    assert stats["web"].checks == 1
+    assert stats["web"].uptime == 100.0
+
+
+def test_timeouts_count_against_uptime_but_not_latency(config_dir):
+    store = HistoryStore()
+    store.record({"web": _result("ok", elapsed=0.2)}, now=1.0)
+    store.record({"web": _result("timeout", elapsed=30.0)}, now=2.0)
+
+    stats = store.stats()["web"]
+
+    assert stats.uptime == 50.0
+    assert stats.p95 == pytest.approx(0.2)
+
+
+def test_flapping_needs_repeated_changes_in_the_window(config_dir):
+    store = HistoryStore()
+    for i, status in enumerate(["ok", "error", "ok", "error", "ok"]):
+        store.record({"bilibili": _result(status), "web": _result("ok")}, now=float(i))
+
+    assert store.is_flapping("bilibili") is True
+    assert store.is_flapping("web") is False
+    assert store.recent_by_channel(3) == {
+        "bilibili": ["ok", "error", "ok"],
+        "web": ["ok", "ok", "ok"],
+    }
+
+
+def test_old_rows_are_pruned_on_write(config_dir):
+    store = HistoryStore()
+    store.record({"web": _result("error")}, now=0.0)
+    store.record({"web": _result("ok")}, now=history.HISTORY_RETENTION_SECONDS + 10.0)
+
+    assert store.recent_statuses("web") == ["ok"]
+
+
+def test_check_all_records_history_only_when_asked_and_online(config_dir, monkeypatch):
+    from agent_reach import doctor
+
+    recorded = []
+    monkeypatch.setattr(history, "record", lambda results: recorded.append(dict(results)))
+
+    doctor.check_all(Config(read_only=True), channels=["rss"], record_history=True)
+    doctor.check_all(Config(read_only=True), channels=["rss"], offline=True, record_history=True)
+    doctor.check_all(Config(read_only=True), channels=["rss"])
+
+    assert len(recorded) == 1
+    assert list(recorded[0]) == ["rss"]
+
+
+def test_doctor_command_records_history_but_pollers_do_not(config_dir, monkeypatch):
+    from agent_reach.api_server import AgentReachApi
+    from agent_reach.commands.doctor import _cmd_doctor
+    from agent_reach.metrics import MetricsCollector
+
+    recorded = []
+    monkeypatch.setattr(history, "record", lambda results: recorded.append(dict(results)))
+
+    _cmd_doctor(Namespace(json=True, channels="rss", offline=False, deadline=None))
+    MetricsCollector(channels=["rss"]).collect()
+    AgentReachApi().handle("GET", "/v1/status?channels=rss")
+
+    assert len(recorded) == 1
+
+
+def _run_watch(monkeypatch, results):
+    monkeypatch.setattr("agent_reach.doctor.check_all", lambda _config, **_kwargs: results)
+    monkeypatch.setattr(watch_cmd, "_latest_release", lambda: None)
+    watch_cmd._cmd_watch(Namespace(channels="", no_cache=False))
+
+
+def test_watch_marks_channels_that_were_working_last_time(config_dir, monkeypatch, capsys):
+    HistoryStore().record({"youtube": _result("ok"), "github": _result("warn")}, now=1.0)
+
+    _run_watch(
+        monkeypatch,
+        {
+            "youtube": _result("error", name="YouTube"),
+            "github": _result("warn", name="GitHub"),
+        },
+    )
+
+    out = capsys.readouterr().out
+    assert "[X] YouTube：error message（上次检查时正常）" in out
+    assert "[!] GitHub：warn message\n" in out
+
+
+def test_watch_silences_flapping_channels_and_reports_recoveries(
+    config_dir, monkeypatch, capsys
+):
+    store = HistoryStore()
+    for i, status in enumerate(["error", "ok", "error", "ok"]):
+        store.record({"bilibili": _result(status)}, now=float(i))
+    store.record({"web": _result("error")}, now=10.0)
+
+    _run_watch(
+        monkeypatch,
+        {
+            "bilibili": _result("error", name="B站"),
+            "web": _result("ok", name="网页"),
+        },
+    )
+
+    out = capsys.readouterr().out
+    assert out.startswith("Agent Reach: 全部正常 (1/2 渠道可用")
+    assert "已恢复：网页" in out
+    assert "状态不稳定，暂不告警：B站" in out
+
+
+def test_history_command_prints_json_and_text(config_dir, capsys):
+    import time
+
+    now = time.time()
+    HistoryStore().record({"web": _result("ok", elapsed=0.25)}, now=now)
+
+    history_cmd._cmd_history(Namespace(json=True, days=None, channels=""))
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["web"]["uptime"] == 100.0
+    assert payload["web"]["p50"] == 0.25
+
+    history_cmd._cmd_history(Namespace(json=False, days=1.0, channels="web"))
+    out = capsys.readouterr().out
+    assert "可用率 100.00%" in out
+    assert "p50 0.250s" in out
+
+
+def test_history_command_without_records_creates_nothing(isolated_home, capsys):
+    history_cmd._cmd_history(Namespace(json=False, days=None, channels=""))
+
+    assert "没有体检记录" in capsys.readouterr().out
+    assert not (isolated_home / ".agent-reach").exists()
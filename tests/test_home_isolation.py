@@ -6,6 +6,7 @@ from argparse import Namespace
 from pathlib import Path
 
 import agent_reach.cli as cli
+from agent_reach.commands import skill as skill_cmd
 from agent_reach.config import Config
 
 
@@ -20,10 +21,10 @@ def test_doctor_leaves_sandbox_home_unchanged(
     isolated_home, monkeypatch, capsys
 ):
     """If Doctor is truly read-only, even the sandbox remains empty."""
-    monkeypatch.setattr("agent_reach.doctor.check_all", lambda config: {})
-    monkeypatch.setattr("agent_reach.doctor.format_report", lambda results: "report")
+    monkeypatch.setattr("agent_reach.doctor.check_all", lambda config, **_kwargs: {})
+    monkeypatch.setattr("agent_reach.doctor.format_report", lambda results, **_kwargs: "report")
     monkeypatch.setattr(
-        cli,
+        skill_cmd,
         "_install_skill",
         lambda *args, **kwargs: (_ for _ in ()).throw(
             AssertionError("doctor must not install skills")
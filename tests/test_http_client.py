@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shared pooled HTTP client."""
+
+import threading
+from http.cookiejar import CookieJar
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from agent_reach import http_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.seen_cookies.append(self.headers.get("Cookie"))
+            self.server.seen_headers.append(dict(self.headers))
+            status, headers, body = self.server.responses.get(
+                self.path, (200, {}, b"ok")
+            )
+            if callable(status):
+                status, headers, body = status()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002 — stdlib signature
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.connections = 0
+    httpd.seen_cookies = []
+    httpd.seen_headers = []
+    httpd.responses = {}
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    http_client.close_sessions()
+
+
+def test_repeated_requests_reuse_one_pooled_connection(server):
+    for _ in range(5):
+        assert http_client.get(server.base + "/", direct=True).text == "ok"
+
+    assert server.connections == 1
+
+
+def test_callers_holding_a_token_skip_the_limiter_on_the_first_attempt(server, monkeypatch):
+    from agent_reach import ratelimit
+
+    hosts = []
+    monkeypatch.setattr(ratelimit, "acquire", hosts.append)
+
+    http_client.get(server.base + "/", direct=True, rate_limit=False)
+    http_client.get(server.base + "/", direct=True)
+
+    assert hosts == ["127.0.0.1"]
+
+
+def test_body_over_max_bytes_is_rejected(server):
+    server.responses["/big"] = (200, {}, b"x" * 101)
+
+    assert len(http_client.get(server.base + "/big", direct=True, max_bytes=101).content) == 101
+    with pytest.raises(http_client.ResponseTooLarge):
+        http_client.get(server.base + "/big", direct=True, max_bytes=100)
+
+
+def test_error_statuses_raise_unless_the_caller_inspects_them(server):
+    server.responses["/missing"] = (404, {}, b"nope")
+
+    with pytest.raises(requests.HTTPError, match="HTTP 404"):
+        http_client.get(server.base + "/missing", direct=True)
+    resp = http_client.get(server.base + "/missing", direct=True, raise_for_status=False)
+    assert resp.status_code == 404
+    assert not resp
+    assert resp.text == "nope"
+
+
+def test_retries_transient_statuses_honoring_retry_after(server):
+    replies = iter([(503, {"Retry-After": "2"}, b"busy"), (200, {}, b'{"ok": true}')])
+    server.responses["/flaky"] = (lambda: next(replies), None, None)
+    sleeps = []
+
+    resp = http_client.get(server.base + "/flaky", direct=True, retries=2, sleeper=sleeps.append)
+
+    assert resp.json() == {"ok": True}
+    assert sleeps == [2.0]
+
+
+def test_cookies_stay_in_the_callers_jar(server):
+    server.responses["/login"] = (200, {"Set-Cookie": "token=abc; Path=/"}, b"")
+    jar = CookieJar()
+
+    http_client.get(server.base + "/login", direct=True, cookie_jar=jar)
+    http_client.get(server.base + "/with-jar", direct=True, cookie_jar=jar)
+    http_client.get(server.base + "/without-jar", direct=True)
+
+    assert [cookie.name for cookie in jar] == ["token"]
+    assert server.seen_cookies == [None, "token=abc", None]
+
+
+def test_direct_session_ignores_proxy_environment(server, monkeypatch):
+    monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+    monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.delenv("no_proxy", raising=False)
+
+    assert http_client.get(server.base + "/", direct=True).text == "ok"
+    with pytest.raises(requests.ConnectionError):
+        http_client.get(server.base + "/", timeout=2)
+
+
+def test_every_attempt_takes_a_rate_limit_token_for_its_host(server, monkeypatch):
+    from agent_reach import ratelimit
+
+    hosts = []
+    monkeypatch.setattr(ratelimit, "acquire", hosts.append)
+    server.responses["/flaky"] = (503, {}, b"")
+
+    http_client.get(server.base + "/flaky", direct=True, retries=1, raise_for_status=False,
+                    sleeper=lambda _s: None)
+
+    assert hosts == ["127.0.0.1", "127.0.0.1"]
+
+
+def test_repeated_connection_failures_open_the_hosts_circuit(server, monkeypatch):
+    from agent_reach import breaker
+
+    for name in ("HTTP_PROXY", "http_proxy", "ALL_PROXY", "all_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(breaker, "_breaker", breaker.CircuitBreaker(threshold=2))
+    closed_port = f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            http_client.get(closed_port + "/", timeout=2)
+    with pytest.raises(breaker.CircuitOpen):
+        http_client.get(closed_port + "/", timeout=2)
+    # Loopback services bypass the circuit: they must work as soon as they restart.
+    with pytest.raises(requests.ConnectionError):
+        http_client.get(closed_port + "/", timeout=2, direct=True)
+
+
+def _conditional(server, validator, header, value):
+    """Reply 304 when the request carries ``header: value``, else 200 + validator."""
+    def reply():
+        if server.seen_headers[-1].get(header) == value:
+            return 304, {}, b""
+        return 200, {validator: value, "Set-Cookie": "s=1"}, b"stored body"
+
+    return reply, None, None
+
+
+def test_revalidated_get_sends_etag_and_serves_304_from_the_stored_body(server):
+    server.responses["/etag"] = _conditional(server, "ETag", "If-None-Match", '"v1"')
+
+    first = http_client.get(server.base + "/etag", direct=True, revalidate=True)
+    second = http_client.get(server.base + "/etag", direct=True, revalidate=True)
+
+    assert (first.revalidated, second.revalidated) == (False, True)
+    assert second.status_code == 200
+    assert second.content == b"stored body"
+    assert second.headers["etag"] == '"v1"'
+    assert "Set-Cookie" not in second.headers
+    assert server.seen_headers[1]["If-None-Match"] == '"v1"'
+
+
+def test_last_modified_is_sent_back_as_if_modified_since(server):
+    stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+    server.responses["/lm"] = _conditional(server, "Last-Modified", "If-Modified-Since", stamp)
+
+    http_client.get(server.base + "/lm", direct=True, revalidate=True)
+    resp = http_client.get(server.base + "/lm", direct=True, revalidate=True)
+
+    assert resp.revalidated
+    assert resp.text == "stored body"
+
+
+def test_validators_are_scoped_to_credentials_and_opt_in(server):
+    server.responses["/etag"] = _conditional(server, "ETag", "If-None-Match", '"v1"')
+
+    http_client.get(server.base + "/etag", direct=True, revalidate=True,
+                    headers={"Authorization": "token alice"})
+    bob = http_client.get(server.base + "/etag", direct=True, revalidate=True,
+                          headers={"Authorization": "token bob"})
+    plain = http_client.get(server.base + "/etag", direct=True)
+
+    assert not bob.revalidated and not plain.revalidated
+    assert "If-None-Match" not in server.seen_headers[1]
+    assert "If-None-Match" not in server.seen_headers[2]
@@ -1,8 +1,11 @@
 """Security boundaries for the optional Agent Reach MCP server."""
 
 import asyncio
+import json
 from types import SimpleNamespace
 
+import pytest
+
 import agent_reach.integrations.mcp_server as mcp_server
 
 
@@ -99,3 +102,286 @@ def test_mcp_status_exception_credentials_are_scrubbed(monkeypatch):
     assert "password" not in text
     assert "top-secret" not in text
     assert "https://***@example.test/data?token=***" in text
+
+
+class _Config:
+    def __init__(self, *, read_only=False):
+        self.read_only = read_only
+
+
+def _counting_agent_reach(started, release):
+    calls = []
+
+    class _SlowAgentReach:
+        def __init__(self, config):
+            self.config = config
+
+        def doctor_report(self):
+            calls.append(1)
+            started.set()
+            assert release.wait(5)
+            return f"report {len(calls)}"
+
+    return _SlowAgentReach, calls
+
+
+def test_mcp_status_runs_off_the_loop_and_shares_one_inflight_run(monkeypatch):
+    import threading
+
+    _install_fake_mcp(monkeypatch)
+    started, release = threading.Event(), threading.Event()
+    agent_reach_cls, calls = _counting_agent_reach(started, release)
+    monkeypatch.setattr(mcp_server, "Config", _Config)
+    monkeypatch.setattr(mcp_server, "AgentReach", agent_reach_cls)
+    server = mcp_server.create_server(status_ttl=60)
+
+    async def scenario():
+        callers = [
+            asyncio.ensure_future(server.call_tool_handler("get_status", {}))
+            for _ in range(5)
+        ]
+        # This coroutine keeps running while the doctor run blocks its worker
+        # thread; a synchronous call on the loop would deadlock here.
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        release.set()
+        return await asyncio.gather(*callers)
+
+    results = asyncio.run(scenario())
+
+    assert calls == [1]
+    assert {result[0].text for result in results} == {"report 1"}
+
+
+def test_mcp_status_is_cached_for_ttl_and_refresh_bypasses_it(monkeypatch):
+    import threading
+
+    _install_fake_mcp(monkeypatch)
+    started, release = threading.Event(), threading.Event()
+    release.set()
+    agent_reach_cls, calls = _counting_agent_reach(started, release)
+    monkeypatch.setattr(mcp_server, "Config", _Config)
+    monkeypatch.setattr(mcp_server, "AgentReach", agent_reach_cls)
+    server = mcp_server.create_server(status_ttl=60)
+
+    first = asyncio.run(server.call_tool_handler("get_status", {}))
+    second = asyncio.run(server.call_tool_handler("get_status", {}))
+    refreshed = asyncio.run(server.call_tool_handler("get_status", {"refresh": True}))
+
+    assert [first[0].text, second[0].text, refreshed[0].text] == [
+        "report 1",
+        "report 1",
+        "report 2",
+    ]
+
+
+def test_single_flight_never_caches_failures():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    cached = mcp_server.SingleFlight(flaky, ttl=60)
+
+    async def scenario():
+        try:
+            await cached.get()
+        except RuntimeError:
+            pass
+        return await cached.get(), await cached.get()
+
+    assert asyncio.run(scenario()) == ("ok", "ok")
+    assert len(attempts) == 2
+
+
+def test_single_flight_ttl_expiry():
+    now = [0.0]
+    calls = []
+    cached = mcp_server.SingleFlight(lambda: calls.append(1) or len(calls), 10, clock=lambda: now[0])
+
+    assert asyncio.run(cached.get()) == 1
+    now[0] = 9.9
+    assert asyncio.run(cached.get()) == 1
+    now[0] = 10.0
+    assert asyncio.run(cached.get()) == 2
+
+
+def test_status_ttl_env_override(monkeypatch):
+    monkeypatch.setenv("AGENT_REACH_MCP_STATUS_TTL", "5")
+    assert mcp_server._status_ttl_from_env() == 5.0
+    monkeypatch.setenv("AGENT_REACH_MCP_STATUS_TTL", "garbage")
+    assert mcp_server._status_ttl_from_env() == mcp_server.DEFAULT_STATUS_TTL
+
+
+def test_mcp_lists_channel_data_tools(monkeypatch):
+    _install_fake_mcp(monkeypatch)
+    monkeypatch.setattr(mcp_server, "Config", _Config)
+
+    server = mcp_server.create_server()
+    tools = asyncio.run(server.list_tools_handler())
+    by_name = {tool.name: tool for tool in tools}
+
+    assert {"get_status", "v2ex_hot_topics", "xueqiu_stock_quote", "web_read",
+            "youtube_transcribe"} <= by_name.keys()
+    assert by_name["v2ex_topic"].inputSchema["required"] == ["topic_id"]
+
+
+def test_mcp_data_tools_run_in_parallel_worker_threads(monkeypatch):
+    import threading
+
+    from agent_reach.channels.v2ex import V2EXChannel
+
+    _install_fake_mcp(monkeypatch)
+    monkeypatch.setattr(mcp_server, "Config", _Config)
+    both_running = threading.Barrier(2, timeout=5)
+
+    def fake_node_topics(self, node_name, limit=20):
+        both_running.wait()  # deadlocks unless both calls run at once
+        return [{"node": node_name, "limit": limit}]
+
+    monkeypatch.setattr(V2EXChannel, "get_node_topics", fake_node_topics)
+    server = mcp_server.create_server()
+
+    async def scenario():
+        return await asyncio.gather(
+            server.call_tool_handler("v2ex_node_topics", {"node_name": "python"}),
+            server.call_tool_handler("v2ex_node_topics", {"node_name": "go", "limit": 3}),
+        )
+
+    first, second = asyncio.run(scenario())
+
+    assert json.loads(first[0].text) == [{"node": "python", "limit": 20}]
+    assert json.loads(second[0].text) == [{"node": "go", "limit": 3}]
+
+
+@pytest.mark.parametrize(
+    ("arguments", "error"),
+    [
+        ({}, "missing argument(s) for v2ex_topic: topic_id"),
+        ({"topic_id": "1"}, "topic_id must be of type integer"),
+        ({"topic_id": 0}, "topic_id must be >= 1"),
+        ({"topic_id": 1, "extra": True}, "unknown argument(s) for v2ex_topic: extra"),
+    ],
+)
+def test_mcp_data_tool_arguments_are_validated(monkeypatch, arguments, error):
+    from agent_reach.channels.v2ex import V2EXChannel
+
+    _install_fake_mcp(monkeypatch)
+    monkeypatch.setattr(mcp_server, "Config", _Config)
+    monkeypatch.setattr(
+        V2EXChannel, "get_topic", lambda self, topic_id: pytest.fail("must not be called")
+    )
+    server = mcp_server.create_server()
+
+    result = asyncio.run(server.call_tool_handler("v2ex_topic", arguments))
+
+    assert result[0].text == f"Error: {error}"
+
+
+def test_mcp_transcribe_sends_progress_notifications(monkeypatch):
+    from agent_reach.channels.youtube import YouTubeChannel
+
+    _install_fake_mcp(monkeypatch)
+    monkeypatch.setattr(mcp_server, "Config", _Config)
+    notifications = []
+
+    class _Session:
+        async def send_progress_notification(self, token, progress, total, message=None):
+            notifications.append((token, progress, total, message))
+
+    def fake_transcribe(self, url, *, provider="auto", config=None, progress=None):
+        assert isinstance(config, _Config)
+        progress(1, None, "audio downloaded")
+        progress(3, 3, "transcribed chunk 1/1")
+        return f"transcript of {url} via {provider}"
+
+    monkeypatch.setattr(YouTubeChannel, "transcribe", fake_transcribe)
+    server = mcp_server.create_server()
+    server.request_context = SimpleNamespace(
+        meta=SimpleNamespace(progressToken="tok-1"), session=_Session()
+    )
+
+    async def scenario():
+        result = await server.call_tool_handler("youtube_transcribe", {"url": "https://youtu.be/x"})
+        await asyncio.sleep(0.05)  # let thread-scheduled notifications run
+        return result
+
+    result = asyncio.run(scenario())
+
+    assert result[0].text == "transcript of https://youtu.be/x via auto"
+    assert notifications == [
+        ("tok-1", 1, None, "audio downloaded"),
+        ("tok-1", 3, 3, "transcribed chunk 1/1"),
+    ]
+
+
+def test_mcp_streaming_status_notifies_per_channel_then_summarizes(monkeypatch):
+    import agent_reach.doctor as doctor
+
+    _install_fake_mcp(monkeypatch)
+    monkeypatch.setattr(mcp_server, "Config", _Config)
+    notifications = []
+
+    class _Session:
+        async def send_progress_notification(self, token, progress, total, message=None):
+            notifications.append((progress, total, json.loads(message)))
+
+    def fake_check_all(config, *, channels=None, on_result=None):
+        assert channels == ["web", "v2ex"]
+        results = {}
+        for key, status in (("v2ex", "ok"), ("web", "warn")):
+            results[key] = {
+                "status": status, "message": f"{key} {status}", "active_backend": None,
+            }
+            on_result(key, results[key])
+        return results
+
+    monkeypatch.setattr(doctor, "check_all", fake_check_all)
+    monkeypatch.setattr(doctor, "format_report", lambda results: f"summary of {len(results)}")
+    server = mcp_server.create_server()
+    server.request_context = SimpleNamespace(
+        meta=SimpleNamespace(progressToken=7), session=_Session()
+    )
+
+    async def scenario():
+        result = await server.call_tool_handler(
+            "get_status_stream", {"channels": ["web", "v2ex"]}
+        )
+        await asyncio.sleep(0.05)
+        return result
+
+    result = asyncio.run(scenario())
+
+    assert result[0].text == "summary of 2"
+    assert notifications == [
+        (1, 2, {"channel": "v2ex", "status": "ok", "message": "v2ex ok", "active_backend": None}),
+        (2, 2, {"channel": "web", "status": "warn", "message": "web warn",
+                "active_backend": None}),
+    ]
+
+
+def test_mcp_full_streaming_status_primes_get_status_cache(monkeypatch):
+    import agent_reach.doctor as doctor
+
+    _install_fake_mcp(monkeypatch)
+    monkeypatch.setattr(mcp_server, "Config", _Config)
+
+    class _AgentReach:
+        def __init__(self, config):
+            pass
+
+        def doctor_report(self):
+            raise AssertionError("get_status should reuse the streamed report")
+
+    monkeypatch.setattr(mcp_server, "AgentReach", _AgentReach)
+    monkeypatch.setattr(doctor, "check_all", lambda config, **_kwargs: {})
+    monkeypatch.setattr(doctor, "format_report", lambda results: "streamed report")
+    server = mcp_server.create_server(status_ttl=60)
+
+    asyncio.run(server.call_tool_handler("get_status_stream", {}))
+    result = asyncio.run(server.call_tool_handler("get_status", {}))
+
+    assert result[0].text == "streamed report"
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Tests for the OpenMetrics exporter (`agent-reach metrics`)."""
+
+import threading
+import urllib.error
+import urllib.request
+from argparse import Namespace
+
+import pytest
+
+from agent_reach import __version__
+from agent_reach.commands import metrics as metrics_cmd
+from agent_reach.metrics import CONTENT_TYPE, MetricsCollector, UpdateState
+
+
+def _results():
+    return {
+        "github": {
+            "status": "ok",
+            "name": "GitHub",
+            "message": "完整可用",
+            "active_backend": "gh CLI",
+            "elapsed": 0.2,
+            "operations": [
+                {"kind": "subprocess", "label": "gh --version", "duration": 0.03, "outcome": "ok"},
+            ],
+        },
+        "v2ex": {
+            "status": "error",
+            "name": "V2EX",
+            "message": 'bad "quote"',
+            "active_backend": None,
+            "elapsed": 3.0,
+            "operations": [
+                {"kind": "http", "label": "HTTPS www.v2ex.com/api", "duration": 3.0,
+                 "outcome": "Timeout"},
+            ],
+        },
+    }
+
+
+class _CountingCheck:
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, config, *, use_cache=True, channels=None):
+        with self.lock:
+            self.calls += 1
+        return _results()
+
+
+def test_exposition_has_status_backend_histograms_and_eof():
+    collector = MetricsCollector(check=_CountingCheck())
+
+    text = collector.collect()
+
+    assert f'agent_reach_build_info{{version="{__version__}"}} 1' in text
+    assert 'agent_reach_channel_up{channel="github"} 1' in text
+    assert 'agent_reach_channel_up{channel="v2ex"} 0' in text
+    assert 'agent_reach_channel_status{channel="v2ex",status="error"} 1' in text
+    assert 'agent_reach_channel_status{channel="v2ex",status="ok"} 0' in text
+    assert 'agent_reach_channel_backend_info{channel="github",backend="gh CLI"} 1' in text
+    assert "# TYPE agent_reach_probe_duration_seconds histogram" in text
+    assert (
+        'agent_reach_probe_duration_seconds_bucket{channel="github",kind="subprocess",'
+        'le="0.05"} 1' in text
+    )
+    assert (
+        'agent_reach_probe_duration_seconds_bucket{channel="v2ex",kind="http",le="2.5"} 0'
+        in text
+    )
+    assert 'agent_reach_channel_check_duration_seconds_count{channel="v2ex"} 1' in text
+    assert "agent_reach_check_cycles_total 1" in text
+    assert "agent_reach_update_available" not in text
+    assert text.endswith("# EOF\n")
+
+
+def test_scrapes_within_interval_share_one_cycle():
+    check = _CountingCheck()
+    now = [100.0]
+    collector = MetricsCollector(check=check, interval=60, clock=lambda: now[0])
+
+    threads = [threading.Thread(target=collector.collect) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert check.calls == 1
+
+    now[0] += 59
+    collector.collect()
+    assert check.calls == 1
+
+    now[0] += 1
+    text = collector.collect()
+    assert check.calls == 2
+    assert "agent_reach_check_cycles_total 2" in text
+    assert 'agent_reach_channel_check_duration_seconds_count{channel="github"} 2' in text
+
+
+def test_update_state_metrics_and_their_own_slower_cache():
+    lookups = []
+
+    def update_check():
+        lookups.append(1)
+        return UpdateState(latest="99.0.0", available=True)
+
+    now = [0.0]
+    collector = MetricsCollector(
+        check=_CountingCheck(), interval=1, update_check=update_check, clock=lambda: now[0]
+    )
+    collector.collect()
+    now[0] += 10
+    text = collector.collect()
+
+    assert len(lookups) == 1
+    assert "agent_reach_update_check_success 1" in text
+    assert "agent_reach_update_available 1" in text
+    assert 'agent_reach_latest_release_info{version="99.0.0"} 1' in text
+
+
+def test_failed_update_lookup_is_reported_as_unsuccessful():
+    collector = MetricsCollector(
+        check=_CountingCheck(), update_check=lambda: UpdateState(latest=None, available=False)
+    )
+
+    text = collector.collect()
+
+    assert "agent_reach_update_check_success 0" in text
+    assert "agent_reach_latest_release_info" not in text
+
+
+def test_label_values_are_escaped():
+    def check(config, **_kwargs):
+        results = _results()
+        results["github"]["active_backend"] = 'we"ird\\name'
+        return results
+
+    text = MetricsCollector(check=check).collect()
+
+    assert 'backend="we\\"ird\\\\name"' in text
+
+
+def test_metrics_command_prints_once(monkeypatch, capsys):
+    monkeypatch.setattr("agent_reach.doctor.check_all", _CountingCheck())
+
+    metrics_cmd._cmd_metrics(
+        Namespace(serve=None, interval=None, channels="", no_cache=False, no_update_check=True)
+    )
+
+    out = capsys.readouterr().out
+    assert 'agent_reach_channel_up{channel="github"} 1' in out
+    assert out.endswith("# EOF\n")
+
+
+def test_http_handler_serves_metrics_and_404s_elsewhere():
+    from http.server import ThreadingHTTPServer
+
+    check = _CountingCheck()
+    collector = MetricsCollector(check=check)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), metrics_cmd._make_handler(collector))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+    try:
+        for _ in range(3):
+            with opener.open(f"{base}/metrics", timeout=5) as resp:
+                assert resp.headers["Content-Type"] == CONTENT_TYPE
+                assert resp.read().decode("utf-8").endswith("# EOF\n")
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            opener.open(f"{base}/other", timeout=5)
+        assert exc.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert check.calls == 1
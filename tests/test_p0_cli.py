@@ -13,6 +13,9 @@ from pathlib import Path
 import pytest
 
 import agent_reach.cli as cli
+from agent_reach.commands import install as install_cmd
+from agent_reach.commands import skill as skill_cmd
+from agent_reach.commands import watch as watch_cmd
 
 
 class _MemoryConfig:
@@ -312,17 +315,17 @@ def test_install_does_not_implicitly_read_browser_cookies(monkeypatch, tmp_path,
         "expanduser",
         lambda value: value.replace("~", str(tmp_path)),
     )
-    monkeypatch.setattr(cli, "_install_system_deps", lambda: None)
-    monkeypatch.setattr(cli, "_install_mcporter", lambda: None)
-    monkeypatch.setattr(cli, "_install_twitter_deps", lambda: None)
-    monkeypatch.setattr(cli, "_install_skill", lambda: None)
+    monkeypatch.setattr(install_cmd, "_install_system_deps", lambda: None)
+    monkeypatch.setattr(install_cmd, "_install_mcporter", lambda: None)
+    monkeypatch.setattr(install_cmd, "_install_twitter_deps", lambda: None)
+    monkeypatch.setattr(install_cmd, "_install_skill", lambda: None)
     monkeypatch.setattr(
         "agent_reach.doctor.check_all",
         lambda _config: {},
     )
     monkeypatch.setattr(
         "agent_reach.doctor.format_report",
-        lambda _results: "report",
+        lambda _results, **_kwargs: "report",
     )
     monkeypatch.setattr(
         cookie_extract,
@@ -380,7 +383,7 @@ def test_install_rejects_unknown_channel_before_side_effects(
         ),
     )
     monkeypatch.setattr(
-        cli,
+        install_cmd,
         "_install_system_deps",
         lambda: pytest.fail("system dependencies must not be installed"),
     )
@@ -538,10 +541,10 @@ def test_doctor_never_installs_or_updates_skill(monkeypatch, capsys):
     import agent_reach.config as config_module
 
     monkeypatch.setattr(config_module, "Config", _MemoryConfig)
-    monkeypatch.setattr("agent_reach.doctor.check_all", lambda _config: {})
-    monkeypatch.setattr("agent_reach.doctor.format_report", lambda _results: "report")
+    monkeypatch.setattr("agent_reach.doctor.check_all", lambda _config, **_kwargs: {})
+    monkeypatch.setattr("agent_reach.doctor.format_report", lambda _results, **_kwargs: "report")
     monkeypatch.setattr(
-        cli,
+        skill_cmd,
         "_install_skill",
         lambda *_args, **_kwargs: pytest.fail("doctor must not install skill"),
     )
@@ -558,6 +561,8 @@ def test_watch_uses_read_only_config(monkeypatch, capsys):
     created = []
 
     class RecordingConfig(_MemoryConfig):
+        CONFIG_DIR = config_module.Config.CONFIG_DIR
+
         def __init__(self, *args, **kwargs):
             super().__init__(*args, **kwargs)
             created.append(self)
@@ -572,7 +577,7 @@ def test_watch_uses_read_only_config(monkeypatch, capsys):
     monkeypatch.setattr(config_module, "Config", RecordingConfig)
     monkeypatch.setattr(
         "agent_reach.doctor.check_all",
-        lambda _config: {
+        lambda _config, **_kwargs: {
             "web": {
                 "status": "ok",
                 "name": "网页",
@@ -584,7 +589,7 @@ def test_watch_uses_read_only_config(monkeypatch, capsys):
         },
     )
     monkeypatch.setattr(
-        cli,
+        watch_cmd,
         "_github_get_with_retry",
         lambda *_args, **_kwargs: (_Release(), None, 1),
     )
@@ -1135,7 +1140,7 @@ def test_server_xhs_install_never_recommends_qr_or_browser_extraction(
     monkeypatch, capsys
 ):
     """Project policy requires an explicit Cookie-Editor export for XHS."""
-    monkeypatch.setattr(cli, "_detect_environment", lambda: "server")
+    monkeypatch.setattr(install_cmd, "_detect_environment", lambda: "server")
 
     cli._install_xhs_deps()
 
@@ -1279,7 +1284,7 @@ def test_missing_profile_is_clean_cli_error_without_traceback(
 def test_install_dry_run_does_not_create_agent_reach_directory(
     isolated_home, monkeypatch
 ):
-    monkeypatch.setattr(cli, "_install_system_deps_dryrun", lambda: None)
+    monkeypatch.setattr(install_cmd, "_install_system_deps_dryrun", lambda: None)
 
     cli._cmd_install(
         Namespace(
@@ -11,6 +11,7 @@ from argparse import Namespace
 import pytest
 
 from agent_reach import cli
+from agent_reach.commands import install as install_cmd
 from agent_reach.cookie_extract import _sync_bird_env, _sync_xfetch_session
 from agent_reach.utils import paths
 
@@ -438,8 +439,8 @@ def test_safe_install_with_proxy_makes_no_persistent_writes(
     observed_configs = []
     skill_calls = []
 
-    monkeypatch.setattr(cli, "_install_system_deps_safe", lambda: None)
-    monkeypatch.setattr(cli, "_install_mcporter_safe", lambda: None)
+    monkeypatch.setattr(install_cmd, "_install_system_deps_safe", lambda: None)
+    monkeypatch.setattr(install_cmd, "_install_mcporter_safe", lambda: None)
     monkeypatch.setattr(
         "agent_reach.doctor.check_all",
         lambda config: observed_configs.append(config) or {},
@@ -449,7 +450,7 @@ def test_safe_install_with_proxy_makes_no_persistent_writes(
         lambda _results: "report",
     )
     monkeypatch.setattr(
-        cli,
+        install_cmd,
         "_install_skill",
         lambda: skill_calls.append("installed"),
     )
@@ -482,17 +483,17 @@ def test_install_is_safe_by_default(isolated_home, monkeypatch, capsys):
     """Plain install checks readiness without modifying the host."""
     monkeypatch.setattr(cli, "_configure_logging", lambda _verbose=False: None)
     monkeypatch.setattr(
-        cli,
+        install_cmd,
         "_install_system_deps",
         lambda: pytest.fail("default install must not modify system dependencies"),
     )
     monkeypatch.setattr(
-        cli,
+        install_cmd,
         "_install_mcporter",
         lambda: pytest.fail("default install must not install global tools"),
     )
     monkeypatch.setattr(
-        cli,
+        install_cmd,
         "_install_skill",
         lambda: pytest.fail("default install must not register agent skills"),
     )
@@ -522,17 +523,17 @@ def test_install_system_flag_explicitly_enables_writes(
     calls = []
     monkeypatch.setattr(cli, "_configure_logging", lambda _verbose=False: None)
     monkeypatch.setattr(
-        cli,
+        install_cmd,
         "_install_system_deps",
         lambda: calls.append("system-deps"),
     )
     monkeypatch.setattr(
-        cli,
+        install_cmd,
         "_install_mcporter",
         lambda: calls.append("mcporter"),
     )
     monkeypatch.setattr(
-        cli,
+        install_cmd,
         "_install_skill",
         lambda: calls.append("skill"),
     )
@@ -559,9 +560,9 @@ def test_install_system_exits_nonzero_when_core_steps_fail(
 ):
     """Automation must not receive exit zero after failed core installation."""
     monkeypatch.setattr(cli, "_configure_logging", lambda _verbose=False: None)
-    monkeypatch.setattr(cli, "_install_system_deps", lambda: False)
-    monkeypatch.setattr(cli, "_install_mcporter", lambda: False)
-    monkeypatch.setattr(cli, "_install_skill", lambda: None)
+    monkeypatch.setattr(install_cmd, "_install_system_deps", lambda: False)
+    monkeypatch.setattr(install_cmd, "_install_mcporter", lambda: False)
+    monkeypatch.setattr(install_cmd, "_install_skill", lambda: None)
     monkeypatch.setattr("agent_reach.doctor.check_all", lambda _config: {})
     monkeypatch.setattr(
         "agent_reach.doctor.format_report",
@@ -586,10 +587,10 @@ def test_install_system_exits_nonzero_when_requested_channel_fails(
     isolated_home, monkeypatch, capsys
 ):
     monkeypatch.setattr(cli, "_configure_logging", lambda _verbose=False: None)
-    monkeypatch.setattr(cli, "_install_system_deps", lambda: True)
-    monkeypatch.setattr(cli, "_install_mcporter", lambda: True)
-    monkeypatch.setattr(cli, "_install_opencli_deps", lambda: False)
-    monkeypatch.setattr(cli, "_install_skill", lambda: True)
+    monkeypatch.setattr(install_cmd, "_install_system_deps", lambda: True)
+    monkeypatch.setattr(install_cmd, "_install_mcporter", lambda: True)
+    monkeypatch.setattr(install_cmd, "_install_opencli_deps", lambda: False)
+    monkeypatch.setattr(install_cmd, "_install_skill", lambda: True)
     monkeypatch.setattr("agent_reach.doctor.check_all", lambda _config: {})
     monkeypatch.setattr(
         "agent_reach.doctor.format_report",
@@ -619,9 +620,9 @@ def test_install_system_exits_nonzero_when_skill_install_fails(
     isolated_home, monkeypatch, capsys
 ):
     monkeypatch.setattr(cli, "_configure_logging", lambda _verbose=False: None)
-    monkeypatch.setattr(cli, "_install_system_deps", lambda: True)
-    monkeypatch.setattr(cli, "_install_mcporter", lambda: True)
-    monkeypatch.setattr(cli, "_install_skill", lambda: False)
+    monkeypatch.setattr(install_cmd, "_install_system_deps", lambda: True)
+    monkeypatch.setattr(install_cmd, "_install_mcporter", lambda: True)
+    monkeypatch.setattr(install_cmd, "_install_skill", lambda: False)
     monkeypatch.setattr("agent_reach.doctor.check_all", lambda _config: {})
     monkeypatch.setattr(
         "agent_reach.doctor.format_report",
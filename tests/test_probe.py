@@ -113,3 +113,142 @@ def test_reinstall_hint_mentions_both_installers():
     hint = reinstall_hint("some-pkg")
     assert "uv tool install --force some-pkg" in hint
     assert "pipx reinstall some-pkg" in hint
+
+
+def test_shared_probe_runs_once_per_scope_and_shares_exceptions():
+    from agent_reach.probe import shared_probe, shared_probe_scope
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert shared_probe("k", compute) == 1
+    assert shared_probe("k", compute) == 2  # no scope → no memo
+
+    def failing():
+        calls.append("boom")
+        raise RuntimeError("boom")
+
+    with shared_probe_scope():
+        assert shared_probe("k", compute) == 3
+        assert shared_probe("k", compute) == 3
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                shared_probe("err", failing)
+    assert calls.count("boom") == 1
+
+
+def test_shared_probe_is_single_flight_across_threads():
+    import contextvars
+    import threading
+    import time
+
+    from agent_reach.probe import shared_probe, shared_probe_scope
+
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.05)
+        return "answer"
+
+    answers = []
+    with shared_probe_scope():
+        threads = [
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(lambda: answers.append(shared_probe("slow", slow)),),
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert answers == ["answer"] * 5
+    assert len(calls) == 1
+
+
+def _counting_tool(tmp_path, monkeypatch, interpreter="/bin/sh"):
+    counter = tmp_path / "runs"
+    (tmp_path / "bin").mkdir(exist_ok=True)
+    tool = _make_executable(
+        tmp_path / "bin" / "counted-tool",
+        f"#!{interpreter}\necho x >> {counter}\necho 'counted-tool 1.0'\n",
+    )
+    monkeypatch.setenv("PATH", str(tmp_path / "bin") + os.pathsep + os.environ.get("PATH", ""))
+    return tool, counter
+
+
+def _runs(counter):
+    return len(counter.read_text().splitlines()) if counter.exists() else 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shell script fixture is POSIX-only")
+def test_probe_cache_serves_unchanged_binary_without_executing(tmp_path, monkeypatch):
+    from agent_reach.config import Config
+
+    Config.CONFIG_DIR.mkdir(mode=0o700)
+    _tool, counter = _counting_tool(tmp_path, monkeypatch)
+
+    first = probe_command("counted-tool")
+    second = probe_command("counted-tool")
+
+    assert first.ok and second.ok
+    assert second.output == "counted-tool 1.0"
+    assert _runs(counter) == 1
+    cache_file = Config.CONFIG_DIR / "cache" / "probes.json"
+    assert stat.S_IMODE(cache_file.stat().st_mode) == 0o600
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shell script fixture is POSIX-only")
+def test_probe_cache_invalidated_when_binary_changes(tmp_path, monkeypatch):
+    from agent_reach.config import Config
+
+    Config.CONFIG_DIR.mkdir(mode=0o700)
+    tool, counter = _counting_tool(tmp_path, monkeypatch)
+    assert probe_command("counted-tool").ok
+
+    with open(tool, "a") as handle:
+        handle.write("# upgraded\n")
+    assert probe_command("counted-tool").ok
+    assert _runs(counter) == 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shebang semantics are POSIX-only")
+def test_probe_cache_never_hides_a_vanished_interpreter(tmp_path, monkeypatch):
+    """The stale-venv case: the shim is unchanged but its interpreter is gone."""
+    import shutil
+
+    from agent_reach.config import Config
+
+    Config.CONFIG_DIR.mkdir(mode=0o700)
+    interpreter = tmp_path / "venv-sh"
+    shutil.copy2("/bin/sh", interpreter)
+    _tool, counter = _counting_tool(tmp_path, monkeypatch, interpreter=str(interpreter))
+    assert probe_command("counted-tool").ok
+
+    interpreter.unlink()
+    assert probe_command("counted-tool").status == "broken"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shell script fixture is POSIX-only")
+def test_probe_cache_disabled_and_fresh_home_stay_live(tmp_path, monkeypatch):
+    from agent_reach.config import Config
+    from agent_reach.probe_cache import probe_cache
+
+    _tool, counter = _counting_tool(tmp_path, monkeypatch)
+    probe_command("counted-tool")
+    probe_command("counted-tool")
+    assert _runs(counter) == 2
+    assert not Config.CONFIG_DIR.exists(), "read-only probes must not create ~/.agent-reach"
+
+    Config.CONFIG_DIR.mkdir(mode=0o700)
+    with probe_cache(False):
+        probe_command("counted-tool")
+        probe_command("counted-tool")
+    assert _runs(counter) == 4
+    assert not (Config.CONFIG_DIR / "cache").exists()
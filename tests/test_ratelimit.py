@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shared per-host token-bucket rate limiter."""
+
+import threading
+
+import pytest
+import yaml
+
+from agent_reach import ratelimit
+from agent_reach.config import Config
+from agent_reach.ratelimit import Rate, RateLimited, RateLimiter
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+@pytest.mark.parametrize(
+    ("value", "per_second", "burst"),
+    [
+        ("2/s", 2.0, 1.0),
+        ("30/min", 0.5, 1.0),
+        ("120/hour", 120 / 3600, 1.0),
+        (5, 5.0, 1.0),
+        ({"rate": "1/s", "burst": 4}, 1.0, 4.0),
+    ],
+)
+def test_rate_parse(value, per_second, burst):
+    assert Rate.parse(value) == Rate(per_second, burst)
+
+
+@pytest.mark.parametrize("value", ["off", False, 0, "0/s"])
+def test_rate_parse_disabled(value):
+    assert Rate.parse(value) is None
+
+
+@pytest.mark.parametrize("value", ["fast", "2/week", None, {"rate": "1/s", "burst": 0}])
+def test_rate_parse_rejects_malformed_values(value):
+    with pytest.raises(ValueError):
+        Rate.parse(value)
+
+
+def _limiter(clock, tmp_path=None, **kwargs):
+    return RateLimiter(
+        (tmp_path / "cache" / "ratelimit.sqlite3") if tmp_path else None,
+        rates={"api.example": Rate(1.0, 2)},
+        clock=clock,
+        sleeper=clock.sleep,
+        **kwargs,
+    )
+
+
+def test_burst_then_paced_waits_and_unlimited_hosts(isolated_home):
+    clock = _Clock()
+    limiter = _limiter(clock)
+
+    waits = [limiter.acquire("api.example") for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 1.0, 2.0]
+    assert limiter.acquire("elsewhere.example") == 0.0
+    assert not (isolated_home / ".agent-reach").exists()
+
+
+def test_tokens_refill_over_time():
+    clock = _Clock()
+    limiter = _limiter(clock)
+    limiter.acquire("api.example")
+    limiter.acquire("api.example")
+
+    clock.now += 1.5
+
+    assert limiter.acquire("api.example") == 0.0
+    assert limiter.acquire("api.example") == pytest.approx(0.5)
+
+
+def test_wait_beyond_max_wait_fails_fast_without_consuming():
+    clock = _Clock()
+    limiter = _limiter(clock, max_wait=1.5)
+    for _ in range(3):
+        limiter.acquire("api.example")
+
+    with pytest.raises(RateLimited, match="api.example"):
+        limiter.acquire("api.example")
+
+    clock.now += 1.0
+    assert limiter.acquire("api.example") == pytest.approx(1.0)
+
+
+def test_patient_callers_wait_at_least_one_refill_interval():
+    clock = _Clock()
+    limiter = RateLimiter(
+        rates={"api.example": Rate(1 / 30, 2)}, clock=clock, sleeper=clock.sleep
+    )
+    limiter.acquire("api.example")
+    limiter.acquire("api.example")
+
+    with pytest.raises(RateLimited):
+        limiter.acquire("api.example")  # 30s away: interactive calls fail fast
+    with ratelimit.patient(max_wait=5.0):
+        assert limiter.acquire("api.example") == pytest.approx(30.0)
+    with ratelimit.patient():
+        assert limiter.acquire("api.example") == pytest.approx(60.0)
+
+
+def test_buckets_are_shared_between_processes_through_the_state_file(tmp_path):
+    clock = _Clock()
+    first = _limiter(clock, tmp_path)
+    second = _limiter(clock, tmp_path)  # another process: separate memory, same file
+
+    assert [first.acquire("api.example"), second.acquire("api.example")] == [0.0, 0.0]
+    assert second.acquire("api.example") == 1.0
+    assert first.acquire("api.example") == 2.0
+    assert (tmp_path / "cache" / "ratelimit.sqlite3").is_file()
+
+
+def test_concurrent_threads_never_exceed_the_burst(tmp_path):
+    clock = _Clock()
+    limiter = _limiter(clock, tmp_path, max_wait=100)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        wait = limiter.acquire("api.example")
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert sorted(waits) == [0.0, 0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+def test_config_overrides_default_channel_rates(isolated_home):
+    Config.CONFIG_DIR.mkdir(mode=0o700)
+    Config.CONFIG_FILE.write_text(
+        yaml.safe_dump({"rate_limits": {"v2ex": "2/s", "web": "off", "xueqiu": "bogus"}}),
+        encoding="utf-8",
+    )
+    limiter = RateLimiter()
+
+    assert limiter.rate_for("www.v2ex.com") == Rate(2.0, ratelimit.DEFAULT_RATES["v2ex"].burst)
+    assert limiter.rate_for("r.jina.ai") is None
+    assert limiter.rate_for("stock.xueqiu.com") == ratelimit.DEFAULT_RATES["xueqiu"]
+    assert limiter.rate_for("example.com") is None
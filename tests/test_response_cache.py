@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shared on-disk response cache."""
+
+import contextvars
+import os
+import sqlite3
+import stat
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from agent_reach import response_cache
+from agent_reach.config import Config
+from agent_reach.response_cache import CachePolicy, ResponseStore, cached
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(response_cache, "_store", ResponseStore(clock=clock))
+    monkeypatch.setitem(response_cache.POLICIES, "test.item", CachePolicy(60, 120))
+    return clock
+
+
+def _counter(values):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return values[len(calls) - 1]
+
+    return fetch, calls
+
+
+def test_fresh_results_are_served_without_fetching(clock, isolated_home):
+    fetch, calls = _counter(["first", "second"])
+
+    assert cached("test.item", "https://api.example/x", fetch) == "first"
+    clock.now += 59
+    assert cached("test.item", "https://api.example/x", fetch) == "first"
+
+    assert len(calls) == 1
+    assert not (isolated_home / ".agent-reach").exists()
+
+
+def test_stale_results_are_served_while_refreshing_in_the_background(clock):
+    fetch, calls = _counter(["first", "second"])
+    cached("test.item", "https://api.example/x", fetch)
+
+    clock.now += 90
+    assert cached("test.item", "https://api.example/x", fetch) == "first"
+    deadline = time.monotonic() + 5
+    while response_cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert cached("test.item", "https://api.example/x", fetch) == "second"
+    assert len(calls) == 2
+
+
+def test_background_refresh_runs_in_the_callers_context(clock):
+    marker = contextvars.ContextVar("marker", default="unset")
+    seen = []
+
+    def fetch():
+        seen.append(marker.get())
+        return "value"
+
+    cached("test.item", "https://api.example/ctx", fetch)
+    clock.now += 90
+    marker.set("caller")
+    cached("test.item", "https://api.example/ctx", fetch)
+    deadline = time.monotonic() + 5
+    while response_cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert seen == ["unset", "caller"]
+
+
+def test_expired_results_are_refetched_and_failures_never_cached(clock):
+    fetch, calls = _counter(["first", "second"])
+    cached("test.item", "https://api.example/x", fetch)
+
+    clock.now += 181
+    assert cached("test.item", "https://api.example/x", fetch) == "second"
+
+    def failing():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        cached("test.item", "https://api.example/y", failing)
+    assert cached("test.item", "https://api.example/y", lambda: "ok") == "ok"
+
+
+def test_refresh_skips_reads_and_off_skips_the_cache_entirely(clock):
+    fetch, calls = _counter(["first", "second", "third"])
+    cached("test.item", "https://api.example/x", fetch)
+
+    with response_cache.cache_mode(response_cache.REFRESH):
+        assert cached("test.item", "https://api.example/x", fetch) == "second"
+    with response_cache.cache_mode(response_cache.OFF):
+        assert cached("test.item", "https://api.example/x", fetch) == "third"
+
+    assert cached("test.item", "https://api.example/x", fetch) == "second"
+
+
+def test_keys_normalize_urls_and_separate_accounts(clock):
+    fetch, calls = _counter(["anon", "alice", "bob"])
+
+    cached("test.item", "https://API.example:443/x?b=2&a=1#frag", fetch)
+    assert cached("test.item", "https://api.example/x?a=1&b=2", fetch) == "anon"
+    assert cached("test.item", "https://api.example/x?a=1&b=2", fetch, vary="alice") == "alice"
+    assert cached("test.item", "https://api.example/x?a=1&b=2", fetch, vary="bob") == "bob"
+    assert cached("test.item", "https://api.example/x?a=1&b=2", fetch, vary="alice") == "alice"
+    assert len(calls) == 3
+
+
+def test_shared_file_is_private_and_evicts_least_recently_used(isolated_home):
+    (isolated_home / ".agent-reach").mkdir()
+    clock = _Clock()
+    path = isolated_home / ".agent-reach" / "cache" / "responses.sqlite3"
+    store = ResponseStore(path, max_bytes=35, clock=clock)
+
+    for name in ("a", "b", "c"):
+        clock.now += 1
+        store.put(name, "x" * 8)  # 10 bytes as JSON
+    clock.now += response_cache._TOUCH_INTERVAL
+    store.get("a")  # now more recent than b
+    clock.now += 1
+    store.put("d", "y" * 8)
+
+    assert store.get("b") is None
+    assert all(store.get(name) is not None for name in ("a", "c", "d"))
+    assert ResponseStore(path, clock=clock).get("d") == (0.0, "y" * 8)
+    if sys.platform != "win32":
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_hits_are_read_while_another_process_holds_the_write_lock(isolated_home):
+    (isolated_home / ".agent-reach").mkdir()
+    clock = _Clock()
+    path = isolated_home / ".agent-reach" / "cache" / "responses.sqlite3"
+    store = ResponseStore(path, clock=clock)
+    store.put("k", "v")
+
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.monotonic()
+        assert store.get("k") == (0.0, "v")
+        clock.now += response_cache._TOUCH_INTERVAL
+        assert store.get("k") == (response_cache._TOUCH_INTERVAL, "v")  # bump skipped
+        assert time.monotonic() - started < 2
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+
+def test_urls_and_account_identities_are_not_stored_in_clear(clock, isolated_home):
+    (isolated_home / ".agent-reach").mkdir()
+
+    cached("test.item", "https://api.example/private?q=1", lambda: "body", vary="token=secret")
+
+    raw = response_cache.cache_path().read_bytes()
+    assert b"body" in raw
+    assert b"api.example" not in raw and b"secret" not in raw
+
+
+def test_concurrent_writers_share_one_file(isolated_home):
+    (isolated_home / ".agent-reach").mkdir()
+    store = ResponseStore()
+
+    threads = [
+        threading.Thread(target=store.put, args=(f"k{i}", {"n": i})) for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [store.get(f"k{i}")[1] for i in range(8)] == [{"n": i} for i in range(8)]
+
+
+def test_xueqiu_results_are_never_shared_across_configured_accounts(isolated_home):
+    from agent_reach.channels import xueqiu as xq
+    from agent_reach.channels.xueqiu import XueqiuChannel
+
+    Config.CONFIG_DIR.mkdir()
+    payloads = iter([{"stocks": [{"code": "SH1", "name": "A"}]},
+                     {"stocks": [{"code": "SH2", "name": "B"}]}])
+    with patch.object(xq, "_get_json", side_effect=lambda url: next(payloads)) as fake:
+        Config.CONFIG_FILE.write_text(yaml.safe_dump({"xueqiu_cookie": "xq_a_token=alice"}))
+        first = XueqiuChannel().search_stock("茅台")
+        assert XueqiuChannel().search_stock("茅台") == first
+        Config.CONFIG_FILE.write_text(yaml.safe_dump({"xueqiu_cookie": "xq_a_token=bob"}))
+        second = XueqiuChannel().search_stock("茅台")
+
+    assert fake.call_count == 2
+    assert first[0]["symbol"] == "SH1" and second[0]["symbol"] == "SH2"
+
+
+def test_cached_many_fetches_only_misses_in_one_call_and_never_caches_failures(clock):
+    calls = []
+
+    def fetch_many(urls):
+        calls.append(list(urls))
+        return [RuntimeError("down") if url.endswith("/b") else url[-1] for url in urls]
+
+    cached("test.item", "https://api.example/a", lambda: "cached-a")
+    values = response_cache.cached_many(
+        "test.item", ["https://api.example/a", "https://api.example/b", "https://api.example/c"],
+        fetch_many,
+    )
+
+    assert values[0] == "cached-a" and values[2] == "c"
+    assert isinstance(values[1], RuntimeError)
+    assert calls == [["https://api.example/b", "https://api.example/c"]]
+    response_cache.cached_many("test.item", ["https://api.example/b"], fetch_many)
+    assert calls[-1] == ["https://api.example/b"]
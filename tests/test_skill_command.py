@@ -117,7 +117,7 @@ class TestSkillCommand(unittest.TestCase):
             self.assertNotIn("linkedin-scraper-mcp", content)
 
     def test_skill_install_command_exits_nonzero_when_install_fails(self):
-        with patch("agent_reach.cli._install_skill", return_value=False):
+        with patch("agent_reach.commands.skill._install_skill", return_value=False):
             with self.assertRaises(SystemExit) as raised:
                 _cmd_skill(Namespace(install=True, uninstall=False))
 
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Cold-start budget for the commands agents call on every turn.
+
+Each case runs the real CLI in a fresh interpreter under ``python -X
+importtime`` and sums the self time of every module imported after the
+interpreter itself is up. Budgets leave generous headroom (bytecode caches
+may be disabled, CI machines are slow); the forbidden-module lists are the
+sharp part: they fail as soon as a fast command starts loading installer,
+configure or (for the commands that never go online, including
+``doctor --offline``) HTTP-client code again. The online ``doctor --json``
+case runs with DNS disabled, so every HTTP check fails at once.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+_MARK = "@@agent-reach-startup@@"
+
+# Imported before the mark, so it costs nothing: no case may reach the
+# network, and an online doctor then fails each HTTP check at once.
+_RUNNER = (
+    "import socket\n"
+    "import sys\n"
+    "def _no_network(*args, **kwargs):\n"
+    "    raise socket.gaierror('network disabled by the startup budget test')\n"
+    "socket.getaddrinfo = _no_network\n"
+    f"sys.stderr.write({_MARK!r} + '\\n')\n"
+    "sys.argv = ['agent-reach', *sys.argv[1:]]\n"
+    "from agent_reach.cli import main\n"
+    "try:\n"
+    "    main()\n"
+    "except SystemExit:\n"
+    "    pass\n"
+)
+
+_NEVER_ON_FAST_PATH = {
+    "agent_reach.commands.configure",
+    "agent_reach.commands.install",
+    "agent_reach.commands.setup",
+    "agent_reach.commands.uninstall",
+    "agent_reach.commands.update",
+    "loguru",
+}
+
+#: HTTP checks need requests; commands that never go online must not load it.
+_OFFLINE = {"requests"}
+
+CASES = [
+    pytest.param(
+        ["version"], "", 60_000,
+        {"yaml", "agent_reach.config", "agent_reach.doctor", *_OFFLINE},
+        id="version",
+    ),
+    pytest.param(
+        ["format", "xhs"], "{}", 120_000,
+        {"yaml", "agent_reach.channels.xiaohongshu", *_OFFLINE},
+        id="format",
+    ),
+    pytest.param(
+        ["doctor", "--json", "--offline", "--channels", "web"], "", 400_000, {"rich", *_OFFLINE},
+        id="doctor-json-offline-web",
+    ),
+    pytest.param(
+        ["doctor", "--json", "--offline"], "", 400_000, {"rich", *_OFFLINE},
+        id="doctor-json-offline",
+    ),
+    # The online doctor legitimately loads the HTTP stack and feedparser (the
+    # RSS check imports it to catch broken installs), on checker threads that
+    # contend for the GIL; the budget is loose, the forbidden list is not.
+    pytest.param(
+        ["doctor", "--json"], "", 1_500_000, {"rich"},
+        id="doctor-json",
+    ),
+]
+
+
+def _import_profile(argv, stdin, home):
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RUNNER, *argv],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    _, _, profile = proc.stderr.partition(_MARK)
+    modules = {}
+    for line in profile.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            modules[name.strip()] = int(self_us)
+    return proc, modules
+
+
+@pytest.mark.parametrize(("argv", "stdin", "budget_us", "forbidden"), CASES)
+def test_common_commands_stay_within_startup_budget(argv, stdin, budget_us, forbidden, tmp_path):
+    proc, modules = _import_profile(argv, stdin, tmp_path)
+
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert "agent_reach.cli" in modules
+    loaded = (_NEVER_ON_FAST_PATH | forbidden) & modules.keys()
+    assert not loaded, f"`agent-reach {' '.join(argv)}` imported {sorted(loaded)}"
+    total = sum(modules.values())
+    slowest = sorted(modules.items(), key=lambda kv: kv[1], reverse=True)[:5]
+    assert total <= budget_us, f"import time {total}us > {budget_us}us; slowest: {slowest}"
@@ -54,13 +54,13 @@ class TestTranscribeChunk:
         fake_config.set("groq_api_key", "gsk_test")
         captured = {}
 
-        def fake_post(url, headers=None, files=None, data=None, timeout=None):
+        def fake_post(url, headers=None, files=None, data=None, timeout=None, **_kwargs):
             captured["url"] = url
             captured["headers"] = headers
             captured["model"] = data["model"]
             return FakeResponse(200, "hello world")
 
-        monkeypatch.setattr(tr.requests, "post", fake_post)
+        monkeypatch.setattr(tr.http_client, "post", fake_post)
         text = tr.transcribe_chunk(chunk_file, "groq", config=fake_config)
         assert text == "hello world"
         assert captured["url"] == tr.PROVIDERS["groq"]["endpoint"]
@@ -71,12 +71,12 @@ class TestTranscribeChunk:
         fake_config.set("openai_api_key", "sk-test")
         captured = {}
 
-        def fake_post(url, headers=None, files=None, data=None, timeout=None):
+        def fake_post(url, headers=None, files=None, data=None, timeout=None, **_kwargs):
             captured["url"] = url
             captured["model"] = data["model"]
             return FakeResponse(200, "openai output")
 
-        monkeypatch.setattr(tr.requests, "post", fake_post)
+        monkeypatch.setattr(tr.http_client, "post", fake_post)
         text = tr.transcribe_chunk(chunk_file, "openai", config=fake_config)
         assert text == "openai output"
         assert captured["url"] == tr.PROVIDERS["openai"]["endpoint"]
@@ -89,7 +89,7 @@ class TestTranscribeChunk:
     def test_raises_on_http_error(self, monkeypatch, fake_config, chunk_file):
         fake_config.set("groq_api_key", "gsk_test")
         monkeypatch.setattr(
-            tr.requests,
+            tr.http_client,
             "post",
             lambda *a, **k: FakeResponse(429, "rate limited"),
         )
@@ -110,11 +110,11 @@ class TestFallback:
         fake_config.set("openai_api_key", "sk-test")
         calls: List[str] = []
 
-        def fake_post(url, headers=None, files=None, data=None, timeout=None):
+        def fake_post(url, headers=None, files=None, data=None, timeout=None, **_kwargs):
             calls.append(url)
             return FakeResponse(200, "from-groq")
 
-        monkeypatch.setattr(tr.requests, "post", fake_post)
+        monkeypatch.setattr(tr.http_client, "post", fake_post)
         text = tr._transcribe_with_fallback(chunk_file, ["groq", "openai"], fake_config)
         assert text == "from-groq"
         assert calls == [tr.PROVIDERS["groq"]["endpoint"]]
@@ -124,13 +124,13 @@ class TestFallback:
         fake_config.set("openai_api_key", "sk-test")
         calls: List[str] = []
 
-        def fake_post(url, headers=None, files=None, data=None, timeout=None):
+        def fake_post(url, headers=None, files=None, data=None, timeout=None, **_kwargs):
             calls.append(url)
             if url == tr.PROVIDERS["groq"]["endpoint"]:
                 return FakeResponse(429, "rate limited")
             return FakeResponse(200, "from-openai")
 
-        monkeypatch.setattr(tr.requests, "post", fake_post)
+        monkeypatch.setattr(tr.http_client, "post", fake_post)
         text = tr._transcribe_with_fallback(chunk_file, ["groq", "openai"], fake_config)
         assert text == "from-openai"
         assert calls == [
@@ -143,11 +143,11 @@ class TestFallback:
         fake_config.set("openai_api_key", "sk-test")
         calls: List[str] = []
 
-        def fake_post(url, headers=None, files=None, data=None, timeout=None):
+        def fake_post(url, headers=None, files=None, data=None, timeout=None, **_kwargs):
             calls.append(url)
             return FakeResponse(200, "via-openai")
 
-        monkeypatch.setattr(tr.requests, "post", fake_post)
+        monkeypatch.setattr(tr.http_client, "post", fake_post)
         text = tr._transcribe_with_fallback(chunk_file, ["groq", "openai"], fake_config)
         assert text == "via-openai"
         assert calls == [tr.PROVIDERS["openai"]["endpoint"]]
@@ -156,7 +156,7 @@ class TestFallback:
         fake_config.set("groq_api_key", "gsk_test")
         fake_config.set("openai_api_key", "sk-test")
         monkeypatch.setattr(
-            tr.requests,
+            tr.http_client,
             "post",
             lambda *a, **k: FakeResponse(500, "boom"),
         )
@@ -198,7 +198,7 @@ class TestOrchestrator:
                 return FakeResponse(429, "rate limited")
             return FakeResponse(200, "from-openai")
 
-        monkeypatch.setattr(tr.requests, "post", fake_post)
+        monkeypatch.setattr(tr.http_client, "post", fake_post)
 
         with pytest.raises(tr.TranscribeError, match="groq.*HTTP 429"):
             tr.transcribe(
@@ -230,7 +230,7 @@ class TestOrchestrator:
                 return FakeResponse(429, "rate limited")
             return FakeResponse(200, "from-openai")
 
-        monkeypatch.setattr(tr.requests, "post", fake_post)
+        monkeypatch.setattr(tr.http_client, "post", fake_post)
 
         text = tr.transcribe(
             str(chunk_file),
@@ -263,7 +263,7 @@ class TestOrchestrator:
             calls.append(url)
             return FakeResponse(200, "from-openai")
 
-        monkeypatch.setattr(tr.requests, "post", fake_post)
+        monkeypatch.setattr(tr.http_client, "post", fake_post)
 
         text = tr.transcribe(
             str(chunk_file),
@@ -274,6 +274,33 @@ class TestOrchestrator:
         assert text == "from-openai"
         assert calls == [tr.PROVIDERS["openai"]["endpoint"]]
 
+    def test_reports_progress_per_stage(
+        self,
+        monkeypatch,
+        fake_config,
+        tmp_path,
+        chunk_file,
+        bounded_audio_duration,
+    ):
+        fake_config.set("groq_api_key", "gsk_test")
+        compressed = tmp_path / "compressed.m4a"
+        compressed.write_bytes(b"compressed")
+        monkeypatch.setattr(tr, "compress_audio", lambda *_args: compressed)
+        monkeypatch.setattr(tr.http_client, "post", lambda url, **_kwargs: FakeResponse(200, "t"))
+        events = []
+
+        tr.transcribe(
+            str(chunk_file),
+            out_dir=tmp_path / "work",
+            config=fake_config,
+            progress=lambda done, total, message: events.append((done, total, message)),
+        )
+
+        assert events == [
+            (2, 3, "audio compressed into 1 chunk(s)"),
+            (3, 3, "transcribed chunk 1/1"),
+        ]
+
     def test_rejects_overlong_audio_before_compression(
         self, monkeypatch, fake_config, chunk_file
     ):
@@ -403,7 +430,7 @@ class TestOrchestrator:
         monkeypatch.setattr(tr, "download_audio", boom_download)
         monkeypatch.setattr(tr, "compress_audio", fake_compress)
         monkeypatch.setattr(
-            tr.requests,
+            tr.http_client,
             "post",
             lambda *a, **k: FakeResponse(200, "transcript text"),
         )
@@ -436,7 +463,7 @@ class TestOrchestrator:
 
         responses = iter(["part one ", "part two "])
         monkeypatch.setattr(
-            tr.requests,
+            tr.http_client,
             "post",
             lambda *a, **k: FakeResponse(200, next(responses)),
         )
@@ -561,7 +588,7 @@ class TestOrchestrator:
         monkeypatch.setattr(tr, "download_audio", fake_download)
         monkeypatch.setattr(tr, "compress_audio", fake_compress)
         monkeypatch.setattr(
-            tr.requests,
+            tr.http_client,
             "post",
             lambda *a, **k: FakeResponse(200, "transcript text"),
         )
@@ -595,7 +622,7 @@ class TestOrchestrator:
         monkeypatch.setattr(tr, "download_audio", fake_download)
         monkeypatch.setattr(tr, "compress_audio", fake_compress)
         monkeypatch.setattr(
-            tr.requests,
+            tr.http_client,
             "post",
             lambda *a, **k: FakeResponse(200, "transcript text"),
         )
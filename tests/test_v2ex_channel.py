@@ -14,6 +14,8 @@ reddit (#364) and xueqiu (#365).
 import json
 import ssl
 import subprocess
+import threading
+import time
 from unittest.mock import patch
 from urllib.error import URLError
 from urllib.parse import parse_qs, urlsplit
@@ -53,6 +55,16 @@ def test_check_warn_on_exception_clears_backend():
     assert ch.active_backend is None
 
 
+def test_offline_check_is_unverified_without_network():
+    from agent_reach.probe import offline_mode
+
+    ch = V2EXChannel()
+    with patch.object(v2, "_get_json", side_effect=AssertionError("network")), offline_mode():
+        result = ch.run_check()
+    assert result.status == "unverified"
+    assert result.active_backend is None
+
+
 def test_get_json_retries_unexpected_tls_eof_with_bounded_curl():
     payload = [{"id": 1}]
     tls_error = URLError(
@@ -61,7 +73,7 @@ def test_get_json_retries_unexpected_tls_eof_with_bounded_curl():
         )
     )
 
-    with patch.object(v2, "_get_json_with_urllib", side_effect=tls_error), patch.object(
+    with patch.object(v2, "_get_json_pooled", side_effect=tls_error), patch.object(
         v2.shutil, "which", return_value="C:/Windows/System32/curl.exe"
     ), patch.object(
         v2.subprocess,
@@ -86,13 +98,29 @@ def test_get_json_retries_unexpected_tls_eof_with_bounded_curl():
     assert run.call_args.kwargs["timeout"] == v2._TIMEOUT + 2
 
 
+def test_tls_eof_is_recognized_inside_requests_exception_wrappers():
+    import requests
+    import urllib3
+
+    eof = ssl.SSLError("[SSL: UNEXPECTED_EOF_WHILE_READING] EOF occurred in violation of protocol")
+    wrapped = requests.exceptions.SSLError(
+        urllib3.exceptions.MaxRetryError(None, "/api", urllib3.exceptions.SSLError(eof))
+    )
+    certificate = requests.exceptions.SSLError(
+        urllib3.exceptions.SSLError(ssl.SSLCertVerificationError("certificate verify failed"))
+    )
+
+    assert v2._is_unexpected_tls_eof(wrapped) is True
+    assert v2._is_unexpected_tls_eof(certificate) is False
+
+
 def test_get_json_does_not_hide_certificate_verification_failures():
     certificate_error = ssl.SSLCertVerificationError(
         "certificate verify failed"
     )
 
     with patch.object(
-        v2, "_get_json_with_urllib", side_effect=certificate_error
+        v2, "_get_json_pooled", side_effect=certificate_error
     ), patch.object(v2.subprocess, "run") as run:
         with pytest.raises(ssl.SSLCertVerificationError):
             v2._get_json("https://www.v2ex.com/api/topics/hot.json")
@@ -106,7 +134,7 @@ def test_get_json_does_not_fallback_for_plain_error_text():
     )
 
     with patch.object(
-        v2, "_get_json_with_urllib", side_effect=fake_error
+        v2, "_get_json_pooled", side_effect=fake_error
     ), patch.object(v2.subprocess, "run") as run:
         with pytest.raises(RuntimeError, match="unrelated"):
             v2._get_json("https://www.v2ex.com/api/topics/hot.json")
@@ -125,13 +153,13 @@ def test_get_json_does_not_fallback_for_plain_error_text():
     ],
 )
 def test_get_json_rejects_non_api_targets_before_network(url):
-    with patch.object(v2.urllib.request, "urlopen") as urlopen, patch.object(
+    with patch.object(v2.http_client, "request") as request, patch.object(
         v2.subprocess, "run"
     ) as run:
         with pytest.raises(ValueError, match="V2EX HTTPS API"):
             v2._get_json(url)
 
-    urlopen.assert_not_called()
+    request.assert_not_called()
     run.assert_not_called()
 
 
@@ -141,7 +169,7 @@ def test_check_is_healthy_when_native_curl_recovers_tls_eof():
         "[SSL: UNEXPECTED_EOF_WHILE_READING] EOF occurred in violation of protocol"
     )
 
-    with patch.object(v2, "_get_json_with_urllib", side_effect=tls_error), patch.object(
+    with patch.object(v2, "_get_json_pooled", side_effect=tls_error), patch.object(
         v2.shutil, "which", return_value="/usr/bin/curl"
     ), patch.object(
         v2.subprocess,
@@ -154,6 +182,116 @@ def test_check_is_healthy_when_native_curl_recovers_tls_eof():
     assert ch.active_backend == ch.backends[0]
 
 
+def _tls_eof():
+    return URLError(
+        ssl.SSLError("[SSL: UNEXPECTED_EOF_WHILE_READING] EOF occurred in violation of protocol")
+    )
+
+
+def test_tls_eof_fallback_makes_curl_the_remembered_transport(isolated_home):
+    from agent_reach.config import Config
+
+    Config.CONFIG_DIR.mkdir()
+    curl_ok = subprocess.CompletedProcess(["curl"], 0, "[]", "")
+    with patch.object(v2, "_get_json_pooled", side_effect=_tls_eof()) as pooled, patch.object(
+        v2.shutil, "which", return_value="/usr/bin/curl"
+    ), patch.object(v2.subprocess, "run", return_value=curl_ok) as run, patch.object(
+        v2.ratelimit, "acquire"
+    ) as acquire:
+        v2._get_json("https://www.v2ex.com/api/topics/hot.json")
+        v2._get_json("https://www.v2ex.com/api/topics/latest.json")
+        v2._sticky_until = 0.0  # a new process reads the persisted choice
+        v2._get_json("https://www.v2ex.com/api/topics/hot.json")
+
+    assert pooled.call_count == 1
+    assert run.call_count == 3
+    assert acquire.call_count == 2  # curl-first requests still take rate-limit tokens
+    state = json.loads((Config.CONFIG_DIR / "cache" / "v2ex_transport.json").read_text())
+    assert state["transport"] == "curl"
+    assert 0 < state["until"] - time.time() <= v2._STICKY_CURL_SECONDS
+
+
+def test_remembered_curl_is_dropped_when_python_tls_works_again(isolated_home):
+    v2._remember_transport(curl=True)
+    assert not (isolated_home / ".agent-reach").exists()
+
+    with patch.object(v2.shutil, "which", return_value=None), patch.object(
+        v2, "_get_json_pooled", return_value=[{"id": 1}]
+    ) as pooled, patch.object(v2.ratelimit, "acquire"):
+        assert v2._get_json("https://www.v2ex.com/api/topics/hot.json") == [{"id": 1}]
+        v2._get_json("https://www.v2ex.com/api/topics/hot.json")
+
+    assert pooled.call_count == 2
+    assert v2._curl_preferred() is False
+    # The failed curl attempt's token carries over; only later calls take their own.
+    assert [c.kwargs for c in pooled.call_args_list] == [
+        {"rate_limit": False},
+        {"rate_limit": True},
+    ]
+
+
+def test_curl_mode_pipelines_many_urls_through_one_process():
+    urls = [f"https://www.v2ex.com/api/replies/show.json?topic_id=1&page={n}" for n in (2, 3, 4)]
+
+    def fake_curl(command, **kwargs):
+        outputs = [command[i + 1] for i, arg in enumerate(command) if arg == "--output"]
+        with open(outputs[0], "w") as fh:
+            json.dump([{"id": 2}], fh)
+        with open(outputs[2], "w") as fh:
+            json.dump([{"id": 4}], fh)
+        return subprocess.CompletedProcess(command, 22, "200\n404\n200\n", "")
+
+    v2._remember_transport(curl=True)
+    with patch.object(v2.shutil, "which", return_value="/usr/bin/curl"), patch.object(
+        v2.subprocess, "run", side_effect=fake_curl
+    ) as run, patch.object(v2.ratelimit, "acquire") as acquire:
+        values = v2._get_json_many(urls)
+
+    assert run.call_count == 1
+    command = run.call_args.args[0]
+    assert [command[i + 1] for i, arg in enumerate(command) if arg == "--url"] == urls
+    assert run.call_args.kwargs["timeout"] == v2._TIMEOUT * 3 + 2
+    assert acquire.call_count == 3
+    assert values[0] == [{"id": 2}] and values[2] == [{"id": 4}]
+    assert isinstance(values[1], RuntimeError)
+
+
+def test_curl_mode_reports_a_rate_limited_url_in_its_own_slot():
+    urls = [f"https://www.v2ex.com/api/replies/show.json?topic_id=1&page={n}" for n in (2, 3, 4)]
+    limited = v2.ratelimit.RateLimited("www.v2ex.com: rate limited")
+
+    def fake_acquire(host):
+        if fake.call_count == 2:
+            raise limited
+
+    v2._remember_transport(curl=True)
+    with patch.object(
+        v2, "_get_json_many_with_curl", return_value=[[{"id": 2}], [{"id": 4}]]
+    ) as batch, patch.object(v2.ratelimit, "acquire", side_effect=fake_acquire) as fake:
+        values = v2._get_json_many(urls)
+
+    assert batch.call_args.args[0] == [urls[0], urls[2]]
+    assert values == [[{"id": 2}], limited, [{"id": 4}]]
+
+
+def test_get_topic_fetches_later_pages_in_one_curl_call_in_curl_mode():
+    topic = [{"id": 7, "title": "t", "replies": 250}]
+    v2._remember_transport(curl=True)
+    with patch.object(v2, "_get_json", side_effect=lambda url: topic if "topics" in url else [
+        {"id": 1, "member": {"username": "a"}, "content": "r1"}
+    ]), patch.object(
+        v2, "_get_json_many_with_curl", return_value=[[{"id": 2}], [{"id": 3}]]
+    ) as batch, patch.object(v2.ratelimit, "acquire"):
+        result = V2EXChannel().get_topic(7)
+
+    assert batch.call_count == 1
+    assert [parse_qs(urlsplit(u).query)["page"] for u in batch.call_args.args[0]] == [
+        ["2"],
+        ["3"],
+    ]
+    assert len(result["replies"]) == 3
+
+
 # --- get_hot_topics / get_node_topics ---
 
 def test_get_hot_topics_maps_node_and_truncates_content():
@@ -211,6 +349,19 @@ def test_get_node_topics_percent_encodes_node_name(node_name):
 
 # --- get_topic: list-or-dict shape + replies fetch + fallbacks ---
 
+def _by_endpoint(topic, replies):
+    """Fake _get_json answering topic and reply-page URLs (fetched concurrently)."""
+    def fake_get_json(url):
+        result = replies if "/replies/" in url else topic
+        if isinstance(result, Exception):
+            raise result
+        if callable(result):
+            return result(parse_qs(urlsplit(url).query))
+        return result
+
+    return fake_get_json
+
+
 def test_get_topic_unwraps_list_and_maps_replies():
     ch = V2EXChannel()
     topic = [{
@@ -223,7 +374,7 @@ def test_get_topic_unwraps_list_and_maps_replies():
         {"member": {"username": "alice"}, "content": "nice", "created": 1},
         {"member": {"username": "bob"}, "content": "+1", "created": 2},
     ]
-    with patch.object(v2, "_get_json", side_effect=[topic, replies]):
+    with patch.object(v2, "_get_json", side_effect=_by_endpoint(topic, replies)):
         result = ch.get_topic(42)
     assert result["id"] == 42
     assert result["author"] == "op"
@@ -235,7 +386,7 @@ def test_get_topic_unwraps_list_and_maps_replies():
 def test_get_topic_survives_failing_replies_fetch():
     ch = V2EXChannel()
     topic = {"id": 7, "title": "x"}  # dict shape (not a list)
-    with patch.object(v2, "_get_json", side_effect=[topic, OSError("boom")]):
+    with patch.object(v2, "_get_json", side_effect=_by_endpoint(topic, OSError("boom"))):
         result = ch.get_topic(7)
     assert result["id"] == 7
     assert result["replies"] == []  # failed replies fetch degrades to empty
@@ -243,7 +394,7 @@ def test_get_topic_survives_failing_replies_fetch():
 
 def test_get_topic_url_fallback_when_missing():
     ch = V2EXChannel()
-    with patch.object(v2, "_get_json", side_effect=[[], []]):
+    with patch.object(v2, "_get_json", side_effect=_by_endpoint([], [])):
         result = ch.get_topic(99)
     assert result["id"] == 99
     assert result["url"] == "https://www.v2ex.com/t/99"
@@ -255,13 +406,13 @@ def test_get_topic_percent_encodes_topic_id_in_both_requests():
 
     def fake_get_json(url):
         captured.append(url)
-        return [{"id": 1}] if len(captured) == 1 else []
+        return [{"id": 1}] if "/topics/" in url else []
 
     with patch.object(v2, "_get_json", side_effect=fake_get_json):
         ch.get_topic("1#&page=99")
 
-    topic_parts = urlsplit(captured[0])
-    replies_parts = urlsplit(captured[1])
+    [topic_parts] = [urlsplit(u) for u in captured if "/topics/" in u]
+    [replies_parts] = [urlsplit(u) for u in captured if "/replies/" in u]
     assert topic_parts.fragment == ""
     assert replies_parts.fragment == ""
     assert parse_qs(topic_parts.query)["id"] == ["1#&page=99"]
@@ -269,6 +420,138 @@ def test_get_topic_percent_encodes_topic_id_in_both_requests():
     assert parse_qs(replies_parts.query)["page"] == ["1"]
 
 
+def test_get_topic_fetches_every_reply_page_in_order_up_to_the_cap():
+    ch = V2EXChannel()
+    topic = {"id": 5, "replies": 250}
+    requested = []
+
+    def page_of(query):
+        page = int(query["page"][0])
+        requested.append(page)
+        first = (page - 1) * 100
+        return [
+            {"id": n, "member": {"username": f"u{n}"}, "content": "", "created": n}
+            for n in range(first, min(first + 100, 250))
+        ]
+
+    with patch.object(v2, "_get_json", side_effect=_by_endpoint(topic, page_of)):
+        full = ch.get_topic(5)
+        capped = ch.get_topic(5, max_replies=120)
+        bare = ch.get_topic(5, max_replies=0)
+
+    assert [r["created"] for r in full["replies"]] == list(range(250))
+    assert [r["created"] for r in capped["replies"]] == list(range(120))
+    assert bare["replies"] == []
+    assert sorted(requested) == [1, 2, 3]  # later calls reuse the cached pages
+
+
+def test_get_topic_stops_at_a_failed_page_and_skips_repeated_replies():
+    ch = V2EXChannel()
+    topic = {"id": 5, "replies": 300}
+
+    def page_of(query):
+        page = int(query["page"][0])
+        if page == 3:
+            raise OSError("reset")
+        # An API ignoring ``page`` would return the same replies again.
+        return [{"id": n, "content": str(n)} for n in range(100)]
+
+    with patch.object(v2, "_get_json", side_effect=_by_endpoint(topic, page_of)):
+        result = ch.get_topic(5)
+
+    assert [r["content"] for r in result["replies"]] == [str(n) for n in range(100)]
+
+
+def test_get_topic_requests_topic_and_first_page_concurrently():
+    ch = V2EXChannel()
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fake_get_json(url):
+        both_started.wait()  # deadlocks (BrokenBarrierError) if fetched serially
+        return {"id": 1, "replies": 1} if "/topics/" in url else [{"id": 9, "content": "hi"}]
+
+    with patch.object(v2, "_get_json", side_effect=fake_get_json):
+        result = ch.get_topic(1)
+
+    assert [r["content"] for r in result["replies"]] == ["hi"]
+
+
+# --- iter_node_topics / iter_replies: lazy paging ---
+
+def _paged(pages, requested):
+    """Fake _get_json serving ``pages[n - 1]`` for ``page=n`` and logging requests."""
+    def fake_get_json(url):
+        page = int(parse_qs(urlsplit(url).query)["page"][0])
+        requested.append(page)
+        return pages[page - 1] if page <= len(pages) else []
+
+    return fake_get_json
+
+
+def test_iter_node_topics_fetches_each_page_only_when_consumed():
+    requested = []
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    with patch.object(v2, "_get_json", side_effect=_paged(pages, requested)):
+        topics = V2EXChannel().iter_node_topics("python")
+        assert next(topics)["id"] == 1
+        assert next(topics)["id"] == 2
+        assert requested == [1]
+        assert [t["id"] for t in topics] == [3]
+
+    assert requested == [1, 2, 3]
+
+
+def test_iter_node_topics_can_stop_after_the_first_page():
+    requested = []
+    pages = [[{"id": 1}], [{"id": 2}]]
+    with patch.object(v2, "_get_json", side_effect=_paged(pages, requested)):
+        assert [t["id"] for t in V2EXChannel().iter_node_topics("python", max_pages=1)] == [1]
+    assert requested == [1]
+
+
+def test_iter_node_topics_stops_at_max_items_and_when_pages_repeat():
+    requested = []
+    with patch.object(v2, "_get_json", side_effect=_paged([[{"id": 1}, {"id": 2}]], requested)):
+        topics = V2EXChannel().iter_node_topics("python", max_items=2)
+        assert [t["id"] for t in topics] == [1, 2]
+    assert requested == [1]
+
+    with patch.object(v2, "_get_json", return_value=[{"id": 1}, {"id": 2}]) as fake:
+        assert len(list(V2EXChannel().iter_node_topics("go"))) == 2  # page ignored
+    assert fake.call_count == 2
+
+
+def test_iter_replies_ends_at_a_short_page_without_another_request():
+    requested = []
+    full = [{"id": n, "member": {"username": f"u{n}"}} for n in range(100)]
+    pages = [full, [{"id": 100, "content": "last"}]]
+    with patch.object(v2, "_get_json", side_effect=_paged(pages, requested)):
+        replies = list(V2EXChannel().iter_replies(5))
+
+    assert len(replies) == 101
+    assert replies[0] == {"author": "u0", "content": "", "created": 0}
+    assert replies[-1]["content"] == "last"
+    assert requested == [1, 2]
+
+
+def test_read_ahead_fetches_the_next_page_while_the_caller_works():
+    requested = []
+    page_two_started = threading.Event()
+    fake = _paged([[{"id": 1}], [{"id": 2}]], requested)
+
+    def tracking(url):
+        result = fake(url)
+        if requested[-1] == 2:
+            page_two_started.set()
+        return result
+
+    with patch.object(v2, "_get_json", side_effect=tracking):
+        topics = V2EXChannel().iter_node_topics("python", read_ahead=True)
+        assert next(topics)["id"] == 1
+        assert page_two_started.wait(5)  # requested before the caller asked for it
+        assert [t["id"] for t in topics] == [2]
+
+
 # --- get_user: field mapping + avatar/url fallbacks ---
 
 def test_get_user_maps_fields_and_prefers_large_avatar():
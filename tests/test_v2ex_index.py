@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Tests for the local V2EX full-text index."""
+
+import os
+import stat
+import sys
+from argparse import Namespace
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import yaml
+
+from agent_reach import ratelimit, v2ex_index
+from agent_reach.channels import v2ex as v2
+from agent_reach.channels.v2ex import V2EXChannel
+from agent_reach.commands import v2ex_backfill
+from agent_reach.config import Config
+from agent_reach.v2ex_index import V2EXIndex, match_expression, tokenize
+
+
+@pytest.fixture
+def index(isolated_home):
+    Config.CONFIG_DIR.mkdir()
+    return V2EXIndex()
+
+
+def _topic(topic_id, title, content="", node="python", replies=0):
+    return {
+        "id": topic_id, "title": title, "content": content, "replies": replies,
+        "node": {"name": node}, "member": {"username": "op"}, "created": topic_id,
+    }
+
+
+def test_cjk_runs_become_bigrams_and_queries_require_every_token():
+    assert tokenize("Python 标准库") == ["python", "标准", "准库", "库"]
+    assert match_expression("标准库 Python") == '"标准" "准库" "python"'
+    assert match_expression("库") == '"库"*'
+    assert match_expression("  ,, ") == ""
+
+
+def test_search_ranks_title_matches_first_and_marks_snippets(index):
+    index.add_topics([
+        _topic(1, "闲聊", "顺便问一下异步框架怎么选"),
+        _topic(2, "异步框架对比", "比较 asyncio 与 trio 的异步框架设计"),
+        _topic(3, "Go 并发", "goroutine"),
+    ])
+
+    results = index.search("异步框架")
+
+    assert [r["topic_id"] for r in results] == [2, 1]
+    assert results[1]["snippet"] == "顺便问一下**异步框架**怎么选"
+    assert results[0]["url"] == "https://www.v2ex.com/t/2"
+    assert index.search("异步框架", limit=1)[0]["topic_id"] == 2
+    assert index.search("发")[0]["topic_id"] == 3  # single character as a prefix
+
+
+def test_replies_are_searchable_under_their_topic_and_node(index):
+    index.add_topics([_topic(1, "求推荐 ORM", node="python")])
+    index.add_replies(1, [{"id": 9, "content": "SQLAlchemy 最稳", "member": {"username": "bob"}}])
+    index.add_replies(1, [{"id": 9, "content": "SQLAlchemy 最稳妥", "member": {"username": "bob"}}])
+
+    [hit] = index.search("sqlalchemy")
+
+    assert hit["kind"] == "reply" and hit["title"] == "求推荐 ORM"
+    assert hit["node_name"] == "python" and hit["author"] == "bob"
+    assert hit["url"] == "https://www.v2ex.com/t/1#r_9"
+    assert hit["snippet"] == "**SQLAlchemy** 最稳妥"  # re-indexing replaces, never duplicates
+    assert index.search("sqlalchemy", node="go") == []
+    assert index.count() == 2
+
+
+def test_index_is_private_and_never_created_without_config_dir(isolated_home):
+    assert V2EXIndex().add_topics([_topic(1, "x")]) == 0
+    assert not (isolated_home / ".agent-reach").exists()
+
+    Config.CONFIG_DIR.mkdir()
+    V2EXIndex().add_topics([_topic(1, "x")])
+    if sys.platform != "win32":
+        assert stat.S_IMODE(os.stat(V2EXIndex().path).st_mode) == 0o600
+
+
+def test_channel_indexes_fetched_topics_only_when_enabled(index):
+    topic = _topic(42, "深度学习显卡", replies=1)
+    fake = {"topics": [topic], "replies": [{"id": 5, "content": "4090 够用"}]}
+
+    def fake_get_json(url):
+        return fake["replies"] if "/replies/" in url else fake["topics"]
+
+    with patch.object(v2, "_get_json", side_effect=fake_get_json):
+        V2EXChannel().get_topic(42)
+        assert "error" in V2EXChannel().search("显卡")[0]
+
+        Config.CONFIG_FILE.write_text(yaml.safe_dump({"v2ex_index": True}))
+        V2EXChannel().get_topic(42)
+
+    assert [r["kind"] for r in V2EXChannel().search("显卡")] == ["topic"]
+    assert V2EXChannel().search("4090")[0]["title"] == "深度学习显卡"
+    assert V2EXChannel().search("不存在的词") == []
+
+
+def test_indexing_setting_is_read_once_until_config_changes(index):
+    Config.CONFIG_FILE.write_text(yaml.safe_dump({"v2ex_index": True}))
+
+    with patch.object(v2ex_index, "_config_enables", wraps=v2ex_index._config_enables) as read:
+        assert all(v2ex_index.indexing_enabled() for _ in range(5))
+        assert read.call_count == 1
+
+        Config.CONFIG_FILE.write_text(yaml.safe_dump({"v2ex_index": "off"}))
+        assert v2ex_index.indexing_enabled() is False
+        assert read.call_count == 2
+
+
+def test_backfill_crawls_nodes_and_their_replies(isolated_home, capsys):
+    def fake_get_json(url):
+        query = parse_qs(urlsplit(url).query)
+        page = int(query["page"][0])
+        if "/replies/" in url:
+            return [{"id": 100, "content": "回复内容"}] if page == 1 else []
+        if page > 1:
+            return []
+        return [_topic(1, "第一帖", replies=1), _topic(2, "第二帖")]
+
+    with patch.object(v2, "_get_json", side_effect=fake_get_json) as fake:
+        v2ex_backfill._cmd_v2ex_backfill(Namespace(nodes=["python"], max_topics=None, replies=True))
+
+    out = capsys.readouterr().out
+    assert "python：已收录 2 个主题、1 条回复" in out
+    assert "本地索引共 3 条" in out
+    assert not any("topic_id=2" in call.args[0] for call in fake.call_args_list)
+    assert V2EXChannel().search("回复内容")[0]["title"] == "第一帖"
+
+
+def test_backfill_waits_for_tokens_when_the_burst_runs_out(isolated_home, monkeypatch, capsys):
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = ratelimit.RateLimiter(
+        rates={"www.v2ex.com": ratelimit.Rate(120 / 3600, 2)},
+        clock=lambda: now[0],
+        sleeper=sleep,
+    )
+    monkeypatch.setattr(ratelimit, "_limiter", limiter)
+
+    def fake_pooled(url, *, rate_limit=True):
+        ratelimit.acquire(urlsplit(url).hostname)  # as http_client does per request
+        page = int(parse_qs(urlsplit(url).query)["page"][0])
+        if "/replies/" in url:
+            return [{"id": 100, "content": "回复"}] if page == 1 else []
+        return [_topic(n, f"主题{n}", replies=1) for n in (1, 2, 3)] if page == 1 else []
+
+    monkeypatch.setattr(v2, "_get_json_pooled", fake_pooled)
+    v2ex_backfill._cmd_v2ex_backfill(Namespace(nodes=["python"], max_topics=None, replies=True))
+
+    assert "python：已收录 3 个主题、3 条回复" in capsys.readouterr().out
+    assert max(sleeps) > ratelimit.MAX_WAIT_SECONDS  # paced, where a chat call fails fast
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Tests for the incremental V2EX node watcher."""
+
+import json
+import os
+import stat
+import sys
+import threading
+
+import pytest
+
+from agent_reach import v2ex_watch
+from agent_reach.commands import v2ex_watch as watch_cmd
+from agent_reach.v2ex_watch import NodeWatcher, adaptive_interval
+
+
+class _Clock:
+    def __init__(self, now=100_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeChannel:
+    """Serves ``pages[node]`` as each node's first page and logs the calls."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def iter_node_topics(self, node, max_pages=None):
+        self.calls.append((node, max_pages))
+        page = self.pages[node]
+        if isinstance(page, Exception):
+            raise page
+        return iter([dict(topic) for topic in page])
+
+
+def _topic(topic_id, created, replies=0):
+    return {"id": topic_id, "title": f"t{topic_id}", "created": created, "replies": replies}
+
+
+def test_first_poll_sets_the_mark_then_only_new_and_changed_topics_are_emitted():
+    clock = _Clock()
+    channel = _FakeChannel({"python": [_topic(2, 200), _topic(1, 100, replies=3)]})
+    watcher = NodeWatcher(["python"], channel=channel, clock=clock)
+
+    assert watcher.poll() == []
+    channel.pages["python"] = [_topic(3, 300), _topic(2, 200), _topic(1, 100, replies=5)]
+    clock.now += 3600
+
+    events = watcher.poll()
+
+    assert [(e["event"], e["id"]) for e in events] == [("changed", 1), ("new", 3)]
+    assert events[1]["node"] == "python" and events[1]["title"] == "t3"
+    assert watcher.states["python"].last_id == 3
+    assert channel.calls[-1] == ("python", 1)  # only the first page
+
+
+def test_include_existing_reports_the_first_page_once():
+    channel = _FakeChannel({"jobs": [_topic(5, 500), _topic(4, 400)]})
+    watcher = NodeWatcher(["jobs"], channel=channel, include_existing=True, clock=_Clock())
+
+    assert [e["id"] for e in watcher.poll()] == [4, 5]
+    assert watcher.poll(force=True) == []
+
+
+def test_interval_follows_how_often_a_node_posts():
+    assert adaptive_interval([1000, 1120, 1240, 1360]) == 120
+    assert adaptive_interval([1000, 1010, 1020]) == v2ex_watch.MIN_INTERVAL
+    assert adaptive_interval([0, 86_400 * 3]) == v2ex_watch.MAX_INTERVAL
+    assert adaptive_interval([]) == v2ex_watch.DEFAULT_INTERVAL
+
+
+def test_only_due_nodes_are_polled_and_failures_do_not_stop_the_rest():
+    clock = _Clock()
+    busy = [_topic(n, 1000 + 120 * n) for n in range(1, 6)]
+    quiet = [_topic(n, 86_400 * n) for n in range(1, 3)]
+    channel = _FakeChannel({"busy": busy, "quiet": quiet, "down": OSError("boom")})
+    watcher = NodeWatcher(["busy", "quiet", "down"], channel=channel, clock=clock)
+
+    watcher.poll()
+    assert watcher.errors == {"down": "boom"}
+    assert watcher.states["busy"].interval == 120
+    assert watcher.states["quiet"].interval == v2ex_watch.MAX_INTERVAL
+
+    channel.calls.clear()
+    clock.now += 120
+    watcher.poll()
+    assert [node for node, _ in channel.calls] == ["busy"]
+    assert watcher.seconds_until_due() == 120
+
+
+def test_due_nodes_are_polled_concurrently():
+    both_started = threading.Barrier(2, timeout=5)
+
+    class _Concurrent(_FakeChannel):
+        def iter_node_topics(self, node, max_pages=None):
+            both_started.wait()  # BrokenBarrierError if polled one after another
+            return super().iter_node_topics(node, max_pages)
+
+    channel = _Concurrent({"a": [_topic(1, 1)], "b": [_topic(2, 2)]})
+    NodeWatcher(["a", "b"], channel=channel, clock=_Clock()).poll()
+
+    assert sorted(node for node, _ in channel.calls) == ["a", "b"]
+
+
+def test_state_is_private_and_resumes_in_a_new_process(isolated_home):
+    (isolated_home / ".agent-reach").mkdir()
+    clock = _Clock()
+    channel = _FakeChannel({"python": [_topic(1, 100)]})
+    NodeWatcher(["python"], channel=channel, clock=clock).poll()
+
+    path = v2ex_watch.state_path()
+    if sys.platform != "win32":
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    channel.pages["python"] = [_topic(2, 200), _topic(1, 100)]
+    clock.now += 3600
+    resumed = NodeWatcher(["python"], channel=channel, clock=clock)
+
+    assert [e["id"] for e in resumed.poll()] == [2]
+    assert json.loads(path.read_text())["nodes"]["python"]["last_id"] == 2
+
+
+def test_without_config_dir_nothing_is_written(isolated_home):
+    channel = _FakeChannel({"python": [_topic(1, 100)]})
+    watcher = NodeWatcher(["python"], channel=channel, clock=_Clock())
+
+    watcher.poll()
+
+    assert watcher.save() is False
+    assert not (isolated_home / ".agent-reach").exists()
+
+
+def test_cli_prints_events_as_ndjson_and_errors_on_stderr(capsys):
+    channel = _FakeChannel({"python": [_topic(7, 700)], "down": OSError("boom")})
+    watcher = NodeWatcher(
+        ["python", "down"], channel=channel, include_existing=True, clock=_Clock()
+    )
+
+    watch_cmd._run(watcher, once=True)
+
+    out, err = capsys.readouterr()
+    [line] = out.splitlines()
+    assert json.loads(line) == {"event": "new", "node": "python", **_topic(7, 700)}
+    assert "down" in err and "boom" in err
+
+
+def test_cli_parses_nodes_and_rejects_an_empty_list(monkeypatch):
+    from agent_reach import cli
+
+    seen = {}
+    monkeypatch.setattr(cli, "_cmd_v2ex_watch", lambda args: seen.setdefault("args", args))
+    monkeypatch.setattr(sys, "argv", ["agent-reach", "v2ex-watch", "python,jobs", "go", "--once"])
+    cli.main()
+    assert watch_cmd._split_nodes(seen["args"].nodes) == ["python", "jobs", "go"]
+    assert seen["args"].once is True
+
+    monkeypatch.setattr(sys, "argv", ["agent-reach", "v2ex-watch", ","])
+    with pytest.raises(SystemExit):
+        cli.main()
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""Tests for `agent-reach watch --daemon` incremental re-probing."""
+
+import os
+import stat
+from argparse import Namespace
+
+import pytest
+
+from agent_reach.commands import watch as watch_cmd
+from agent_reach.config import Config
+from agent_reach.watcher import ChannelWatcher
+
+
+class _FakeCheck:
+    """Stand-in for doctor.check_all that records which channels ran."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = []
+
+    def __call__(self, config, *, use_cache=True, channels=None):
+        self.calls.append(list(channels))
+        return {
+            name: {"status": self.statuses[name], "name": name.upper(), "message": "msg"}
+            for name in channels
+        }
+
+
+def _touch_binary(directory, name):
+    path = directory / name
+    path.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return path
+
+
+@pytest.fixture
+def bin_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "bin"
+    directory.mkdir()
+    monkeypatch.setenv("PATH", str(directory))
+    return directory
+
+
+def test_first_poll_checks_every_channel_then_nothing_until_inputs_change(bin_dir):
+    check = _FakeCheck({"youtube": "off", "v2ex": "ok"})
+    watcher = ChannelWatcher(["v2ex", "youtube"], check=check)
+
+    baseline = watcher.poll()
+
+    assert check.calls == [["youtube", "v2ex"]]
+    assert [(t.channel, t.before, t.after) for t in baseline] == [
+        ("youtube", None, "off"),
+        ("v2ex", None, "ok"),
+    ]
+    assert watcher.poll() == []
+    assert check.calls == [["youtube", "v2ex"]]
+
+
+def test_new_binary_on_path_rechecks_only_its_channel(bin_dir):
+    check = _FakeCheck({"youtube": "off", "v2ex": "ok"})
+    watcher = ChannelWatcher(["youtube", "v2ex"], check=check)
+    watcher.poll()
+
+    _touch_binary(bin_dir, "yt-dlp")
+    check.statuses["youtube"] = "ok"
+    transitions = watcher.poll()
+
+    assert check.calls[-1] == ["youtube"]
+    assert [(t.channel, t.before, t.after) for t in transitions] == [("youtube", "off", "ok")]
+
+
+def test_credential_file_write_rechecks_channel_without_reporting_unchanged_status(
+    bin_dir, isolated_home
+):
+    check = _FakeCheck({"reddit": "warn", "web": "ok"})
+    watcher = ChannelWatcher(["reddit", "web"], check=check)
+    watcher.poll()
+
+    credential = isolated_home / ".config" / "rdt-cli" / "credential.json"
+    credential.parent.mkdir(parents=True)
+    credential.write_text("{}", encoding="utf-8")
+
+    assert watcher.poll() == []
+    assert check.calls[-1] == ["reddit"]
+
+
+def test_config_edit_reloads_config_and_rechecks_everything(bin_dir):
+    seen = []
+    check = _FakeCheck({"web": "ok", "exa_search": "off"})
+
+    def recording_check(config, **kwargs):
+        seen.append(dict(config.data))
+        return check(config, **kwargs)
+
+    watcher = ChannelWatcher(["web", "exa_search"], check=recording_check)
+    watcher.poll()
+
+    Config.CONFIG_FILE.parent.mkdir(mode=0o700)
+    Config.CONFIG_FILE.write_text("exa_api_key: test\n", encoding="utf-8")
+    watcher.poll()
+
+    assert check.calls[-1] == ["exa_search", "web"]
+    assert seen == [{}, {"exa_api_key": "test"}]
+
+
+def test_timed_out_channel_is_retried_on_next_poll(bin_dir):
+    check = _FakeCheck({"web": "timeout"})
+    watcher = ChannelWatcher(["web"], check=check)
+    watcher.poll()
+    check.statuses["web"] = "ok"
+
+    transitions = watcher.poll()
+
+    assert len(check.calls) == 2
+    assert [(t.before, t.after) for t in transitions] == [("timeout", "ok")]
+
+
+def test_watcher_rejects_unknown_channels():
+    with pytest.raises(ValueError, match="nope"):
+        ChannelWatcher(["web", "nope"], check=_FakeCheck({}))
+
+
+def test_daemon_prints_baseline_then_only_transitions(bin_dir, monkeypatch, capsys):
+    statuses = {"youtube": "off", "web": "ok"}
+    check = _FakeCheck(statuses)
+    monkeypatch.setattr("agent_reach.doctor.check_all", check)
+    monkeypatch.setattr(watch_cmd, "_latest_release", lambda: None)
+
+    def sleep(_seconds):
+        if len(check.calls) == 1:
+            _touch_binary(bin_dir, "yt-dlp")
+            statuses["youtube"] = "ok"
+
+    args = Namespace(daemon=True, interval=5.0, channels="youtube,web", no_cache=False)
+    watch_cmd._run_daemon(args, sleep=sleep, max_polls=3)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert "YOUTUBE：未启用：msg" in lines[0]
+    assert lines[1].startswith("Agent Reach watch: 1/2 渠道可用")
+    assert "YOUTUBE：未启用 → 正常：msg" in lines[2]
+    assert len(lines) == 3
+    assert check.calls == [["youtube", "web"], ["youtube"]]
+
+
+def test_daemon_silences_a_flapping_channel_without_recording_history(
+    bin_dir, monkeypatch, capsys
+):
+    statuses = {"youtube": "off"}
+    check = _FakeCheck(statuses)
+    monkeypatch.setattr("agent_reach.doctor.check_all", check)
+    monkeypatch.setattr(watch_cmd, "_latest_release", lambda: None)
+    monkeypatch.setattr(
+        "agent_reach.history.record", lambda _results: pytest.fail("daemon wrote history")
+    )
+
+    def sleep(_seconds):
+        binary = bin_dir / "yt-dlp"
+        if binary.exists():
+            binary.unlink()
+            statuses["youtube"] = "off"
+        else:
+            _touch_binary(bin_dir, "yt-dlp")
+            statuses["youtube"] = "ok"
+
+    args = Namespace(daemon=True, interval=5.0, channels="youtube", no_cache=False)
+    watch_cmd._run_daemon(args, sleep=sleep, max_polls=6)
+
+    lines = capsys.readouterr().out.splitlines()[2:]
+    assert len(check.calls) == 6
+    assert ["→" in line for line in lines] == [True, True, True, False]
+    assert "状态不稳定" in lines[-1]
+
+
+def test_daemon_checks_for_updates_once_per_day(bin_dir, monkeypatch, capsys):
+    monkeypatch.setattr("agent_reach.doctor.check_all", _FakeCheck({"web": "ok"}))
+    lookups = []
+
+    def latest_release():
+        lookups.append(1)
+        return ("99.0.0", "notes")
+
+    monkeypatch.setattr(watch_cmd, "_latest_release", latest_release)
+
+    args = Namespace(daemon=True, interval=1.0, channels="web", no_cache=False)
+    watch_cmd._run_daemon(args, sleep=lambda _s: None, max_polls=3)
+
+    out = capsys.readouterr().out
+    assert len(lookups) == 1
+    assert out.count("新版本可用: v99.0.0") == 1
+
+
+def test_watch_interval_requires_daemon(monkeypatch, capsys):
+    import agent_reach.cli as cli
+
+    monkeypatch.setattr("sys.argv", ["agent-reach", "watch", "--interval", "5"])
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+
+    assert exc.value.code == 2
+    assert "--interval requires --daemon" in capsys.readouterr().err
+
+
+def test_fingerprints_never_read_credential_contents(bin_dir, isolated_home, monkeypatch):
+    credential = isolated_home / ".xiaohongshu-cli" / "cookies.json"
+    credential.parent.mkdir()
+    credential.write_text('{"a1": "secret"}', encoding="utf-8")
+    opened = []
+    real_open = os.open
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(os.fspath(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "open", tracking_open)
+    watcher = ChannelWatcher(["xiaohongshu"], check=_FakeCheck({"xiaohongshu": "ok"}))
+    watcher.changed_channels()
+
+    assert str(credential) not in opened
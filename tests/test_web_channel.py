@@ -12,16 +12,22 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from agent_reach import http_client
 from agent_reach.channels.web import _UA, WebChannel
 
 _MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+_REQUEST = "agent_reach.http_client.request"
 
 
 def _resp(body=b"# Example\nfull text\n"):
-    """A urlopen() return value usable as a context manager."""
-    cm = MagicMock()
-    cm.__enter__.return_value.read.return_value = body
-    return cm
+    """A stand-in for http_client.request that serves ``body`` within max_bytes."""
+
+    def fake_request(method, url, *, max_bytes=http_client.DEFAULT_MAX_BYTES, **_kwargs):
+        if len(body) > max_bytes:
+            raise http_client.ResponseTooLarge(f"response exceeds the {max_bytes} byte limit")
+        return http_client.Response(200, {}, body, url)
+
+    return MagicMock(side_effect=fake_request)
 
 
 # --- can_handle: universal fallback contract ---
@@ -43,7 +49,7 @@ def test_can_handle_accepts_any_url():
 
 def test_check_is_ok_and_touches_no_network():
     channel = WebChannel()
-    with patch("urllib.request.urlopen") as mock_open:
+    with patch(_REQUEST) as mock_open:
         status, message = channel.check()
     assert status == "ok"
     assert channel.active_backend == "Jina Reader"
@@ -56,42 +62,38 @@ def test_check_is_ok_and_touches_no_network():
 
 def test_read_prepends_https_for_schemeless_url():
     channel = WebChannel()
-    with patch("urllib.request.urlopen", return_value=_resp()) as mock_open:
+    with patch(_REQUEST, _resp()) as mock_open:
         out = channel.read("example.com/article")
-    req = mock_open.call_args.args[0]
-    assert req.full_url == "https://r.jina.ai/https://example.com/article"
+    assert mock_open.call_args.args[1] == "https://r.jina.ai/https://example.com/article"
     assert out == "# Example\nfull text\n"
 
 
 def test_read_preserves_existing_http_scheme():
     channel = WebChannel()
-    with patch("urllib.request.urlopen", return_value=_resp()) as mock_open:
+    with patch(_REQUEST, _resp()) as mock_open:
         channel.read("http://example.com")
-    req = mock_open.call_args.args[0]
     # http:// must be kept as-is, not coerced to https:// nor double-prefixed.
-    assert req.full_url == "https://r.jina.ai/http://example.com"
+    assert mock_open.call_args.args[1] == "https://r.jina.ai/http://example.com"
 
 
 def test_read_preserves_existing_https_scheme():
     channel = WebChannel()
-    with patch("urllib.request.urlopen", return_value=_resp()) as mock_open:
+    with patch(_REQUEST, _resp()) as mock_open:
         channel.read("https://example.com/deep/path")
-    req = mock_open.call_args.args[0]
-    assert req.full_url == "https://r.jina.ai/https://example.com/deep/path"
+    assert mock_open.call_args.args[1] == "https://r.jina.ai/https://example.com/deep/path"
 
 
 def test_read_sends_expected_headers_and_timeout():
     channel = WebChannel()
-    with patch("urllib.request.urlopen", return_value=_resp()) as mock_open:
+    with patch(_REQUEST, _resp()) as mock_open:
         channel.read("https://example.com")
-    req = mock_open.call_args.args[0]
-    assert req.headers == {"User-agent": _UA, "Accept": "text/plain"}
+    assert mock_open.call_args.kwargs["headers"] == {"User-Agent": _UA, "Accept": "text/plain"}
     assert mock_open.call_args.kwargs["timeout"] == 30
 
 
 def test_read_decodes_utf8_body():
     channel = WebChannel()
-    with patch("urllib.request.urlopen", return_value=_resp("café ☕\n".encode("utf-8"))):
+    with patch(_REQUEST, _resp("café ☕\n".encode("utf-8"))):
         out = channel.read("https://example.com")
     assert out == "café ☕\n"
 
@@ -125,7 +127,7 @@ def test_read_decodes_utf8_body():
 def test_read_rejects_non_public_urls_before_network(url):
     channel = WebChannel()
 
-    with patch("urllib.request.urlopen") as mock_open:
+    with patch(_REQUEST) as mock_open:
         with pytest.raises(ValueError, match="public HTTP"):
             channel.read(url)
 
@@ -135,7 +137,7 @@ def test_read_rejects_non_public_urls_before_network(url):
 @pytest.mark.parametrize("url", ["https://8.8.8.8/page", "http://010.010.010.010/page"])
 def test_read_allows_public_literal_addresses(url):
     channel = WebChannel()
-    with patch("urllib.request.urlopen", return_value=_resp()) as mock_open:
+    with patch(_REQUEST, _resp()) as mock_open:
         channel.read(url)
     mock_open.assert_called_once()
 
@@ -144,26 +146,22 @@ def test_read_accepts_response_at_exact_size_limit():
     channel = WebChannel()
     response = _resp(b"x" * _MAX_RESPONSE_BYTES)
 
-    with patch("urllib.request.urlopen", return_value=response):
+    with patch(_REQUEST, response):
         out = channel.read("https://example.com/exact")
 
     assert len(out) == _MAX_RESPONSE_BYTES
-    response.__enter__.return_value.read.assert_called_once_with(
-        _MAX_RESPONSE_BYTES + 1
-    )
+    assert response.call_args.kwargs["max_bytes"] == _MAX_RESPONSE_BYTES
 
 
 def test_read_rejects_oversized_reader_response():
     channel = WebChannel()
     response = _resp(b"x" * (_MAX_RESPONSE_BYTES + 1))
 
-    with patch("urllib.request.urlopen", return_value=response):
+    with patch(_REQUEST, response):
         with pytest.raises(ValueError, match="response exceeds"):
             channel.read("https://example.com/large")
 
-    response.__enter__.return_value.read.assert_called_once_with(
-        _MAX_RESPONSE_BYTES + 1
-    )
+    assert response.call_args.kwargs["max_bytes"] == _MAX_RESPONSE_BYTES
 
 
 @pytest.mark.parametrize(
@@ -185,9 +183,7 @@ def test_read_rejects_oversized_reader_response():
 def test_read_rejects_high_confidence_antibot_pages(body):
     channel = WebChannel()
 
-    with patch(
-        "urllib.request.urlopen", return_value=_resp(body.encode("utf-8"))
-    ) as mock_open:
+    with patch(_REQUEST, _resp(body.encode("utf-8"))) as mock_open:
         with pytest.raises(RuntimeError, match="反爬验证页"):
             channel.read("https://example.com/protected")
 
@@ -208,7 +204,7 @@ def test_read_rejects_high_confidence_antibot_pages(body):
 def test_read_does_not_reject_single_generic_antibot_terms(body):
     channel = WebChannel()
 
-    with patch("urllib.request.urlopen", return_value=_resp(body.encode("utf-8"))):
+    with patch(_REQUEST, _resp(body.encode("utf-8"))):
         assert channel.read("https://example.com/article") == body
 
 
@@ -221,5 +217,5 @@ def test_antibot_detection_has_a_fixed_scan_window():
         + "## Performing security verification\n"
     )
 
-    with patch("urllib.request.urlopen", return_value=_resp(body.encode("utf-8"))):
+    with patch(_REQUEST, _resp(body.encode("utf-8"))):
         assert channel.read("https://example.com/long-article") == body
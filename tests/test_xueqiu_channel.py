@@ -17,6 +17,7 @@ from urllib.parse import parse_qs, urlsplit
 
 import pytest
 
+from agent_reach import http_client
 from agent_reach.channels import xueqiu as xq
 from agent_reach.channels.xueqiu import XueqiuChannel, _strip_html
 
@@ -78,6 +79,21 @@ def test_check_warn_on_exception():
     assert ch.active_backend is None
 
 
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [({"xueqiu_cookie": "xq_a_token=secret"}, "已配置登录 Cookie"), ({}, "未配置登录 Cookie")],
+)
+def test_offline_check_reports_cookie_state_without_network(config, expected):
+    from agent_reach.probe import offline_mode
+
+    ch = XueqiuChannel()
+    with patch.object(xq, "_get_json", side_effect=AssertionError("network")), offline_mode():
+        status, message = ch.check(config)
+    assert status == "unverified"
+    assert expected in message
+    assert "secret" not in message
+
+
 def test_check_never_reads_browser_cookie_store_implicitly(monkeypatch):
     browser_reads = []
     fake_rookiepy = types.SimpleNamespace(
@@ -91,17 +107,12 @@ def test_check_never_reads_browser_cookie_store_implicitly(monkeypatch):
         lambda config=None: False,
     )
 
-    class FakeResponse:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *_args):
-            return None
-
-        def read(self):
-            return b'{"data":{"quote":{"symbol":"SH601138","pe_ttm":38.1}}}'
-
-    monkeypatch.setattr(xq._opener, "open", lambda *_args, **_kwargs: FakeResponse())
+    body = b'{"data":{"quote":{"symbol":"SH601138","pe_ttm":38.1}}}'
+    monkeypatch.setattr(
+        http_client,
+        "request",
+        lambda _method, url, **_kwargs: http_client.Response(200, {}, body, url),
+    )
 
     status, _message = XueqiuChannel().check()
 